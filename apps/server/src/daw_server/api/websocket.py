@@ -14,11 +14,12 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from daw_agents.models.drivers import STREAM_RESTART, StreamChunk
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
 
@@ -393,7 +394,8 @@ class AgentStreamCallback:
     """LangGraph callback handler for streaming agent events to WebSocket clients.
 
     This callback integrates with LangGraph workflows to emit real-time events
-    for state transitions, LLM thinking, tool calls, and errors.
+    for state transitions, LLM thinking, tool calls, and errors. Token chunks
+    from ModelRouter.route_stream() can be forwarded as they arrive.
 
     Attributes:
         _manager: The WebSocketManager to use for broadcasting
@@ -548,6 +550,56 @@ class AgentStreamCallback:
         await self._manager.broadcast(self._workflow_id, event)
 
 
+    async def on_llm_new_token(
+        self,
+        token: str,
+        **kwargs: Any,
+    ) -> None:
+        """Handle a streamed LLM token - emits THOUGHT streaming event.
+
+        Args:
+            token: The newly generated token
+            **kwargs: Additional arguments (may include model)
+        """
+        event = AgentStreamEvent(
+            event_type=EventType.THOUGHT,
+            workflow_id=self._workflow_id,
+            data={
+                "status": "streaming",
+                "token": token,
+                "model": kwargs.get("model", "unknown"),
+            },
+        )
+        await self._manager.broadcast(self._workflow_id, event)
+
+    async def forward_stream(self, chunks: AsyncIterator[StreamChunk]) -> str:
+        """Forward ModelRouter.route_stream() chunks to clients as they arrive.
+
+        A STREAM_RESTART chunk (primary failed mid-stream) is broadcast with
+        status "restarted" so clients can clear partial output.
+
+        Args:
+            chunks: Async iterator of StreamChunk from route_stream()
+
+        Returns:
+            The full response text (fallback output only, after a restart)
+        """
+        parts: list[str] = []
+        async for chunk in chunks:
+            if chunk.finish_reason == STREAM_RESTART:
+                parts.clear()
+                event = AgentStreamEvent(
+                    event_type=EventType.THOUGHT,
+                    workflow_id=self._workflow_id,
+                    data={"status": "restarted", "model": chunk.model or "unknown"},
+                )
+                await self._manager.broadcast(self._workflow_id, event)
+            elif chunk.content:
+                parts.append(chunk.content)
+                await self.on_llm_new_token(chunk.content, model=chunk.model or "unknown")
+        return "".join(parts)
+
+
 def create_websocket_router(
     manager: WebSocketManager | None = None,
 ) -> APIRouter:
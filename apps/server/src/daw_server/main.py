@@ -2,6 +2,8 @@
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI
@@ -32,10 +34,33 @@ clerk_config = ClerkConfig(
     authorized_parties=os.getenv("CLERK_AUTHORIZED_PARTIES", "").split(",") or None,
 )
 
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan: pre-warm and release pooled model connections.
+
+    Pre-warming opens TLS connections to configured LLM providers so the
+    first agent request does not pay the handshake. It is skipped when
+    DAW_PREWARM_MODEL_CLIENTS is false or in test mode.
+    """
+    from daw_agents.models.drivers import DriverRegistry
+
+    prewarm = os.getenv("DAW_PREWARM_MODEL_CLIENTS", "true").lower() == "true"
+    if prewarm and os.getenv("TESTING", "false").lower() != "true":
+        warmed = await DriverRegistry.prewarm()
+        logger.info("Pre-warmed model clients: %s", warmed)
+
+    yield
+
+    await DriverRegistry.shutdown()
+
+
 app = FastAPI(
     title="DAW Server",
     description="Deterministic Agentic Workbench - AI Agent Orchestration Server",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Rate limiter configuration
@@ -396,6 +396,49 @@ class TestAgentStreamCallback:
         assert event.event_type == EventType.ERROR
         assert "Something went wrong" in str(event.data)
 
+    @pytest.mark.asyncio
+    async def test_on_llm_new_token_emits_streaming_thought(self) -> None:
+        """on_llm_new_token should emit a streaming THOUGHT event."""
+        from daw_server.api.websocket import (
+            AgentStreamCallback,
+            EventType,
+            WebSocketManager,
+        )
+
+        manager = WebSocketManager()
+        manager.broadcast = AsyncMock()
+        callback = AgentStreamCallback(manager, "wf_123")
+
+        await callback.on_llm_new_token("def", model="gpt-4o")
+
+        event = manager.broadcast.call_args[0][1]
+        assert event.event_type == EventType.THOUGHT
+        assert event.data == {"status": "streaming", "token": "def", "model": "gpt-4o"}
+
+    @pytest.mark.asyncio
+    async def test_forward_stream_broadcasts_chunks(self) -> None:
+        """forward_stream should broadcast each chunk and return the full text."""
+        from daw_agents.models.drivers import STREAM_RESTART, StreamChunk
+
+        from daw_server.api.websocket import AgentStreamCallback, WebSocketManager
+
+        async def chunks() -> Any:
+            yield StreamChunk(content="stale", model="primary")
+            yield StreamChunk(content="", finish_reason=STREAM_RESTART, model="primary")
+            yield StreamChunk(content="fresh ", model="fallback")
+            yield StreamChunk(content="text", model="fallback")
+            yield StreamChunk(content="", finish_reason="stop", model="fallback")
+
+        manager = WebSocketManager()
+        manager.broadcast = AsyncMock()
+        callback = AgentStreamCallback(manager, "wf_123")
+
+        result = await callback.forward_stream(chunks())
+
+        assert result == "fresh text"
+        statuses = [call[0][1].data["status"] for call in manager.broadcast.call_args_list]
+        assert statuses == ["streaming", "restarted", "streaming", "streaming"]
+
 
 class TestWebSocketEndpoint:
     """Tests for WebSocket endpoint."""
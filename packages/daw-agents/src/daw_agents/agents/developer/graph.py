@@ -30,6 +30,7 @@ Workflow Graph:
 from __future__ import annotations
 
 import logging
+from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING, Any
 
 from langgraph.graph import END, START, StateGraph
@@ -49,7 +50,8 @@ from daw_agents.models.router import ModelRouter, TaskType
 
 if TYPE_CHECKING:
     from daw_agents.mcp.client import MCPClient
-    from daw_agents.sandbox.e2b import E2BSandbox
+    from daw_agents.sandbox.base import Sandbox
+    from daw_agents.sandbox.pool import SandboxPool
     from daw_agents.tdd.guard import TDDGuard
 
 logger = logging.getLogger(__name__)
@@ -73,6 +75,7 @@ class Developer:
         graph: Compiled LangGraph workflow
         mcp_client: Optional MCP client for tool integration
         sandbox: Optional E2B sandbox for test execution
+        sandbox_pool: Optional pool; one warm sandbox is leased per execute()
         tdd_guard: Optional TDD guard for workflow enforcement
 
     Example:
@@ -91,8 +94,9 @@ class Developer:
         router: ModelRouter | None = None,
         max_iterations: int = 5,
         mcp_client: MCPClient | None = None,
-        sandbox: E2BSandbox | None = None,
+        sandbox: Sandbox | None = None,
         tdd_guard: TDDGuard | None = None,
+        sandbox_pool: SandboxPool | None = None,
     ) -> None:
         """Initialize the Developer Agent.
 
@@ -102,12 +106,15 @@ class Developer:
             mcp_client: Optional MCP client for tool calls
             sandbox: Optional E2B sandbox for test execution
             tdd_guard: Optional TDD guard for workflow enforcement
+            sandbox_pool: Optional SandboxPool. When set, every test run of an
+                execute() call reuses one leased, pre-provisioned sandbox.
         """
         self.router = router or ModelRouter()
         self.task_type = TaskType.CODING
         self.max_iterations = max_iterations
         self.mcp_client = mcp_client
         self.sandbox = sandbox
+        self.sandbox_pool = sandbox_pool
         self.tdd_guard = tdd_guard
         self.graph = self._build_graph()
 
@@ -185,14 +192,14 @@ class Developer:
         self.mcp_client = mcp_client
         logger.info("MCP client configured for Developer Agent")
 
-    def configure_sandbox(self, sandbox: E2BSandbox) -> None:
-        """Configure E2B sandbox for test execution.
+    def configure_sandbox(self, sandbox: Sandbox) -> None:
+        """Configure a sandbox for test execution.
 
         Args:
-            sandbox: E2BSandbox instance for isolated test execution
+            sandbox: Sandbox (E2B or local) for isolated test execution
         """
         self.sandbox = sandbox
-        logger.info("E2B sandbox configured for Developer Agent")
+        logger.info("Sandbox configured for Developer Agent")
 
     def configure_tdd_guard(self, tdd_guard: TDDGuard) -> None:
         """Configure TDD guard for workflow enforcement.
@@ -242,8 +249,22 @@ class Developer:
             "error": None,
         }
 
-        # Run the workflow
-        final_state = await self.graph.ainvoke(initial_state)
+        # Run the workflow, on one leased sandbox if a pool is configured
+        async with AsyncExitStack() as stack:
+            configurable: dict[str, Any] = {}
+            if self.sandbox_pool is not None:
+                try:
+                    configurable["sandbox"] = await stack.enter_async_context(
+                        self.sandbox_pool.lease()
+                    )
+                    configurable["sandbox_workspace"] = self.sandbox_pool.workspace
+                except Exception as e:
+                    logger.warning(
+                        "Could not lease a pooled sandbox, using one per test run: %s", e
+                    )
+            final_state = await self.graph.ainvoke(
+                initial_state, config={"configurable": configurable}
+            )
 
         # Determine success based on final status
         status = final_state.get("status", "error")
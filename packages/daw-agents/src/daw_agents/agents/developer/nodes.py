@@ -23,11 +23,14 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
 
 from daw_agents.agents.developer.state import DeveloperState
 from daw_agents.models.router import ModelRouter, TaskType
-from daw_agents.sandbox.e2b import E2BSandbox
+from daw_agents.sandbox.base import Sandbox
+from daw_agents.sandbox.registry import SandboxRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -98,21 +101,73 @@ Return ONLY the Python test code, no explanations or markdown formatting.
     return test_code
 
 
+async def _run_tests(
+    sandbox: Sandbox,
+    workspace: str,
+    test_code: str,
+    source_code: str,
+    test_file: str,
+    source_file: str,
+    setup_command: str | None,
+) -> dict[str, Any]:
+    """Upload source and test files to a started sandbox and run pytest.
+
+    Files and command go out in one run_script() call, a single round trip
+    on E2B instead of one per file plus one for the command.
+    """
+    start_time = time.time()
+
+    command = f"python -m pytest {test_file} -v"
+    if setup_command:
+        command = f"{setup_command} && {command}"
+    result = await sandbox.run_script(
+        f"cd {workspace} && {command}",
+        files={
+            f"{workspace}/{source_file}": source_code,
+            f"{workspace}/{test_file}": test_code,
+        },
+        timeout=120,
+    )
+
+    duration_ms = (time.time() - start_time) * 1000
+
+    # Combine stdout and stderr for full output
+    output = result.stdout
+    if result.stderr:
+        output += f"\n\nSTDERR:\n{result.stderr}"
+
+    return {
+        "passed": result.exit_code == 0,
+        "output": output,
+        "exit_code": result.exit_code,
+        "duration_ms": duration_ms,
+    }
+
+
 async def execute_tests_in_sandbox(
     test_code: str,
     source_code: str,
     test_file: str,
     source_file: str,
+    sandbox: Sandbox | None = None,
+    workspace: str | None = None,
 ) -> dict[str, Any]:
-    """Execute tests in E2B sandbox.
+    """Execute tests in a sandbox (backend chosen by DAW_SANDBOX_BACKEND).
 
     This function is called by run_test_node and can be mocked in tests.
 
+    With a leased sandbox (see SandboxPool) the files are written to its
+    workspace and pytest runs directly, since the pool pre-installs it.
+    Otherwise a fresh sandbox is started, pytest installed, and the
+    sandbox killed afterwards.
+
     Args:
         test_code: Test code to execute
         source_code: Source code to test against
         test_file: Path to test file
         source_file: Path to source file
+        sandbox: Optional started sandbox leased for this Developer run
+        workspace: Directory to run in (default: /home/user)
 
     Returns:
         Dictionary with test results (passed, output, exit_code, duration_ms)
@@ -120,39 +175,26 @@ async def execute_tests_in_sandbox(
     logger.info("Executing tests in sandbox: %s", test_file)
 
     start_time = time.time()
+    workspace = workspace or "/home/user"
 
     try:
-        sandbox = E2BSandbox.from_env()
-
-        async with sandbox:
-            # Write source code to sandbox
-            await sandbox.write_file(f"/home/user/{source_file}", source_code)
-
-            # Write test code to sandbox
-            await sandbox.write_file(f"/home/user/{test_file}", test_code)
+        if sandbox is not None:
+            return await _run_tests(
+                sandbox, workspace, test_code, source_code, test_file, source_file, None
+            )
 
+        async with SandboxRegistry.create() as fresh_sandbox:
             # Install pytest if not present and run tests
-            result = await sandbox.run_command(
-                f"cd /home/user && pip install -q pytest && python -m pytest {test_file} -v",
-                timeout=120,
+            return await _run_tests(
+                fresh_sandbox,
+                workspace,
+                test_code,
+                source_code,
+                test_file,
+                source_file,
+                "pip install -q pytest",
             )
 
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Combine stdout and stderr for full output
-            output = result.stdout
-            if result.stderr:
-                output += f"\n\nSTDERR:\n{result.stderr}"
-
-            passed = result.exit_code == 0
-
-            return {
-                "passed": passed,
-                "output": output,
-                "exit_code": result.exit_code,
-                "duration_ms": duration_ms,
-            }
-
     except Exception as e:
         duration_ms = (time.time() - start_time) * 1000
         logger.error("Sandbox execution failed: %s", str(e))
@@ -332,26 +374,36 @@ async def write_test_node(state: DeveloperState) -> dict[str, Any]:
     }
 
 
-async def run_test_node(state: DeveloperState) -> dict[str, Any]:
-    """Execute tests in the E2B sandbox.
+async def run_test_node(
+    state: DeveloperState,
+    config: Optional[RunnableConfig] = None,  # noqa: UP045 - spelling LangGraph matches
+) -> dict[str, Any]:
+    """Execute tests in the sandbox.
 
     This node runs tests and records the results.
     In RED phase, tests should fail.
     In GREEN phase, tests should pass.
 
+    A sandbox leased for the whole Developer run is passed in through
+    config["configurable"] ("sandbox", "sandbox_workspace").
+
     Args:
         state: Current developer state
+        config: LangGraph run configuration
 
     Returns:
         State updates with test_result and incremented iteration
     """
     logger.info("Executing run_test_node, iteration: %d", state["iteration"])
 
+    configurable = (config or {}).get("configurable", {})
     result = await execute_tests_in_sandbox(
         test_code=state["test_code"],
         source_code=state["source_code"],
         test_file=state["test_file"],
         source_file=state["source_file"],
+        sandbox=configurable.get("sandbox"),
+        workspace=configurable.get("sandbox_workspace"),
     )
 
     return {
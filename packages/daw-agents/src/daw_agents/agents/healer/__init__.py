@@ -4,7 +4,7 @@ This package provides the Healer Agent (OPS-002) which implements
 error recovery workflow:
 
 1. Diagnose failed tool outputs
-2. Query Neo4j for similar past errors
+2. Query Neo4j for similar past errors (fingerprint + LSH index)
 3. Generate fixes using LLM + RAG
 4. Apply and validate fixes
 5. Store successful resolutions for future use
@@ -15,6 +15,9 @@ Key Components:
 - HealerStatus: Enum for workflow states
 - ErrorInfo: Model for error information
 - HealerResult: Model for workflow results
+- ErrorFingerprint: Normalized error identity with MinHash/LSH bands
+- ResolutionIndex: In-process LRU of recent resolutions
+- CandidateFixConfig: Settings for best-of-N parallel fix candidates
 
 Dependencies:
 - EXECUTOR-001: Developer Agent (produces failed outputs)
@@ -38,8 +41,15 @@ Example:
     result = await healer.heal(error)
 """
 
+from daw_agents.agents.healer.fingerprint import (
+    ErrorFingerprint,
+    ResolutionIndex,
+    fingerprint_error,
+    get_resolution_index,
+)
 from daw_agents.agents.healer.graph import Healer
 from daw_agents.agents.healer.models import (
+    CandidateFixConfig,
     ErrorInfo,
     FixSuggestion,
     HealerResult,
@@ -55,6 +65,11 @@ __all__ = [
     "HealerStatus",
     "HealerResult",
     "ErrorInfo",
+    "CandidateFixConfig",
+    "ErrorFingerprint",
+    "ResolutionIndex",
+    "fingerprint_error",
+    "get_resolution_index",
     "FixSuggestion",
     "KnowledgeEntry",
     "ValidationResult",
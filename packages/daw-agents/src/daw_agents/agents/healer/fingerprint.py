@@ -0,0 +1,351 @@
+"""Error fingerprinting for the Healer knowledge graph.
+
+Similar-error lookup needs a key that survives the noise in real failures
+(line numbers, temp paths, object addresses, the literal values in an
+assertion) but still separates unrelated errors:
+
+- normalize_message: Message template with literals replaced by
+  placeholders ("assert <num> == <num>")
+- normalize_frames: Stack trace reduced to "file.py:function" frames
+- ErrorFingerprint: Exact digest of (type, template, frames) plus a
+  MinHash signature and LSH band keys for near-duplicate matching
+- ResolutionIndex: In-process LRU of recent resolutions, looked up by
+  digest and LSH band
+- get_resolution_index(): Process-wide ResolutionIndex
+
+The digest and each LSH band are stored as separately indexed properties
+on ErrorResolution nodes, so a lookup is a union of index seeks rather
+than a label scan.
+
+Usage:
+    ```python
+    fingerprint = fingerprint_error("TestFailure", message, stack_trace)
+    matches = get_resolution_index().lookup(fingerprint)
+    ```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# MinHash signature of NUM_BANDS * ROWS_PER_BAND values. Two errors share at
+# least one band with probability 1 - (1 - s^4)^8 for Jaccard similarity s:
+# ~0.98 at s=0.8, ~0.5 at s=0.55, ~0.08 at s=0.3.
+NUM_BANDS = 8
+ROWS_PER_BAND = 4
+NUM_PERMUTATIONS = NUM_BANDS * ROWS_PER_BAND
+
+MAX_FRAMES = 8
+MAX_TEMPLATE_LENGTH = 300
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERMUTATIONS)
+]
+
+# Literal patterns, applied in order
+_LITERALS = [
+    (re.compile(r"'[^'\n]*'|\"[^\"\n]*\""), "<str>"),
+    (re.compile(r"(?:[A-Za-z]:)?(?:[\w.\-~]*[/\\])+[\w.\-]+"), "<path>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b"), "<hex>"),
+    (re.compile(r"\b[0-9a-fA-F]{8,}(?:-[0-9a-fA-F]{4,})*\b"), "<id>"),
+    (re.compile(r"(?<![\w<.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?(?!\.?\d)"), "<num>"),
+]
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"<\w+>|\w+|[^\w\s]")
+
+# 'File "src/calc.py", line 3, in add' (traceback) and
+# 'tests/test_calc.py:5: in test_add' (pytest --tb=short)
+_TRACEBACK_FRAME = re.compile(r'File "([^"]+)", line \d+, in ([\w<>.]+)')
+_PYTEST_FRAME = re.compile(r"^\s*([\w./\\\-]+\.py):\d+:(?:\s+in\s+([\w<>.]+))?", re.MULTILINE)
+
+
+def normalize_message(message: str) -> str:
+    """Reduce an error message to a template with literals stripped.
+
+    Args:
+        message: Raw error message
+
+    Returns:
+        Lower-cased template, e.g. "assertionerror: assert <num> == <num>"
+    """
+    template = message
+    for pattern, placeholder in _LITERALS:
+        template = pattern.sub(placeholder, template)
+    template = _WHITESPACE.sub(" ", template).strip().lower()
+    return template[:MAX_TEMPLATE_LENGTH]
+
+
+def normalize_frames(stack_trace: str) -> list[str]:
+    """Extract the innermost stack frames as "file.py:function".
+
+    Directories and line numbers are dropped so the same failure in a
+    different checkout or after an unrelated edit keeps its frames.
+
+    Args:
+        stack_trace: Python traceback or pytest output
+
+    Returns:
+        Up to MAX_FRAMES frames, outermost first
+    """
+    frames = [
+        f"{os.path.basename(path)}:{function}"
+        for path, function in _TRACEBACK_FRAME.findall(stack_trace)
+    ]
+    if not frames:
+        frames = [
+            f"{os.path.basename(path)}:{function}" if function else os.path.basename(path)
+            for path, function in _PYTEST_FRAME.findall(stack_trace)
+        ]
+    return frames[-MAX_FRAMES:]
+
+
+def _shingles(error_type: str, template: str, frames: list[str]) -> set[str]:
+    """Token bigrams of the template plus every frame and the error type."""
+    tokens = _WORD.findall(template)
+    shingles = {f"t:{a} {b}" for a, b in zip(tokens, tokens[1:], strict=False)}
+    if len(tokens) == 1:
+        shingles.add(f"t:{tokens[0]}")
+    shingles.update(f"f:{frame}" for frame in frames)
+    shingles.add(f"type:{error_type.lower()}")
+    return shingles
+
+
+def _minhash(shingles: set[str]) -> tuple[int, ...]:
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles
+    ]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def _bands(minhash: tuple[int, ...]) -> tuple[str, ...]:
+    bands = []
+    for band in range(NUM_BANDS):
+        rows = minhash[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        payload = ",".join(map(str, rows)).encode("ascii")
+        bands.append(hashlib.blake2b(payload, digest_size=8).hexdigest())
+    return tuple(bands)
+
+
+@dataclass(frozen=True)
+class ErrorFingerprint:
+    """Normalized identity of an error.
+
+    Attributes:
+        error_type: Error type/category
+        template: Message template with literals stripped
+        frames: Normalized stack frames
+        digest: SHA-256 of (type, template, frames); equal for exact repeats
+        minhash: MinHash signature over template bigrams and frames
+        bands: LSH band keys derived from the MinHash signature
+    """
+
+    error_type: str
+    template: str
+    frames: tuple[str, ...]
+    digest: str
+    minhash: tuple[int, ...]
+    bands: tuple[str, ...]
+
+    def similarity(self, other: ErrorFingerprint) -> float:
+        """Estimate Jaccard similarity from the MinHash signatures.
+
+        Args:
+            other: Fingerprint to compare with
+
+        Returns:
+            1.0 for identical digests, otherwise the fraction of equal
+            MinHash values
+        """
+        if self.digest == other.digest:
+            return 1.0
+        if len(self.minhash) != len(other.minhash) or not self.minhash:
+            return 0.0
+        same = sum(a == b for a, b in zip(self.minhash, other.minhash, strict=True))
+        return same / len(self.minhash)
+
+    def to_properties(self) -> dict[str, Any]:
+        """Node properties for an ErrorResolution, one per indexed LSH band."""
+        properties: dict[str, Any] = {
+            "fingerprint": self.digest,
+            "error_template": self.template,
+            "error_frames": list(self.frames),
+            "minhash": list(self.minhash),
+        }
+        for band, key in enumerate(self.bands):
+            properties[f"lsh_{band}"] = key
+        return properties
+
+    @classmethod
+    def from_properties(cls, properties: dict[str, Any]) -> ErrorFingerprint | None:
+        """Rebuild a fingerprint from stored node properties.
+
+        Returns:
+            The fingerprint, or None for entries stored without one
+        """
+        if not properties.get("fingerprint") or not properties.get("minhash"):
+            return None
+        return cls(
+            error_type=str(properties.get("error_type", "")),
+            template=str(properties.get("error_template", "")),
+            frames=tuple(properties.get("error_frames") or ()),
+            digest=str(properties["fingerprint"]),
+            minhash=tuple(int(v) for v in properties["minhash"]),
+            bands=tuple(str(properties.get(f"lsh_{band}", "")) for band in range(NUM_BANDS)),
+        )
+
+
+def fingerprint_error(
+    error_type: str,
+    error_message: str,
+    stack_trace: str = "",
+) -> ErrorFingerprint:
+    """Fingerprint an error from its type, message and stack trace.
+
+    Args:
+        error_type: Error type/category (e.g. "TestFailure")
+        error_message: Raw error message
+        stack_trace: Traceback or test runner output, if any
+
+    Returns:
+        The error's ErrorFingerprint
+    """
+    template = normalize_message(error_message)
+    frames = normalize_frames(stack_trace)
+    canonical = "\x1f".join([error_type, template, *frames])
+    minhash = _minhash(_shingles(error_type, template, frames))
+    return ErrorFingerprint(
+        error_type=error_type,
+        template=template,
+        frames=tuple(frames),
+        digest=hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+        minhash=minhash,
+        bands=_bands(minhash),
+    )
+
+
+class ResolutionIndex:
+    """In-process LRU of recent error resolutions with LSH lookup.
+
+    Holds the resolutions this process stored or fetched from Neo4j,
+    keyed by fingerprint digest, with a band -> digests map so near
+    duplicates are found without comparing against every entry.
+
+    Usage:
+        ```python
+        index = ResolutionIndex(max_entries=256)
+        index.add(fingerprint, {"fix_description": "...", "fixed_code": "..."})
+        matches = index.lookup(fingerprint)
+        ```
+    """
+
+    def __init__(self, max_entries: int = 512, min_similarity: float = 0.5) -> None:
+        """Initialize the index.
+
+        Args:
+            max_entries: Resolutions kept before the least recently used
+                is evicted
+            min_similarity: Estimated Jaccard similarity a match needs
+        """
+        self.max_entries = max_entries
+        self.min_similarity = min_similarity
+        self._entries: OrderedDict[str, tuple[ErrorFingerprint, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._buckets: dict[tuple[int, str], set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, fingerprint: ErrorFingerprint, resolution: dict[str, Any]) -> None:
+        """Add or replace the resolution for a fingerprint.
+
+        Args:
+            fingerprint: Fingerprint of the resolved error
+            resolution: Resolution as returned by query_similar_errors
+        """
+        if fingerprint.digest in self._entries:
+            self._entries.move_to_end(fingerprint.digest)
+        else:
+            for bucket in enumerate(fingerprint.bands):
+                self._buckets.setdefault(bucket, set()).add(fingerprint.digest)
+        self._entries[fingerprint.digest] = (fingerprint, dict(resolution))
+
+        while len(self._entries) > self.max_entries:
+            digest, (evicted, _) = self._entries.popitem(last=False)
+            for bucket in enumerate(evicted.bands):
+                members = self._buckets.get(bucket)
+                if members is not None:
+                    members.discard(digest)
+                    if not members:
+                        del self._buckets[bucket]
+
+    def lookup(self, fingerprint: ErrorFingerprint, limit: int = 5) -> list[dict[str, Any]]:
+        """Find resolutions of the same or similar errors.
+
+        Args:
+            fingerprint: Fingerprint of the error to heal
+            limit: Maximum number of matches
+
+        Returns:
+            Copies of the matching resolutions, most similar first, each
+            with its estimated "similarity"
+        """
+        candidates: set[str] = set()
+        if fingerprint.digest in self._entries:
+            candidates.add(fingerprint.digest)
+        for bucket in enumerate(fingerprint.bands):
+            candidates.update(self._buckets.get(bucket, ()))
+
+        scored = []
+        for digest in candidates:
+            stored, resolution = self._entries[digest]
+            score = fingerprint.similarity(stored)
+            if score >= self.min_similarity:
+                scored.append((score, digest, resolution))
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        matches = []
+        for score, digest, resolution in scored[:limit]:
+            self._entries.move_to_end(digest)
+            matches.append({**resolution, "similarity": score})
+        return matches
+
+    def clear(self) -> None:
+        """Remove every resolution."""
+        self._entries.clear()
+        self._buckets.clear()
+
+
+_index: ResolutionIndex | None = None
+
+
+def get_resolution_index() -> ResolutionIndex:
+    """Get the process-wide resolution index (created on first use).
+
+    Returns:
+        The shared ResolutionIndex
+    """
+    global _index
+    if _index is None:
+        _index = ResolutionIndex()
+    return _index
+
+
+__all__ = [
+    "NUM_BANDS",
+    "ErrorFingerprint",
+    "ResolutionIndex",
+    "fingerprint_error",
+    "get_resolution_index",
+    "normalize_frames",
+    "normalize_message",
+]
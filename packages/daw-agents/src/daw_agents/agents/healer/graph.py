@@ -25,6 +25,11 @@ Workflow Graph:
                                            |-> complete (END) - fix worked
                                            |-> suggest_fix (retry loop)
                                            |-> error (END) - max attempts
+
+In best-of-N mode (candidates > 1) a single heal_candidates node replaces
+suggest_fix -> apply_fix -> validate_fix: it generates N diverse fixes
+concurrently (different temperatures, primary and fallback models),
+validates each in its own sandbox and keeps the first one that passes.
 """
 
 from __future__ import annotations
@@ -34,10 +39,12 @@ from typing import TYPE_CHECKING, Any
 
 from langgraph.graph import END, START, StateGraph
 
-from daw_agents.agents.healer.models import ErrorInfo, HealerResult
+from daw_agents.agents.healer.models import CandidateFixConfig, ErrorInfo, HealerResult
 from daw_agents.agents.healer.nodes import (
     apply_fix_node,
+    candidate_model_configs,
     diagnose_error_node,
+    heal_candidates_node,
     query_knowledge_graph_node,
     route_after_apply_fix,
     route_after_diagnose,
@@ -79,6 +86,8 @@ class Healer:
         graph: Compiled LangGraph workflow
         neo4j_connector: Optional Neo4j connector for knowledge graph
         mcp_client: Optional MCP client for tool integration
+        candidates: Fix candidates generated and validated per attempt
+        candidate_config: Diversity, timeout and selection for candidates
 
     Example:
         healer = Healer()
@@ -102,6 +111,8 @@ class Healer:
         max_attempts: int = 3,
         neo4j_connector: Neo4jConnector | None = None,
         mcp_client: MCPClient | None = None,
+        candidates: int = 1,
+        candidate_config: CandidateFixConfig | None = None,
     ) -> None:
         """Initialize the Healer Agent.
 
@@ -110,12 +121,18 @@ class Healer:
             max_attempts: Maximum healing attempts to prevent infinite loops (default: 3)
             neo4j_connector: Optional Neo4j connector for knowledge graph queries
             mcp_client: Optional MCP client for tool calls
+            candidates: Generate and validate this many fix candidates
+                concurrently per attempt (1 keeps the serial workflow)
+            candidate_config: Temperatures, model alternation, timeout and
+                selection for candidates (defaults apply if None)
         """
         self.router = router or ModelRouter()
         self.task_type = TaskType.CODING
         self.max_attempts = max_attempts
         self.neo4j_connector = neo4j_connector
         self.mcp_client = mcp_client
+        self.candidates = max(1, candidates)
+        self.candidate_config = candidate_config or CandidateFixConfig()
         self.graph = self._build_graph()
 
         logger.info(
@@ -134,6 +151,9 @@ class Healer:
                                                |-> suggest_fix (retry)
                                                |-> error (END)
 
+        With candidates > 1 the fix steps are one node:
+        ... query_knowledge_graph -> heal_candidates -> [conditional edges]
+
         Returns:
             Compiled LangGraph workflow
         """
@@ -143,6 +163,10 @@ class Healer:
         # Add nodes for each healing step
         workflow.add_node("diagnose_error", diagnose_error_node)
         workflow.add_node("query_knowledge_graph", query_knowledge_graph_node)
+
+        if self.candidates > 1:
+            return self._compile_best_of_n(workflow)
+
         workflow.add_node("suggest_fix", suggest_fix_node)
         workflow.add_node("apply_fix", apply_fix_node)
         workflow.add_node("validate_fix", validate_fix_node)
@@ -200,6 +224,37 @@ class Healer:
         # Compile the graph
         return workflow.compile()
 
+    def _compile_best_of_n(self, workflow: StateGraph) -> Any:
+        """Finish the graph with one node running all candidates per attempt.
+
+        Generating, applying and validating every candidate inside a single
+        node lets the first passing candidate cancel the rest.
+        """
+        workflow.add_node("heal_candidates", heal_candidates_node)
+
+        workflow.add_edge(START, "diagnose_error")
+        workflow.add_conditional_edges(
+            "diagnose_error",
+            route_after_diagnose,
+            {"query_knowledge": "query_knowledge_graph"},
+        )
+        workflow.add_conditional_edges(
+            "query_knowledge_graph",
+            route_after_query_knowledge,
+            {"suggest_fix": "heal_candidates"},
+        )
+        workflow.add_conditional_edges(
+            "heal_candidates",
+            route_after_validate,
+            {
+                "complete": END,
+                "error": END,
+                "suggest_fix": "heal_candidates",
+            },
+        )
+
+        return workflow.compile()
+
     def configure_neo4j(self, neo4j_connector: Neo4jConnector) -> None:
         """Configure Neo4j connector for knowledge graph queries.
 
@@ -256,7 +311,19 @@ class Healer:
         }
 
         # Run the workflow
-        final_state = await self.graph.ainvoke(initial_state)
+        final_state = await self.graph.ainvoke(
+            initial_state,
+            config={
+                "configurable": {
+                    "fix_candidates": self.candidate_config,
+                    "fix_candidate_models": candidate_model_configs(
+                        self.router.get_config_for_task(TaskType.CODING),
+                        self.candidates,
+                        self.candidate_config,
+                    ),
+                }
+            },
+        )
 
         # Determine success based on final status
         status = final_state.get("status", "error")
@@ -327,6 +394,7 @@ class Healer:
         similar_errors = await query_similar_errors(
             error_signature=analysis.get("error_signature", ""),
             error_type=error_info.error_type,
+            error_info=error_info.model_dump(),
         )
 
         return {
@@ -8,6 +8,7 @@ This module defines the data models used by the Healer Agent:
 - KnowledgeEntry: Stored error resolution for future RAG
 - ValidationResult: Result of running validation tests
 - HealerResult: Final result of the healing workflow
+- CandidateFixConfig: Diversity and selection settings for best-of-N healing
 
 The Healer Agent implements error recovery workflow and uses
 TaskType.CODING for model routing to generate fixes.
@@ -15,12 +16,13 @@ TaskType.CODING for model routing to generate fixes.
 
 from __future__ import annotations
 
-import hashlib
 from datetime import datetime
 from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from daw_agents.agents.healer.fingerprint import ErrorFingerprint, fingerprint_error
+
 
 class HealerStatus(str, Enum):
     """Status enum for Healer Agent workflow states.
@@ -67,22 +69,25 @@ class ErrorInfo(BaseModel):
     source_code: str = Field(default="", description="Current source code")
     test_code: str = Field(default="", description="Test code that's failing")
 
+    def to_fingerprint(self) -> ErrorFingerprint:
+        """Fingerprint this error for exact and near-duplicate matching.
+
+        Returns:
+            ErrorFingerprint over the message template and stack frames
+        """
+        return fingerprint_error(self.error_type, self.error_message, self.stack_trace)
+
     def to_signature(self) -> str:
         """Generate an error signature for matching similar errors.
 
-        Creates a normalized hash of error type and key parts of the message
-        to enable finding similar past errors in the knowledge graph.
+        The signature is the error type plus a prefix of the fingerprint
+        digest, so errors differing only in literals (numbers, paths,
+        quoted values) or line numbers share a signature.
 
         Returns:
             A string signature representing this error pattern
         """
-        # Normalize error message by removing specific values
-        normalized_message = self.error_message.lower()
-        # Create signature from error type and normalized message start
-        signature_base = f"{self.error_type}:{normalized_message[:100]}"
-        # Hash for consistency
-        signature_hash = hashlib.md5(signature_base.encode()).hexdigest()[:16]
-        return f"{self.error_type}:{signature_hash}"
+        return f"{self.error_type}:{self.to_fingerprint().digest[:16]}"
 
 
 class FixSuggestion(BaseModel):
@@ -195,3 +200,27 @@ class HealerResult(BaseModel):
         default=None, description="ID of knowledge entry created"
     )
     error: str | None = Field(default=None, description="Error message if failed")
+
+
+class CandidateFixConfig(BaseModel):
+    """Configuration for generating and validating fix candidates concurrently.
+
+    Candidate i uses temperatures[i % len(temperatures)]; with
+    alternate_models, odd candidates swap the coding task's primary and
+    fallback models so the pool mixes both.
+
+    Attributes:
+        temperatures: Sampling temperatures cycled across candidates
+        alternate_models: Generate odd candidates with the fallback model
+        candidate_timeout: Seconds allowed for one candidate to be
+            generated, applied and validated
+        wait_for_all: Validate every candidate and pick the passing one
+            with the highest confidence instead of the first to pass
+    """
+
+    temperatures: list[float] = Field(
+        default_factory=lambda: [0.2, 0.7, 1.0], min_length=1
+    )
+    alternate_models: bool = True
+    candidate_timeout: float = Field(default=180.0, gt=0)
+    wait_for_all: bool = False
@@ -3,10 +3,12 @@
 This module implements the node functions for the error recovery workflow:
 
 1. diagnose_error_node: Analyze the failed tool output
-2. query_knowledge_graph_node: Search Neo4j for similar errors
+2. query_knowledge_graph_node: Search Neo4j for similar errors (by fingerprint)
 3. suggest_fix_node: Generate fix using LLM
 4. apply_fix_node: Apply the suggested fix
 5. validate_fix_node: Run tests to verify the fix
+6. heal_candidates_node: Steps 3-5 for N diverse candidates concurrently
+   (best-of-N mode)
 
 And routing functions:
 - route_after_diagnose: Go to query_knowledge
@@ -23,15 +25,27 @@ Dependencies:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any
-
-from daw_agents.agents.healer.models import ErrorInfo
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from daw_agents.agents.healer.fingerprint import (
+    NUM_BANDS,
+    ErrorFingerprint,
+    fingerprint_error,
+    get_resolution_index,
+)
+from daw_agents.agents.healer.models import CandidateFixConfig, ErrorInfo
 from daw_agents.agents.healer.state import HealerState
 from daw_agents.memory.neo4j import Neo4jConfig, Neo4jConnector
+from daw_agents.models.providers import ModelConfig, get_default_configs
 from daw_agents.models.router import ModelRouter, TaskType
-from daw_agents.sandbox.e2b import E2BSandbox, SandboxConfig
+from daw_agents.sandbox.registry import SandboxBackend, SandboxRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -66,68 +80,139 @@ async def analyze_error(
     }
 
 
+_RESOLUTION_INDEXES = ("fingerprint", "error_signature") + tuple(
+    f"lsh_{band}" for band in range(NUM_BANDS)
+)
+_indexes_ready = False
+
+
+def _get_connector() -> Neo4jConnector:
+    """Get the Neo4j connector configured from the environment."""
+    # Note: VPS may be unreachable (72.60.204.156:7687), callers handle errors
+    config = Neo4jConfig(
+        uri=os.environ.get("NEO4J_URI", "bolt://72.60.204.156:7687"),
+        user=os.environ.get("NEO4J_USER", "neo4j"),
+        password=os.environ.get("NEO4J_PASSWORD", "daw_graph_2024"),
+    )
+    return Neo4jConnector.get_instance(config)
+
+
+async def ensure_resolution_indexes(connector: Neo4jConnector) -> None:
+    """Create the ErrorResolution property indexes (once per process).
+
+    Every property a similar-error lookup matches on (fingerprint digest,
+    legacy signature and each LSH band) gets its own range index.
+
+    Args:
+        connector: Connected Neo4j connector
+    """
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    for prop in _RESOLUTION_INDEXES:
+        await connector.query(
+            f"CREATE INDEX error_resolution_{prop} IF NOT EXISTS "
+            f"FOR (e:ErrorResolution) ON (e.{prop})"
+        )
+    _indexes_ready = True
+
+
+def _resolution_from_properties(properties: dict[str, Any]) -> dict[str, Any]:
+    """Shape a stored ErrorResolution as a similar-error result."""
+    return {
+        "id": properties.get("id"),
+        "signature": properties.get("error_signature"),
+        "type": properties.get("error_type"),
+        "fix_description": properties.get("fix_description"),
+        "fixed_code": properties.get("fixed_code"),
+        "created_at": properties.get("created_at"),
+    }
+
+
 async def query_similar_errors(
     error_signature: str,
     error_type: str,
+    error_info: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    """Query Neo4j for similar past errors.
+    """Query for similar past errors by fingerprint.
 
     This function is called by query_knowledge_graph_node and can be mocked in tests.
 
+    The error is fingerprinted (message template, normalized frames,
+    MinHash/LSH bands). Recent resolutions in the in-process index are
+    returned without a round trip; otherwise Neo4j is queried with
+    equality matches on indexed properties only, and the candidates are
+    ranked by estimated similarity and added to the in-process index.
+
     Args:
-        error_signature: Normalized error signature
+        error_signature: Error signature from ErrorInfo.to_signature()
         error_type: Type of error
+        error_info: Full error details; without them only an exact
+            signature match is possible
 
     Returns:
-        List of similar error resolutions from knowledge graph
+        List of similar error resolutions, most similar first
     """
     logger.info("Querying knowledge graph for: %s", error_signature)
 
-    # Try to query Neo4j for similar errors
-    # Note: VPS may be unreachable (72.60.204.156:7687), so handle gracefully
-    try:
-        # Get Neo4j configuration from environment or use defaults
-        neo4j_uri = os.environ.get("NEO4J_URI", "bolt://72.60.204.156:7687")
-        neo4j_user = os.environ.get("NEO4J_USER", "neo4j")
-        neo4j_password = os.environ.get("NEO4J_PASSWORD", "daw_graph_2024")
-
-        config = Neo4jConfig(
-            uri=neo4j_uri,
-            user=neo4j_user,
-            password=neo4j_password,
-        )
+    info = error_info or {}
+    fingerprint = fingerprint_error(
+        error_type,
+        info.get("error_message", ""),
+        info.get("stack_trace", ""),
+    )
+    index = get_resolution_index()
+    if error_info is not None:
+        matches = index.lookup(fingerprint)
+        if matches:
+            logger.info("Found %d similar errors in resolution index", len(matches))
+            return matches
 
-        connector = Neo4jConnector.get_instance(config)
+    try:
+        connector = _get_connector()
 
         # Check connectivity before querying
         if not await connector.is_connected():
             logger.warning("Neo4j not connected, returning empty results")
             return []
 
-        # Query for similar errors by signature and type
-        cypher = """
+        await ensure_resolution_indexes(connector)
+
+        # An OR of equality predicates on indexed properties plans as a
+        # union of index seeks; LSH bands only apply with full error details
+        predicates = ["e.error_signature = $signature"]
+        params: dict[str, Any] = {"signature": error_signature}
+        if error_info is not None:
+            predicates.append("e.fingerprint = $fingerprint")
+            params["fingerprint"] = fingerprint.digest
+            for band, key in enumerate(fingerprint.bands):
+                predicates.append(f"e.lsh_{band} = $lsh_{band}")
+                params[f"lsh_{band}"] = key
+        cypher = f"""
             MATCH (e:ErrorResolution)
-            WHERE e.error_type = $error_type
-               OR e.error_signature CONTAINS $signature_part
-            RETURN e.error_signature as signature,
-                   e.error_type as type,
-                   e.fix_description as fix_description,
-                   e.fixed_code as fixed_code,
-                   e.created_at as created_at
-            ORDER BY e.created_at DESC
-            LIMIT 5
+            WHERE {" OR ".join(predicates)}
+            RETURN properties(e) AS e
+            LIMIT 50
         """
 
-        # Use first 50 chars of signature for fuzzy matching
-        signature_part = error_signature[:50] if len(error_signature) > 50 else error_signature
-
-        results = await connector.query(
-            cypher,
-            params={"error_type": error_type, "signature_part": signature_part},
-        )
-
-        logger.info("Found %d similar errors in knowledge graph", len(results))
-        return results
+        records = await connector.query(cypher, params=params)
+
+        scored = []
+        for record in records:
+            properties = record["e"]
+            resolution = _resolution_from_properties(properties)
+            stored = ErrorFingerprint.from_properties(properties)
+            if stored is None:
+                score = 1.0 if properties.get("error_signature") == error_signature else 0.0
+            else:
+                score = fingerprint.similarity(stored) if error_info is not None else 1.0
+                index.add(stored, resolution)
+            if score >= index.min_similarity:
+                scored.append({**resolution, "similarity": score})
+        scored.sort(key=lambda r: r["similarity"], reverse=True)
+
+        logger.info("Found %d similar errors in knowledge graph", len(scored))
+        return scored[:5]
 
     except Exception as e:
         # Neo4j VPS may be unreachable - graceful fallback
@@ -139,6 +224,7 @@ async def generate_fix_suggestion(
     error_info: dict[str, Any],
     similar_errors: list[dict[str, Any]],
     previous_attempts: int,
+    model_config: ModelConfig | None = None,
 ) -> dict[str, Any]:
     """Generate a fix suggestion using LLM.
 
@@ -148,6 +234,8 @@ async def generate_fix_suggestion(
         error_info: Dictionary containing error details
         similar_errors: List of similar past errors with resolutions
         previous_attempts: Number of previous fix attempts
+        model_config: Coding model and temperature to use instead of the
+            default (best-of-N candidates)
 
     Returns:
         Dictionary with fix suggestion details
@@ -200,7 +288,12 @@ FIXED_CODE:
 
     try:
         # Use ModelRouter with TaskType.CODING for fix generation
-        router = ModelRouter()
+        if model_config is None:
+            router = ModelRouter()
+        else:
+            router = ModelRouter(
+                configs={**get_default_configs(), TaskType.CODING: model_config}
+            )
         response = await router.route(
             task_type=TaskType.CODING,
             messages=[
@@ -312,9 +405,8 @@ async def run_validation_tests(
     start_time = time.time()
 
     try:
-        # Get E2B API key from environment
-        e2b_api_key = os.environ.get("E2B_API_KEY")
-        if not e2b_api_key:
+        backend = SandboxRegistry.backend_from_env()
+        if backend is SandboxBackend.E2B and not os.environ.get("E2B_API_KEY"):
             logger.warning("E2B_API_KEY not set, cannot run validation tests")
             return {
                 "passed": False,
@@ -323,26 +415,14 @@ async def run_validation_tests(
                 "duration_ms": 0.0,
             }
 
-        config = SandboxConfig(
-            api_key=e2b_api_key,
-            timeout=120,  # 2 minute timeout for test execution
-        )
-
-        async with E2BSandbox(config) as sandbox:
-            # Write the fixed source code to sandbox
+        async with SandboxRegistry.create(backend) as sandbox:
+            # Upload the fixed source and test code and run pytest in one call
+            # Use PYTHONPATH to include /tmp so imports work
             sandbox_source_file = f"/tmp/{source_file.split('/')[-1]}"
-            await sandbox.write_file(sandbox_source_file, fixed_code)
-            logger.debug("Wrote fixed code to sandbox: %s", sandbox_source_file)
-
-            # Write the test code to sandbox
             sandbox_test_file = f"/tmp/{test_file.split('/')[-1]}"
-            await sandbox.write_file(sandbox_test_file, test_code)
-            logger.debug("Wrote test code to sandbox: %s", sandbox_test_file)
-
-            # Run pytest on the test file
-            # Use PYTHONPATH to include /tmp so imports work
-            result = await sandbox.run_command(
+            result = await sandbox.run_script(
                 f"cd /tmp && PYTHONPATH=/tmp python -m pytest {sandbox_test_file} -v --tb=short",
+                files={sandbox_source_file: fixed_code, sandbox_test_file: test_code},
                 timeout=60,
             )
 
@@ -385,26 +465,68 @@ async def store_to_neo4j(
     error_type: str,
     fix_description: str,
     fixed_code: str,
+    fingerprint: ErrorFingerprint | None = None,
 ) -> str:
     """Store a successful resolution in Neo4j.
 
     This function is called by store_resolution and can be mocked in tests.
 
+    The ErrorResolution node is merged on its fingerprint digest (or the
+    signature when no fingerprint is given), so healing the same error
+    again updates the stored fix and bumps success_count instead of
+    adding a duplicate. The fingerprint's digest and LSH bands are stored
+    as indexed properties. If Neo4j is unreachable the entry ID is still
+    returned and the resolution lives only in the in-process index.
+
     Args:
         error_signature: Error signature for matching
         error_type: Type of error
         fix_description: Description of the fix
         fixed_code: The code that fixed the error
+        fingerprint: Fingerprint of the resolved error
 
     Returns:
-        ID of the created knowledge entry
+        ID of the created or updated knowledge entry
     """
     logger.info("Storing resolution to Neo4j for: %s", error_type)
 
-    # In production, this would use Neo4j connector (DB-001)
-    import uuid
+    entry_id = f"entry-{uuid.uuid4().hex[:8]}"
+    now = datetime.utcnow().isoformat()
+    properties: dict[str, Any] = {
+        "error_signature": error_signature,
+        "error_type": error_type,
+        "fix_description": fix_description,
+        "fixed_code": fixed_code,
+        "last_used_at": now,
+    }
+    if fingerprint is not None:
+        properties.update(fingerprint.to_properties())
+        merge_key = "fingerprint"
+    else:
+        merge_key = "error_signature"
 
-    return f"entry-{uuid.uuid4().hex[:8]}"
+    try:
+        connector = _get_connector()
+        if not await connector.is_connected():
+            logger.warning("Neo4j not connected, resolution not persisted")
+            return entry_id
+
+        await ensure_resolution_indexes(connector)
+        records = await connector.query(
+            f"""
+            MERGE (e:ErrorResolution {{{merge_key}: $key}})
+            ON CREATE SET e.id = $id, e.created_at = $now, e.success_count = 0
+            SET e += $props, e.success_count = e.success_count + 1
+            RETURN e.id AS id
+            """,
+            params={"key": properties[merge_key], "id": entry_id, "now": now, "props": properties},
+        )
+        if records and records[0].get("id"):
+            entry_id = str(records[0]["id"])
+    except Exception as e:
+        logger.warning("Failed to store resolution in Neo4j: %s", str(e))
+
+    return entry_id
 
 
 async def store_resolution(
@@ -414,6 +536,9 @@ async def store_resolution(
 ) -> str:
     """Store a successful error resolution in Neo4j knowledge graph.
 
+    The resolution is also added to the in-process resolution index so
+    the next occurrence of the error is answered without a query.
+
     Args:
         error_info: The original error information
         fix_description: Description of how the error was fixed
@@ -423,12 +548,26 @@ async def store_resolution(
         ID of the created knowledge entry
     """
     signature = error_info.to_signature()
+    fingerprint = error_info.to_fingerprint()
 
     entry_id = await store_to_neo4j(
         error_signature=signature,
         error_type=error_info.error_type,
         fix_description=fix_description,
         fixed_code=fixed_code,
+        fingerprint=fingerprint,
+    )
+
+    get_resolution_index().add(
+        fingerprint,
+        {
+            "id": entry_id,
+            "signature": signature,
+            "type": error_info.error_type,
+            "fix_description": fix_description,
+            "fixed_code": fixed_code,
+            "created_at": datetime.utcnow().isoformat(),
+        },
     )
 
     logger.info("Stored resolution with ID: %s", entry_id)
@@ -491,6 +630,7 @@ async def query_knowledge_graph_node(state: HealerState) -> dict[str, Any]:
     similar_errors = await query_similar_errors(
         error_signature=error_signature,
         error_type=error_type,
+        error_info=error_info,
     )
 
     logger.info("Found %d similar errors", len(similar_errors))
@@ -583,6 +723,209 @@ async def validate_fix_node(state: HealerState) -> dict[str, Any]:
     }
 
 
+# =============================================================================
+# Best-of-N Candidates
+# =============================================================================
+
+
+def candidate_model_configs(
+    base: ModelConfig,
+    count: int,
+    config: CandidateFixConfig | None = None,
+) -> list[ModelConfig]:
+    """Build diverse coding model configs for best-of-N fix candidates.
+
+    Args:
+        base: Coding task config the candidates are derived from
+        count: Number of candidates
+        config: Temperatures and model alternation (defaults apply if None)
+
+    Returns:
+        One ModelConfig per candidate
+    """
+    config = config or CandidateFixConfig()
+    configs = []
+    for index in range(count):
+        primary, fallback = base.primary, base.fallback
+        if config.alternate_models and index % 2 == 1:
+            primary, fallback = fallback, primary
+        configs.append(
+            ModelConfig(
+                primary=primary,
+                fallback=fallback,
+                max_tokens=base.max_tokens,
+                temperature=config.temperatures[index % len(config.temperatures)],
+            )
+        )
+    return configs
+
+
+async def _run_candidate(
+    state: HealerState,
+    model_config: ModelConfig,
+) -> dict[str, Any]:
+    """Generate, apply and validate one fix candidate."""
+    error_info = state["error_info"]
+    fix_suggestion = await generate_fix_suggestion(
+        error_info=error_info,
+        similar_errors=state["similar_errors"],
+        previous_attempts=state["attempt"],
+        model_config=model_config,
+    )
+    fixed_code = await apply_code_fix(
+        source_code=error_info.get("source_code", ""),
+        fix_suggestion=fix_suggestion,
+    )
+    validation_result = await run_validation_tests(
+        fixed_code=fixed_code,
+        test_code=error_info.get("test_code", ""),
+        source_file=error_info.get("source_file", ""),
+        test_file=error_info.get("test_file", ""),
+    )
+    return {
+        "fix_suggestion": fix_suggestion,
+        "fixed_code": fixed_code,
+        "validation_result": validation_result,
+    }
+
+
+def _confidence(candidate: dict[str, Any]) -> float:
+    return float(candidate["fix_suggestion"].get("confidence", 0.0))
+
+
+async def run_fix_candidates(
+    state: HealerState,
+    model_configs: list[ModelConfig],
+    config: CandidateFixConfig | None = None,
+) -> dict[str, Any] | None:
+    """Generate and validate fix candidates concurrently and pick one.
+
+    Each candidate runs suggest -> apply -> validate in its own task (and
+    its own sandbox). The first candidate to pass wins and the others are
+    cancelled; with config.wait_for_all, every candidate finishes and the
+    passing one with the highest confidence wins. If none pass, the
+    highest-confidence failed candidate is returned so the next attempt
+    has something to report.
+
+    Args:
+        state: Current healer state
+        model_configs: Coding model config for each candidate
+        config: Timeout and selection behaviour (defaults apply if None)
+
+    Returns:
+        The chosen candidate (fix_suggestion, fixed_code, validation_result
+        and its index as "candidate"), or None if every candidate errored
+    """
+    config = config or CandidateFixConfig()
+    tasks = {
+        asyncio.create_task(
+            asyncio.wait_for(_run_candidate(state, model_config), config.candidate_timeout)
+        ): index
+        for index, model_config in enumerate(model_configs)
+    }
+
+    finished: list[dict[str, Any]] = []
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=tasks.__getitem__):
+                index = tasks[task]
+                try:
+                    candidate = {**task.result(), "candidate": index}
+                except TimeoutError:
+                    logger.warning(
+                        "Fix candidate %d timed out after %g seconds",
+                        index,
+                        config.candidate_timeout,
+                    )
+                    continue
+                except Exception as e:
+                    logger.warning("Fix candidate %d failed: %s", index, e)
+                    continue
+                finished.append(candidate)
+
+            if pending and not config.wait_for_all and any(
+                c["validation_result"].get("passed") for c in finished
+            ):
+                logger.info(
+                    "Fix candidate passed - cancelling %d running candidate(s)",
+                    len(pending),
+                )
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    passing = [c for c in finished if c["validation_result"].get("passed")]
+    if passing and not config.wait_for_all:
+        return passing[0]
+    pool = passing or finished
+    return max(pool, key=_confidence) if pool else None
+
+
+async def heal_candidates_node(
+    state: HealerState,
+    config: Optional[RunnableConfig] = None,  # noqa: UP045 - spelling LangGraph matches
+) -> dict[str, Any]:
+    """Generate, apply and validate N diverse fix candidates concurrently.
+
+    Replaces the suggest_fix -> apply_fix -> validate_fix chain in the
+    best-of-N graph; one round counts as one attempt. The candidate model
+    configs and CandidateFixConfig come from the "fix_candidate_models"
+    and "fix_candidates" entries of the run's configurable settings.
+
+    Args:
+        state: Current healer state
+        config: LangGraph run configuration
+
+    Returns:
+        State updates with the chosen fix, its validation result and
+        incremented attempt
+    """
+    configurable = (config or {}).get("configurable", {})
+    candidate_config = configurable.get("fix_candidates")
+    model_configs = configurable.get("fix_candidate_models") or candidate_model_configs(
+        get_default_configs()[TaskType.CODING], 3, candidate_config
+    )
+
+    logger.info(
+        "Executing heal_candidates_node with %d candidates, attempt: %d",
+        len(model_configs),
+        state["attempt"],
+    )
+    chosen = await run_fix_candidates(state, model_configs, candidate_config)
+
+    if chosen is None:
+        return {
+            "fix_suggestion": None,
+            "fixed_code": state["error_info"].get("source_code", ""),
+            "validation_result": {
+                "passed": False,
+                "output": "All fix candidates failed",
+                "exit_code": 1,
+                "duration_ms": 0.0,
+            },
+            "status": "validate",
+            "attempt": state["attempt"] + 1,
+        }
+
+    logger.info(
+        "Selected fix candidate %d (passed=%s, confidence=%.2f)",
+        chosen["candidate"],
+        chosen["validation_result"].get("passed", False),
+        _confidence(chosen),
+    )
+    return {
+        "fix_suggestion": {**chosen["fix_suggestion"], "candidate": chosen["candidate"]},
+        "fixed_code": chosen["fixed_code"],
+        "validation_result": chosen["validation_result"],
+        "status": "validate",
+        "attempt": state["attempt"] + 1,
+    }
+
+
 # =============================================================================
 # Routing Functions
 # =============================================================================
@@ -16,6 +16,7 @@ Public API (VALIDATOR-001):
 - SecurityFinding: Individual security vulnerability
 - StyleIssue: Code style/linting issue
 - TestResult: Test execution results
+- ParallelValidationConfig: Stage timeouts for parallel validation
 
 Public API (VALIDATOR-002 - Multi-Model Ensemble):
 - ValidationEnsemble: Ensemble validation with 2+ models
@@ -25,9 +26,22 @@ Public API (VALIDATOR-002 - Multi-Model Ensemble):
 - VotingStrategy: Enum for voting strategies (majority, unanimous, weighted)
 - ValidationType: Enum for validation context types
 - ConsensusStatus: Enum for consensus outcomes
+
+Public API (test execution):
+- ValidationWorkerPool: Warm pytest worker processes running validation tests
+- ValidationPoolStats: Job, timeout and crash statistics for the pool
+- get_validation_pool: Process-wide worker pool used by run_pytest
+- ValidationCache: Content-addressed cache of stage results (memory + Redis/disk)
+- get_validation_cache: Process-wide cache used by the validation stages
+- make_validation_key: Key over code, tests, tool versions and config
 """
 
 from daw_agents.agents.validator.agent import ValidatorAgent
+from daw_agents.agents.validator.cache import (
+    ValidationCache,
+    get_validation_cache,
+    make_validation_key,
+)
 from daw_agents.agents.validator.ensemble import (
     ConsensusStatus,
     EnsembleConfig,
@@ -38,11 +52,17 @@ from daw_agents.agents.validator.ensemble import (
     VotingStrategy,
 )
 from daw_agents.agents.validator.models import (
+    ParallelValidationConfig,
     SecurityFinding,
     StyleIssue,
     TestResult,
     ValidationResult,
 )
+from daw_agents.agents.validator.runner import (
+    ValidationPoolStats,
+    ValidationWorkerPool,
+    get_validation_pool,
+)
 from daw_agents.agents.validator.state import ValidationState
 
 __all__ = [
@@ -53,6 +73,7 @@ __all__ = [
     "SecurityFinding",
     "StyleIssue",
     "TestResult",
+    "ParallelValidationConfig",
     # VALIDATOR-002 - Multi-Model Ensemble
     "ValidationEnsemble",
     "EnsembleConfig",
@@ -61,4 +82,11 @@ __all__ = [
     "VotingStrategy",
     "ValidationType",
     "ConsensusStatus",
+    # Test execution
+    "ValidationWorkerPool",
+    "ValidationPoolStats",
+    "get_validation_pool",
+    "ValidationCache",
+    "get_validation_cache",
+    "make_validation_key",
 ]
@@ -16,6 +16,10 @@ Workflow States:
 - policy_check: Check code style/linting
 - generate_report: Generate validation report
 - route_decision: Decide next step (approve/retry/escalate)
+
+In parallel mode a single parallel_checks node runs the test, security
+and policy stages concurrently over a shared workspace, with per-stage
+timeouts, and generate_report joins their results.
 """
 
 from __future__ import annotations
@@ -25,9 +29,10 @@ from typing import Any
 
 from langgraph.graph import END, START, StateGraph
 
-from daw_agents.agents.validator.models import ValidationResult
+from daw_agents.agents.validator.models import ParallelValidationConfig, ValidationResult
 from daw_agents.agents.validator.nodes import (
     generate_report_node,
+    parallel_checks_node,
     policy_check_node,
     route_decision,
     run_tests_node,
@@ -59,6 +64,8 @@ class ValidatorAgent:
         max_retries: Maximum retry attempts for fixable issues
         graph: Compiled LangGraph workflow
         mcp_client: Optional MCP client for tool integration
+        parallel: Whether stages 1-3 run concurrently
+        parallel_config: Stage timeouts and cancellation for parallel mode
 
     Example:
         agent = ValidatorAgent()
@@ -75,6 +82,8 @@ class ValidatorAgent:
         router: ModelRouter | None = None,
         max_retries: int = 3,
         mcp_client: MCPClient | None = None,
+        parallel: bool = False,
+        parallel_config: ParallelValidationConfig | None = None,
     ) -> None:
         """Initialize the ValidatorAgent.
 
@@ -82,11 +91,16 @@ class ValidatorAgent:
             router: Optional ModelRouter instance. If None, creates a new one.
             max_retries: Maximum retry attempts for fixable issues (default: 3)
             mcp_client: Optional MCP client for tool integration
+            parallel: Run tests, security scan and policy check concurrently
+            parallel_config: Stage timeouts for parallel mode (defaults apply
+                if None)
         """
         self.router = router or ModelRouter()
         self.task_type = TaskType.VALIDATION
         self.max_retries = max_retries
         self.mcp_client = mcp_client
+        self.parallel = parallel
+        self.parallel_config = parallel_config or ParallelValidationConfig()
         self.graph = self._build_graph()
 
         logger.info(
@@ -101,23 +115,33 @@ class ValidatorAgent:
         START -> run_tests -> security_scan -> policy_check ->
         generate_report -> route_decision -> (end/retry/escalate)
 
+        In parallel mode the first three steps are one node:
+        START -> parallel_checks -> generate_report -> route_decision
+
         Returns:
             Compiled LangGraph workflow
         """
         # Create the state graph
         workflow = StateGraph(ValidationState)
-
-        # Add nodes for each validation step
-        workflow.add_node("run_tests", run_tests_node)
-        workflow.add_node("security_scan", security_scan_node)
-        workflow.add_node("policy_check", policy_check_node)
         workflow.add_node("generate_report", generate_report_node)
 
-        # Define edges - sequential flow
-        workflow.add_edge(START, "run_tests")
-        workflow.add_edge("run_tests", "security_scan")
-        workflow.add_edge("security_scan", "policy_check")
-        workflow.add_edge("policy_check", "generate_report")
+        if self.parallel:
+            # Fan the stages out inside one node so they share a workspace
+            # and a critical finding can cancel the others
+            workflow.add_node("parallel_checks", parallel_checks_node)
+            workflow.add_edge(START, "parallel_checks")
+            workflow.add_edge("parallel_checks", "generate_report")
+        else:
+            # Add nodes for each validation step
+            workflow.add_node("run_tests", run_tests_node)
+            workflow.add_node("security_scan", security_scan_node)
+            workflow.add_node("policy_check", policy_check_node)
+
+            # Define edges - sequential flow
+            workflow.add_edge(START, "run_tests")
+            workflow.add_edge("run_tests", "security_scan")
+            workflow.add_edge("security_scan", "policy_check")
+            workflow.add_edge("policy_check", "generate_report")
 
         # Add conditional edge for route decision
         workflow.add_conditional_edges(
@@ -179,7 +203,10 @@ class ValidatorAgent:
         }
 
         # Run the workflow
-        result = await self.graph.ainvoke(initial_state)
+        result = await self.graph.ainvoke(
+            initial_state,
+            config={"configurable": {"parallel_validation": self.parallel_config}},
+        )
 
         # Extract and return validation result
         validation_data = result.get("validation_result", {})
@@ -0,0 +1,306 @@
+"""Content-addressed cache for Validator stage results.
+
+The same generated code is often validated several times (Orchestrator
+retries, ValidationEnsemble plus ValidatorAgent, re-validation after a
+fix). run_pytest, run_security_scan and run_linter consult this cache so
+an unchanged artifact costs a hash and a lookup instead of a tool run:
+
+- make_validation_key: SHA-256 of the stage, code, tests, the identity of
+  the tools the stage runs and any stage config
+- ValidationCache: In-memory LRU in front of an optional shared tier
+  (RedisResponseCache or DiskResponseCache from daw_agents.models)
+- get_validation_cache(): Process-wide cache configured from the
+  environment
+
+Tool identity is the path, mtime and size of each tool's executable or
+package, so upgrading pytest, coverage, bandit or ruff changes every key
+and stale results are never served. Results reporting an "error"
+(timeouts, crashed tools) are not cached.
+
+Environment:
+- DAW_VALIDATION_CACHE: "memory" (default), "redis", "disk" or "off"
+- DAW_VALIDATION_CACHE_DIR: Directory for the disk tier (default: a
+  private per-user directory under XDG_CACHE_HOME or ~/.cache)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import sys
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from daw_agents.models.cache import (
+    CacheStats,
+    DiskResponseCache,
+    InMemoryResponseCache,
+    RedisResponseCache,
+    ResponseCache,
+)
+
+logger = logging.getLogger(__name__)
+
+VALIDATION_KEY_PREFIX = "daw:validation"
+DEFAULT_VALIDATION_TTL_SECONDS = 86400.0
+
+# Executables on PATH and Python packages each stage's result depends on
+_STAGE_EXECUTABLES: dict[str, tuple[str, ...]] = {
+    "tests": ("pytest",),
+    "security": ("bandit",),
+    "lint": ("ruff",),
+}
+_STAGE_PACKAGES: dict[str, tuple[str, ...]] = {
+    "tests": ("pytest", "coverage"),
+}
+
+
+def _file_identity(path: str | None) -> str:
+    """Identify an installed file by path, mtime and size."""
+    if path is None:
+        return "missing"
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    return f"{os.path.realpath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _package_origin(name: str) -> str | None:
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec is not None else None
+
+
+def tool_fingerprint(stage: str) -> dict[str, str]:
+    """Identify the tool installation a validation stage runs.
+
+    Args:
+        stage: Stage name ("tests", "security" or "lint").
+
+    Returns:
+        Mapping of tool to an identity that changes on reinstall/upgrade.
+    """
+    tools = {
+        f"bin:{name}": _file_identity(shutil.which(name))
+        for name in _STAGE_EXECUTABLES.get(stage, ())
+    }
+    for name in _STAGE_PACKAGES.get(stage, ()):
+        tools[f"py:{name}"] = _file_identity(_package_origin(name))
+    if stage == "tests":
+        tools["python"] = sys.version
+    return tools
+
+
+def make_validation_key(
+    stage: str,
+    code: str,
+    tests: str = "",
+    config: Mapping[str, Any] | None = None,
+) -> str:
+    """Build the content-addressed key for a stage result.
+
+    Args:
+        stage: Stage name ("tests", "security" or "lint").
+        code: Source code being validated.
+        tests: Test file content (tests stage only).
+        config: Stage options that affect the result.
+
+    Returns:
+        Cache key of the form "daw:validation:<stage>:<sha256>"
+    """
+    payload = {
+        "stage": stage,
+        "code": code,
+        "tests": tests,
+        "tools": tool_fingerprint(stage),
+        "config": dict(config or {}),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{VALIDATION_KEY_PREFIX}:{stage}:{digest}"
+
+
+class ValidationCache:
+    """Two-tier cache for validation stage results.
+
+    Lookups try the in-memory LRU first, then the shared tier; hits from
+    the shared tier are promoted to memory. Errors in the shared tier are
+    handled by its ResponseCache implementation and count as misses.
+
+    Usage:
+        ```python
+        cache = ValidationCache(backend=DiskResponseCache("/var/cache/daw"))
+        result = await cache.get_or_run("lint", lambda: run_ruff(code), code)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = DEFAULT_VALIDATION_TTL_SECONDS,
+        backend: ResponseCache | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in the in-memory LRU.
+            ttl_seconds: Lifetime of a cached result.
+            backend: Optional shared tier (Redis or disk).
+        """
+        self.memory = InMemoryResponseCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.backend = backend
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Look up a cached stage result.
+
+        Args:
+            key: Key from make_validation_key().
+
+        Returns:
+            A fresh copy of the cached result, or None on a miss.
+        """
+        value = await self.memory.get(key)
+        if value is None and self.backend is not None:
+            value = await self.backend.get(key)
+            if value is not None:
+                await self.memory.set(key, value)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        result: dict[str, Any] = json.loads(value)
+        return result
+
+    async def set(self, key: str, result: dict[str, Any]) -> None:
+        """Store a stage result in every tier (skipped for error results).
+
+        Args:
+            key: Key from make_validation_key().
+            result: Result dictionary returned by the stage.
+        """
+        if result.get("error"):
+            return
+        value = json.dumps(result, default=str)
+        await self.memory.set(key, value)
+        if self.backend is not None:
+            await self.backend.set(key, value)
+        self.stats.sets += 1
+
+    async def get_or_run(
+        self,
+        stage: str,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+        code: str,
+        tests: str = "",
+        config: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Return the cached result of a stage, running it on a miss.
+
+        Args:
+            stage: Stage name ("tests", "security" or "lint").
+            run: Runs the stage and returns its result dictionary.
+            code: Source code being validated.
+            tests: Test file content (tests stage only).
+            config: Stage options that affect the result.
+
+        Returns:
+            The stage result.
+        """
+        key = make_validation_key(stage, code, tests, config)
+        cached = await self.get(key)
+        if cached is not None:
+            logger.debug("Validation cache hit for %s stage", stage)
+            return cached
+        result = await run()
+        await self.set(key, result)
+        return result
+
+    async def clear(self) -> None:
+        """Remove all cached results from every tier."""
+        await self.memory.clear()
+        if self.backend is not None:
+            await self.backend.clear()
+
+
+class _DisabledValidationCache(ValidationCache):
+    """Cache that never stores anything (DAW_VALIDATION_CACHE=off)."""
+
+    async def get_or_run(
+        self,
+        stage: str,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+        code: str,
+        tests: str = "",
+        config: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return await run()
+
+
+_cache: ValidationCache | None = None
+
+
+def _default_cache_dir() -> Path:
+    """Create the per-user disk tier directory, readable by its owner only.
+
+    Cached results are served without re-running the tools, so the
+    directory must not be writable by other users (as a shared temp
+    directory would be).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    directory = Path(base) / "daw-agents" / "validation"
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    directory.chmod(0o700)
+    return directory
+
+
+def get_validation_cache() -> ValidationCache:
+    """Get the process-wide validation cache (created on first use).
+
+    DAW_VALIDATION_CACHE selects the shared tier: "memory" (default, no
+    shared tier), "redis" (the cache database from RedisConfig), "disk"
+    (DAW_VALIDATION_CACHE_DIR, default _default_cache_dir()) or "off" to
+    disable caching. Shared tiers keep results as long as the in-memory
+    tier does.
+
+    Returns:
+        The shared ValidationCache.
+    """
+    global _cache
+    if _cache is None:
+        mode = os.environ.get("DAW_VALIDATION_CACHE", "memory").strip().lower()
+        if mode == "off":
+            _cache = _DisabledValidationCache()
+        elif mode == "redis":
+            _cache = ValidationCache(
+                backend=RedisResponseCache(
+                    key_prefix=VALIDATION_KEY_PREFIX,
+                    ttl_seconds=DEFAULT_VALIDATION_TTL_SECONDS,
+                )
+            )
+        elif mode == "disk":
+            directory = os.environ.get("DAW_VALIDATION_CACHE_DIR") or _default_cache_dir()
+            _cache = ValidationCache(
+                backend=DiskResponseCache(directory, ttl_seconds=DEFAULT_VALIDATION_TTL_SECONDS)
+            )
+        else:
+            _cache = ValidationCache()
+    return _cache
+
+
+__all__ = [
+    "DEFAULT_VALIDATION_TTL_SECONDS",
+    "VALIDATION_KEY_PREFIX",
+    "ValidationCache",
+    "get_validation_cache",
+    "make_validation_key",
+    "tool_fingerprint",
+]
@@ -5,6 +5,7 @@ This module defines the data models for validation results:
 - SecurityFinding: Individual security vulnerability findings
 - StyleIssue: Code style/linting issues
 - TestResult: Test execution results
+- ParallelValidationConfig: Stage timeouts for parallel validation
 """
 
 from __future__ import annotations
@@ -98,3 +99,20 @@ class ValidationResult(BaseModel):
     test_result: TestResult | None = None
     security_findings: list[SecurityFinding] = Field(default_factory=list)
     style_issues: list[StyleIssue] = Field(default_factory=list)
+
+
+class ParallelValidationConfig(BaseModel):
+    """Configuration for running the validation stages concurrently.
+
+    Attributes:
+        tests_timeout: Seconds allowed for the test stage
+        security_timeout: Seconds allowed for the security scan
+        lint_timeout: Seconds allowed for the lint/policy check
+        cancel_on_critical: Cancel the stages still running once the
+            security scan reports a critical finding
+    """
+
+    tests_timeout: float = Field(default=120.0, gt=0)
+    security_timeout: float = Field(default=60.0, gt=0)
+    lint_timeout: float = Field(default=60.0, gt=0)
+    cancel_on_critical: bool = True
@@ -14,27 +14,109 @@ to ensure cross-validation (different model than Executor/CODING).
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import importlib.util
 import json
 import logging
 import re
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
+from langchain_core.runnables import RunnableConfig
+
+from daw_agents.agents.validator.cache import get_validation_cache
+from daw_agents.agents.validator.models import ParallelValidationConfig
+from daw_agents.agents.validator.runner import get_validation_pool
 from daw_agents.agents.validator.state import ValidationState
+from daw_agents.tdd.worker import WorkerCrashedError
 
 logger = logging.getLogger(__name__)
 
 
-async def run_pytest(code: str, requirements: str) -> dict[str, Any]:
+def _write_workspace(workspace: Path, code: str, requirements: str) -> None:
+    """Write the module under test and its test file into a directory."""
+    (workspace / "module.py").write_text(code)
+    (workspace / "test_module.py").write_text(requirements)
+
+
+async def _communicate(
+    process: asyncio.subprocess.Process, timeout: float
+) -> tuple[bytes, bytes]:
+    """Wait for a tool's output, killing it on timeout or cancellation."""
+    try:
+        return await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except (TimeoutError, asyncio.CancelledError):
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        raise
+
+
+async def run_pytest(
+    code: str, requirements: str, workspace: Path | None = None
+) -> dict[str, Any]:
     """Execute pytest and return results.
 
-    Writes code to a temporary directory and runs pytest with coverage.
+    Runs the tests in a warm worker from the validation worker pool, which
+    collects outcomes and coverage in memory. Falls back to a fresh pytest
+    process per validation if the pool is disabled (DAW_VALIDATOR_WORKERS=0)
+    or its worker dies. Results for unchanged code, tests and tools are
+    served from the validation cache.
 
     Args:
         code: Source code being tested (Python file content)
         requirements: Test requirements (test file content)
+        workspace: Directory already holding module.py and test_module.py
+            (shared with the other stages in parallel validation)
+
+    Returns:
+        Dictionary with test results including pass/fail counts and coverage
+    """
+    return await get_validation_cache().get_or_run(
+        "tests", lambda: _run_pytest(code, requirements, workspace), code, requirements
+    )
+
+
+async def _run_pytest(
+    code: str, requirements: str, workspace: Path | None = None
+) -> dict[str, Any]:
+    """Run the tests in the worker pool, or a subprocess as a fallback."""
+    pool = get_validation_pool()
+    if pool.size > 0 and importlib.util.find_spec("pytest") is not None:
+        try:
+            return await pool.run(code, requirements, timeout=120.0, workspace=workspace)
+        except TimeoutError:
+            logger.error("pytest execution timed out")
+            return {
+                "passed": False,
+                "total_tests": 0,
+                "passed_tests": 0,
+                "failed_tests": 0,
+                "skipped_tests": 0,
+                "coverage_percent": 0.0,
+                "failed_test_names": [],
+                "output": "pytest execution timed out",
+                "error": "Timeout after 120 seconds",
+            }
+        except WorkerCrashedError as e:
+            logger.warning("Validation worker failed (%s), running pytest in a subprocess", e)
+
+    return await _run_pytest_subprocess(code, requirements, workspace)
+
+
+async def _run_pytest_subprocess(
+    code: str, requirements: str, workspace: Path | None = None
+) -> dict[str, Any]:
+    """Execute pytest in a fresh process and return results.
+
+    Writes code to a temporary directory (unless a workspace is given) and
+    runs pytest with coverage.
+
+    Args:
+        code: Source code being tested (Python file content)
+        requirements: Test requirements (test file content)
+        workspace: Directory already holding module.py and test_module.py
 
     Returns:
         Dictionary with test results including pass/fail counts and coverage
@@ -54,16 +136,14 @@ async def run_pytest(code: str, requirements: str) -> dict[str, Any]:
             "error": "pytest not found in PATH",
         }
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Write the source code
-        src_file = temp_path / "module.py"
-        src_file.write_text(code)
-
-        # Write the test file
+    with contextlib.ExitStack() as stack:
+        if workspace is None:
+            temp_path = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+            _write_workspace(temp_path, code, requirements)
+        else:
+            temp_path = workspace
+        temp_dir = str(temp_path)
         test_file = temp_path / "test_module.py"
-        test_file.write_text(requirements)
 
         # Build pytest command with JSON output and coverage
         cmd = [
@@ -88,10 +168,7 @@ async def run_pytest(code: str, requirements: str) -> dict[str, Any]:
                 stderr=asyncio.subprocess.PIPE,
                 env={"PYTHONPATH": temp_dir},
             )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=120.0,
-            )
+            stdout, stderr = await _communicate(process, timeout=120.0)
 
             output = stdout.decode("utf-8") + stderr.decode("utf-8")
 
@@ -212,15 +289,26 @@ def _parse_pytest_output(output: str, passed: bool) -> dict[str, Any]:
     }
 
 
-async def run_security_scan(code: str) -> dict[str, Any]:
+async def run_security_scan(code: str, path: Path | None = None) -> dict[str, Any]:
     """Run SAST security scanning on code using bandit.
 
+    Results for unchanged code and bandit installs are served from the
+    validation cache.
+
     Args:
         code: Source code to scan (Python file content)
+        path: Existing file holding the code (skips writing a temp copy)
 
     Returns:
         Dictionary with security findings including severity levels
     """
+    return await get_validation_cache().get_or_run(
+        "security", lambda: _run_bandit(code, path), code
+    )
+
+
+async def _run_bandit(code: str, path: Path | None = None) -> dict[str, Any]:
+    """Scan code with bandit (uncached)."""
     # Check if bandit is available
     if shutil.which("bandit") is None:
         logger.warning("bandit not found in PATH, returning placeholder result")
@@ -230,12 +318,13 @@ async def run_security_scan(code: str) -> dict[str, Any]:
             "warning": "bandit not available - security scan skipped",
         }
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Write the source code to a temp file
-        src_file = temp_path / "code.py"
-        src_file.write_text(code)
+    with contextlib.ExitStack() as stack:
+        if path is None:
+            # Write the source code to a temp file
+            temp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            path = Path(temp_dir) / "code.py"
+            path.write_text(code)
+        src_file = path
 
         # Run bandit with JSON output
         cmd = [
@@ -252,10 +341,7 @@ async def run_security_scan(code: str) -> dict[str, Any]:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=60.0,
-            )
+            stdout, stderr = await _communicate(process, timeout=60.0)
 
             output = stdout.decode("utf-8")
 
@@ -330,15 +416,24 @@ async def run_security_scan(code: str) -> dict[str, Any]:
             }
 
 
-async def run_linter(code: str) -> dict[str, Any]:
+async def run_linter(code: str, path: Path | None = None) -> dict[str, Any]:
     """Run code linting/style checks using ruff.
 
+    Results for unchanged code and ruff installs are served from the
+    validation cache.
+
     Args:
         code: Source code to lint (Python file content)
+        path: Existing file holding the code (skips writing a temp copy)
 
     Returns:
         Dictionary with style issues and their locations
     """
+    return await get_validation_cache().get_or_run("lint", lambda: _run_ruff(code, path), code)
+
+
+async def _run_ruff(code: str, path: Path | None = None) -> dict[str, Any]:
+    """Lint code with ruff (uncached)."""
     # Check if ruff is available
     if shutil.which("ruff") is None:
         logger.warning("ruff not found in PATH, returning placeholder result")
@@ -348,12 +443,13 @@ async def run_linter(code: str) -> dict[str, Any]:
             "warning": "ruff not available - lint check skipped",
         }
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Write the source code to a temp file
-        src_file = temp_path / "code.py"
-        src_file.write_text(code)
+    with contextlib.ExitStack() as stack:
+        if path is None:
+            # Write the source code to a temp file
+            temp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            path = Path(temp_dir) / "code.py"
+            path.write_text(code)
+        src_file = path
 
         # Run ruff with JSON output
         cmd = [
@@ -369,10 +465,7 @@ async def run_linter(code: str) -> dict[str, Any]:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=60.0,
-            )
+            stdout, stderr = await _communicate(process, timeout=60.0)
 
             output = stdout.decode("utf-8")
 
@@ -551,6 +644,143 @@ async def policy_check_node(state: ValidationState) -> dict[str, Any]:
     }
 
 
+async def run_parallel_checks(
+    code: str,
+    requirements: str,
+    config: ParallelValidationConfig | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Run the test, security and lint stages concurrently.
+
+    The code and tests are written once to a shared temporary workspace
+    that every stage reads. Each stage has its own timeout; a stage that
+    times out or errors reports a failed result instead of failing the
+    others. When a critical security finding arrives first, the stages
+    still running are cancelled (if config.cancel_on_critical is set).
+
+    Args:
+        code: Source code being validated
+        requirements: Test file content
+        config: Stage timeouts and cancellation behaviour
+
+    Returns:
+        Mapping of state key (test_results, security_findings,
+        style_issues) to that stage's result dictionary
+    """
+    config = config or ParallelValidationConfig()
+    with tempfile.TemporaryDirectory(prefix="daw-validate-") as temp_dir:
+        workspace = Path(temp_dir)
+        _write_workspace(workspace, code, requirements)
+        module = workspace / "module.py"
+
+        stages = {
+            "test_results": (
+                run_pytest(code, requirements, workspace=workspace),
+                config.tests_timeout,
+            ),
+            "security_findings": (
+                run_security_scan(code, path=module),
+                config.security_timeout,
+            ),
+            "style_issues": (run_linter(code, path=module), config.lint_timeout),
+        }
+        tasks = {
+            asyncio.create_task(asyncio.wait_for(coro, timeout)): key
+            for key, (coro, timeout) in stages.items()
+        }
+
+        results: dict[str, dict[str, Any]] = {}
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = tasks[task]
+                try:
+                    results[key] = task.result()
+                except TimeoutError:
+                    logger.error("Validation stage %s timed out", key)
+                    results[key] = _stage_failure(
+                        key, f"Timeout after {stages[key][1]:g} seconds"
+                    )
+                except Exception as e:
+                    logger.error("Validation stage %s failed: %s", key, e)
+                    results[key] = _stage_failure(key, str(e))
+
+            if pending and config.cancel_on_critical and _has_critical(
+                results.get("security_findings")
+            ):
+                logger.warning(
+                    "Critical security finding - cancelling %d running stage(s)",
+                    len(pending),
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                for task in pending:
+                    results[tasks[task]] = {
+                        **_stage_failure(
+                            tasks[task], "Cancelled after a critical security finding"
+                        ),
+                        "cancelled": True,
+                    }
+                break
+
+    return results
+
+
+def _has_critical(security_findings: dict[str, Any] | None) -> bool:
+    """Check whether a security result contains a blocking finding."""
+    return any(
+        finding.get("severity") == "critical"
+        for finding in (security_findings or {}).get("findings", [])
+    )
+
+
+def _stage_failure(key: str, error: str) -> dict[str, Any]:
+    """Result of a stage that did not complete, shaped like the stage's output."""
+    if key == "test_results":
+        return {
+            "passed": False,
+            "total_tests": 0,
+            "passed_tests": 0,
+            "failed_tests": 0,
+            "skipped_tests": 0,
+            "coverage_percent": 0.0,
+            "failed_test_names": [],
+            "output": "",
+            "error": error,
+        }
+    items = "findings" if key == "security_findings" else "issues"
+    return {"passed": False, items: [], "error": error}
+
+
+async def parallel_checks_node(
+    state: ValidationState,
+    config: Optional[RunnableConfig] = None,  # noqa: UP045 - spelling LangGraph matches
+) -> dict[str, Any]:
+    """Run tests, security scan and policy check concurrently.
+
+    Replaces the run_tests -> security_scan -> policy_check chain in the
+    parallel validation graph. Stage timeouts come from the
+    "parallel_validation" entry of the run's configurable settings.
+
+    Args:
+        state: Current validation state
+        config: LangGraph run configuration
+
+    Returns:
+        State update with test_results, security_findings and style_issues
+    """
+    configurable = (config or {}).get("configurable", {})
+    parallel_config = configurable.get("parallel_validation")
+
+    logger.info("Running validation stages in parallel")
+    results = await run_parallel_checks(
+        state["code"], state["requirements"], parallel_config
+    )
+
+    return {**results, "current_node": "generate_report"}
+
+
 async def generate_report_node(state: ValidationState) -> dict[str, Any]:
     """Generate final validation report based on all checks.
 
@@ -0,0 +1,217 @@
+"""Warm pytest workers for the Validator's test stage.
+
+Running the Validator's tests used to mean one fresh ``pytest`` process per
+validation: for the small modules the Executor generates, interpreter and
+plugin startup dominated. This module keeps a pool of long-lived worker
+processes instead:
+
+- ValidationWorkerPool: Up to ``os.cpu_count()`` workers, one job at a time
+  each, so concurrent workflows validate in parallel
+- ValidationPoolStats: Jobs, timeouts, crashes and run time of the pool
+- get_validation_pool(): Process-wide pool (DAW_VALIDATOR_WORKERS sets the
+  size; 0 disables the pool)
+
+Workers run daw_agents.tdd.module_worker, which executes each job in its
+own temporary directory and import namespace and returns outcomes and
+line coverage in memory. The client side reuses the TDD Guard's
+PytestWorker; only the request handled by the worker process differs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from daw_agents.tdd.worker import PytestWorker
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# Pool
+# -----------------------------------------------------------------------------
+
+
+# Variables passed to validation workers; everything else (API keys,
+# credentials) is withheld from the generated code they execute
+_WORKER_ENV_KEYS = ("PATH", "HOME")
+
+# Directory containing the daw_agents package, importable by the workers
+_PACKAGE_PARENT = str(Path(__file__).resolve().parents[3])
+
+
+class _ValidationWorker(PytestWorker):
+    """Worker process serving (code, tests) jobs instead of raw pytest args."""
+
+    module = "daw_agents.tdd.module_worker"
+
+    def _environment(self) -> dict[str, str]:
+        """Minimal environment: the code under test is LLM-generated."""
+        env = {key: os.environ[key] for key in _WORKER_ENV_KEYS if key in os.environ}
+        env["PYTHONPATH"] = _PACKAGE_PARENT
+        return env
+
+
+@dataclass
+class ValidationPoolStats:
+    """Statistics for the validation worker pool.
+
+    Attributes:
+        jobs: Jobs completed by a worker.
+        timeouts: Jobs killed for exceeding their timeout.
+        crashes: Jobs lost because the worker process died.
+        total_run_ms: Wall time spent in completed jobs.
+    """
+
+    jobs: int = 0
+    timeouts: int = 0
+    crashes: int = 0
+    total_run_ms: float = 0.0
+
+    @property
+    def avg_run_ms(self) -> float:
+        """Average wall time of a completed job in milliseconds."""
+        return self.total_run_ms / self.jobs if self.jobs else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to a dictionary."""
+        return {
+            "jobs": self.jobs,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+            "total_run_ms": self.total_run_ms,
+            "avg_run_ms": self.avg_run_ms,
+        }
+
+
+class ValidationWorkerPool:
+    """Pool of warm pytest worker processes for validation jobs.
+
+    Worker processes are started on first use and recycled after
+    ``max_runs`` jobs, on timeout and if they die.
+
+    Usage:
+        ```python
+        pool = ValidationWorkerPool(size=4)
+        result = await pool.run(code, tests)
+        await pool.close()
+        ```
+    """
+
+    def __init__(self, size: int | None = None, max_runs: int = 200) -> None:
+        """Initialize the pool.
+
+        Args:
+            size: Number of worker processes (default: CPU count).
+            max_runs: Jobs a worker serves before it is restarted.
+        """
+        self.size = size if size is not None else (os.cpu_count() or 1)
+        self.max_runs = max_runs
+        self.stats = ValidationPoolStats()
+        self._workers: list[_ValidationWorker] = []
+        self._idle: asyncio.Queue[_ValidationWorker] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def run(
+        self,
+        code: str,
+        tests: str,
+        timeout: float = 120.0,
+        workspace: Path | None = None,
+    ) -> dict[str, Any]:
+        """Run a test file against a module in the next free worker.
+
+        Args:
+            code: Source of the module under test (imported as ``module``).
+            tests: Source of the pytest test file.
+            timeout: Seconds before the job's worker is killed.
+            workspace: Directory already holding ``module.py`` and
+                ``test_module.py`` to run in place of a private copy.
+
+        Returns:
+            Dictionary with passed, total_tests, passed_tests, failed_tests,
+            skipped_tests, coverage_percent, failed_test_names and output.
+
+        Raises:
+            TimeoutError: If the job exceeded ``timeout``.
+            WorkerCrashedError: If the worker died during the job.
+        """
+        idle = self._bind_loop()
+        worker = await idle.get()
+        start = time.perf_counter()
+        try:
+            request = (
+                {"workspace": str(workspace)}
+                if workspace is not None
+                else {"code": code, "tests": tests}
+            )
+            response = await worker.request(request, timeout)
+        except TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        except Exception:
+            self.stats.crashes += 1
+            raise
+        finally:
+            idle.put_nowait(worker)
+
+        self.stats.jobs += 1
+        self.stats.total_run_ms += (time.perf_counter() - start) * 1000
+        exit_code = int(response.pop("exit_code"))
+        return {"passed": exit_code == 0, **response}
+
+    async def close(self) -> None:
+        """Stop all worker processes."""
+        workers, self._workers = self._workers, []
+        self._idle = None
+        self._loop = None
+        await asyncio.gather(*(worker.close() for worker in workers))
+
+    def _bind_loop(self) -> asyncio.Queue[_ValidationWorker]:
+        # Worker pipes belong to the event loop that started them; a pool
+        # reused from another loop starts over with fresh workers.
+        loop = asyncio.get_running_loop()
+        if self._idle is None or self._loop is not loop:
+            for worker in self._workers:
+                worker.kill()
+            cwd = Path(tempfile.gettempdir())
+            self._workers = [
+                _ValidationWorker(cwd, max_runs=self.max_runs) for _ in range(max(self.size, 1))
+            ]
+            self._idle = asyncio.Queue()
+            for worker in self._workers:
+                self._idle.put_nowait(worker)
+            self._loop = loop
+        return self._idle
+
+
+_pool: ValidationWorkerPool | None = None
+
+
+def get_validation_pool() -> ValidationWorkerPool:
+    """Get the process-wide validation worker pool (created on first use).
+
+    DAW_VALIDATOR_WORKERS overrides the pool size; 0 disables the pool and
+    makes the Validator spawn a pytest process per validation.
+
+    Returns:
+        The shared ValidationWorkerPool.
+    """
+    global _pool
+    if _pool is None:
+        size = os.environ.get("DAW_VALIDATOR_WORKERS")
+        _pool = ValidationWorkerPool(size=int(size) if size else None)
+    return _pool
+
+
+__all__ = [
+    "ValidationPoolStats",
+    "ValidationWorkerPool",
+    "get_validation_pool",
+]
@@ -8,6 +8,7 @@ This module provides:
 Architecture:
 - Database 0: Celery message broker (task queue)
 - Database 1: LangGraph checkpoint persistence (state recovery)
+- Database 2: LLM response cache (model router)
 
 Both purposes use the same Redis instance but separate logical databases
 to prevent key collisions and enable independent management.
@@ -39,6 +40,7 @@ class RedisConfig:
         password: Redis authentication password (default: None)
         db_celery: Database number for Celery broker (default: 0)
         db_langgraph: Database number for LangGraph checkpoints (default: 1)
+        db_cache: Database number for the LLM response cache (default: 2)
     """
 
     host: str = ""
@@ -46,6 +48,7 @@ class RedisConfig:
     password: str | None = None
     db_celery: int = 0
     db_langgraph: int = 1
+    db_cache: int = 2
 
     def __post_init__(self) -> None:
         """Initialize values from environment if not provided."""
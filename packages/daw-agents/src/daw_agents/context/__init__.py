@@ -4,20 +4,43 @@ Context management module for DAW Agent Workbench.
 This module provides:
 - ContextCompactor: Manages conversation history compaction
 - CompactionConfig: Configuration for compaction behavior
+- SummarizationMode: Flat or tree (map-reduce) reduction of summaries
 - Message: Message model for chat messages
 - Summary: Summary model for compacted message groups
+- TokenCounter: Cached, batch-capable tiktoken counting
+- RunningTokenTotal: Incremental token total for an append-only history
+- LiteLLMEmbedder: Batched summary embeddings through litellm
+- InMemoryVectorIndex / Neo4jVectorIndex: Summary vector indexes for
+  semantic retrieval
 """
 
 from daw_agents.context.compaction import (
     CompactionConfig,
     ContextCompactor,
     Message,
+    SummarizationMode,
     Summary,
 )
+from daw_agents.context.tokens import RunningTokenTotal, TokenCounter
+from daw_agents.context.vector_index import (
+    Embedder,
+    InMemoryVectorIndex,
+    LiteLLMEmbedder,
+    Neo4jVectorIndex,
+    VectorIndex,
+)
 
 __all__ = [
     "CompactionConfig",
     "ContextCompactor",
+    "Embedder",
+    "InMemoryVectorIndex",
+    "LiteLLMEmbedder",
     "Message",
+    "Neo4jVectorIndex",
+    "RunningTokenTotal",
+    "SummarizationMode",
     "Summary",
+    "TokenCounter",
+    "VectorIndex",
 ]
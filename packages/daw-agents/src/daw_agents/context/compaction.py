@@ -4,11 +4,16 @@ Context Compaction module for managing conversation history.
 This module implements CORE-006: Context Compaction Logic for the DAW Agent Workbench.
 
 Key Features:
-- Token counting using tiktoken
-- LLM-based summarization of message groups
+- Token counting using tiktoken, cached per message content and kept as
+  a running total per conversation (see daw_agents.context.tokens)
+- LLM-based summarization of message groups, run concurrently
+- Tree (map-reduce) merging of summaries until they fit the budget
+- Incremental compaction from a rolling per-conversation summary checkpoint
 - Context window management with recency bias
-- Neo4j storage for summaries
-- Semantic retrieval of relevant context
+- Neo4j storage for summaries, batched into one transaction per compaction
+- Semantic retrieval of relevant context: summaries are embedded on
+  storage and searched by cosine similarity with a recency boost
+  (see daw_agents.context.vector_index)
 
 Usage:
     ```python
@@ -26,18 +31,40 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import UTC, datetime
+from enum import Enum
 from typing import Any
 
 import tiktoken
 from pydantic import BaseModel, Field
 
+from daw_agents.context.tokens import (
+    DEFAULT_TOKEN_CACHE_SIZE,
+    RunningTokenTotal,
+    TokenCounter,
+)
+from daw_agents.context.vector_index import (
+    Embedder,
+    InMemoryVectorIndex,
+    Neo4jVectorIndex,
+    VectorEntry,
+    VectorIndex,
+    parse_created_at,
+    recency_boost,
+)
 from daw_agents.memory.neo4j import Neo4jConnector
 from daw_agents.models.router import ModelRouter, TaskType
 
 logger = logging.getLogger(__name__)
 
+# Conversations whose running token totals and summary checkpoints are kept
+# in memory between compact() calls
+MAX_TRACKED_CONVERSATIONS = 1024
+
 
 class Message(BaseModel):
     """Model representing a chat message."""
@@ -61,6 +88,18 @@ class Summary(BaseModel):
     )
 
 
+class SummarizationMode(str, Enum):
+    """How summaries that exceed the budget are reduced.
+
+    - FLAT: Summarize all group summaries once more in a single call
+    - TREE: Merge summaries in groups of tree_fan_in, level by level,
+      until the combined summary fits the budget (map-reduce)
+    """
+
+    FLAT = "flat"
+    TREE = "tree"
+
+
 class CompactionConfig(BaseModel):
     """Configuration for context compaction behavior."""
 
@@ -84,6 +123,50 @@ class CompactionConfig(BaseModel):
         default="cl100k_base",
         description="Tiktoken encoding name for token counting",
     )
+    max_concurrent_summaries: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum summarization calls in flight at once",
+    )
+    summarization_mode: SummarizationMode = Field(
+        default=SummarizationMode.FLAT,
+        description="How over-budget summaries are reduced (flat or tree)",
+    )
+    tree_fan_in: int = Field(
+        default=4,
+        ge=2,
+        description="Summaries merged per call in tree mode",
+    )
+    incremental: bool = Field(
+        default=False,
+        description=(
+            "Reuse the conversation's summary checkpoint and only summarize "
+            "messages past its end_index (requires a conversation_id)"
+        ),
+    )
+    checkpoint_rebuild_limit: int = Field(
+        default=100,
+        description="Stored summaries read to rebuild a missing checkpoint",
+    )
+    recency_weight: float = Field(
+        default=0.1,
+        ge=0.0,
+        description="Score bonus for a just-created summary in semantic retrieval",
+    )
+    recency_half_life_hours: float = Field(
+        default=168.0,
+        gt=0.0,
+        description="Summary age at which the recency bonus halves",
+    )
+    retrieval_candidate_factor: int = Field(
+        default=4,
+        ge=1,
+        description="Nearest neighbours fetched per requested result before recency re-ranking",
+    )
+    token_cache_size: int = Field(
+        default=DEFAULT_TOKEN_CACHE_SIZE,
+        description="Maximum number of distinct texts whose token counts are cached",
+    )
 
 
 class ContextCompactor:
@@ -92,10 +175,10 @@ class ContextCompactor:
 
     This class provides:
     1. Token counting for messages using tiktoken
-    2. LLM-based summarization of message groups
-    3. Context compaction with recency bias
-    4. Neo4j storage for persistent summaries
-    5. Retrieval of relevant summaries
+    2. Concurrent LLM-based summarization of message groups
+    3. Context compaction with recency bias, with flat or tree reduction
+    4. Batched Neo4j storage for persistent summaries
+    5. Semantic retrieval of relevant summaries (vector index + recency)
 
     Architecture:
     - Recent messages (configurable count) are kept intact
@@ -119,6 +202,8 @@ class ContextCompactor:
         model_router: ModelRouter,
         neo4j_connector: Neo4jConnector | None = None,
         config: CompactionConfig | None = None,
+        embedder: Embedder | None = None,
+        vector_index: VectorIndex | None = None,
     ) -> None:
         """
         Initialize the ContextCompactor.
@@ -127,31 +212,50 @@ class ContextCompactor:
             model_router: ModelRouter for LLM calls (summarization)
             neo4j_connector: Optional Neo4j connector for summary storage
             config: Optional configuration (uses defaults if not provided)
+            embedder: Optional embedder; enables semantic retrieval
+            vector_index: Index for summary embeddings. Defaults to a
+                          Neo4jVectorIndex when a connector is given, else an
+                          InMemoryVectorIndex. Ignored without an embedder.
         """
         self.model_router = model_router
         self.neo4j_connector = neo4j_connector
         self.config = config or CompactionConfig()
+        self.embedder = embedder
+        self.vector_index: VectorIndex | None = None
+        if embedder is not None:
+            if vector_index is not None:
+                self.vector_index = vector_index
+            elif neo4j_connector is not None:
+                self.vector_index = Neo4jVectorIndex(neo4j_connector)
+            else:
+                self.vector_index = InMemoryVectorIndex()
         self._encoding = tiktoken.get_encoding(self.config.encoding_name)
+        self.token_counter = TokenCounter(
+            self._encoding, max_entries=self.config.token_cache_size
+        )
+        self._running_totals: OrderedDict[str, RunningTokenTotal] = OrderedDict()
+        self._checkpoints: OrderedDict[str, Summary] = OrderedDict()
 
     def count_tokens(self, text: str) -> int:
         """
         Count tokens in a text string using tiktoken.
 
+        Counts are cached by content hash, so repeated text is encoded once.
+
         Args:
             text: The text to count tokens for
 
         Returns:
             Number of tokens in the text
         """
-        if not text:
-            return 0
-        return len(self._encoding.encode(text))
+        return self.token_counter.count(text)
 
     def count_message_tokens(self, messages: list[Message]) -> int:
         """
         Count total tokens in a list of messages.
 
         This includes both role and content tokens, plus message formatting overhead.
+        Uncached messages are encoded together in one batch.
 
         Args:
             messages: List of Message objects
@@ -159,14 +263,29 @@ class ContextCompactor:
         Returns:
             Total token count for all messages
         """
-        if not messages:
-            return 0
+        return self.token_counter.count_messages(messages)
+
+    def running_total(self, conversation_id: str) -> RunningTokenTotal:
+        """
+        Get the incremental token total tracked for a conversation.
 
-        total = 0
-        for message in messages:
-            # Count role tokens (approximate overhead per message)
-            total += self.count_tokens(message.role) + 4  # Role + formatting overhead
-            total += self.count_tokens(message.content)
+        compact() keeps one per conversation_id, so a history that grew by
+        one message since the last call costs one count, not a full recount.
+
+        Args:
+            conversation_id: The conversation to track
+
+        Returns:
+            RunningTokenTotal for the conversation
+        """
+        total = self._running_totals.get(conversation_id)
+        if total is None:
+            total = RunningTokenTotal(self.token_counter)
+            self._running_totals[conversation_id] = total
+            while len(self._running_totals) > MAX_TRACKED_CONVERSATIONS:
+                self._running_totals.popitem(last=False)
+        else:
+            self._running_totals.move_to_end(conversation_id)
         return total
 
     async def summarize(self, messages: list[Message]) -> str:
@@ -230,6 +349,11 @@ Summary:"""
         2. Summarize older messages in groups
         3. Return compacted history under token limit
 
+        With config.incremental and a conversation_id, step 2 starts from
+        the conversation's rolling summary checkpoint and only summarizes
+        messages past its end_index, so a new turn costs one small
+        summarization instead of re-summarizing the whole history.
+
         Args:
             messages: Full conversation history
             max_tokens: Override for max token limit
@@ -242,7 +366,10 @@ Summary:"""
             return []
 
         target_max = max_tokens or self.config.max_tokens
-        current_tokens = self.count_message_tokens(messages)
+        if conversation_id:
+            current_tokens = self.running_total(conversation_id).sync(messages)
+        else:
+            current_tokens = self.count_message_tokens(messages)
 
         # If already under limit, return as-is
         if current_tokens <= target_max:
@@ -272,37 +399,13 @@ Summary:"""
             summary = await self.summarize(messages)
             return [Message(role="system", content=f"[Summary of previous conversation]: {summary}")]
 
-        # Group and summarize old messages
-        summaries: list[str] = []
-        group_size = self.config.messages_per_summary
-
-        for i in range(0, len(old_messages), group_size):
-            group = old_messages[i : i + group_size]
-            summary = await self.summarize(group)
-            summaries.append(summary)
-
-            # Store summary if Neo4j is configured and conversation_id provided
-            if self.neo4j_connector and conversation_id:
-                await self.store_summary(
-                    summary=summary,
-                    conversation_id=conversation_id,
-                    metadata={
-                        "message_count": len(group),
-                        "start_index": i,
-                        "end_index": i + len(group) - 1,
-                    },
-                )
-
-        # Combine summaries into a context message
-        combined_summary = "\n---\n".join(summaries)
-
-        # Check if combined summary fits in budget
-        summary_tokens = self.count_tokens(combined_summary)
-        if summary_tokens > summary_budget:
-            # Recursively summarize the summaries
-            summary_messages = [Message(role="system", content=s) for s in summaries]
-            final_summary = await self.summarize(summary_messages)
-            combined_summary = final_summary
+        if self.config.incremental and conversation_id:
+            combined_summary = await self._incremental_summary(
+                old_messages, conversation_id, summary_budget
+            )
+        else:
+            summaries = await self._summarize_and_store(old_messages, conversation_id)
+            combined_summary = await self._reduce_summaries(summaries, summary_budget)
 
         # Build final compacted message list
         compacted = [
@@ -321,6 +424,295 @@ Summary:"""
 
         return compacted
 
+    async def _summarize_and_store(
+        self,
+        messages: list[Message],
+        conversation_id: str | None,
+        offset: int = 0,
+    ) -> list[str]:
+        """
+        Summarize messages in groups and store the summaries in one batch.
+
+        Args:
+            messages: Messages to summarize
+            conversation_id: Conversation for storage; nothing is stored if None
+            offset: History index of messages[0], for start/end_index
+
+        Returns:
+            One summary per group of config.messages_per_summary messages
+        """
+        group_size = self.config.messages_per_summary
+        starts = range(0, len(messages), group_size)
+        groups = [messages[i : i + group_size] for i in starts]
+        summaries = await self._summarize_groups(groups)
+
+        # Store summaries if Neo4j is configured and conversation_id provided
+        if self.neo4j_connector and conversation_id:
+            await self.store_summaries(
+                [
+                    (
+                        summary,
+                        {
+                            "message_count": len(group),
+                            "start_index": offset + start,
+                            "end_index": offset + start + len(group) - 1,
+                        },
+                    )
+                    for start, group, summary in zip(
+                        starts, groups, summaries, strict=True
+                    )
+                ],
+                conversation_id=conversation_id,
+            )
+        elif self.vector_index is not None and conversation_id:
+            # No graph storage: keep the summaries searchable in-process.
+            # Ids are stable per message range, so compacting the same
+            # history again replaces its entries instead of adding copies.
+            created_at = datetime.now(UTC).isoformat()
+            await self._index_summaries(
+                [
+                    _summary_id(conversation_id, group, offset + start)
+                    for start, group in zip(starts, groups, strict=True)
+                ],
+                [
+                    {
+                        "content": summary,
+                        "conversation_id": conversation_id,
+                        "created_at": created_at,
+                        "message_count": len(group),
+                        "start_index": offset + start,
+                        "end_index": offset + start + len(group) - 1,
+                    }
+                    for start, group, summary in zip(
+                        starts, groups, summaries, strict=True
+                    )
+                ],
+            )
+
+        return summaries
+
+    async def _incremental_summary(
+        self,
+        old_messages: list[Message],
+        conversation_id: str,
+        budget: int,
+    ) -> str:
+        """
+        Extend the conversation's checkpoint to cover old_messages.
+
+        Only messages past the checkpoint's end_index are summarized; the
+        new summaries are rolled into the checkpoint text, reduced to fit
+        budget, and saved as the new checkpoint.
+
+        A checkpoint reaching past the end of old_messages means the
+        history was rewritten, so it is discarded and rebuilt. Edits to
+        messages the checkpoint already covers are not detected.
+        """
+        checkpoint = await self.load_checkpoint(conversation_id)
+        if checkpoint is not None and checkpoint.end_index >= len(old_messages):
+            logger.info(
+                "Checkpoint for %s covers %d messages but history has %d; rebuilding",
+                conversation_id,
+                checkpoint.end_index + 1,
+                len(old_messages),
+            )
+            checkpoint = None
+
+        covered = checkpoint.end_index + 1 if checkpoint else 0
+        pending = old_messages[covered:]
+        if not pending:
+            return checkpoint.content if checkpoint else ""
+
+        logger.debug(
+            "Incremental compaction of %s: %d new messages past index %d",
+            conversation_id,
+            len(pending),
+            covered - 1,
+        )
+        summaries = await self._summarize_and_store(
+            pending, conversation_id, offset=covered
+        )
+        parts = ([checkpoint.content] if checkpoint else []) + summaries
+        content = await self._reduce_summaries(parts, budget)
+
+        await self.save_checkpoint(
+            Summary(
+                content=content,
+                conversation_id=conversation_id,
+                message_count=len(old_messages),
+                start_index=0,
+                end_index=len(old_messages) - 1,
+                token_count=self.count_tokens(content),
+            )
+        )
+        return content
+
+    async def load_checkpoint(self, conversation_id: str) -> Summary | None:
+        """
+        Load the rolling summary checkpoint of a conversation.
+
+        Looks in memory first, then for a SummaryCheckpoint node in Neo4j.
+        If neither exists, a checkpoint is rebuilt from the contiguous run
+        of stored summaries starting at index 0 (retrieve_by_conversation),
+        so histories compacted before incremental mode are reused.
+
+        Args:
+            conversation_id: The conversation to load
+
+        Returns:
+            The checkpoint, or None if nothing has been summarized yet
+        """
+        checkpoint = self._checkpoints.get(conversation_id)
+        if checkpoint is not None:
+            self._checkpoints.move_to_end(conversation_id)
+            return checkpoint
+        if self.neo4j_connector is None:
+            return None
+
+        rows = await self.neo4j_connector.query(
+            cypher="""
+                MATCH (c:SummaryCheckpoint)
+                WHERE c.conversation_id = $conversation_id
+                RETURN c.content as content, c.message_count as message_count,
+                       c.end_index as end_index
+                LIMIT 1
+            """,
+            params={"conversation_id": conversation_id},
+        )
+        if rows:
+            row = rows[0]
+            checkpoint = Summary(
+                content=row["content"],
+                conversation_id=conversation_id,
+                message_count=row["message_count"],
+                start_index=0,
+                end_index=row["end_index"],
+                token_count=self.count_tokens(row["content"]),
+            )
+        else:
+            checkpoint = await self._rebuild_checkpoint(conversation_id)
+
+        if checkpoint is not None:
+            self._remember_checkpoint(checkpoint)
+        return checkpoint
+
+    async def _rebuild_checkpoint(self, conversation_id: str) -> Summary | None:
+        """Join stored group summaries covering indexes 0..n without gaps."""
+        stored = await self.retrieve_by_conversation(
+            conversation_id, limit=self.config.checkpoint_rebuild_limit
+        )
+        parts: list[str] = []
+        next_index = 0
+        for row in stored:
+            start = row.get("start_index")
+            end = row.get("end_index")
+            if start is None or end is None or start > next_index:
+                break
+            if start < next_index:
+                # Re-stored by an earlier full compaction; already covered
+                continue
+            parts.append(row["content"])
+            next_index = end + 1
+
+        if not parts:
+            return None
+        content = "\n---\n".join(parts)
+        return Summary(
+            content=content,
+            conversation_id=conversation_id,
+            message_count=next_index,
+            start_index=0,
+            end_index=next_index - 1,
+            token_count=self.count_tokens(content),
+        )
+
+    async def save_checkpoint(self, checkpoint: Summary) -> None:
+        """
+        Save a conversation's rolling summary checkpoint.
+
+        Kept in memory, and upserted as the conversation's single
+        SummaryCheckpoint node when Neo4j is configured.
+
+        Args:
+            checkpoint: Summary covering messages 0..end_index
+        """
+        self._remember_checkpoint(checkpoint)
+        if self.neo4j_connector is None:
+            return
+
+        await self.neo4j_connector.query(
+            cypher="""
+                MERGE (c:SummaryCheckpoint:ConversationContext
+                       {conversation_id: $conversation_id})
+                SET c.content = $content, c.message_count = $message_count,
+                    c.start_index = 0, c.end_index = $end_index,
+                    c.token_count = $token_count, c.created_at = $created_at
+            """,
+            params={
+                "conversation_id": checkpoint.conversation_id,
+                "content": checkpoint.content,
+                "message_count": checkpoint.message_count,
+                "end_index": checkpoint.end_index,
+                "token_count": checkpoint.token_count,
+                "created_at": checkpoint.created_at.isoformat(),
+            },
+        )
+
+    def _remember_checkpoint(self, checkpoint: Summary) -> None:
+        self._checkpoints[checkpoint.conversation_id] = checkpoint
+        self._checkpoints.move_to_end(checkpoint.conversation_id)
+        while len(self._checkpoints) > MAX_TRACKED_CONVERSATIONS:
+            self._checkpoints.popitem(last=False)
+
+    async def _summarize_groups(self, groups: list[list[Message]]) -> list[str]:
+        """
+        Summarize message groups concurrently, preserving their order.
+
+        At most config.max_concurrent_summaries calls run at once.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_summaries)
+
+        async def summarize_group(group: list[Message]) -> str:
+            async with semaphore:
+                return await self.summarize(group)
+
+        return list(await asyncio.gather(*(summarize_group(g) for g in groups)))
+
+    async def _reduce_summaries(self, summaries: list[str], budget: int) -> str:
+        """
+        Combine group summaries, re-summarizing them if they exceed budget.
+
+        FLAT mode re-summarizes everything in one call. TREE mode merges
+        tree_fan_in summaries per call, concurrently, and repeats on the
+        results until the combined text fits or one summary remains.
+        """
+        combined = "\n---\n".join(summaries)
+        if self.count_tokens(combined) <= budget:
+            return combined
+
+        if self.config.summarization_mode == SummarizationMode.FLAT:
+            return await self.summarize([Message(role="system", content=s) for s in summaries])
+
+        level = summaries
+        while len(level) > 1 and self.count_tokens(combined) > budget:
+            fan_in = self.config.tree_fan_in
+            level = await self._summarize_groups(
+                [
+                    [Message(role="system", content=s) for s in level[i : i + fan_in]]
+                    for i in range(0, len(level), fan_in)
+                ]
+            )
+            combined = "\n---\n".join(level)
+            logger.debug(
+                "Merged summaries into %d (%d tokens)",
+                len(level),
+                self.count_tokens(combined),
+            )
+
+        if len(level) == 1 and self.count_tokens(combined) > budget:
+            combined = await self.summarize([Message(role="system", content=combined)])
+        return combined
+
     async def store_summary(
         self,
         summary: str,
@@ -356,20 +748,151 @@ Summary:"""
             labels=["Summary", "ConversationContext"],
             properties=properties,
         )
+        await self._index_summaries([node_id], [properties])
 
         logger.debug("Stored summary node: %s", node_id)
         return node_id
 
+    async def store_summaries(
+        self,
+        summaries: list[tuple[str, dict[str, Any]]],
+        conversation_id: str,
+    ) -> list[str]:
+        """
+        Store several summaries in Neo4j in a single transaction.
+
+        Args:
+            summaries: (summary text, metadata) pairs, as for store_summary
+            conversation_id: ID of the conversation
+
+        Returns:
+            The element_ids of the created nodes, in input order
+
+        Raises:
+            RuntimeError: If Neo4j connector is not configured
+        """
+        if self.neo4j_connector is None:
+            raise RuntimeError("Neo4j connector not configured")
+        if not summaries:
+            return []
+
+        created_at = datetime.now(UTC).isoformat()
+        properties_list: list[dict[str, Any]] = [
+            {
+                "content": summary,
+                "conversation_id": conversation_id,
+                "token_count": self.count_tokens(summary),
+                "created_at": created_at,
+                **metadata,
+            }
+            for summary, metadata in summaries
+        ]
+        node_ids = await self.neo4j_connector.create_nodes(
+            labels=["Summary", "ConversationContext"],
+            properties_list=properties_list,
+        )
+        await self._index_summaries(node_ids, properties_list)
+
+        logger.debug("Stored %d summary nodes", len(node_ids))
+        return node_ids
+
+    async def _index_summaries(
+        self, ids: list[str], properties_list: list[dict[str, Any]]
+    ) -> None:
+        """
+        Embed summaries in one batch and add them to the vector index.
+
+        Embedding failures are logged rather than raised, so compaction
+        never fails on the retrieval path; backfill_embeddings() picks up
+        summaries left unindexed.
+        """
+        if self.embedder is None or self.vector_index is None or not ids:
+            return
+        try:
+            vectors = await self.embedder.embed([p["content"] for p in properties_list])
+        except Exception as e:
+            logger.warning("Could not embed %d summaries: %s", len(ids), e)
+            return
+
+        await self.vector_index.add(
+            [
+                _vector_entry(node_id, vector, properties)
+                for node_id, vector, properties in zip(
+                    ids, vectors, properties_list, strict=True
+                )
+            ]
+        )
+
+    async def backfill_embeddings(self, batch_size: int = 100) -> int:
+        """
+        Embed and index summaries stored in Neo4j, batch_size at a time.
+
+        With a Neo4jVectorIndex only summaries without an embedding are
+        processed, so the backfill can be interrupted and resumed. Other
+        indexes are loaded with every stored summary.
+
+        Args:
+            batch_size: Summaries embedded per embedding call
+
+        Returns:
+            Number of summaries indexed
+
+        Raises:
+            RuntimeError: If Neo4j or an embedder is not configured
+        """
+        if self.neo4j_connector is None:
+            raise RuntimeError("Neo4j connector not configured")
+        if self.embedder is None or self.vector_index is None:
+            raise RuntimeError("Embedder not configured")
+
+        persistent = isinstance(self.vector_index, Neo4jVectorIndex)
+        where = "WHERE s.embedding IS NULL" if persistent else ""
+        cypher = f"""
+            MATCH (s:Summary)
+            {where}
+            RETURN elementId(s) as id, s.content as content,
+                   s.conversation_id as conversation_id,
+                   s.message_count as message_count, s.created_at as created_at
+            ORDER BY elementId(s)
+            SKIP $skip
+            LIMIT $limit
+        """
+
+        indexed = 0
+        while True:
+            rows = await self.neo4j_connector.query(
+                cypher=cypher,
+                params={"skip": 0 if persistent else indexed, "limit": batch_size},
+            )
+            if not rows:
+                break
+            vectors = await self.embedder.embed([row["content"] for row in rows])
+            await self.vector_index.add(
+                [
+                    _vector_entry(row["id"], vector, row)
+                    for row, vector in zip(rows, vectors, strict=True)
+                ]
+            )
+            indexed += len(rows)
+            logger.debug("Backfilled %d summary embeddings", indexed)
+            if len(rows) < batch_size:
+                break
+
+        logger.info("Backfilled embeddings for %d summaries", indexed)
+        return indexed
+
     async def retrieve_relevant(
         self,
         query: str,
         limit: int = 5,
     ) -> list[dict[str, Any]]:
         """
-        Retrieve relevant summaries from Neo4j.
+        Retrieve relevant summaries.
 
-        Uses text matching for relevance. For semantic search,
-        consider integrating vector embeddings.
+        With an embedder configured, the query is embedded and the top
+        results by cosine similarity plus a recency boost are returned
+        (each with "score" and "similarity"). Otherwise falls back to
+        substring matching in Neo4j.
 
         Args:
             query: Search query
@@ -379,8 +902,11 @@ Summary:"""
             List of summary dictionaries
 
         Raises:
-            RuntimeError: If Neo4j connector is not configured
+            RuntimeError: If neither an embedder nor Neo4j is configured
         """
+        if self.embedder is not None and self.vector_index is not None:
+            return await self._retrieve_semantic(query, limit)
+
         if self.neo4j_connector is None:
             raise RuntimeError("Neo4j connector not configured")
 
@@ -402,6 +928,46 @@ Summary:"""
         logger.debug("Retrieved %d relevant summaries", len(results))
         return results
 
+    async def _retrieve_semantic(self, query: str, limit: int) -> list[dict[str, Any]]:
+        """Top-k summaries by cosine similarity, re-ranked with recency."""
+        assert self.embedder is not None and self.vector_index is not None
+        [vector] = await self.embedder.embed([query])
+        matches = await self.vector_index.search(
+            vector, k=limit * self.config.retrieval_candidate_factor
+        )
+
+        now = datetime.now(UTC)
+        scored = sorted(
+            (
+                (
+                    match.similarity
+                    + recency_boost(
+                        match.created_at,
+                        self.config.recency_weight,
+                        self.config.recency_half_life_hours,
+                        now=now,
+                    ),
+                    match,
+                )
+                for match in matches
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )[:limit]
+
+        logger.debug("Retrieved %d relevant summaries by similarity", len(scored))
+        return [
+            {
+                "content": match.content,
+                "conversation_id": match.conversation_id,
+                "message_count": match.metadata.get("message_count"),
+                "created_at": match.created_at.isoformat(),
+                "similarity": match.similarity,
+                "score": score,
+            }
+            for score, match in scored
+        ]
+
     async def retrieve_by_conversation(
         self,
         conversation_id: str,
@@ -441,9 +1007,33 @@ Summary:"""
         return results
 
 
+def _summary_id(conversation_id: str, group: list[Message], start_index: int) -> str:
+    """Derive the index id of a summary from its conversation and message range."""
+    digest = hashlib.sha256(f"{start_index}:{len(group)}".encode())
+    for message in group:
+        digest.update(f"\0{message.role}\0{message.content}".encode())
+    return f"{conversation_id}:{digest.hexdigest()[:32]}"
+
+
+def _vector_entry(
+    entry_id: str, vector: list[float], properties: dict[str, Any]
+) -> VectorEntry:
+    """Build a VectorEntry from stored summary properties."""
+    metadata_keys = ("message_count", "start_index", "end_index")
+    return VectorEntry(
+        id=entry_id,
+        vector=vector,
+        content=properties["content"],
+        conversation_id=properties.get("conversation_id") or "",
+        created_at=parse_created_at(properties.get("created_at")),
+        metadata={k: properties[k] for k in metadata_keys if properties.get(k) is not None},
+    )
+
+
 __all__ = [
     "CompactionConfig",
     "ContextCompactor",
     "Message",
+    "SummarizationMode",
     "Summary",
 ]
@@ -0,0 +1,296 @@
+"""
+Cached token counting for context management.
+
+This module keeps token counting off the hot path of ContextCompactor:
+- TokenCounter: tiktoken counts memoized in a bounded LRU keyed by a
+  content hash, with batch encoding of cache misses
+- RunningTokenTotal: Incremental total for an append-only message history
+- TokenCacheStats: Hit/miss counters for the count cache
+
+Every compact() call used to re-encode the whole history. With the cache,
+only text that has not been seen before is encoded, and a RunningTokenTotal
+turns "history grew by one message" into a single lookup or encode.
+
+Usage:
+    ```python
+    import tiktoken
+
+    from daw_agents.context.tokens import RunningTokenTotal, TokenCounter
+
+    counter = TokenCounter(tiktoken.get_encoding("cl100k_base"))
+    counter.count_messages(history)  # cold start: one encode_batch pass
+
+    total = RunningTokenTotal(counter)
+    total.sync(history)
+    history.append(Message(role="user", content="..."))
+    total.sync(history)  # counts only the new message
+    ```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    import tiktoken
+
+# Tokens added per message for role and chat formatting, on top of the
+# encoded role and content.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+DEFAULT_TOKEN_CACHE_SIZE = 100_000
+
+# Below this many uncached texts, encoding serially beats thread start-up
+PARALLEL_ENCODE_THRESHOLD = 512
+
+
+class ChatMessage(Protocol):
+    """Anything with a role and content, e.g. compaction.Message."""
+
+    role: str
+    content: str
+
+
+def _text_key(text: str) -> bytes:
+    """Fixed-size cache key for a text, so the cache never holds message bodies."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+@dataclass
+class TokenCacheStats:
+    """Counters for the token count cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize stats for logging or metrics export."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class TokenCounter:
+    """Token counter with a bounded, content-addressed cache.
+
+    Counts are cached per distinct text, keyed by a 16-byte BLAKE2b digest
+    and evicted least-recently-used beyond max_entries, so memory stays
+    bounded regardless of message size.
+
+    Text is encoded with encode_ordinary: special-token strings inside a
+    message are counted as plain text instead of raising ValueError.
+    """
+
+    def __init__(
+        self,
+        encoding: tiktoken.Encoding,
+        max_entries: int = DEFAULT_TOKEN_CACHE_SIZE,
+        num_threads: int = 8,
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            encoding: tiktoken encoding used for counting
+            max_entries: Maximum number of cached counts
+            num_threads: Maximum threads used by encode_batch for cold
+                         starts (capped at the CPU count)
+        """
+        self.encoding = encoding
+        self.max_entries = max_entries
+        self.num_threads = num_threads
+        self.stats = TokenCacheStats()
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _lookup(self, key: bytes) -> int | None:
+        count = self._counts.get(key)
+        if count is None:
+            self.stats.misses += 1
+            return None
+        self._counts.move_to_end(key)
+        self.stats.hits += 1
+        return count
+
+    def _store(self, key: bytes, count: int) -> None:
+        self._counts[key] = count
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+            self.stats.evictions += 1
+
+    def count(self, text: str) -> int:
+        """Count tokens in a text, encoding it only on a cache miss."""
+        if not text:
+            return 0
+        key = _text_key(text)
+        count = self._lookup(key)
+        if count is None:
+            count = len(self.encoding.encode_ordinary(text))
+            self._store(key, count)
+        return count
+
+    def _encode_lengths(self, texts: list[str]) -> list[int]:
+        """Token counts for texts, split across threads when worthwhile.
+
+        tiktoken releases the GIL while encoding, so large batches are
+        split into one contiguous chunk per thread. tiktoken's own
+        encode_batch submits one future per text, which costs more than
+        encoding a typical chat message.
+        """
+        threads = min(self.num_threads, os.cpu_count() or 1)
+        if threads <= 1 or len(texts) < PARALLEL_ENCODE_THRESHOLD:
+            return [len(self.encoding.encode_ordinary(text)) for text in texts]
+
+        def encode_chunk(chunk: list[str]) -> list[int]:
+            return [len(self.encoding.encode_ordinary(text)) for text in chunk]
+
+        size = -(-len(texts) // threads)
+        chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return [n for lengths in executor.map(encode_chunk, chunks) for n in lengths]
+
+    def encode_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count tokens in many texts, encoding all cache misses in one batch.
+
+        Duplicates are encoded once, and on multi-core machines large
+        batches are encoded on a thread pool, which makes cold starts on
+        long histories cheaper than encoding one text at a time.
+
+        Args:
+            texts: Texts to count
+
+        Returns:
+            Token count per text, in order
+        """
+        counts: list[int | None] = [None] * len(texts)
+        missing: dict[bytes, list[int]] = {}
+        missing_texts: list[str] = []
+
+        for index, text in enumerate(texts):
+            if not text:
+                counts[index] = 0
+                continue
+            key = _text_key(text)
+            if key in missing:
+                missing[key].append(index)
+                continue
+            cached = self._lookup(key)
+            if cached is None:
+                missing[key] = [index]
+                missing_texts.append(text)
+            else:
+                counts[index] = cached
+
+        if missing_texts:
+            lengths = self._encode_lengths(missing_texts)
+            for (key, indexes), length in zip(missing.items(), lengths, strict=True):
+                self._store(key, length)
+                for index in indexes:
+                    counts[index] = length
+
+        return [count or 0 for count in counts]
+
+    def count_message(self, message: ChatMessage) -> int:
+        """Count one message: role + content + formatting overhead."""
+        return (
+            self.count(message.role)
+            + MESSAGE_OVERHEAD_TOKENS
+            + self.count(message.content)
+        )
+
+    def count_messages(self, messages: Sequence[ChatMessage]) -> int:
+        """Count a list of messages, batch-encoding any uncached text."""
+        if not messages:
+            return 0
+        texts: list[str] = []
+        for message in messages:
+            texts.append(message.role)
+            texts.append(message.content)
+        return sum(self.encode_batch(texts)) + MESSAGE_OVERHEAD_TOKENS * len(messages)
+
+    def clear(self) -> None:
+        """Drop all cached counts."""
+        self._counts.clear()
+
+
+class RunningTokenTotal:
+    """Token total of an append-only history, updated incrementally.
+
+    sync() counts only the messages added since the previous sync. If the
+    history was rewritten instead of appended to (it got shorter, or the
+    last counted message changed) the total is recomputed from scratch.
+    Only the last counted message is compared, so edits further back in
+    the history are not detected; call reset() after such an edit.
+    """
+
+    def __init__(self, counter: TokenCounter) -> None:
+        self.counter = counter
+        self.total = 0
+        self._counted = 0
+        self._last: ChatMessage | None = None
+
+    def __len__(self) -> int:
+        return self._counted
+
+    def _is_prefix(self, messages: Sequence[ChatMessage]) -> bool:
+        if self._counted == 0:
+            return True
+        if len(messages) < self._counted:
+            return False
+        last = messages[self._counted - 1]
+        return self._last is not None and (
+            last is self._last
+            or (last.role == self._last.role and last.content == self._last.content)
+        )
+
+    def sync(self, messages: Sequence[ChatMessage]) -> int:
+        """Bring the total up to date with the given history.
+
+        Args:
+            messages: The full history, previously synced messages first
+
+        Returns:
+            Token total of messages
+        """
+        if not self._is_prefix(messages):
+            self.reset()
+        new_messages = messages[self._counted :]
+        if new_messages:
+            self.total += self.counter.count_messages(new_messages)
+            self._counted = len(messages)
+            self._last = messages[-1]
+        return self.total
+
+    def reset(self) -> None:
+        """Forget the counted history."""
+        self.total = 0
+        self._counted = 0
+        self._last = None
+
+
+__all__ = [
+    "DEFAULT_TOKEN_CACHE_SIZE",
+    "MESSAGE_OVERHEAD_TOKENS",
+    "PARALLEL_ENCODE_THRESHOLD",
+    "RunningTokenTotal",
+    "TokenCacheStats",
+    "TokenCounter",
+]
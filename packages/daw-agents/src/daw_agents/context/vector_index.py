@@ -0,0 +1,313 @@
+"""
+Vector index for semantic retrieval of conversation summaries.
+
+This module provides:
+- Embedder: Protocol for batch text embedding
+- LiteLLMEmbedder: Embeddings through litellm.aembedding, batched
+- VectorEntry / VectorMatch: Indexed summary and a scored search hit
+- VectorIndex: Interface shared by the index backends
+- InMemoryVectorIndex: Exact cosine search over a NumPy matrix
+- Neo4jVectorIndex: Summary embeddings in a Neo4j vector index
+- recency_boost(): Score bonus that decays with summary age
+
+ContextCompactor embeds summaries as it stores them and, when an index
+is configured, answers retrieve_relevant() with top-k cosine similarity
+plus a recency boost instead of a substring scan over every Summary node.
+
+Usage:
+    ```python
+    from daw_agents.context.vector_index import InMemoryVectorIndex, LiteLLMEmbedder
+
+    compactor = ContextCompactor(
+        model_router=router,
+        embedder=LiteLLMEmbedder(),
+        vector_index=InMemoryVectorIndex(),
+    )
+    results = await compactor.retrieve_relevant("database migration plan")
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Protocol
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from daw_agents.memory.neo4j import Neo4jConnector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_INDEX_NAME = "summary_embeddings"
+
+
+class Embedder(Protocol):
+    """Turns texts into embedding vectors, one per text."""
+
+    async def embed(self, texts: list[str]) -> list[list[float]]: ...
+
+
+class LiteLLMEmbedder:
+    """Embedder backed by litellm.aembedding.
+
+    Texts are sent in batches of batch_size, so backfilling thousands of
+    summaries costs a handful of API calls.
+    """
+
+    def __init__(self, model: str = DEFAULT_EMBEDDING_MODEL, batch_size: int = 256) -> None:
+        self.model = model
+        self.batch_size = batch_size
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, preserving order."""
+        from litellm import aembedding
+
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start : start + self.batch_size]
+            response = await aembedding(model=self.model, input=batch)
+            data = sorted(response.data, key=lambda item: item["index"])
+            vectors.extend(list(item["embedding"]) for item in data)
+        return vectors
+
+
+@dataclass
+class VectorEntry:
+    """A summary stored in a vector index.
+
+    Attributes:
+        id: Summary identifier (the Neo4j element_id when stored in Neo4j)
+        vector: Embedding of the summary content
+        content: Summary text
+        conversation_id: Conversation the summary belongs to
+        created_at: When the summary was created
+        metadata: Other summary properties (message_count, indexes, ...)
+    """
+
+    id: str
+    vector: list[float]
+    content: str
+    conversation_id: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class VectorMatch:
+    """A search hit: the entry (without vector) and its cosine similarity."""
+
+    id: str
+    content: str
+    conversation_id: str
+    created_at: datetime
+    similarity: float
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def recency_boost(
+    created_at: datetime,
+    weight: float,
+    half_life_hours: float,
+    now: datetime | None = None,
+) -> float:
+    """Score bonus for recent summaries, halving every half_life_hours.
+
+    Args:
+        created_at: When the summary was created
+        weight: Bonus for a summary created just now
+        half_life_hours: Age at which the bonus has halved
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Bonus between 0 and weight
+    """
+    if weight <= 0 or half_life_hours <= 0:
+        return 0.0
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=UTC)
+    age_hours = max(((now or datetime.now(UTC)) - created_at).total_seconds(), 0.0) / 3600
+    return weight * math.pow(0.5, age_hours / half_life_hours)
+
+
+def parse_created_at(value: Any) -> datetime:
+    """Read a stored created_at (datetime or ISO string), defaulting to now."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.now(UTC)
+
+
+class VectorIndex(ABC):
+    """Interface for summary vector indexes."""
+
+    @abstractmethod
+    async def add(self, entries: list[VectorEntry]) -> None:
+        """Add entries, replacing any with the same id."""
+
+    @abstractmethod
+    async def search(self, vector: list[float], k: int) -> list[VectorMatch]:
+        """Return the k entries most similar to vector, best first."""
+
+
+class InMemoryVectorIndex(VectorIndex):
+    """Exact cosine search over an in-process NumPy matrix.
+
+    Vectors are normalized on insert, so a search is one matrix-vector
+    product plus a partial sort. Suitable for tests and single-process
+    deployments; at a few hundred thousand summaries use Neo4jVectorIndex.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[VectorEntry] = []
+        self._positions: dict[str, int] = {}
+        self._vectors: list[np.ndarray] = []
+        self._matrix: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm else array
+
+    async def add(self, entries: list[VectorEntry]) -> None:
+        for entry in entries:
+            normalized = self._normalize(entry.vector)
+            position = self._positions.get(entry.id)
+            if position is None:
+                self._positions[entry.id] = len(self._entries)
+                self._entries.append(entry)
+                self._vectors.append(normalized)
+            else:
+                self._entries[position] = entry
+                self._vectors[position] = normalized
+        self._matrix = None
+
+    async def search(self, vector: list[float], k: int) -> list[VectorMatch]:
+        if not self._entries or k <= 0:
+            return []
+        if self._matrix is None:
+            self._matrix = np.vstack(self._vectors)
+
+        scores = self._matrix @ self._normalize(vector)
+        k = min(k, len(self._entries))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            VectorMatch(
+                id=self._entries[i].id,
+                content=self._entries[i].content,
+                conversation_id=self._entries[i].conversation_id,
+                created_at=self._entries[i].created_at,
+                similarity=float(scores[i]),
+                metadata=self._entries[i].metadata,
+            )
+            for i in top
+        ]
+
+
+class Neo4jVectorIndex(VectorIndex):
+    """Summary embeddings stored on Summary nodes with a Neo4j vector index.
+
+    The index is created (IF NOT EXISTS) on first use, with the dimension
+    of the first vector seen. Requires Neo4j 5.11+.
+    """
+
+    def __init__(
+        self,
+        connector: Neo4jConnector,
+        index_name: str = DEFAULT_INDEX_NAME,
+        label: str = "Summary",
+        property_name: str = "embedding",
+    ) -> None:
+        self.connector = connector
+        self.index_name = index_name
+        self.label = label
+        self.property_name = property_name
+        self._index_ready = False
+
+    async def ensure_index(self, dimensions: int) -> None:
+        """Create the vector index if it does not exist yet."""
+        if self._index_ready:
+            return
+        await self.connector.query(
+            cypher=(
+                f"CREATE VECTOR INDEX {self.index_name} IF NOT EXISTS "
+                f"FOR (s:{self.label}) ON (s.{self.property_name}) "
+                "OPTIONS {indexConfig: {"
+                "`vector.dimensions`: $dimensions, "
+                "`vector.similarity_function`: 'cosine'}}"
+            ),
+            params={"dimensions": dimensions},
+        )
+        self._index_ready = True
+
+    async def add(self, entries: list[VectorEntry]) -> None:
+        """Set embeddings on existing Summary nodes (one UNWIND write)."""
+        if not entries:
+            return
+        await self.ensure_index(len(entries[0].vector))
+        await self.connector.query(
+            cypher=(
+                "UNWIND $rows AS row "
+                "MATCH (s) WHERE elementId(s) = row.id "
+                f"SET s.{self.property_name} = row.vector"
+            ),
+            params={"rows": [{"id": e.id, "vector": e.vector} for e in entries]},
+        )
+
+    async def search(self, vector: list[float], k: int) -> list[VectorMatch]:
+        if k <= 0:
+            return []
+        await self.ensure_index(len(vector))
+        rows = await self.connector.query(
+            cypher="""
+                CALL db.index.vector.queryNodes($index_name, $k, $vector)
+                YIELD node, score
+                RETURN elementId(node) as id, node.content as content,
+                       node.conversation_id as conversation_id,
+                       node.message_count as message_count,
+                       node.created_at as created_at, score
+                ORDER BY score DESC
+            """,
+            params={"index_name": self.index_name, "k": k, "vector": vector},
+        )
+        # Neo4j reports cosine scores as (1 + cosine) / 2
+        return [
+            VectorMatch(
+                id=row["id"],
+                content=row["content"],
+                conversation_id=row["conversation_id"],
+                created_at=parse_created_at(row.get("created_at")),
+                similarity=2 * float(row["score"]) - 1,
+                metadata={"message_count": row.get("message_count")},
+            )
+            for row in rows
+        ]
+
+
+__all__ = [
+    "DEFAULT_EMBEDDING_MODEL",
+    "DEFAULT_INDEX_NAME",
+    "Embedder",
+    "InMemoryVectorIndex",
+    "LiteLLMEmbedder",
+    "Neo4jVectorIndex",
+    "VectorEntry",
+    "VectorIndex",
+    "VectorMatch",
+    "parse_created_at",
+    "recency_boost",
+]
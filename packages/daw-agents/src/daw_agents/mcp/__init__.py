@@ -44,21 +44,29 @@ Exports:
         - Exception classes
 
     Audit:
+        - AuditCheckpoint: Signed Merkle checkpoint over a chain segment
         - AuditConfig: Audit logging configuration
         - AuditEntry: Audit log entry model
         - AuditLogger: Main audit logging class
+        - AuditStore: Bounded, indexed in-memory audit trail
+        - AuditWriter: Background batch writer for Neo4j persistence
         - ResultStatus: Result status enum
         - compute_entry_hash: Hash computation for tamper resistance
         - verify_chain_integrity: Chain integrity verification
+        - verify_chain_parallel: Segment-parallel chain verification
 """
 
 from daw_agents.mcp.audit import (
+    AuditCheckpoint,
     AuditConfig,
     AuditEntry,
     AuditLogger,
+    AuditStore,
+    AuditWriter,
     ResultStatus,
     compute_entry_hash,
     verify_chain_integrity,
+    verify_chain_parallel,
 )
 from daw_agents.mcp.client import (
     MCPClient,
@@ -158,10 +166,14 @@ __all__ = [
     "PermissionDeniedError",
     "RoleNotFoundError",
     # Audit
+    "AuditCheckpoint",
     "AuditConfig",
     "AuditEntry",
     "AuditLogger",
+    "AuditStore",
+    "AuditWriter",
     "ResultStatus",
     "compute_entry_hash",
     "verify_chain_integrity",
+    "verify_chain_parallel",
 ]
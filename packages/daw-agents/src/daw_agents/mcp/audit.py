@@ -3,9 +3,14 @@
 This module implements comprehensive audit logging for MCP tool calls with:
 - Full audit trail of every tool call with all required metadata
 - SHA-256 hash-chaining for tamper resistance
+- Signed Merkle checkpoints over fixed-size chain segments, and
+  segment-parallel verification that can resume from a checkpoint
 - 7-year retention policy for SOC 2/ISO 27001 compliance
-- Neo4j storage for persistent audit logs
+- Neo4j storage for persistent audit logs, optionally written by a
+  background batch writer (AuditWriter) off the tool-call path
 - Helicone integration for observability
+- Bounded, indexed in-memory store (AuditStore) with incrementally
+  maintained statistics and streaming export
 
 Every tool call is logged with:
 - timestamp: When the call occurred (UTC)
@@ -57,12 +62,21 @@ from __future__ import annotations
 import asyncio
 import csv
 import hashlib
+import heapq
+import hmac
 import io
 import json
 import logging
+import multiprocessing
+import os
 import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from json.encoder import encode_basestring_ascii as _quote
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
@@ -110,6 +124,19 @@ class AuditConfig(BaseModel):
         enable_helicone: Whether to report to Helicone for observability
         max_parameter_length: Maximum length for parameter values in logs
         sanitize_sensitive_keys: Keys to redact from parameters
+        background_writes: Persist to Neo4j from a background batch writer
+            instead of awaiting a write on every tool call
+        write_batch_size: Maximum entries per Neo4j write transaction
+        write_flush_interval_ms: Longest an entry waits for its batch to fill
+        write_queue_size: Entries buffered before log_tool_call waits
+            (backpressure)
+        max_memory_entries: Entries kept in memory before the oldest is
+            evicted
+        memory_bucket_seconds: Width of the time buckets indexing the
+            in-memory store
+        checkpoint_interval: Entries per signed checkpoint segment
+            (0 disables checkpoints)
+        checkpoint_key: HMAC key used to sign and verify checkpoints
     """
 
     retention_days: int = Field(
@@ -142,6 +169,44 @@ class AuditConfig(BaseModel):
         ],
         description="Parameter keys to redact for security",
     )
+    background_writes: bool = Field(
+        default=False,
+        description="Batch Neo4j writes in a background task",
+    )
+    write_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Max entries per Neo4j write transaction",
+    )
+    write_flush_interval_ms: int = Field(
+        default=100,
+        ge=1,
+        description="Max time an entry waits for its batch to fill",
+    )
+    write_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Buffered entries before log_tool_call blocks",
+    )
+    max_memory_entries: int = Field(
+        default=100_000,
+        ge=1,
+        description="In-memory entries kept before the oldest is evicted",
+    )
+    memory_bucket_seconds: int = Field(
+        default=3600,
+        ge=1,
+        description="Time bucket width for in-memory range queries and statistics",
+    )
+    checkpoint_interval: int = Field(
+        default=0,
+        ge=0,
+        description="Entries per checkpoint segment (0 disables checkpoints)",
+    )
+    checkpoint_key: str | None = Field(
+        default=None,
+        description="HMAC key for signing checkpoints",
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -218,11 +283,107 @@ class AuditEntry(BaseModel):
     )
 
 
+class AuditCheckpoint(BaseModel):
+    """Signed summary of a fixed-size segment of the hash chain.
+
+    The logger emits one checkpoint every config.checkpoint_interval
+    entries. Its Merkle root commits to every entry hash in the segment
+    and its HMAC signature to the checkpoint itself. That makes a
+    checkpoint a trusted point to resume verification from: entries
+    after it only have to chain from last_entry_hash.
+
+    Attributes:
+        segment_index: Position of the segment in the logger's chain
+        entry_count: Number of entries in the segment
+        first_entry_id: ID of the segment's first entry
+        last_entry_id: ID of the segment's last entry
+        last_timestamp: Timestamp of the segment's last entry
+        previous_hash: Hash the segment's first entry chains from
+        last_entry_hash: Hash of the segment's last entry
+        merkle_root: Merkle root over the segment's entry hashes
+        created_at: When the checkpoint was created (UTC)
+        signature: HMAC-SHA256 of the checkpoint (None if unsigned)
+    """
+
+    segment_index: int = Field(ge=0, description="Position of the segment in the chain")
+    entry_count: int = Field(ge=1, description="Entries in the segment")
+    first_entry_id: str = Field(description="First entry of the segment")
+    last_entry_id: str = Field(description="Last entry of the segment")
+    last_timestamp: datetime = Field(description="Timestamp of the last entry")
+    previous_hash: str | None = Field(
+        default=None,
+        description="Hash the first entry chains from",
+    )
+    last_entry_hash: str = Field(description="Hash of the last entry")
+    merkle_root: str = Field(description="Merkle root over the segment's entry hashes")
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        description="When the checkpoint was created",
+    )
+    signature: str | None = Field(
+        default=None,
+        description="HMAC-SHA256 signature of the checkpoint",
+    )
+
+    def signing_payload(self) -> bytes:
+        """Canonical bytes covered by the signature."""
+        fields = self.model_dump(mode="json", exclude={"signature"})
+        return json.dumps(fields, sort_keys=True).encode("utf-8")
+
+
 # -----------------------------------------------------------------------------
 # Hash Chain Functions
 # -----------------------------------------------------------------------------
 
 
+def _entry_hash_fields(entry: AuditEntry) -> tuple[Any, ...]:
+    """Fields covered by an entry's hash, as plain (picklable) values."""
+    return (
+        entry.entry_id,
+        entry.timestamp.isoformat(),
+        entry.agent_id,
+        entry.user_id,
+        entry.tool_name,
+        entry.action,
+        entry.parameters,
+        entry.result_status.value,
+        entry.response_time_ms,
+        entry.previous_hash or "",
+    )
+
+
+def _hash_fields(fields: tuple[Any, ...], algorithm: str = "sha256") -> str:
+    """Hash the fields returned by _entry_hash_fields().
+
+    Produces the same canonical text as json.dumps(hash_data,
+    sort_keys=True) over the fields (with parameters embedded as their
+    own sort_keys JSON string), but assembles the outer object directly
+    instead of serializing it a second time.
+    """
+    (
+        entry_id,
+        timestamp,
+        agent_id,
+        user_id,
+        tool_name,
+        action,
+        parameters,
+        result_status,
+        response_time_ms,
+        previous_hash,
+    ) = fields
+    canonical = (
+        f'{{"action": {_quote(action)}, "agent_id": {_quote(agent_id)}, '
+        f'"entry_id": {_quote(entry_id)}, '
+        f'"parameters": {_quote(json.dumps(parameters, sort_keys=True))}, '
+        f'"previous_hash": {_quote(previous_hash)}, '
+        f'"response_time_ms": {int(response_time_ms)}, '
+        f'"result_status": {_quote(result_status)}, "timestamp": {_quote(timestamp)}, '
+        f'"tool_name": {_quote(tool_name)}, "user_id": {_quote(user_id)}}}'
+    )
+    return hashlib.new(algorithm, canonical.encode("utf-8")).hexdigest()
+
+
 def compute_entry_hash(entry: AuditEntry, algorithm: str = "sha256") -> str:
     """Compute SHA-256 hash of an audit entry for chain integrity.
 
@@ -238,27 +399,7 @@ def compute_entry_hash(entry: AuditEntry, algorithm: str = "sha256") -> str:
     Returns:
         Hex-encoded hash string (64 characters for SHA-256)
     """
-    # Create canonical representation for hashing
-    hash_data = {
-        "entry_id": entry.entry_id,
-        "timestamp": entry.timestamp.isoformat(),
-        "agent_id": entry.agent_id,
-        "user_id": entry.user_id,
-        "tool_name": entry.tool_name,
-        "action": entry.action,
-        "parameters": json.dumps(entry.parameters, sort_keys=True),
-        "result_status": entry.result_status.value,
-        "response_time_ms": entry.response_time_ms,
-        "previous_hash": entry.previous_hash or "",
-    }
-
-    # Create deterministic JSON string
-    canonical = json.dumps(hash_data, sort_keys=True)
-
-    # Compute hash
-    hasher = hashlib.new(algorithm)
-    hasher.update(canonical.encode("utf-8"))
-    return hasher.hexdigest()
+    return _hash_fields(_entry_hash_fields(entry), algorithm)
 
 
 def verify_chain_integrity(entries: list[AuditEntry]) -> bool:
@@ -309,6 +450,873 @@ def verify_chain_integrity(entries: list[AuditEntry]) -> bool:
     return True
 
 
+def entry_to_properties(entry: AuditEntry) -> dict[str, Any]:
+    """Convert an audit entry to Neo4j node properties.
+
+    Args:
+        entry: The audit entry to store
+
+    Returns:
+        Flat property dictionary (parameters JSON-encoded, datetimes ISO 8601)
+    """
+    return {
+        "entry_id": entry.entry_id,
+        "timestamp": entry.timestamp.isoformat(),
+        "agent_id": entry.agent_id,
+        "user_id": entry.user_id,
+        "tool_name": entry.tool_name,
+        "action": entry.action,
+        "parameters": json.dumps(entry.parameters),
+        "result_status": entry.result_status.value,
+        "response_time_ms": entry.response_time_ms,
+        "previous_hash": entry.previous_hash,
+        "entry_hash": entry.entry_hash,
+        "error_details": entry.error_details,
+        "session_id": entry.session_id,
+        "token_id": entry.token_id,
+        "retention_until": (
+            entry.retention_until.isoformat() if entry.retention_until else None
+        ),
+    }
+
+
+def entry_from_properties(node: dict[str, Any]) -> AuditEntry:
+    """Rebuild an audit entry from Neo4j node properties.
+
+    Args:
+        node: Properties as written by entry_to_properties()
+
+    Returns:
+        The audit entry
+    """
+    return AuditEntry(
+        entry_id=node.get("entry_id", ""),
+        timestamp=datetime.fromisoformat(node.get("timestamp", "")),
+        agent_id=node.get("agent_id", ""),
+        user_id=node.get("user_id", ""),
+        tool_name=node.get("tool_name", ""),
+        action=node.get("action", ""),
+        parameters=json.loads(node.get("parameters", "{}")),
+        result_status=ResultStatus(node.get("result_status", "error")),
+        response_time_ms=node.get("response_time_ms", 0),
+        previous_hash=node.get("previous_hash"),
+        entry_hash=node.get("entry_hash"),
+        error_details=node.get("error_details"),
+        session_id=node.get("session_id"),
+        token_id=node.get("token_id"),
+        retention_until=(
+            datetime.fromisoformat(node["retention_until"])
+            if node.get("retention_until")
+            else None
+        ),
+    )
+
+
+# -----------------------------------------------------------------------------
+# Checkpoints and Segment Verification
+# -----------------------------------------------------------------------------
+
+
+def merkle_root(hashes: Sequence[str], algorithm: str = "sha256") -> str:
+    """Compute the Merkle root over a sequence of hex-encoded entry hashes.
+
+    Inner nodes hash a 0x01 prefix plus both children; an unpaired node is
+    carried up a level unchanged rather than duplicated.
+
+    Args:
+        hashes: Entry hashes in chain order
+        algorithm: Hash algorithm (default: sha256)
+
+    Returns:
+        Hex-encoded root (the hash of no data for an empty sequence)
+    """
+    if not hashes:
+        return hashlib.new(algorithm).hexdigest()
+
+    level = [bytes.fromhex(h) for h in hashes]
+    while len(level) > 1:
+        parents = [
+            hashlib.new(algorithm, b"\x01" + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level[0].hex()
+
+
+def sign_checkpoint(checkpoint: AuditCheckpoint, key: str) -> AuditCheckpoint:
+    """Return a copy of a checkpoint carrying its HMAC-SHA256 signature.
+
+    Args:
+        checkpoint: Checkpoint to sign
+        key: Signing key (config.checkpoint_key)
+
+    Returns:
+        The signed checkpoint
+    """
+    return checkpoint.model_copy(update={"signature": _checkpoint_hmac(checkpoint, key)})
+
+
+def verify_checkpoint_signature(checkpoint: AuditCheckpoint, key: str) -> bool:
+    """Check a checkpoint's HMAC-SHA256 signature.
+
+    Args:
+        checkpoint: Checkpoint to check
+        key: Signing key (config.checkpoint_key)
+
+    Returns:
+        True if the checkpoint is signed with this key and unmodified
+    """
+    if checkpoint.signature is None:
+        return False
+    return hmac.compare_digest(checkpoint.signature, _checkpoint_hmac(checkpoint, key))
+
+
+def _checkpoint_hmac(checkpoint: AuditCheckpoint, key: str) -> str:
+    return hmac.new(key.encode("utf-8"), checkpoint.signing_payload(), hashlib.sha256).hexdigest()
+
+
+@dataclass
+class SegmentVerification:
+    """Result of verifying one contiguous segment of the hash chain.
+
+    A segment is checked on its own: stored hashes against recomputed
+    ones and the links between its entries. The link from the segment's
+    first entry to whatever precedes it is left to the caller, using
+    first_previous_hash.
+    """
+
+    valid: bool
+    entry_count: int = 0
+    first_entry_id: str | None = None
+    first_previous_hash: str | None = None
+    last_entry_id: str | None = None
+    last_entry_hash: str | None = None
+    merkle_root: str | None = None
+    failed_entry_id: str | None = None
+    reason: str | None = None
+
+
+def verify_segment(
+    rows: Sequence[tuple[tuple[Any, ...], str | None]],
+    algorithm: str = "sha256",
+) -> SegmentVerification:
+    """Verify one segment of the hash chain.
+
+    Module-level and given plain tuples so it can run in a process pool.
+
+    Args:
+        rows: (hash fields, stored entry hash) per entry, in chain order
+        algorithm: Hash algorithm the entries were hashed with
+
+    Returns:
+        The segment's verification result
+    """
+    if not rows:
+        return SegmentVerification(valid=True)
+
+    hashes: list[str] = []
+    for fields, stored_hash in rows:
+        entry_id, previous_hash = fields[0], fields[-1] or None
+        computed = _hash_fields(fields, algorithm)
+        if stored_hash is not None and stored_hash != computed:
+            return SegmentVerification(
+                valid=False, failed_entry_id=entry_id, reason="hash mismatch"
+            )
+        if hashes and previous_hash != hashes[-1]:
+            return SegmentVerification(
+                valid=False, failed_entry_id=entry_id, reason="chain broken"
+            )
+        hashes.append(computed)
+
+    return SegmentVerification(
+        valid=True,
+        entry_count=len(rows),
+        first_entry_id=rows[0][0][0],
+        first_previous_hash=rows[0][0][-1] or None,
+        last_entry_id=rows[-1][0][0],
+        last_entry_hash=hashes[-1],
+        merkle_root=merkle_root(hashes, algorithm),
+    )
+
+
+def _segment_rows(entries: Sequence[AuditEntry]) -> list[tuple[tuple[Any, ...], str | None]]:
+    return [(_entry_hash_fields(entry), entry.entry_hash) for entry in entries]
+
+
+@dataclass
+class ChainVerification:
+    """Outcome of verifying a hash chain segment by segment.
+
+    Segment results are added in chain order; each must be valid and
+    chain from the previous segment's last hash.
+
+    Attributes:
+        valid: Whether everything checked so far is intact
+        entries_checked: Entries in the segments that verified
+        segments_checked: Segments that verified
+        last_entry_id: Last verified entry
+        last_entry_hash: Hash of the last verified entry
+        failed_entry_id: Entry where verification failed
+        reason: Why verification failed
+    """
+
+    valid: bool = True
+    entries_checked: int = 0
+    segments_checked: int = 0
+    last_entry_id: str | None = None
+    last_entry_hash: str | None = None
+    failed_entry_id: str | None = None
+    reason: str | None = None
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def add(self, segment: SegmentVerification, check_link: bool = True) -> bool:
+        """Fold in the next segment's result.
+
+        Args:
+            segment: Result of verify_segment() for the next segment
+            check_link: Whether the segment must chain from last_entry_hash
+
+        Returns:
+            Whether the chain is still valid
+        """
+        if not self.valid:
+            return False
+        if not segment.valid:
+            self._fail(segment.failed_entry_id, segment.reason)
+        elif check_link and segment.first_previous_hash != self.last_entry_hash:
+            self._fail(segment.first_entry_id, "chain broken")
+        elif segment.entry_count:
+            self.entries_checked += segment.entry_count
+            self.segments_checked += 1
+            self.last_entry_id = segment.last_entry_id
+            self.last_entry_hash = segment.last_entry_hash
+        return self.valid
+
+    def _fail(self, entry_id: str | None, reason: str | None) -> None:
+        self.valid = False
+        self.failed_entry_id = entry_id
+        self.reason = reason
+        logger.warning("Audit chain verification failed at entry %s: %s", entry_id, reason)
+
+
+def _process_pool(max_workers: int | None) -> ProcessPoolExecutor:
+    """Create a process pool for segment verification.
+
+    Workers are started with forkserver (spawn where it is unavailable)
+    rather than forked, so they do not inherit the event loop, driver
+    threads or held locks of this process.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context(method)
+    )
+
+
+def verify_chain_parallel(
+    entries: Sequence[AuditEntry],
+    segment_size: int = 1000,
+    max_workers: int | None = None,
+    previous_hash: str | None = None,
+    algorithm: str = "sha256",
+) -> ChainVerification:
+    """Verify an audit entry chain with segments checked in a process pool.
+
+    Args:
+        entries: Audit entries in chain order
+        segment_size: Entries verified per task
+        max_workers: Worker processes (default: CPU count; 1 verifies
+            in this process)
+        previous_hash: Hash the first entry must chain from, e.g. a
+            trusted checkpoint's last_entry_hash (None skips that check)
+        algorithm: Hash algorithm the entries were hashed with
+
+    Returns:
+        The verification result
+    """
+    result = ChainVerification(last_entry_hash=previous_hash)
+    segments = [
+        _segment_rows(entries[start : start + segment_size])
+        for start in range(0, len(entries), segment_size)
+    ]
+
+    def fold(outcomes: Iterator[SegmentVerification]) -> None:
+        for index, outcome in enumerate(outcomes):
+            if not result.add(outcome, check_link=index > 0 or previous_hash is not None):
+                return
+
+    if max_workers == 1 or len(segments) <= 1:
+        fold(verify_segment(rows, algorithm) for rows in segments)
+        return result
+
+    executor = _process_pool(max_workers)
+    try:
+        fold(executor.map(verify_segment, segments, [algorithm] * len(segments)))
+    finally:
+        executor.shutdown(cancel_futures=True)
+    return result
+
+
+def verify_checkpoint(
+    entries: Sequence[AuditEntry],
+    checkpoint: AuditCheckpoint,
+    key: str | None = None,
+    algorithm: str = "sha256",
+) -> bool:
+    """Check a checkpoint's segment of entries against the checkpoint.
+
+    Args:
+        entries: The entries of the checkpoint's segment, in chain order
+        checkpoint: The checkpoint
+        key: Signing key; when given, the signature must also be valid
+        algorithm: Hash algorithm the entries were hashed with
+
+    Returns:
+        True if the entries verify and match the checkpoint
+    """
+    if key is not None and not verify_checkpoint_signature(checkpoint, key):
+        logger.warning("Invalid signature on audit checkpoint %d", checkpoint.segment_index)
+        return False
+
+    segment = verify_segment(_segment_rows(entries), algorithm)
+    return (
+        segment.valid
+        and segment.entry_count == checkpoint.entry_count
+        and segment.first_entry_id == checkpoint.first_entry_id
+        and segment.first_previous_hash == checkpoint.previous_hash
+        and segment.last_entry_hash == checkpoint.last_entry_hash
+        and segment.merkle_root == checkpoint.merkle_root
+    )
+
+
+# -----------------------------------------------------------------------------
+# In-Memory Store
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class AuditStatistics:
+    """Running totals over a set of audit entries.
+
+    Maintained incrementally: entries are added when logged and removed
+    when evicted or purged, so reading the totals never rescans entries.
+    """
+
+    total_entries: int = 0
+    total_response_time_ms: int = 0
+    status_counts: dict[str, int] = field(default_factory=dict)
+    by_agent: dict[str, int] = field(default_factory=dict)
+    by_tool: dict[str, int] = field(default_factory=dict)
+
+    def add(self, entry: AuditEntry, count: int = 1) -> None:
+        """Count an entry in (count=1) or out (count=-1) of the totals."""
+        self.total_entries += count
+        self.total_response_time_ms += count * entry.response_time_ms
+        for counts, key in (
+            (self.status_counts, entry.result_status.value),
+            (self.by_agent, entry.agent_id),
+            (self.by_tool, entry.tool_name),
+        ):
+            value = counts.get(key, 0) + count
+            if value:
+                counts[key] = value
+            else:
+                del counts[key]
+
+    def merge(self, other: AuditStatistics) -> None:
+        """Add another set of totals to these."""
+        self.total_entries += other.total_entries
+        self.total_response_time_ms += other.total_response_time_ms
+        for counts, extra in (
+            (self.status_counts, other.status_counts),
+            (self.by_agent, other.by_agent),
+            (self.by_tool, other.by_tool),
+        ):
+            for key, value in extra.items():
+                counts[key] = counts.get(key, 0) + value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary in the format returned by AuditLogger.get_audit_statistics()."""
+        return {
+            "total_entries": self.total_entries,
+            "success_count": self.status_counts.get(ResultStatus.SUCCESS.value, 0),
+            "failure_count": self.status_counts.get(ResultStatus.FAILURE.value, 0),
+            "denied_count": self.status_counts.get(ResultStatus.DENIED.value, 0),
+            "error_count": self.status_counts.get(ResultStatus.ERROR.value, 0),
+            "timeout_count": self.status_counts.get(ResultStatus.TIMEOUT.value, 0),
+            "avg_response_time_ms": (
+                self.total_response_time_ms / self.total_entries
+                if self.total_entries
+                else 0.0
+            ),
+            "by_agent": dict(self.by_agent),
+            "by_tool": dict(self.by_tool),
+        }
+
+
+class AuditStore:
+    """Bounded in-memory audit trail with secondary indexes.
+
+    Entries live in a ring buffer of max_entries slots addressed by a
+    monotonically increasing sequence number; once full, each new entry
+    evicts the oldest. Sequence numbers of every entry are indexed by
+    agent_id, user_id, tool_name, session_id, result_status and time
+    bucket, so a filtered query only visits entries of its most
+    selective criterion. Statistics are kept overall and per time bucket.
+
+    Example:
+        store = AuditStore(max_entries=50_000)
+        store.append(entry)
+        entries = store.query(agent_id="executor", limit=100)
+        stats = store.statistics()
+    """
+
+    INDEXED_FIELDS = ("agent_id", "user_id", "tool_name", "session_id", "result_status")
+
+    def __init__(self, max_entries: int = 100_000, bucket_seconds: int = 3600) -> None:
+        """Initialize the store.
+
+        Args:
+            max_entries: Entries kept before the oldest is evicted
+            bucket_seconds: Width of the time buckets used for range
+                queries and per-range statistics
+        """
+        self.max_entries = max_entries
+        self.bucket_seconds = bucket_seconds
+        self._slots: list[tuple[int, AuditEntry] | None] = []
+        self._next_seq = 0
+        self._size = 0
+        self._indexes: dict[str, dict[Any, deque[int]]] = {
+            name: {} for name in self.INDEXED_FIELDS
+        }
+        self._buckets: dict[int, deque[int]] = {}
+        self._bucket_stats: dict[int, AuditStatistics] = {}
+        self._stats = AuditStatistics()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[AuditEntry]:
+        """Iterate over the stored entries in the order they were appended."""
+        for seq in range(max(0, self._next_seq - self.max_entries), self._next_seq):
+            entry = self._get(seq)
+            if entry is not None:
+                yield entry
+
+    def _bucket(self, timestamp: datetime) -> int:
+        return int(timestamp.timestamp()) // self.bucket_seconds
+
+    def _keys(self, entry: AuditEntry) -> Iterator[tuple[dict[Any, deque[int]], Any]]:
+        for name in self.INDEXED_FIELDS:
+            value = getattr(entry, name)
+            if value is not None:
+                yield self._indexes[name], value
+
+    def _get(self, seq: int) -> AuditEntry | None:
+        if seq < 0 or seq >= self._next_seq or seq < self._next_seq - self.max_entries:
+            return None
+        slot = self._slots[seq % self.max_entries]
+        if slot is None or slot[0] != seq:
+            return None
+        return slot[1]
+
+    def append(self, entry: AuditEntry) -> None:
+        """Add an entry, evicting the oldest one if the store is full.
+
+        Args:
+            entry: Audit entry to store
+        """
+        seq = self._next_seq
+        position = seq % self.max_entries
+        if seq < self.max_entries:
+            self._slots.append((seq, entry))
+        else:
+            evicted = self._slots[position]
+            if evicted is not None:
+                self._remove(*evicted)
+            self._slots[position] = (seq, entry)
+        self._next_seq += 1
+        self._size += 1
+
+        for index, value in self._keys(entry):
+            index.setdefault(value, deque()).append(seq)
+        bucket = self._bucket(entry.timestamp)
+        self._buckets.setdefault(bucket, deque()).append(seq)
+        self._bucket_stats.setdefault(bucket, AuditStatistics()).add(entry)
+        self._stats.add(entry)
+
+    def _remove(self, seq: int, entry: AuditEntry) -> None:
+        """Drop an entry from the indexes and statistics."""
+        bucket = self._bucket(entry.timestamp)
+        postings = [*self._keys(entry), (self._buckets, bucket)]
+        for index, value in postings:
+            seqs = index.get(value)
+            if seqs is None:
+                continue
+            # Eviction always removes the oldest entry, at the front
+            if seqs and seqs[0] == seq:
+                seqs.popleft()
+            else:
+                seqs.remove(seq)
+            if not seqs:
+                del index[value]
+        bucket_stats = self._bucket_stats.get(bucket)
+        if bucket_stats is not None:
+            bucket_stats.add(entry, -1)
+            if not bucket_stats.total_entries:
+                del self._bucket_stats[bucket]
+        self._stats.add(entry, -1)
+        self._size -= 1
+
+    def _time_buckets(
+        self, start_time: datetime | None, end_time: datetime | None
+    ) -> list[int]:
+        """Keys of the time buckets overlapping a range, oldest first."""
+        low = self._bucket(start_time) if start_time is not None else None
+        high = self._bucket(end_time) if end_time is not None else None
+        return sorted(
+            bucket
+            for bucket in self._buckets
+            if (low is None or bucket >= low) and (high is None or bucket <= high)
+        )
+
+    def iter_query(
+        self,
+        agent_id: str | None = None,
+        user_id: str | None = None,
+        tool_name: str | None = None,
+        result_status: ResultStatus | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        session_id: str | None = None,
+    ) -> Iterator[AuditEntry]:
+        """Iterate over matching entries in the order they were appended.
+
+        The candidate entries come from the smallest matching index; the
+        remaining criteria are checked per candidate. Entries appended
+        while iterating are not included.
+
+        Args:
+            (same as AuditLogger.query_audit_trail, without limit)
+
+        Yields:
+            Matching audit entries
+        """
+        criteria = {
+            "agent_id": agent_id,
+            "user_id": user_id,
+            "tool_name": tool_name,
+            "session_id": session_id,
+            "result_status": result_status,
+        }
+        smallest: Sequence[int] | None = None
+        for name, value in criteria.items():
+            if value is None:
+                continue
+            seqs = self._indexes[name].get(value)
+            if seqs is None:
+                return
+            if smallest is None or len(seqs) < len(smallest):
+                smallest = seqs
+        if start_time is not None or end_time is not None:
+            # Buckets are only merged when they are the smallest candidate
+            buckets = self._time_buckets(start_time, end_time)
+            size = sum(len(self._buckets[bucket]) for bucket in buckets)
+            if smallest is None or size < len(smallest):
+                smallest = list(heapq.merge(*(self._buckets[bucket] for bucket in buckets)))
+
+        seq_range: Sequence[int]
+        if smallest is not None:
+            # Copy so appends during iteration cannot mutate the postings
+            seq_range = list(smallest)
+        else:
+            seq_range = range(max(0, self._next_seq - self.max_entries), self._next_seq)
+
+        for seq in seq_range:
+            entry = self._get(seq)
+            if entry is None:
+                continue
+            if any(
+                value is not None and getattr(entry, name) != value
+                for name, value in criteria.items()
+            ):
+                continue
+            if start_time is not None and entry.timestamp < start_time:
+                continue
+            if end_time is not None and entry.timestamp > end_time:
+                continue
+            yield entry
+
+    def query(
+        self,
+        agent_id: str | None = None,
+        user_id: str | None = None,
+        tool_name: str | None = None,
+        result_status: ResultStatus | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        session_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[AuditEntry]:
+        """Return matching entries in chronological order.
+
+        Args:
+            (same as AuditLogger.query_audit_trail)
+
+        Returns:
+            List of matching audit entries sorted by timestamp
+        """
+        results = list(
+            self.iter_query(
+                agent_id=agent_id,
+                user_id=user_id,
+                tool_name=tool_name,
+                result_status=result_status,
+                start_time=start_time,
+                end_time=end_time,
+                session_id=session_id,
+            )
+        )
+        results.sort(key=lambda e: e.timestamp)
+        return results[:limit] if limit is not None else results
+
+    def statistics(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Summary statistics, optionally restricted to a time range.
+
+        Without a range the running totals are returned as-is. With one,
+        buckets entirely inside the range contribute their running totals
+        and only entries in the two edge buckets are inspected.
+
+        Args:
+            start_time: Count entries at or after this time
+            end_time: Count entries at or before this time
+
+        Returns:
+            Dictionary in the format of AuditLogger.get_audit_statistics()
+        """
+        if start_time is None and end_time is None:
+            return self._stats.to_dict()
+
+        totals = AuditStatistics()
+        low = self._bucket(start_time) if start_time is not None else None
+        high = self._bucket(end_time) if end_time is not None else None
+        for bucket, bucket_stats in self._bucket_stats.items():
+            if (low is not None and bucket < low) or (high is not None and bucket > high):
+                continue
+            if bucket == low or bucket == high:
+                for seq in self._buckets.get(bucket, ()):
+                    entry = self._get(seq)
+                    if entry is None:
+                        continue
+                    if start_time is not None and entry.timestamp < start_time:
+                        continue
+                    if end_time is not None and entry.timestamp > end_time:
+                        continue
+                    totals.add(entry)
+            else:
+                totals.merge(bucket_stats)
+        return totals.to_dict()
+
+    def purge_expired(self, now: datetime) -> int:
+        """Remove entries whose retention period has ended.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Number of entries removed
+        """
+        expired = [
+            (seq, entry)
+            for seq in range(max(0, self._next_seq - self.max_entries), self._next_seq)
+            if (entry := self._get(seq)) is not None
+            and entry.retention_until is not None
+            and entry.retention_until < now
+        ]
+        for seq, entry in expired:
+            self._remove(seq, entry)
+            self._slots[seq % self.max_entries] = None
+        return len(expired)
+
+
+# -----------------------------------------------------------------------------
+# Background Writer
+# -----------------------------------------------------------------------------
+
+
+AUDIT_NODE_LABELS = ["AuditEntry", "MCP"]
+CHECKPOINT_NODE_LABELS = ["AuditCheckpoint", "MCP"]
+
+
+@dataclass
+class AuditWriterStats:
+    """Counters for the background audit writer."""
+
+    queued: int = 0
+    written: int = 0
+    batches: int = 0
+    retries: int = 0
+    dropped: int = 0
+    max_batch: int = 0
+
+
+class AuditWriter:
+    """Background writer that group-commits audit entries to Neo4j.
+
+    Entries are buffered in a bounded queue and written by one task, one
+    UNWIND transaction per batch. A batch is written once it reaches
+    batch_size entries or its first entry has waited flush_interval
+    seconds. Entries are written in the order they were queued, so the
+    stored hash chain has the same order as the in-memory one. When the
+    queue is full, put() waits (backpressure) rather than dropping.
+
+    A failed batch is retried with exponential backoff; after max_retries
+    it is dropped and counted in stats.dropped (the entries remain in the
+    AuditLogger's in-memory trail).
+
+    Example:
+        writer = AuditWriter(neo4j, batch_size=200, flush_interval=0.05)
+        await writer.put(entry)
+        await writer.close()  # flushes everything queued
+    """
+
+    def __init__(
+        self,
+        connector: Neo4jConnector,
+        batch_size: int = 100,
+        flush_interval: float = 0.1,
+        max_queue_size: int = 10000,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            connector: Neo4j connector the batches are written through
+            batch_size: Maximum entries per write transaction
+            flush_interval: Seconds an entry may wait for its batch to fill
+            max_queue_size: Entries buffered before put() waits
+            max_retries: Attempts per batch before it is dropped
+            retry_backoff: Initial delay between attempts (doubles each time)
+        """
+        self.connector = connector
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.stats = AuditWriterStats()
+        self._queue: asyncio.Queue[AuditEntry] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: asyncio.Task[None] | None = None
+        self._flush_requested = asyncio.Event()
+
+    @property
+    def pending(self) -> int:
+        """Entries queued but not yet written."""
+        return self._queue.qsize()
+
+    async def put(self, entry: AuditEntry) -> None:
+        """Queue an entry for writing, waiting while the queue is full.
+
+        Args:
+            entry: Audit entry with its hash chain fields set
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="audit-writer")
+        await self._queue.put(entry)
+        self.stats.queued += 1
+
+    async def flush(self) -> None:
+        """Write queued entries now and wait until they are written (or dropped)."""
+        if self._task is not None and not self._task.done():
+            self._flush_requested.set()
+            try:
+                await self._queue.join()
+            finally:
+                self._flush_requested.clear()
+
+    async def close(self) -> None:
+        """Flush queued entries and stop the writer task."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _collect_batch(self) -> list[AuditEntry]:
+        """Gather entries until the batch fills, times out or a flush is requested."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            timeout = deadline - loop.time()
+            if timeout <= 0 or self._flush_requested.is_set():
+                break
+
+            getter = asyncio.ensure_future(self._queue.get())
+            flush = asyncio.ensure_future(self._flush_requested.wait())
+            await asyncio.wait(
+                {getter, flush}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            flush.cancel()
+            getter.cancel()
+            # A getter that completed before the cancel still holds an entry
+            result, _ = await asyncio.gather(getter, flush, return_exceptions=True)
+            if isinstance(result, BaseException):
+                break
+            batch.append(result)
+        return batch
+
+    async def _write(self, batch: list[AuditEntry]) -> None:
+        properties = [entry_to_properties(entry) for entry in batch]
+        delay = self.retry_backoff
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await self.connector.create_nodes(
+                    labels=AUDIT_NODE_LABELS, properties_list=properties
+                )
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.stats.dropped += len(batch)
+                    logger.error(
+                        "Failed to persist %d audit entries to Neo4j after %d attempts: %s",
+                        len(batch),
+                        attempt,
+                        e,
+                    )
+                    return
+                self.stats.retries += 1
+                logger.warning("Audit batch write failed (attempt %d): %s", attempt, e)
+                await asyncio.sleep(delay)
+                delay *= 2
+            else:
+                self.stats.written += len(batch)
+                self.stats.batches += 1
+                self.stats.max_batch = max(self.stats.max_batch, len(batch))
+                logger.debug("Persisted %d audit entries to Neo4j", len(batch))
+                return
+
+
 # -----------------------------------------------------------------------------
 # Audit Logger
 # -----------------------------------------------------------------------------
@@ -322,17 +1330,29 @@ class AuditLogger:
     - query_audit_trail(): Query historical audit entries
     - get_audit_statistics(): Get summary statistics
     - export_audit_trail(): Export audit trail in JSON/CSV
+    - stream_audit_trail(): Export audit trail in chunks (JSON Lines/CSV/JSON)
     - purge_expired_entries(): Remove entries past retention
+    - verify_audit_trail(): Verify the hash chain, optionally from a checkpoint
 
     The logger maintains a hash chain for tamper resistance. Each entry
     includes a hash of its content plus the previous entry's hash.
 
     Supports Neo4j for persistent storage and Helicone for observability.
+    Without Neo4j, entries are kept in a bounded AuditStore holding the
+    most recent config.max_memory_entries entries.
+
+    With config.checkpoint_interval, an AuditCheckpoint is emitted every
+    that many entries. Entry timestamps strictly increase in chain order,
+    so reading entries by timestamp reads them in chain order.
+    With config.background_writes, entries are persisted by an AuditWriter
+    so tool calls do not wait on Neo4j; call close() on shutdown to flush.
 
     Attributes:
         config: Audit configuration
         neo4j_connector: Optional Neo4j connector for persistence
         helicone_tracker: Optional Helicone tracker for observability
+        writer: Background batch writer (None unless background_writes)
+        checkpoints: Checkpoints emitted by this logger, oldest first
     """
 
     def __init__(
@@ -352,14 +1372,32 @@ class AuditLogger:
         self.neo4j_connector = neo4j_connector
         self.helicone_tracker = helicone_tracker
 
-        # In-memory storage for entries (used when no Neo4j connector)
-        self._entries: list[AuditEntry] = []
+        # In-memory storage for entries (queried when no Neo4j connector)
+        self._entries = AuditStore(
+            max_entries=config.max_memory_entries,
+            bucket_seconds=config.memory_bucket_seconds,
+        )
 
         # Lock for thread-safe hash chain operations
         self._chain_lock = asyncio.Lock()
 
         # Track last entry hash for chain continuation
         self._last_entry_hash: str | None = None
+        self._last_timestamp: datetime | None = None
+
+        # Entry hashes of the segment the next checkpoint will cover
+        self.checkpoints: list[AuditCheckpoint] = []
+        self._segment_hashes: list[str] = []
+        self._segment_start: AuditEntry | None = None
+
+        self.writer: AuditWriter | None = None
+        if neo4j_connector is not None and config.background_writes:
+            self.writer = AuditWriter(
+                neo4j_connector,
+                batch_size=config.write_batch_size,
+                flush_interval=config.write_flush_interval_ms / 1000,
+                max_queue_size=config.write_queue_size,
+            )
 
         logger.debug("Initialized AuditLogger with retention_days=%d", config.retention_days)
 
@@ -460,6 +1498,11 @@ class AuditLogger:
 
         # Thread-safe hash chain update
         async with self._chain_lock:
+            # Keep timestamps strictly increasing in chain order
+            if self._last_timestamp is not None and entry.timestamp <= self._last_timestamp:
+                entry.timestamp = self._last_timestamp + timedelta(microseconds=1)
+            self._last_timestamp = entry.timestamp
+
             # Set previous hash for chain continuity
             entry.previous_hash = self._last_entry_hash
 
@@ -472,9 +1515,17 @@ class AuditLogger:
             # Store in memory
             self._entries.append(entry)
 
+            checkpoint = self._advance_checkpoint(entry)
+
+            # Queue while holding the lock so writes keep chain order
+            if self.writer is not None:
+                await self.writer.put(entry)
+
         # Persist to Neo4j if available
-        if self.neo4j_connector is not None:
+        if self.neo4j_connector is not None and self.writer is None:
             await self._persist_to_neo4j(entry)
+        if checkpoint is not None and self.neo4j_connector is not None:
+            await self._persist_checkpoint(checkpoint)
 
         # Report to Helicone if enabled
         if self.config.enable_helicone and self.helicone_tracker is not None:
@@ -504,29 +1555,9 @@ class AuditLogger:
             return None
 
         try:
-            properties = {
-                "entry_id": entry.entry_id,
-                "timestamp": entry.timestamp.isoformat(),
-                "agent_id": entry.agent_id,
-                "user_id": entry.user_id,
-                "tool_name": entry.tool_name,
-                "action": entry.action,
-                "parameters": json.dumps(entry.parameters),
-                "result_status": entry.result_status.value,
-                "response_time_ms": entry.response_time_ms,
-                "previous_hash": entry.previous_hash,
-                "entry_hash": entry.entry_hash,
-                "error_details": entry.error_details,
-                "session_id": entry.session_id,
-                "token_id": entry.token_id,
-                "retention_until": (
-                    entry.retention_until.isoformat() if entry.retention_until else None
-                ),
-            }
-
             node_id = await self.neo4j_connector.create_node(
-                labels=["AuditEntry", "MCP"],
-                properties=properties,
+                labels=AUDIT_NODE_LABELS,
+                properties=entry_to_properties(entry),
             )
 
             logger.debug("Persisted audit entry %s to Neo4j as %s", entry.entry_id, node_id)
@@ -536,6 +1567,64 @@ class AuditLogger:
             logger.error("Failed to persist audit entry to Neo4j: %s", e)
             return None
 
+    def _advance_checkpoint(self, entry: AuditEntry) -> AuditCheckpoint | None:
+        """Add an entry to the current segment, closing it when full.
+
+        Must be called with the chain lock held, in chain order.
+
+        Returns:
+            The new checkpoint if the entry completed a segment
+        """
+        interval = self.config.checkpoint_interval
+        if interval <= 0 or entry.entry_hash is None:
+            return None
+
+        if self._segment_start is None:
+            self._segment_start = entry
+        self._segment_hashes.append(entry.entry_hash)
+        if len(self._segment_hashes) < interval:
+            return None
+
+        checkpoint = AuditCheckpoint(
+            segment_index=len(self.checkpoints),
+            entry_count=len(self._segment_hashes),
+            first_entry_id=self._segment_start.entry_id,
+            last_entry_id=entry.entry_id,
+            last_timestamp=entry.timestamp,
+            previous_hash=self._segment_start.previous_hash,
+            last_entry_hash=entry.entry_hash,
+            merkle_root=merkle_root(self._segment_hashes, self.config.hash_algorithm),
+        )
+        if self.config.checkpoint_key is not None:
+            checkpoint = sign_checkpoint(checkpoint, self.config.checkpoint_key)
+
+        self.checkpoints.append(checkpoint)
+        self._segment_hashes = []
+        self._segment_start = None
+        logger.debug("Created audit checkpoint %d", checkpoint.segment_index)
+        return checkpoint
+
+    async def _persist_checkpoint(self, checkpoint: AuditCheckpoint) -> str | None:
+        """Persist a checkpoint to Neo4j.
+
+        Args:
+            checkpoint: The checkpoint to persist
+
+        Returns:
+            Neo4j node ID if successful, None otherwise
+        """
+        if self.neo4j_connector is None:
+            return None
+
+        try:
+            return await self.neo4j_connector.create_node(
+                labels=CHECKPOINT_NODE_LABELS,
+                properties=checkpoint.model_dump(mode="json"),
+            )
+        except Exception as e:
+            logger.error("Failed to persist audit checkpoint to Neo4j: %s", e)
+            return None
+
     def _report_to_helicone(self, entry: AuditEntry) -> None:
         """Report audit entry to Helicone for observability.
 
@@ -591,6 +1680,8 @@ class AuditLogger:
         """
         # If Neo4j connector available, query from database
         if self.neo4j_connector is not None:
+            # Make entries still queued in the background writer visible
+            await self.flush()
             return await self._query_from_neo4j(
                 agent_id=agent_id,
                 user_id=user_id,
@@ -602,38 +1693,17 @@ class AuditLogger:
                 limit=limit,
             )
 
-        # Otherwise, filter in-memory entries
-        results = self._entries.copy()
-
-        if agent_id is not None:
-            results = [e for e in results if e.agent_id == agent_id]
-
-        if user_id is not None:
-            results = [e for e in results if e.user_id == user_id]
-
-        if tool_name is not None:
-            results = [e for e in results if e.tool_name == tool_name]
-
-        if result_status is not None:
-            results = [e for e in results if e.result_status == result_status]
-
-        if start_time is not None:
-            results = [e for e in results if e.timestamp >= start_time]
-
-        if end_time is not None:
-            results = [e for e in results if e.timestamp <= end_time]
-
-        if session_id is not None:
-            results = [e for e in results if e.session_id == session_id]
-
-        # Sort by timestamp
-        results.sort(key=lambda e: e.timestamp)
-
-        # Apply limit
-        if limit is not None:
-            results = results[:limit]
-
-        return results
+        # Otherwise, query the in-memory store
+        return self._entries.query(
+            agent_id=agent_id,
+            user_id=user_id,
+            tool_name=tool_name,
+            result_status=result_status,
+            start_time=start_time,
+            end_time=end_time,
+            session_id=session_id,
+            limit=limit,
+        )
 
     async def _query_from_neo4j(
         self,
@@ -703,39 +1773,92 @@ class AuditLogger:
         try:
             records = await self.neo4j_connector.query(cypher, params)
 
-            entries: list[AuditEntry] = []
-            for record in records:
-                node = record.get("n", {})
-                entries.append(
-                    AuditEntry(
-                        entry_id=node.get("entry_id", ""),
-                        timestamp=datetime.fromisoformat(node.get("timestamp", "")),
-                        agent_id=node.get("agent_id", ""),
-                        user_id=node.get("user_id", ""),
-                        tool_name=node.get("tool_name", ""),
-                        action=node.get("action", ""),
-                        parameters=json.loads(node.get("parameters", "{}")),
-                        result_status=ResultStatus(node.get("result_status", "error")),
-                        response_time_ms=node.get("response_time_ms", 0),
-                        previous_hash=node.get("previous_hash"),
-                        entry_hash=node.get("entry_hash"),
-                        error_details=node.get("error_details"),
-                        session_id=node.get("session_id"),
-                        token_id=node.get("token_id"),
-                        retention_until=(
-                            datetime.fromisoformat(node["retention_until"])
-                            if node.get("retention_until")
-                            else None
-                        ),
-                    )
-                )
-
-            return entries
+            return [entry_from_properties(record.get("n", {})) for record in records]
 
         except Exception as e:
             logger.error("Failed to query audit trail from Neo4j: %s", e)
             return []
 
+    async def _iter_from_neo4j(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[AuditEntry]:
+        """Iterate over stored entries in Neo4j, one page at a time.
+
+        Pages are fetched by keyset on (timestamp, entry_id) rather than
+        SKIP, so each page is an index range scan and memory stays bounded
+        by page_size regardless of the size of the trail.
+
+        Args:
+            start_time: Only entries at or after this time
+            end_time: Only entries at or before this time
+            page_size: Entries fetched per query
+
+        Yields:
+            Audit entries in chronological order
+        """
+        if self.neo4j_connector is None:
+            return
+
+        conditions: list[str] = []
+        params: dict[str, Any] = {"page_size": page_size}
+        if start_time is not None:
+            conditions.append("n.timestamp >= $start_time")
+            params["start_time"] = start_time.isoformat()
+        if end_time is not None:
+            conditions.append("n.timestamp <= $end_time")
+            params["end_time"] = end_time.isoformat()
+        conditions.append(
+            "($after_ts IS NULL OR n.timestamp > $after_ts"
+            " OR (n.timestamp = $after_ts AND n.entry_id > $after_id))"
+        )
+
+        cypher = f"""
+            MATCH (n:AuditEntry)
+            WHERE {" AND ".join(conditions)}
+            RETURN n
+            ORDER BY n.timestamp, n.entry_id
+            LIMIT $page_size
+        """
+
+        after_ts: str | None = None
+        after_id: str | None = None
+        while True:
+            try:
+                records = await self.neo4j_connector.query(
+                    cypher, {**params, "after_ts": after_ts, "after_id": after_id}
+                )
+            except Exception as e:
+                logger.error("Failed to page audit trail from Neo4j: %s", e)
+                return
+
+            for record in records:
+                node = record.get("n", {})
+                after_ts = node.get("timestamp")
+                after_id = node.get("entry_id")
+                yield entry_from_properties(node)
+
+            if len(records) < page_size:
+                return
+
+    async def _iter_audit_entries(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[AuditEntry]:
+        """Iterate over entries in a time range from Neo4j or memory."""
+        if self.neo4j_connector is not None:
+            await self.flush()
+            async for entry in self._iter_from_neo4j(start_time, end_time, page_size):
+                yield entry
+            return
+
+        for entry in self._entries.query(start_time=start_time, end_time=end_time):
+            yield entry
+
     async def get_audit_statistics(
         self,
         start_time: datetime | None = None,
@@ -743,6 +1866,9 @@ class AuditLogger:
     ) -> dict[str, Any]:
         """Get summary statistics for audit entries.
 
+        In memory the statistics are read from running totals; with Neo4j
+        they are accumulated page by page.
+
         Args:
             start_time: Filter entries after this time
             end_time: Filter entries before this time
@@ -754,53 +1880,83 @@ class AuditLogger:
             - failure_count: Number of failed calls
             - denied_count: Number of denied calls
             - error_count: Number of error calls
+            - timeout_count: Number of timed out calls
             - avg_response_time_ms: Average response time
             - by_agent: Breakdown by agent
             - by_tool: Breakdown by tool
         """
-        entries = await self.query_audit_trail(
-            start_time=start_time,
-            end_time=end_time,
-        )
+        if self.neo4j_connector is None:
+            return self._entries.statistics(start_time=start_time, end_time=end_time)
 
-        if not entries:
-            return {
-                "total_entries": 0,
-                "success_count": 0,
-                "failure_count": 0,
-                "denied_count": 0,
-                "error_count": 0,
-                "avg_response_time_ms": 0.0,
-                "by_agent": {},
-                "by_tool": {},
-            }
-
-        success_count = sum(1 for e in entries if e.result_status == ResultStatus.SUCCESS)
-        failure_count = sum(1 for e in entries if e.result_status == ResultStatus.FAILURE)
-        denied_count = sum(1 for e in entries if e.result_status == ResultStatus.DENIED)
-        error_count = sum(1 for e in entries if e.result_status == ResultStatus.ERROR)
-        total_response_time = sum(e.response_time_ms for e in entries)
-
-        # Breakdown by agent
-        by_agent: dict[str, int] = {}
-        for entry in entries:
-            by_agent[entry.agent_id] = by_agent.get(entry.agent_id, 0) + 1
-
-        # Breakdown by tool
-        by_tool: dict[str, int] = {}
-        for entry in entries:
-            by_tool[entry.tool_name] = by_tool.get(entry.tool_name, 0) + 1
+        totals = AuditStatistics()
+        async for entry in self._iter_audit_entries(start_time, end_time):
+            totals.add(entry)
+        return totals.to_dict()
 
-        return {
-            "total_entries": len(entries),
-            "success_count": success_count,
-            "failure_count": failure_count,
-            "denied_count": denied_count,
-            "error_count": error_count,
-            "avg_response_time_ms": total_response_time / len(entries),
-            "by_agent": by_agent,
-            "by_tool": by_tool,
-        }
+    async def stream_audit_trail(
+        self,
+        format: str = "jsonl",
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[str]:
+        """Export the audit trail as a stream of text chunks.
+
+        Entries are read and serialized chunk_size at a time, so exporting
+        a large trail never holds it in memory as a whole.
+
+        Args:
+            format: "jsonl" (one JSON object per line), "csv" or "json"
+                (a single JSON array, as returned by export_audit_trail)
+            start_time: Filter entries after this time
+            end_time: Filter entries before this time
+            chunk_size: Entries serialized per yielded chunk
+
+        Yields:
+            Consecutive pieces of the export
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        fmt = format.lower()
+        if fmt not in ("jsonl", "csv", "json"):
+            raise ValueError(f"Unsupported export format: {format}")
+
+        buffer = io.StringIO()
+        writer: csv.DictWriter[str] | None = None
+        count = 0
+
+        if fmt == "json":
+            buffer.write("[")
+
+        async for entry in self._iter_audit_entries(start_time, end_time, chunk_size):
+            row = entry.model_dump(mode="json")
+            if fmt == "jsonl":
+                buffer.write(json.dumps(row, default=str))
+                buffer.write("\n")
+            elif fmt == "json":
+                buffer.write(",\n  " if count else "\n  ")
+                buffer.write(json.dumps(row, indent=2, default=str).replace("\n", "\n  "))
+            else:
+                if writer is None:
+                    writer = csv.DictWriter(buffer, fieldnames=list(row.keys()))
+                    writer.writeheader()
+                # Convert complex types to strings
+                for key, value in row.items():
+                    if isinstance(value, dict):
+                        row[key] = json.dumps(value)
+                writer.writerow(row)
+
+            count += 1
+            if count % chunk_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if fmt == "json":
+            buffer.write("\n]" if count else "]")
+        if buffer.tell():
+            yield buffer.getvalue()
 
     async def export_audit_trail(
         self,
@@ -808,48 +1964,27 @@ class AuditLogger:
         start_time: datetime | None = None,
         end_time: datetime | None = None,
     ) -> str:
-        """Export audit trail in JSON or CSV format.
+        """Export audit trail in JSON, JSON Lines or CSV format.
+
+        Use stream_audit_trail() for large trails.
 
         Args:
-            format: Export format ("json" or "csv")
+            format: Export format ("json", "jsonl" or "csv")
             start_time: Filter entries after this time
             end_time: Filter entries before this time
 
         Returns:
             String containing the exported data
         """
-        entries = await self.query_audit_trail(
-            start_time=start_time,
-            end_time=end_time,
+        return "".join(
+            [
+                chunk
+                async for chunk in self.stream_audit_trail(
+                    format=format, start_time=start_time, end_time=end_time
+                )
+            ]
         )
 
-        if format.lower() == "json":
-            return json.dumps(
-                [e.model_dump(mode="json") for e in entries],
-                indent=2,
-                default=str,
-            )
-
-        elif format.lower() == "csv":
-            output = io.StringIO()
-            if entries:
-                fieldnames = list(entries[0].model_dump().keys())
-                writer = csv.DictWriter(output, fieldnames=fieldnames)
-                writer.writeheader()
-                for entry in entries:
-                    row = entry.model_dump(mode="json")
-                    # Convert complex types to strings
-                    for key, value in row.items():
-                        if isinstance(value, dict):
-                            row[key] = json.dumps(value)
-                        elif isinstance(value, datetime):
-                            row[key] = value.isoformat()
-                    writer.writerow(row)
-            return output.getvalue()
-
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
-
     async def purge_expired_entries(self) -> int:
         """Purge audit entries past their retention period.
 
@@ -859,6 +1994,7 @@ class AuditLogger:
         now = datetime.now(UTC)
 
         if self.neo4j_connector is not None:
+            await self.flush()
             # Delete from Neo4j
             cypher = """
                 MATCH (n:AuditEntry)
@@ -879,27 +2015,160 @@ class AuditLogger:
                 return 0
 
         # Purge from in-memory storage
-        before_count = len(self._entries)
-        self._entries = [
-            e
-            for e in self._entries
-            if e.retention_until is None or e.retention_until >= now
-        ]
-        deleted_count = before_count - len(self._entries)
+        deleted_count = self._entries.purge_expired(now)
 
         logger.info("Purged %d expired audit entries", deleted_count)
         return deleted_count
 
+    async def latest_checkpoint(self) -> AuditCheckpoint | None:
+        """Get the most recent checkpoint.
+
+        Returns:
+            The latest checkpoint in Neo4j (or emitted by this logger,
+            without Neo4j), or None if there is none
+        """
+        if self.neo4j_connector is None:
+            return self.checkpoints[-1] if self.checkpoints else None
+
+        cypher = """
+            MATCH (c:AuditCheckpoint)
+            RETURN c
+            ORDER BY c.last_timestamp DESC
+            LIMIT 1
+        """
+        try:
+            records = await self.neo4j_connector.query(cypher, {})
+        except Exception as e:
+            logger.error("Failed to load audit checkpoint from Neo4j: %s", e)
+            return None
+        return AuditCheckpoint(**records[0]["c"]) if records else None
+
+    async def verify_audit_trail(
+        self,
+        since: AuditCheckpoint | None = None,
+        segment_size: int = 1000,
+        max_workers: int | None = None,
+        page_size: int = 500,
+    ) -> ChainVerification:
+        """Verify the hash chain of the stored audit trail.
+
+        Entries are read page by page (from Neo4j when connected) and
+        verified segment_size at a time, with a bounded number of segments
+        in flight, so memory does not grow with the length of the trail.
+        The first segment is verified in a thread of this process; a
+        process pool is only started once a second segment exists.
+
+        Args:
+            since: Trusted checkpoint to start after; only later entries
+                are read, and the first must chain from its last hash.
+                With config.checkpoint_key its signature must be valid.
+            segment_size: Entries verified per task
+            max_workers: Worker processes (default: CPU count; 1 verifies
+                in a thread of this process)
+            page_size: Entries fetched per Neo4j query
+
+        Returns:
+            The verification result
+        """
+        previous_hash = since.last_entry_hash if since is not None else None
+        result = ChainVerification(
+            last_entry_id=since.last_entry_id if since is not None else None,
+            last_entry_hash=previous_hash,
+        )
+        key = self.config.checkpoint_key
+        if since is not None and key is not None and not verify_checkpoint_signature(since, key):
+            result._fail(since.last_entry_id, "untrusted checkpoint")
+            return result
+
+        algorithm = self.config.hash_algorithm
+        loop = asyncio.get_running_loop()
+        executor: ProcessPoolExecutor | None = None
+        max_pending = 2 * (max_workers or os.cpu_count() or 1)
+        pending: deque[asyncio.Future[SegmentVerification]] = deque()
+        folded = 0
+        submitted = 0
+
+        def submit(entries: list[AuditEntry]) -> None:
+            nonlocal executor, submitted
+            if executor is None and submitted and max_workers != 1:
+                executor = _process_pool(max_workers)
+            rows = _segment_rows(entries)
+            pending.append(loop.run_in_executor(executor, verify_segment, rows, algorithm))
+            submitted += 1
+
+        async def drain(limit: int) -> bool:
+            nonlocal folded
+            while len(pending) > limit:
+                outcome = await pending.popleft()
+                check_link = folded > 0 or previous_hash is not None
+                folded += 1
+                if not result.add(outcome, check_link=check_link):
+                    return False
+            return True
+
+        segment: list[AuditEntry] = []
+        start_time = since.last_timestamp if since is not None else None
+        try:
+            async for entry in self._iter_audit_entries(start_time, None, page_size):
+                if start_time is not None and entry.timestamp <= start_time:
+                    continue
+                segment.append(entry)
+                if len(segment) < segment_size:
+                    continue
+                submit(segment)
+                segment = []
+                if not await drain(max_pending - 1):
+                    return result
+
+            if segment:
+                submit(segment)
+            await drain(0)
+            return result
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def flush(self) -> None:
+        """Wait until entries queued for background writing are persisted."""
+        if self.writer is not None:
+            await self.writer.flush()
+
+    async def close(self) -> None:
+        """Flush queued entries and stop the background writer.
+
+        Call on shutdown when background_writes is enabled; entries still
+        queued when the process exits are otherwise lost from Neo4j.
+        """
+        if self.writer is not None:
+            await self.writer.close()
+
 
 # -----------------------------------------------------------------------------
 # Module Exports
 # -----------------------------------------------------------------------------
 
 __all__ = [
+    "AuditCheckpoint",
     "AuditConfig",
     "AuditEntry",
     "AuditLogger",
+    "AuditStatistics",
+    "AuditStore",
+    "AuditWriter",
+    "AuditWriterStats",
+    "ChainVerification",
     "ResultStatus",
+    "SegmentVerification",
     "compute_entry_hash",
+    "entry_from_properties",
+    "entry_to_properties",
+    "merkle_root",
+    "sign_checkpoint",
     "verify_chain_integrity",
+    "verify_chain_parallel",
+    "verify_checkpoint",
+    "verify_checkpoint_signature",
+    "verify_segment",
 ]
@@ -8,6 +8,13 @@ Core Components:
 - ClaudeDriver, OpenAIDriver, GeminiDriver, LocalDriver: Provider implementations
 - DriverRegistry: Config-based driver selection (FR-10.1.3)
 - ModelRouter: Routes requests to appropriate models based on task type
+- ResponseCache: Pluggable LLM response cache (in-memory LRU, Redis or disk)
+- SingleFlight: Coalesces identical in-flight requests into one call
+- ProviderLimiter: Per-provider concurrency, RPM and TPM admission control
+- CircuitBreakerRegistry: Process-wide (driver, model) circuit breakers
+- ModelMetrics: In-process sink for streaming latency/throughput and token usage
+- RouteResult: Response plus usage returned by ModelRouter.route_with_usage
+- ClientPool: Shared, tuned HTTP connection pools for provider SDKs
 
 Design Principle:
     LLM as stateless reasoning unit, system as the OS.
@@ -35,7 +42,23 @@ Usage:
     ```
 """
 
+from daw_agents.models.cache import (
+    CacheStats,
+    DiskResponseCache,
+    InMemoryResponseCache,
+    RedisResponseCache,
+    ResponseCache,
+    make_cache_key,
+)
+from daw_agents.models.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from daw_agents.models.client_pool import ClientPool, ClientPoolConfig, get_client_pool
 from daw_agents.models.drivers import (
+    STREAM_RESTART,
     ClaudeDriver,
     CompletionResponse,
     DriverRegistry,
@@ -47,6 +70,20 @@ from daw_agents.models.drivers import (
     OpenAIDriver,
     StreamChunk,
 )
+from daw_agents.models.limiter import (
+    LimiterConfig,
+    LimiterStats,
+    ProviderLimiter,
+    TokenBucket,
+)
+from daw_agents.models.metrics import (
+    MODEL_PRICING,
+    ModelMetrics,
+    StreamStats,
+    UsageRecord,
+    estimate_cost_usd,
+    get_model_metrics,
+)
 from daw_agents.models.providers import (
     ModelConfig,
     ModelProvider,
@@ -54,10 +91,16 @@ from daw_agents.models.providers import (
     get_default_configs,
     get_helicone_config,
 )
-from daw_agents.models.router import ModelRouter, TaskType
+from daw_agents.models.router import ModelRouter, RouteResult, TaskType
+from daw_agents.models.singleflight import (
+    SingleFlight,
+    SingleFlightStats,
+    get_single_flight,
+)
 
 __all__ = [
     # Drivers (FR-10.1)
+    "STREAM_RESTART",
     "ClaudeDriver",
     "CompletionResponse",
     "DriverRegistry",
@@ -72,8 +115,41 @@ __all__ = [
     "ModelConfig",
     "ModelProvider",
     "ModelRouter",
+    "RouteResult",
     "ProviderConfig",
     "TaskType",
     "get_default_configs",
     "get_helicone_config",
+    # Response cache
+    "CacheStats",
+    "DiskResponseCache",
+    "InMemoryResponseCache",
+    "RedisResponseCache",
+    "ResponseCache",
+    "make_cache_key",
+    # Request coalescing
+    "SingleFlight",
+    "SingleFlightStats",
+    "get_single_flight",
+    # Admission control
+    "LimiterConfig",
+    "LimiterStats",
+    "ProviderLimiter",
+    "TokenBucket",
+    # Circuit breaking
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitBreakerRegistry",
+    "CircuitState",
+    # Metrics
+    "MODEL_PRICING",
+    "ModelMetrics",
+    "StreamStats",
+    "UsageRecord",
+    "estimate_cost_usd",
+    "get_model_metrics",
+    # Connection pooling
+    "ClientPool",
+    "ClientPoolConfig",
+    "get_client_pool",
 ]
@@ -0,0 +1,309 @@
+"""
+Response Cache for the DAW Model Router.
+
+This module implements a pluggable cache for LLM completions:
+- make_cache_key: Canonical hash of normalized messages + ModelConfig
+- ResponseCache: Abstract cache interface with hit/miss counters
+- InMemoryResponseCache: Process-local LRU cache with TTL
+- RedisResponseCache: Shared cache backed by Redis
+- DiskResponseCache: Cache persisted as files in a local directory
+
+Identical requests are common under retries: compaction summaries,
+validator prompts and persona critiques are frequently re-sent with the
+same messages and configuration. The ModelRouter consults the cache
+before calling a provider so those repeats cost a lookup instead of a
+completion.
+
+Only deterministic requests (temperature == 0) are cached by default.
+Sampling at temperature > 0 is expected to vary between calls, so
+caching it must be explicitly allowed by the caller.
+
+Usage:
+    ```python
+    from daw_agents.models import InMemoryResponseCache, ModelRouter
+
+    router = ModelRouter(cache=InMemoryResponseCache(max_entries=512))
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from daw_agents.models.providers import ModelConfig
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis as AsyncRedis
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "daw:llm:response"
+
+
+def _normalize_messages(messages: list[dict[str, str]]) -> list[dict[str, str]]:
+    """Normalize messages so trivially different prompts share a key.
+
+    Roles are lower-cased and surrounding whitespace is stripped from
+    content. Keys are sorted later by json.dumps.
+    """
+    normalized = []
+    for msg in messages:
+        entry = {key: str(value) for key, value in msg.items()}
+        entry["role"] = entry.get("role", "").strip().lower()
+        entry["content"] = entry.get("content", "").strip()
+        normalized.append(entry)
+    return normalized
+
+
+def make_cache_key(messages: list[dict[str, str]], config: ModelConfig) -> str:
+    """Build a canonical cache key for a routed request.
+
+    Args:
+        messages: Chat messages in OpenAI format
+        config: Model configuration used for the request
+
+    Returns:
+        Cache key of the form "daw:llm:response:<sha256>"
+    """
+    payload = {
+        "messages": _normalize_messages(messages),
+        "config": config.model_dump(mode="json"),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{digest}"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of cache lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize counters for logging or metrics export."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class ResponseCache(ABC):
+    """Abstract interface for LLM response caches.
+
+    Subclasses implement _get/_set; the public get/set methods maintain
+    the shared hit/miss counters.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def _get(self, key: str) -> str | None:
+        """Backend-specific lookup."""
+        ...
+
+    @abstractmethod
+    async def _set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """Backend-specific store."""
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all cached responses."""
+        ...
+
+    async def get(self, key: str) -> str | None:
+        """Look up a cached response, recording a hit or miss."""
+        value = await self._get(key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: float | None = None) -> None:
+        """Store a response under key for ttl_seconds (defaults to cache TTL)."""
+        await self._set(key, value, ttl_seconds or self.ttl_seconds)
+        self.stats.sets += 1
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Process-local LRU response cache with per-entry TTL.
+
+    Entries expire after their TTL and the least recently used entry is
+    evicted once max_entries is reached.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        super().__init__(ttl_seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def _set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisResponseCache(ResponseCache):
+    """Response cache shared across processes via Redis.
+
+    Uses get_async_redis_client() lazily so constructing the cache never
+    opens a connection. Redis errors are logged and treated as misses:
+    a cache outage must never fail a routed request.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRedis | None = None,
+        db: int | None = None,
+        ttl_seconds: float = 3600.0,
+        key_prefix: str = CACHE_KEY_PREFIX,
+    ) -> None:
+        super().__init__(ttl_seconds=ttl_seconds)
+        self._client = client
+        self._db = db
+        self.key_prefix = key_prefix
+
+    async def _get_client(self) -> AsyncRedis:
+        if self._client is None:
+            from daw_agents.config.redis import RedisConfig, get_async_redis_client
+
+            db = self._db if self._db is not None else RedisConfig().db_cache
+            self._client = await get_async_redis_client(db=db)
+        return self._client
+
+    async def _get(self, key: str) -> str | None:
+        try:
+            client = await self._get_client()
+            value = await client.get(key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("Response cache lookup failed: %s", e)
+            return None
+        return str(value) if value is not None else None
+
+    async def _set(self, key: str, value: str, ttl_seconds: float) -> None:
+        try:
+            client = await self._get_client()
+            await client.set(key, value, ex=max(1, int(ttl_seconds)))
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("Response cache store failed: %s", e)
+
+    async def clear(self) -> None:
+        client = await self._get_client()
+        async for key in client.scan_iter(match=f"{self.key_prefix}:*"):
+            await client.delete(key)
+
+
+class DiskResponseCache(ResponseCache):
+    """Cache persisted as one JSON file per key under a directory.
+
+    Survives restarts and can be shared by processes on the same host.
+    Files are written atomically (temp file + rename); unreadable or
+    expired entries are treated as misses.
+    """
+
+    def __init__(self, directory: str | Path, ttl_seconds: float = 3600.0) -> None:
+        super().__init__(ttl_seconds=ttl_seconds)
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    async def _get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._read, self._path(key))
+
+    async def _set(self, key: str, value: str, ttl_seconds: float) -> None:
+        entry = json.dumps({"expires_at": time.time() + ttl_seconds, "value": value})
+        try:
+            await asyncio.to_thread(self._write, self._path(key), entry)
+        except OSError as e:
+            self.stats.errors += 1
+            logger.warning("Disk cache store failed: %s", e)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    def _read(self, path: Path) -> str | None:
+        try:
+            entry = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.stats.errors += 1
+            logger.warning("Disk cache lookup failed: %s", e)
+            return None
+        if entry.get("expires_at", 0) <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return str(entry["value"])
+
+    def _write(self, path: Path, entry: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(entry)
+            os.replace(temp, path)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
+
+    def _clear(self) -> None:
+        for path in self.directory.glob("*/*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,226 @@
+"""
+Circuit Breaker for Model Drivers.
+
+This module implements per-(driver, model) circuit breaking:
+- CircuitState: CLOSED / OPEN / HALF_OPEN
+- CircuitBreakerConfig: Window size, error-rate and p95-latency thresholds
+- CircuitBreaker: Rolling-window health tracking for one driver/model pair
+- CircuitBreakerRegistry: Process-wide breakers shared by all routers
+
+A breaker trips OPEN when, within the rolling window and after at least
+min_calls samples, either the error rate or the p95 latency crosses its
+threshold. While OPEN, DriverWithFallback skips the primary and goes
+straight to the fallback instead of paying the full primary timeout.
+After open_seconds the breaker lets a limited number of probe calls
+through (HALF_OPEN); a successful probe closes it again, a failed one
+re-opens it.
+
+Usage:
+    ```python
+    breaker = CircuitBreakerRegistry.get("claude", "claude-sonnet-4-20250514")
+    if breaker.allow_request():
+        ...
+        breaker.record_success(latency)
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Thresholds for a circuit breaker.
+
+    Attributes:
+        window_seconds: Length of the rolling window of call samples
+        min_calls: Samples required in the window before the breaker can trip
+        error_rate_threshold: Error fraction (0.0-1.0) that trips the breaker
+        p95_latency_threshold: p95 latency in seconds that trips the breaker
+                               (None disables latency-based tripping)
+        open_seconds: Time spent OPEN before probing in HALF_OPEN
+        half_open_max_calls: Concurrent probe calls allowed in HALF_OPEN
+    """
+
+    window_seconds: float = 60.0
+    min_calls: int = 10
+    error_rate_threshold: float = 0.5
+    p95_latency_threshold: float | None = None
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for one (driver, model) pair."""
+
+    def __init__(self, name: str, config: CircuitBreakerConfig | None = None) -> None:
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        # (timestamp, succeeded, latency_seconds)
+        self._samples: deque[tuple[float, bool, float]] = deque()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving OPEN -> HALF_OPEN once open_seconds elapse."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.config.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.config.window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+
+    def error_rate(self) -> float:
+        """Fraction of failed calls in the rolling window."""
+        self._prune()
+        if not self._samples:
+            return 0.0
+        failures = sum(1 for _, ok, _ in self._samples if not ok)
+        return failures / len(self._samples)
+
+    def p95_latency(self) -> float:
+        """95th percentile latency of calls in the rolling window."""
+        self._prune()
+        latencies = sorted(latency for _, _, latency in self._samples)
+        if not latencies:
+            return 0.0
+        index = max(0, math.ceil(0.95 * len(latencies)) - 1)
+        return latencies[index]
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted now.
+
+        In HALF_OPEN only half_open_max_calls probes are let through.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.OPEN:
+            return False
+        if self._half_open_in_flight < self.config.half_open_max_calls:
+            self._half_open_in_flight += 1
+            return True
+        return False
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful call."""
+        if self._state == CircuitState.HALF_OPEN:
+            logger.info("Circuit %s closed after successful probe", self.name)
+            self._state = CircuitState.CLOSED
+            self._samples.clear()
+        self._samples.append((time.monotonic(), True, latency))
+        self._evaluate()
+
+    def record_failure(self, latency: float) -> None:
+        """Record a failed call."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._trip("probe failed")
+            return
+        self._samples.append((time.monotonic(), False, latency))
+        self._evaluate()
+
+    def release_probe(self) -> None:
+        """Give back a call slot whose outcome will never be recorded.
+
+        For calls abandoned before they finished (e.g. cancelled). The
+        breaker is neither closed nor opened; in HALF_OPEN the slot
+        becomes available to the next probe.
+        """
+        if self._state == CircuitState.HALF_OPEN and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    def _evaluate(self) -> None:
+        if self._state != CircuitState.CLOSED:
+            return
+        self._prune()
+        if len(self._samples) < self.config.min_calls:
+            return
+        if self.error_rate() >= self.config.error_rate_threshold:
+            self._trip(f"error rate {self.error_rate():.0%}")
+        elif (
+            self.config.p95_latency_threshold is not None
+            and self.p95_latency() >= self.config.p95_latency_threshold
+        ):
+            self._trip(f"p95 latency {self.p95_latency():.2f}s")
+
+    def _trip(self, reason: str) -> None:
+        logger.warning("Circuit %s opened: %s", self.name, reason)
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_in_flight = 0
+
+    def reset(self) -> None:
+        """Force the breaker CLOSED and forget all samples."""
+        self._state = CircuitState.CLOSED
+        self._samples.clear()
+        self._half_open_in_flight = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize breaker health for logging or metrics export."""
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "calls": len(self._samples),
+            "error_rate": self.error_rate(),
+            "p95_latency": self.p95_latency(),
+        }
+
+
+class CircuitBreakerRegistry:
+    """Process-wide registry of circuit breakers keyed by (driver, model).
+
+    Breakers are class-level state so every ModelRouter and
+    DriverWithFallback in the process sees the same provider health.
+    """
+
+    _breakers: dict[tuple[str, str], CircuitBreaker] = {}
+    _config: CircuitBreakerConfig = CircuitBreakerConfig()
+
+    @classmethod
+    def get(cls, driver: str, model: str) -> CircuitBreaker:
+        """Get (or create) the breaker for a driver/model pair."""
+        key = (driver, model)
+        if key not in cls._breakers:
+            cls._breakers[key] = CircuitBreaker(f"{driver}:{model}", cls._config)
+        return cls._breakers[key]
+
+    @classmethod
+    def configure(cls, config: CircuitBreakerConfig) -> None:
+        """Set the config used for breakers created from now on."""
+        cls._config = config
+
+    @classmethod
+    def snapshot(cls) -> list[dict[str, Any]]:
+        """Health of every known breaker."""
+        return [breaker.to_dict() for breaker in cls._breakers.values()]
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all breakers and restore the default config."""
+        cls._breakers.clear()
+        cls._config = CircuitBreakerConfig()
@@ -0,0 +1,207 @@
+"""
+Shared HTTP Client Pool for Model Drivers.
+
+This module manages the HTTP connections used by provider SDKs:
+- ClientPoolConfig: Connection limits, keep-alive and HTTP/2 settings
+- ClientPool: One tuned httpx.AsyncClient per provider and event loop,
+  shared process-wide
+- get_client_pool(): Access the process-wide pool
+
+Provider SDKs create their own HTTP client by default, with untuned
+limits and a separate pool per SDK client. Drivers instead pass a pooled
+client from here, so bursty workloads reuse warm keep-alive connections
+rather than paying a TLS handshake per burst. prewarm() opens connections
+at startup and aclose() releases them at shutdown (wired into the
+FastAPI lifespan in daw_server.main).
+
+An httpx client's connections belong to the event loop they were opened
+on, so clients are kept per running loop; workers that run a fresh loop
+per job get their own clients instead of broken connections.
+
+Configuration (environment):
+    DAW_HTTP_MAX_CONNECTIONS=100
+    DAW_HTTP_MAX_KEEPALIVE=20
+    DAW_HTTP_KEEPALIVE_EXPIRY=60
+    DAW_HTTP2=true
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Provider endpoints contacted by prewarm(), with the env var holding their key
+PROVIDER_ENDPOINTS: dict[str, tuple[str, str]] = {
+    "anthropic": ("https://api.anthropic.com", "ANTHROPIC_API_KEY"),
+    "openai": ("https://api.openai.com", "OPENAI_API_KEY"),
+}
+
+
+@dataclass
+class ClientPoolConfig:
+    """HTTP connection pool settings shared by all provider clients.
+
+    Attributes:
+        max_connections: Maximum open connections per provider
+        max_keepalive_connections: Idle connections kept open per provider
+        keepalive_expiry: Seconds an idle connection is kept alive
+        http2: Use HTTP/2 when the h2 package is installed
+        connect_timeout: Seconds allowed to establish a connection
+        read_timeout: Seconds allowed between bytes of a response
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+    connect_timeout: float = 10.0
+    read_timeout: float = 600.0
+
+    @classmethod
+    def from_env(cls) -> ClientPoolConfig:
+        """Load pool settings from DAW_HTTP_* environment variables."""
+        defaults = cls()
+        return cls(
+            max_connections=int(
+                os.environ.get("DAW_HTTP_MAX_CONNECTIONS", defaults.max_connections)
+            ),
+            max_keepalive_connections=int(
+                os.environ.get("DAW_HTTP_MAX_KEEPALIVE", defaults.max_keepalive_connections)
+            ),
+            keepalive_expiry=float(
+                os.environ.get("DAW_HTTP_KEEPALIVE_EXPIRY", defaults.keepalive_expiry)
+            ),
+            http2=os.environ.get("DAW_HTTP2", "true").lower() in ("true", "1", "yes"),
+        )
+
+
+class ClientPool:
+    """Process-wide registry of pooled httpx clients, one per provider and loop."""
+
+    def __init__(self, config: ClientPoolConfig | None = None) -> None:
+        self.config = config or ClientPoolConfig.from_env()
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        # Clients requested outside a running loop
+        self._unbound: dict[str, httpx.AsyncClient] = {}
+
+    def _loop_clients(self) -> dict[str, httpx.AsyncClient]:
+        """Clients of the running event loop (or of no loop)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._unbound
+        return self._clients.setdefault(loop, {})
+
+    @property
+    def http2_enabled(self) -> bool:
+        """True if HTTP/2 is requested and the h2 package is available."""
+        return self.config.http2 and importlib.util.find_spec("h2") is not None
+
+    def get_http_client(self, provider: str) -> httpx.AsyncClient:
+        """Get the pooled client for a provider, creating it on first use.
+
+        Args:
+            provider: Provider name, e.g. "anthropic", "openai" or "local"
+
+        Returns:
+            Shared httpx.AsyncClient for that provider on the running loop
+        """
+        clients = self._loop_clients()
+        client = clients.get(provider)
+        if client is None or client.is_closed:
+            try:
+                import httpx
+            except ImportError as e:
+                raise ImportError(
+                    "httpx package required for pooled model clients. "
+                    "Install with: pip install httpx"
+                ) from e
+
+            client = httpx.AsyncClient(
+                http2=self.http2_enabled,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(
+                    self.config.read_timeout, connect=self.config.connect_timeout
+                ),
+            )
+            clients[provider] = client
+        return client
+
+    async def prewarm(self, endpoints: dict[str, str] | None = None) -> dict[str, bool]:
+        """Open connections to provider endpoints ahead of the first request.
+
+        Any HTTP response (even 404) counts as warm: the point is the
+        completed TCP/TLS handshake left in the keep-alive pool.
+
+        Args:
+            endpoints: Provider name -> base URL. Defaults to the providers
+                       in PROVIDER_ENDPOINTS that have an API key configured.
+
+        Returns:
+            Provider name -> whether a connection was established
+        """
+        if endpoints is None:
+            endpoints = {
+                name: url
+                for name, (url, key_var) in PROVIDER_ENDPOINTS.items()
+                if os.environ.get(key_var)
+            }
+
+        async def warm(name: str, url: str) -> bool:
+            try:
+                await self.get_http_client(name).head(url)
+            except Exception as e:
+                logger.warning("Could not pre-warm %s client (%s): %s", name, url, e)
+                return False
+            return True
+
+        names = list(endpoints)
+        results = await asyncio.gather(*(warm(name, endpoints[name]) for name in names))
+        return dict(zip(names, results))
+
+    async def aclose(self) -> None:
+        """Close the running loop's pooled clients and release their connections.
+
+        Clients of loops that are already closed are dropped; clients of
+        other running loops are left to those loops.
+        """
+        clients = list(self._loop_clients().values()) + list(self._unbound.values())
+        self._loop_clients().clear()
+        self._unbound.clear()
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Error closing pooled HTTP client: %s", e)
+
+    def __len__(self) -> int:
+        return len(self._unbound) + sum(len(c) for c in self._clients.values())
+
+
+_default_pool: ClientPool | None = None
+
+
+def get_client_pool() -> ClientPool:
+    """Return the process-wide ClientPool, creating it from env on first use."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = ClientPool()
+    return _default_pool
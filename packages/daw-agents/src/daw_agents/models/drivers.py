@@ -13,6 +13,9 @@ Design Principles:
 2. Hot-swappable drivers without code changes
 3. Config-driven selection via YAML or environment
 4. Automatic fallback on driver failure
+5. Shared per-provider admission control (see limiter.py)
+6. Circuit breaking and hedged requests (see circuit_breaker.py)
+7. Pooled, process-wide HTTP connections (see client_pool.py)
 
 Usage:
     ```python
@@ -35,14 +38,25 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from daw_agents.models.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from daw_agents.models.client_pool import get_client_pool
+from daw_agents.models.limiter import (
+    DEFAULT_PRIORITY,
+    LimiterConfig,
+    ProviderLimiter,
+    estimate_tokens,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +74,7 @@ class CompletionResponse:
     """Standardized response from any model driver.
 
     All drivers return this same structure, enabling true agnosticism.
+    fallback_used is set by DriverWithFallback when the fallback answered.
     """
 
     content: str
@@ -67,14 +82,25 @@ class CompletionResponse:
     usage: dict[str, int] = field(default_factory=dict)
     finish_reason: str = "stop"
     raw_response: Any = None
+    fallback_used: bool = False
+
+
+# finish_reason of the marker chunk emitted when a stream fails part-way and
+# restarts on the fallback model: consumers should discard content so far.
+STREAM_RESTART = "restart"
 
 
 @dataclass
 class StreamChunk:
-    """A chunk from streaming completion."""
+    """A chunk from streaming completion.
+
+    model is filled in by DriverWithFallback so consumers can tell
+    primary output from fallback output.
+    """
 
     content: str
     finish_reason: str | None = None
+    model: str | None = None
 
 
 class ModelDriver(ABC):
@@ -169,6 +195,7 @@ class ClaudeDriver(ModelDriver):
     def __init__(self, api_key: str | None = None):
         self._api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self._client: Any = None
+        self._http_client: Any = None
 
     @property
     def driver_type(self) -> DriverType:
@@ -185,10 +212,16 @@ class ClaudeDriver(ModelDriver):
         ]
 
     def _get_client(self) -> Any:
-        if self._client is None:
+        # Rebuilt when the pool hands out a new client (new loop or closed)
+        http_client = get_client_pool().get_http_client("anthropic")
+        if self._client is None or self._http_client is not http_client:
             try:
                 from anthropic import AsyncAnthropic
-                self._client = AsyncAnthropic(api_key=self._api_key)
+                self._client = AsyncAnthropic(
+                    api_key=self._api_key,
+                    http_client=http_client,
+                )
+                self._http_client = http_client
             except ImportError as e:
                 raise ImportError(
                     "anthropic package required for ClaudeDriver. "
@@ -285,6 +318,7 @@ class OpenAIDriver(ModelDriver):
         self._api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self._api_base = api_base  # For Helicone proxy
         self._client: Any = None
+        self._http_client: Any = None
 
     @property
     def driver_type(self) -> DriverType:
@@ -295,13 +329,19 @@ class OpenAIDriver(ModelDriver):
         return ["gpt-4o", "gpt-4", "o1-preview", "o1-mini", "o1"]
 
     def _get_client(self) -> Any:
-        if self._client is None:
+        # Rebuilt when the pool hands out a new client (new loop or closed)
+        http_client = get_client_pool().get_http_client("openai")
+        if self._client is None or self._http_client is not http_client:
             try:
                 from openai import AsyncOpenAI
-                kwargs: dict[str, Any] = {"api_key": self._api_key}
+                kwargs: dict[str, Any] = {
+                    "api_key": self._api_key,
+                    "http_client": http_client,
+                }
                 if self._api_base:
                     kwargs["base_url"] = self._api_base
                 self._client = AsyncOpenAI(**kwargs)
+                self._http_client = http_client
             except ImportError as e:
                 raise ImportError(
                     "openai package required for OpenAIDriver. "
@@ -533,6 +573,7 @@ class LocalDriver(ModelDriver):
         )
         self._api_key = api_key
         self._client: Any = None
+        self._http_client: Any = None
 
     @property
     def driver_type(self) -> DriverType:
@@ -548,13 +589,17 @@ class LocalDriver(ModelDriver):
         return True
 
     def _get_client(self) -> Any:
-        if self._client is None:
+        # Rebuilt when the pool hands out a new client (new loop or closed)
+        http_client = get_client_pool().get_http_client("local")
+        if self._client is None or self._http_client is not http_client:
             try:
                 from openai import AsyncOpenAI
                 self._client = AsyncOpenAI(
                     api_key=self._api_key,
                     base_url=self._api_base,
+                    http_client=http_client,
                 )
+                self._http_client = http_client
             except ImportError as e:
                 raise ImportError(
                     "openai package required for LocalDriver (uses OpenAI-compatible API). "
@@ -631,6 +676,9 @@ class DriverRegistry:
 
         # Auto-detect from model name
         driver = DriverRegistry.get_driver_for_model("claude-3-5-sonnet-20241022")
+
+        # Shared admission control for every instance of a driver type
+        limiter = DriverRegistry.get_limiter(DriverType.CLAUDE)
     """
 
     _drivers: dict[DriverType, type[ModelDriver]] = {
@@ -642,6 +690,12 @@ class DriverRegistry:
 
     _instances: dict[DriverType, ModelDriver] = {}
 
+    # Bumped whenever cached instances are dropped, so holders of drivers
+    # (e.g. ModelRouter's fallback pairs) know to fetch them again
+    generation: int = 0
+
+    _limiters: dict[DriverType, ProviderLimiter] = {}
+
     @classmethod
     def register(cls, driver_type: DriverType, driver_class: type[ModelDriver]) -> None:
         """Register a custom driver."""
@@ -702,6 +756,64 @@ class DriverRegistry:
     def clear_cache(cls) -> None:
         """Clear cached driver instances."""
         cls._instances.clear()
+        cls.generation += 1
+
+    @classmethod
+    async def prewarm(cls) -> dict[str, bool]:
+        """Open pooled provider connections before the first request.
+
+        Returns:
+            Provider name -> whether a connection was established
+        """
+        return await get_client_pool().prewarm()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close pooled HTTP connections and drop cached driver instances.
+
+        Cached SDK clients hold a reference to their pooled HTTP client, so
+        they are discarded too; the next get_driver() starts fresh and
+        ModelRouter rebuilds its fallback pairs.
+        """
+        await get_client_pool().aclose()
+        cls.clear_cache()
+
+    @classmethod
+    def get_limiter(cls, driver_type: str | DriverType) -> ProviderLimiter:
+        """Get the limiter shared by every instance of a driver type.
+
+        Limits are read from DAW_<DRIVER>_MAX_CONCURRENCY, DAW_<DRIVER>_RPM
+        and DAW_<DRIVER>_TPM the first time a limiter is requested.
+
+        Args:
+            driver_type: Driver type or its string value
+
+        Returns:
+            ProviderLimiter instance (cached)
+        """
+        if isinstance(driver_type, str):
+            driver_type = DriverType(driver_type.lower())
+
+        if driver_type not in cls._limiters:
+            cls._limiters[driver_type] = ProviderLimiter(
+                LimiterConfig.from_env(driver_type.value)
+            )
+        return cls._limiters[driver_type]
+
+    @classmethod
+    def configure_limiter(
+        cls, driver_type: str | DriverType, config: LimiterConfig
+    ) -> ProviderLimiter:
+        """Replace the limiter for a driver type with explicit limits."""
+        if isinstance(driver_type, str):
+            driver_type = DriverType(driver_type.lower())
+        cls._limiters[driver_type] = ProviderLimiter(config)
+        return cls._limiters[driver_type]
+
+    @classmethod
+    def clear_limiters(cls) -> None:
+        """Drop all limiters (and their metrics)."""
+        cls._limiters.clear()
 
 
 class DriverWithFallback:
@@ -709,12 +821,26 @@ class DriverWithFallback:
 
     FR-10.1.5: Automatic fallback on driver failure
 
+    Each call is admitted through the DriverRegistry limiter of the driver
+    that serves it, so primary and fallback are throttled independently.
+
+    If the primary stream fails after emitting content, a STREAM_RESTART
+    marker chunk is yielded before the fallback stream starts.
+
+    Each (driver, model) pair has a process-wide circuit breaker. When the
+    primary's breaker is open the primary is skipped entirely. With
+    hedge_after set, the fallback is started once the primary has been
+    running that many seconds and whichever succeeds first wins.
+
     Usage:
         driver = DriverWithFallback(
             primary=ClaudeDriver(),
             fallback=OpenAIDriver(),
         )
         response = await driver.complete(...)  # Falls back if primary fails
+
+        # Start the fallback if the primary has not answered within 5s
+        driver = DriverWithFallback(ClaudeDriver(), OpenAIDriver(), hedge_after=5.0)
     """
 
     def __init__(
@@ -722,75 +848,301 @@ class DriverWithFallback:
         primary: ModelDriver,
         fallback: ModelDriver,
         fallback_models: dict[str, str] | None = None,
+        priority: int = DEFAULT_PRIORITY,
+        use_limiter: bool = True,
+        use_circuit_breaker: bool = True,
+        hedge_after: float | None = None,
     ):
         self.primary = primary
         self.fallback = fallback
         self.fallback_models = fallback_models or {}
+        self.priority = priority
+        self.use_limiter = use_limiter
+        self.use_circuit_breaker = use_circuit_breaker
+        self.hedge_after = hedge_after
 
     def _get_fallback_model(self, model: str) -> str:
         """Get the fallback model for a given primary model."""
         return self.fallback_models.get(model, model)
 
-    async def complete(
+    def _get_limiter(self, driver: ModelDriver) -> ProviderLimiter | None:
+        """Get the shared limiter for a driver, if admission control applies."""
+        if not self.use_limiter:
+            return None
+        driver_type = getattr(driver, "driver_type", None)
+        if not isinstance(driver_type, DriverType):
+            return None
+        return DriverRegistry.get_limiter(driver_type)
+
+    def _get_breaker(self, driver: ModelDriver, model: str) -> CircuitBreaker | None:
+        """Get the shared circuit breaker for a driver/model pair."""
+        if not self.use_circuit_breaker:
+            return None
+        driver_type = getattr(driver, "driver_type", None)
+        if isinstance(driver_type, DriverType):
+            name = driver_type.value
+        else:
+            # Unregistered drivers get a per-instance breaker
+            name = f"{type(driver).__name__}@{id(driver):x}"
+        return CircuitBreakerRegistry.get(name, model)
+
+    async def _complete_tracked(
         self,
+        driver: ModelDriver,
+        breaker: CircuitBreaker | None,
         messages: list[dict[str, str]],
         model: str,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
+        max_tokens: int,
+        temperature: float,
         **kwargs: Any,
     ) -> CompletionResponse:
+        """Call a driver and record the outcome on its circuit breaker."""
+        start = time.monotonic()
         try:
-            return await self.primary.complete(
+            response = await self._complete_with(
+                driver,
                 messages=messages,
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 **kwargs,
             )
-        except Exception as primary_error:
-            logger.warning(
-                f"Primary driver failed: {primary_error}. Trying fallback..."
-            )
-            fallback_model = self._get_fallback_model(model)
-            try:
-                return await self.fallback.complete(
-                    messages=messages,
-                    model=fallback_model,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    **kwargs,
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure(time.monotonic() - start)
+            raise
+        except BaseException:
+            # Cancelled (e.g. the hedge race was lost): no outcome to record
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+        if breaker is not None:
+            breaker.record_success(time.monotonic() - start)
+        return response
+
+    async def _race(
+        self,
+        primary_task: asyncio.Task[CompletionResponse],
+        call_fallback: Callable[[], Awaitable[CompletionResponse]],
+    ) -> CompletionResponse:
+        """Race a slow primary against the fallback; the first success wins."""
+        logger.info(
+            f"Primary exceeded hedge budget of {self.hedge_after}s. Starting fallback..."
+        )
+        fallback_task = asyncio.ensure_future(call_fallback())
+        pending = {primary_task, fallback_task}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-            except Exception as fallback_error:
-                logger.error(f"Fallback driver also failed: {fallback_error}")
-                raise primary_error from fallback_error
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        primary_error = primary_task.exception()
+        fallback_error = fallback_task.exception()
+        logger.error(f"Fallback driver also failed: {fallback_error}")
+        raise primary_error or RuntimeError("Hedged request failed") from fallback_error
+
+    async def _complete_with(
+        self,
+        driver: ModelDriver,
+        messages: list[dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs: Any,
+    ) -> CompletionResponse:
+        """Call driver.complete() once admitted by its limiter."""
+        limiter = self._get_limiter(driver)
+        if limiter is None:
+            return await driver.complete(
+                messages=messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs,
+            )
 
-    async def stream(
+        async with limiter.acquire(
+            priority=self.priority, tokens=estimate_tokens(messages, max_tokens)
+        ) as lease:
+            response = await driver.complete(
+                messages=messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs,
+            )
+            lease.record_usage(response.usage)
+            return response
+
+    async def _stream_with(
         self,
+        driver: ModelDriver,
         messages: list[dict[str, str]],
         model: str,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
+        max_tokens: int,
+        temperature: float,
         **kwargs: Any,
     ) -> AsyncIterator[StreamChunk]:
-        try:
-            async for chunk in self.primary.stream(
+        """Stream from driver, holding a limiter slot for the whole stream."""
+        limiter = self._get_limiter(driver)
+        if limiter is None:
+            async for chunk in driver.stream(
                 messages=messages,
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 **kwargs,
             ):
+                chunk.model = chunk.model or model
                 yield chunk
-        except Exception as primary_error:
-            logger.warning(
-                f"Primary driver failed: {primary_error}. Trying fallback..."
-            )
-            fallback_model = self._get_fallback_model(model)
-            async for chunk in self.fallback.stream(
+            return
+
+        async with limiter.acquire(
+            priority=self.priority, tokens=estimate_tokens(messages, max_tokens)
+        ):
+            async for chunk in driver.stream(
                 messages=messages,
-                model=fallback_model,
+                model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 **kwargs,
             ):
+                chunk.model = chunk.model or model
                 yield chunk
+
+    async def _fallback_after(
+        self,
+        primary_error: Exception,
+        call_fallback: Callable[[], Awaitable[CompletionResponse]],
+    ) -> CompletionResponse:
+        """Retry on the fallback after a primary failure."""
+        logger.warning(f"Primary driver failed: {primary_error}. Trying fallback...")
+        try:
+            return await call_fallback()
+        except Exception as fallback_error:
+            logger.error(f"Fallback driver also failed: {fallback_error}")
+            raise primary_error from fallback_error
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> CompletionResponse:
+        fallback_model = self._get_fallback_model(model)
+        primary_breaker = self._get_breaker(self.primary, model)
+        fallback_breaker = self._get_breaker(self.fallback, fallback_model)
+
+        async def call_fallback() -> CompletionResponse:
+            response = await self._complete_tracked(
+                self.fallback,
+                fallback_breaker,
+                messages=messages,
+                model=fallback_model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs,
+            )
+            response.fallback_used = True
+            return response
+
+        if primary_breaker is not None and not primary_breaker.allow_request():
+            logger.warning(
+                f"Circuit {primary_breaker.name} is open. Using fallback directly..."
+            )
+            return await call_fallback()
+
+        primary_call: Awaitable[CompletionResponse] = self._complete_tracked(
+            self.primary,
+            primary_breaker,
+            messages=messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+
+        if self.hedge_after is not None:
+            primary_task = asyncio.ensure_future(primary_call)
+            try:
+                done, _ = await asyncio.wait({primary_task}, timeout=self.hedge_after)
+            except asyncio.CancelledError:
+                primary_task.cancel()
+                raise
+            if not done:
+                return await self._race(primary_task, call_fallback)
+            primary_call = primary_task
+
+        try:
+            return await primary_call
+        except Exception as primary_error:
+            return await self._fallback_after(primary_error, call_fallback)
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        fallback_model = self._get_fallback_model(model)
+        primary_breaker = self._get_breaker(self.primary, model)
+
+        if primary_breaker is None or primary_breaker.allow_request():
+            start = time.monotonic()
+            yielded = False
+            try:
+                async for chunk in self._stream_with(
+                    self.primary,
+                    messages=messages,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs,
+                ):
+                    yielded = yielded or bool(chunk.content)
+                    yield chunk
+            except Exception as primary_error:
+                if primary_breaker is not None:
+                    primary_breaker.record_failure(time.monotonic() - start)
+                logger.warning(
+                    f"Primary driver failed: {primary_error}. Trying fallback..."
+                )
+                if yielded:
+                    # Partial primary output is stale once the fallback restarts
+                    yield StreamChunk(
+                        content="", finish_reason=STREAM_RESTART, model=model
+                    )
+            except BaseException:
+                # Cancelled or closed early by the consumer
+                if primary_breaker is not None:
+                    primary_breaker.release_probe()
+                raise
+            else:
+                if primary_breaker is not None:
+                    primary_breaker.record_success(time.monotonic() - start)
+                return
+        else:
+            logger.warning(
+                f"Circuit {primary_breaker.name} is open. Using fallback directly..."
+            )
+
+        async for chunk in self._stream_with(
+            self.fallback,
+            messages=messages,
+            model=fallback_model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        ):
+            yield chunk
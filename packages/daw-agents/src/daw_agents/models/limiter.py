@@ -0,0 +1,325 @@
+"""
+Admission Control for Model Drivers.
+
+This module implements per-provider rate limiting:
+- LimiterConfig: Concurrency, requests-per-minute and tokens-per-minute limits
+- TokenBucket: Continuous-refill bucket used for RPM and TPM budgets
+- ProviderLimiter: Priority-ordered admission with queue-wait metrics
+- LimiterStats: Admission and wait-time counters per priority lane
+
+Without admission control a burst of agent calls hits provider 429s and
+DriverWithFallback then pushes the same burst onto the fallback provider.
+ProviderLimiter queues requests locally instead: lower priority values
+are admitted first (the router maps VALIDATION ahead of FAST), and a
+request only starts once a concurrency slot and enough RPM/TPM budget
+are available.
+
+Limits are read from the environment per driver type, e.g.:
+    DAW_CLAUDE_MAX_CONCURRENCY=8
+    DAW_CLAUDE_RPM=50
+    DAW_CLAUDE_TPM=40000
+
+Usage:
+    ```python
+    limiter = DriverRegistry.get_limiter(DriverType.CLAUDE)
+    async with limiter.acquire(priority=0, tokens=1200) as lease:
+        response = await driver.complete(...)
+        lease.record_usage(response.usage)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_PRIORITY = 2
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+@dataclass
+class LimiterConfig:
+    """Admission limits for one provider.
+
+    Attributes:
+        max_concurrency: Maximum requests in flight at once
+        requests_per_minute: Request budget per minute (None = unlimited)
+        tokens_per_minute: Token budget per minute (None = unlimited)
+    """
+
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+    @classmethod
+    def from_env(cls, name: str) -> LimiterConfig:
+        """Load limits for a provider from DAW_<NAME>_* environment variables.
+
+        Args:
+            name: Provider name, e.g. "claude" or "openai"
+
+        Returns:
+            LimiterConfig populated from the environment
+        """
+        prefix = f"DAW_{name.upper()}_"
+        rpm = os.environ.get(f"{prefix}RPM")
+        tpm = os.environ.get(f"{prefix}TPM")
+        return cls(
+            max_concurrency=int(
+                os.environ.get(f"{prefix}MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+            ),
+            requests_per_minute=float(rpm) if rpm else None,
+            tokens_per_minute=float(tpm) if tpm else None,
+        )
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate.
+
+    The bucket starts full with capacity equal to one minute of budget.
+    Requests larger than the capacity are admitted once the bucket is
+    full, so they are slowed down rather than blocked forever.
+    """
+
+    def __init__(self, per_minute: float, capacity: float | None = None) -> None:
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount can be consumed (0.0 if available now)."""
+        self._refill()
+        needed = min(amount, self.capacity) - self._tokens
+        return max(0.0, needed / self.rate)
+
+    def consume(self, amount: float) -> None:
+        """Consume amount tokens. The balance may go negative (debt)."""
+        self._refill()
+        self._tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens, e.g. after an over-estimate."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+
+@dataclass
+class LimiterStats:
+    """Admission and queue-wait counters for a ProviderLimiter."""
+
+    admitted: int = 0
+    queued: int = 0
+    cancelled: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    wait_by_priority: dict[int, float] = field(default_factory=dict)
+    admitted_by_priority: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """Mean queue wait over all admitted requests."""
+        return self.total_wait_seconds / self.admitted if self.admitted else 0.0
+
+    def record(self, priority: int, wait: float) -> None:
+        """Record an admission after waiting wait seconds."""
+        self.admitted += 1
+        self.total_wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        self.wait_by_priority[priority] = self.wait_by_priority.get(priority, 0.0) + wait
+        self.admitted_by_priority[priority] = self.admitted_by_priority.get(priority, 0) + 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize counters for logging or metrics export."""
+        return {
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "cancelled": self.cancelled,
+            "average_wait_seconds": self.average_wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+            "wait_by_priority": dict(self.wait_by_priority),
+            "admitted_by_priority": dict(self.admitted_by_priority),
+        }
+
+
+class LimiterLease:
+    """A granted admission. Used to reconcile estimated token usage."""
+
+    def __init__(self, limiter: ProviderLimiter, estimated_tokens: int) -> None:
+        self._limiter = limiter
+        self.estimated_tokens = estimated_tokens
+
+    def record_usage(self, usage: dict[str, int]) -> None:
+        """Reconcile the TPM budget with the tokens actually used.
+
+        Args:
+            usage: CompletionResponse.usage (input_tokens/output_tokens)
+        """
+        bucket = self._limiter._tpm
+        if bucket is None or not usage:
+            return
+        actual = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+        difference = self.estimated_tokens - actual
+        if difference > 0:
+            bucket.refund(difference)
+        elif difference < 0:
+            bucket.consume(-difference)
+        self.estimated_tokens = actual
+
+
+class ProviderLimiter:
+    """Priority-aware admission control for a single provider.
+
+    Requests wait in a priority queue (lowest value first, FIFO within a
+    priority) until a concurrency slot is free and the RPM/TPM buckets
+    can cover them.
+    """
+
+    def __init__(self, config: LimiterConfig | None = None) -> None:
+        self.config = config or LimiterConfig()
+        self._rpm = (
+            TokenBucket(self.config.requests_per_minute)
+            if self.config.requests_per_minute
+            else None
+        )
+        self._tpm = (
+            TokenBucket(self.config.tokens_per_minute)
+            if self.config.tokens_per_minute
+            else None
+        )
+        self._active = 0
+        self._waiters: list[tuple[int, int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self.stats = LimiterStats()
+
+    @property
+    def active(self) -> int:
+        """Requests currently holding a concurrency slot."""
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for admission."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _budget_wait(self, tokens: int) -> float:
+        """Seconds until the RPM/TPM buckets can admit a request."""
+        wait = 0.0
+        if self._rpm is not None:
+            wait = max(wait, self._rpm.wait_time(1))
+        if self._tpm is not None and tokens:
+            wait = max(wait, self._tpm.wait_time(tokens))
+        return wait
+
+    def _admit(self, tokens: int) -> None:
+        self._active += 1
+        if self._rpm is not None:
+            self._rpm.consume(1)
+        if self._tpm is not None and tokens:
+            self._tpm.consume(tokens)
+
+    def _dispatch(self) -> None:
+        """Admit queued requests in priority order while capacity allows."""
+        self._timer = None
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._active >= self.config.max_concurrency:
+                return
+            wait = self._budget_wait(tokens)
+            if wait > 0:
+                loop = future.get_loop()
+                self._timer = loop.call_later(wait, self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            self._admit(tokens)
+            future.set_result(None)
+
+    def _release(self) -> None:
+        self._active -= 1
+        if self._timer is not None:
+            self._timer.cancel()
+        self._dispatch()
+
+    @asynccontextmanager
+    async def acquire(
+        self, priority: int = DEFAULT_PRIORITY, tokens: int = 0
+    ) -> AsyncIterator[LimiterLease]:
+        """Wait for admission, then hold a slot for the duration of the block.
+
+        Args:
+            priority: Lane priority, lower values are admitted first
+            tokens: Estimated tokens the request will consume (for TPM)
+
+        Yields:
+            LimiterLease used to reconcile actual token usage
+        """
+        start = time.monotonic()
+        can_admit_now = (
+            not self.queue_depth
+            and self._active < self.config.max_concurrency
+            and self._budget_wait(tokens) == 0
+        )
+        if can_admit_now:
+            self._admit(tokens)
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                self._waiters, (priority, next(self._sequence), tokens, future)
+            )
+            self.stats.queued += 1
+            if self._timer is None:
+                self._dispatch()
+            try:
+                await future
+            except asyncio.CancelledError:
+                self.stats.cancelled += 1
+                if future.done() and not future.cancelled():
+                    # Admitted just before cancellation: give the slot back
+                    self._release()
+                else:
+                    future.cancel()
+                raise
+
+        self.stats.record(priority, time.monotonic() - start)
+        try:
+            yield LimiterLease(self, tokens)
+        finally:
+            self._release()
+
+
+def estimate_tokens(messages: list[dict[str, str]], max_tokens: int) -> int:
+    """Rough upper-bound token estimate for TPM admission.
+
+    Uses ~4 characters per token for the prompt plus the full completion
+    budget. LimiterLease.record_usage() corrects the estimate afterwards.
+    """
+    prompt_chars = sum(len(msg.get("content", "")) for msg in messages)
+    return prompt_chars // 4 + max_tokens
@@ -0,0 +1,301 @@
+"""
+In-process Model Metrics for the DAW Model Router.
+
+This module collects per-model performance data without an external proxy:
+- StreamStats: Time-to-first-token and throughput for streamed completions
+- UsageRecord: Token usage, latency, cost and cache status of one request
+- ModelMetrics: Process-wide sink keyed by model identifier
+- estimate_cost_usd(): Approximate request cost from MODEL_PRICING
+
+Streamed output is measured in chunks. Providers emit roughly one token
+per content chunk, so chunks/second is reported as tokens/second.
+
+ModelRouter.route_with_usage() records a UsageRecord for every request.
+HeliconeTracker.sync_from_metrics() and TaskMetrics.from_model_usage()
+read them back, so cost accounting works without the Helicone proxy.
+
+Usage:
+    ```python
+    from daw_agents.models.metrics import get_model_metrics
+
+    stats = get_model_metrics().stream_stats("claude-sonnet-4-20250514")
+    print(stats.average_ttft, stats.tokens_per_second)
+
+    for record in get_model_metrics().usage_records(task_id="task-001"):
+        print(record.model, record.total_tokens, record.cost_usd)
+    ```
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+# USD per million (prompt, completion) tokens, matched by model-name prefix.
+# Unknown models are costed at zero rather than guessed.
+MODEL_PRICING: dict[str, tuple[float, float]] = {
+    "claude-opus-4": (15.0, 75.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-3-opus": (15.0, 75.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "claude-3-haiku": (0.25, 1.25),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-4o": (2.5, 10.0),
+    "o1-mini": (3.0, 12.0),
+    "o1": (15.0, 60.0),
+    "gemini-1.5-pro": (1.25, 5.0),
+    "gemini-1.5-flash": (0.075, 0.3),
+}
+
+# Usage records kept in memory before the oldest are dropped
+DEFAULT_MAX_USAGE_RECORDS = 10_000
+
+
+def estimate_cost_usd(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Approximate the cost of a request from MODEL_PRICING.
+
+    Args:
+        model: Model identifier, optionally provider-prefixed ("openai/gpt-4o")
+        prompt_tokens: Tokens sent to the model
+        completion_tokens: Tokens generated by the model
+
+    Returns:
+        Cost in USD, or 0.0 if the model has no known pricing
+    """
+    name = model.rsplit("/", 1)[-1]
+    for prefix in sorted(MODEL_PRICING, key=len, reverse=True):
+        if name.startswith(prefix):
+            prompt_price, completion_price = MODEL_PRICING[prefix]
+            return (
+                prompt_tokens * prompt_price + completion_tokens * completion_price
+            ) / 1_000_000
+    return 0.0
+
+
+@dataclass
+class StreamStats:
+    """Aggregated streaming performance for one model."""
+
+    streams: int = 0
+    failures: int = 0
+    total_ttft: float = 0.0
+    min_ttft: float | None = None
+    max_ttft: float = 0.0
+    total_tokens: int = 0
+    total_generation_seconds: float = 0.0
+
+    @property
+    def average_ttft(self) -> float:
+        """Mean time-to-first-token in seconds."""
+        return self.total_ttft / self.streams if self.streams else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Output throughput measured from first token to end of stream."""
+        if self.total_generation_seconds <= 0:
+            return 0.0
+        return self.total_tokens / self.total_generation_seconds
+
+    def record(self, ttft: float, tokens: int, generation_seconds: float) -> None:
+        """Record one completed stream."""
+        self.streams += 1
+        self.total_ttft += ttft
+        self.min_ttft = ttft if self.min_ttft is None else min(self.min_ttft, ttft)
+        self.max_ttft = max(self.max_ttft, ttft)
+        self.total_tokens += tokens
+        self.total_generation_seconds += generation_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize stats for logging or metrics export."""
+        return {
+            "streams": self.streams,
+            "failures": self.failures,
+            "average_ttft": self.average_ttft,
+            "min_ttft": self.min_ttft,
+            "max_ttft": self.max_ttft,
+            "tokens_per_second": self.tokens_per_second,
+        }
+
+
+@dataclass
+class UsageRecord:
+    """Token usage and outcome of one routed request.
+
+    Attributes:
+        sequence: Position in the sink, increasing per record
+        model: Model that produced the response
+        task_type: Task type the request was routed for
+        prompt_tokens: Tokens sent to the provider (0 unless a provider was called)
+        completion_tokens: Tokens generated by the provider
+        latency_ms: Wall-clock time seen by the caller
+        fallback_used: True if the fallback model answered
+        cache_status: "miss", "hit", "coalesced" or "bypass"
+        cost_usd: Estimated cost of the provider call
+        metadata: Caller metadata passed to route (task_id, user_id, ...)
+        request_id: Unique identifier for the record
+        timestamp: When the request completed
+    """
+
+    sequence: int
+    model: str
+    task_type: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: int = 0
+    fallback_used: bool = False
+    cache_status: str = "bypass"
+    cost_usd: float = 0.0
+    metadata: dict[str, Any] = field(default_factory=dict)
+    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def cached(self) -> bool:
+        """True if no provider call was made for this request."""
+        return self.cache_status in ("hit", "coalesced")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the record for logging or export."""
+        return {
+            "sequence": self.sequence,
+            "request_id": self.request_id,
+            "model": self.model,
+            "task_type": self.task_type,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency_ms": self.latency_ms,
+            "fallback_used": self.fallback_used,
+            "cache_status": self.cache_status,
+            "cost_usd": self.cost_usd,
+            "metadata": self.metadata,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+class ModelMetrics:
+    """Process-wide sink for per-model performance metrics."""
+
+    def __init__(self, max_usage_records: int = DEFAULT_MAX_USAGE_RECORDS) -> None:
+        self._streams: dict[str, StreamStats] = {}
+        self._usage: deque[UsageRecord] = deque(maxlen=max_usage_records)
+        self._next_sequence = 1
+
+    def record_stream(
+        self, model: str, ttft: float, tokens: int, generation_seconds: float
+    ) -> None:
+        """Record a completed stream for model."""
+        self.stream_stats(model).record(ttft, tokens, generation_seconds)
+
+    def record_stream_failure(self, model: str) -> None:
+        """Record a stream that failed before completing."""
+        self.stream_stats(model).failures += 1
+
+    def stream_stats(self, model: str) -> StreamStats:
+        """Get (or create) streaming stats for model."""
+        return self._streams.setdefault(model, StreamStats())
+
+    def record_usage(
+        self,
+        model: str,
+        task_type: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        latency_ms: int = 0,
+        fallback_used: bool = False,
+        cache_status: str = "bypass",
+        metadata: dict[str, Any] | None = None,
+    ) -> UsageRecord:
+        """Record the usage of one routed request.
+
+        Cost is estimated from MODEL_PRICING. Once max_usage_records is
+        reached the oldest records are dropped.
+
+        Returns:
+            The stored UsageRecord
+        """
+        record = UsageRecord(
+            sequence=self._next_sequence,
+            model=model,
+            task_type=task_type,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency_ms=latency_ms,
+            fallback_used=fallback_used,
+            cache_status=cache_status,
+            cost_usd=estimate_cost_usd(model, prompt_tokens, completion_tokens),
+            metadata=dict(metadata or {}),
+        )
+        self._next_sequence += 1
+        self._usage.append(record)
+        return record
+
+    def usage_records(
+        self, after_sequence: int = 0, task_id: str | None = None
+    ) -> list[UsageRecord]:
+        """Get recorded usage, oldest first.
+
+        Args:
+            after_sequence: Only return records with a higher sequence
+            task_id: Only return records whose metadata has this task_id
+
+        Returns:
+            Matching UsageRecords
+        """
+        return [
+            record
+            for record in self._usage
+            if record.sequence > after_sequence
+            and (task_id is None or record.metadata.get("task_id") == task_id)
+        ]
+
+    def usage_totals(self) -> dict[str, dict[str, Any]]:
+        """Aggregate retained usage records by model."""
+        totals: dict[str, dict[str, Any]] = {}
+        for record in self._usage:
+            entry = totals.setdefault(
+                record.model,
+                {
+                    "requests": 0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "cost_usd": 0.0,
+                    "fallbacks": 0,
+                    "cached": 0,
+                },
+            )
+            entry["requests"] += 1
+            entry["prompt_tokens"] += record.prompt_tokens
+            entry["completion_tokens"] += record.completion_tokens
+            entry["cost_usd"] += record.cost_usd
+            entry["fallbacks"] += int(record.fallback_used)
+            entry["cached"] += int(record.cached)
+        return totals
+
+    def snapshot(self) -> dict[str, Any]:
+        """All collected metrics keyed by model."""
+        return {
+            "streams": {model: stats.to_dict() for model, stats in self._streams.items()},
+            "usage": self.usage_totals(),
+        }
+
+    def reset(self) -> None:
+        """Discard all collected metrics."""
+        self._streams.clear()
+        self._usage.clear()
+
+
+_default_metrics = ModelMetrics()
+
+
+def get_model_metrics() -> ModelMetrics:
+    """Return the process-wide ModelMetrics sink."""
+    return _default_metrics
@@ -7,6 +7,10 @@ This module implements:
 - Fallback logic when primary model fails
 - Helicone integration for cost tracking
 - Integration with Model Driver abstraction (FR-10.1)
+- Optional response caching for repeated deterministic requests
+- Coalescing of identical in-flight requests (single-flight)
+- Token streaming with time-to-first-token metrics (route_stream)
+- Per-request token usage, latency and cost accounting (route_with_usage)
 
 Based on FR-01.1: Router Mode selects models based on task type:
 - Planning tasks: o1/Claude Opus (high reasoning)
@@ -27,21 +31,33 @@ from __future__ import annotations
 
 import logging
 import os
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Any
 
 from litellm import acompletion
 
+from daw_agents.models.cache import CacheStats, ResponseCache, make_cache_key
 from daw_agents.models.drivers import (
+    STREAM_RESTART,
     DriverRegistry,
     DriverWithFallback,
     ModelDriver,
+    StreamChunk,
 )
+from daw_agents.models.metrics import ModelMetrics, get_model_metrics
 from daw_agents.models.providers import (
     ModelConfig,
     get_default_configs,
     get_helicone_config,
 )
+from daw_agents.models.singleflight import (
+    SingleFlight,
+    SingleFlightStats,
+    get_single_flight,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +78,70 @@ class TaskType(str, Enum):
     FAST = "fast"
 
 
+# Limiter priority lanes per task type (lower values are admitted first).
+# Validation gates workflow progress, so it goes ahead of bulk FAST calls.
+TASK_PRIORITIES: dict[TaskType, int] = {
+    TaskType.VALIDATION: 0,
+    TaskType.PLANNING: 1,
+    TaskType.CODING: 2,
+    TaskType.FAST: 3,
+}
+
+
+@dataclass
+class RouteResult:
+    """Response and usage of a request routed by ModelRouter.route_with_usage.
+
+    Attributes:
+        content: Response text
+        model: Model that answered (the fallback if fallback_used)
+        prompt_tokens: Prompt tokens billed for this call
+        completion_tokens: Completion tokens billed for this call
+        latency_ms: Wall-clock time seen by the caller
+        fallback_used: True if the primary failed and the fallback answered
+        cache_status: "miss" (stored in the cache), "hit", "coalesced"
+                      (shared another caller's in-flight request) or
+                      "bypass" (the cache was not consulted)
+    """
+
+    content: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: int = 0
+    fallback_used: bool = False
+    cache_status: str = "bypass"
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def cached(self) -> bool:
+        """True if the response did not require a provider call."""
+        return self.cache_status in ("hit", "coalesced")
+
+
+def _token_count(value: Any) -> int:
+    """Coerce a provider-reported token count, treating missing values as 0."""
+    return value if isinstance(value, int) else 0
+
+
+def _litellm_result(
+    response: Any, model: str, fallback_used: bool = False
+) -> RouteResult:
+    """Build a RouteResult from a LiteLLM completion response."""
+    usage = getattr(response, "usage", None)
+    return RouteResult(
+        content=str(response.choices[0].message.content),
+        model=model,
+        prompt_tokens=_token_count(getattr(usage, "prompt_tokens", 0)),
+        completion_tokens=_token_count(getattr(usage, "completion_tokens", 0)),
+        fallback_used=fallback_used,
+    )
+
+
 class ModelRouter:
     """Routes LLM requests to appropriate models based on task type.
 
@@ -71,6 +151,10 @@ class ModelRouter:
     3. Helicone integration for cost tracking
     4. Cross-validation principle (validator != executor model)
     5. LLM agnosticism via ModelDriver abstraction (FR-10.1)
+    6. Optional response caching keyed on messages + ModelConfig
+    7. Coalescing of identical concurrent requests into one provider call
+    8. Token streaming with fallback and first-token latency metrics
+    9. Token usage and cost recorded per request in the metrics sink
 
     Example:
         ```python
@@ -89,6 +173,17 @@ class ModelRouter:
 
         # Get model for a specific task type
         model = router.get_model_for_task(TaskType.CODING)
+
+        # Serve repeated deterministic requests from an in-process cache
+        router = ModelRouter(cache=InMemoryResponseCache())
+
+        # Stream tokens as they are generated
+        async for chunk in router.route_stream(TaskType.CODING, messages):
+            print(chunk.content, end="")
+
+        # Get token usage, latency and the model that answered
+        result = await router.route_with_usage(TaskType.CODING, messages)
+        print(result.model, result.total_tokens, result.cache_status)
         ```
     """
 
@@ -96,6 +191,12 @@ class ModelRouter:
         self,
         configs: dict[TaskType, ModelConfig] | None = None,
         use_drivers: bool | None = None,
+        cache: ResponseCache | None = None,
+        cache_nondeterministic: bool = False,
+        coalesce: bool = True,
+        single_flight: SingleFlight | None = None,
+        hedge_after: float | None = None,
+        metrics: ModelMetrics | None = None,
     ) -> None:
         """Initialize the ModelRouter.
 
@@ -104,6 +205,18 @@ class ModelRouter:
             use_drivers: Use ModelDriver abstraction instead of LiteLLM.
                         If None, reads from DAW_USE_DRIVERS env var.
                         Defaults to False for backward compatibility.
+            cache: Optional response cache checked before calling a provider.
+            cache_nondeterministic: Also cache and coalesce requests with
+                        temperature > 0. Off by default since sampled
+                        responses should vary between calls.
+            coalesce: Share one provider call between identical concurrent
+                        requests. Defaults to True.
+            single_flight: In-flight call registry. Defaults to the
+                        process-wide instance shared by all routers.
+            hedge_after: Driver mode only. Seconds to wait for the primary
+                        before racing the fallback against it. If None,
+                        reads DAW_HEDGE_AFTER_SECONDS; unset disables hedging.
+            metrics: Metrics sink. Defaults to the process-wide sink.
         """
         self.configs = configs or get_default_configs()
         self._helicone_config = get_helicone_config()
@@ -117,6 +230,17 @@ class ModelRouter:
             )
         self._use_drivers = use_drivers
         self._driver: ModelDriver | None = None
+        self._cache = cache
+        self._cache_nondeterministic = cache_nondeterministic
+        self._coalesce = coalesce
+        self._single_flight = single_flight or get_single_flight()
+
+        if hedge_after is None and os.environ.get("DAW_HEDGE_AFTER_SECONDS"):
+            hedge_after = float(os.environ["DAW_HEDGE_AFTER_SECONDS"])
+        self._hedge_after = hedge_after
+        self._metrics = metrics or get_model_metrics()
+        self._fallback_drivers: dict[TaskType, DriverWithFallback] = {}
+        self._drivers_generation = DriverRegistry.generation
 
         self._validate_cross_validation_principle()
 
@@ -164,6 +288,31 @@ class ModelRouter:
         """
         return self.configs[task_type]
 
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Hit/miss counters of the response cache, or None if caching is off."""
+        return self._cache.stats if self._cache is not None else None
+
+    @property
+    def coalesce_stats(self) -> SingleFlightStats:
+        """Executed/coalesced call counters of the single-flight registry."""
+        return self._single_flight.stats
+
+    def _get_request_key(
+        self, messages: list[dict[str, str]], config: ModelConfig
+    ) -> str | None:
+        """Return the identity used for caching and coalescing a request.
+
+        Returns None when the request must be sent on its own: neither
+        caching nor coalescing is enabled, or the request is sampled
+        (temperature > 0) and cache_nondeterministic is off.
+        """
+        if self._cache is None and not self._coalesce:
+            return None
+        if config.temperature > 0 and not self._cache_nondeterministic:
+            return None
+        return make_cache_key(messages, config)
+
     def _build_request_params(
         self,
         task_type: TaskType,
@@ -242,6 +391,13 @@ class ModelRouter:
         When use_drivers=True, uses the ModelDriver abstraction (FR-10.1)
         for LLM-agnostic operation.
 
+        When a response cache is configured, cacheable requests are served
+        from the cache and successful responses are stored in it. Identical
+        concurrent requests share a single provider call; the metadata of
+        the first caller is the one sent to the provider.
+
+        Use route_with_usage() to also get token usage and latency.
+
         Args:
             task_type: The type of task (planning, coding, validation, fast)
             messages: Chat messages in OpenAI format
@@ -250,24 +406,140 @@ class ModelRouter:
         Returns:
             String response from the model
 
+        Raises:
+            Exception: If both primary and fallback models fail
+        """
+        result = await self.route_with_usage(task_type, messages, metadata)
+        return result.content
+
+    async def route_with_usage(
+        self,
+        task_type: TaskType,
+        messages: list[dict[str, str]],
+        metadata: dict[str, Any] | None = None,
+    ) -> RouteResult:
+        """Route a request like route(), returning usage alongside content.
+
+        Every call is recorded in the metrics sink as a UsageRecord. Cache
+        hits and coalesced calls report zero tokens, since only the call
+        that reached the provider consumed any; a cache hit reports the
+        primary model as its model.
+
+        Args:
+            task_type: The type of task (planning, coding, validation, fast)
+            messages: Chat messages in OpenAI format
+            metadata: Optional metadata for tracking (user_id, task_id, etc.)
+
+        Returns:
+            RouteResult with content, token counts, latency, the model that
+            answered and the cache status
+
         Raises:
             Exception: If both primary and fallback models fail
         """
         config = self.configs[task_type]
+        started = time.monotonic()
+
+        request_key = self._get_request_key(messages, config)
+        result: RouteResult | None = None
+        if request_key is not None and self._cache is not None:
+            cached = await self._cache.get(request_key)
+            if cached is not None:
+                logger.debug("Response cache hit for %s task", task_type.value)
+                result = RouteResult(
+                    content=cached, model=config.primary, cache_status="hit"
+                )
+
+        if result is None and request_key is not None and self._coalesce:
+            executed = False
+
+            async def dispatch() -> RouteResult:
+                nonlocal executed
+                executed = True
+                return await self._dispatch(
+                    task_type, messages, config, metadata, request_key
+                )
+
+            result = await self._single_flight.do(request_key, dispatch)
+            if not executed:
+                result = replace(
+                    result, prompt_tokens=0, completion_tokens=0, cache_status="coalesced"
+                )
+
+        if result is None:
+            result = await self._dispatch(
+                task_type, messages, config, metadata, request_key
+            )
 
+        result = replace(result, latency_ms=int((time.monotonic() - started) * 1000))
+        self._metrics.record_usage(
+            model=result.model,
+            task_type=task_type.value,
+            prompt_tokens=result.prompt_tokens,
+            completion_tokens=result.completion_tokens,
+            latency_ms=result.latency_ms,
+            fallback_used=result.fallback_used,
+            cache_status=result.cache_status,
+            metadata=metadata,
+        )
+        return result
+
+    async def _dispatch(
+        self,
+        task_type: TaskType,
+        messages: list[dict[str, str]],
+        config: ModelConfig,
+        metadata: dict[str, Any] | None,
+        request_key: str | None,
+    ) -> RouteResult:
+        """Send a request to the provider and populate the cache."""
         # Use driver abstraction if enabled (FR-10.1)
         if self._use_drivers:
-            return await self._route_with_drivers(task_type, messages, config)
+            result = await self._route_with_drivers(task_type, messages, config)
+        else:
+            # Legacy LiteLLM mode
+            result = await self._route_with_litellm(
+                task_type, messages, config, metadata
+            )
 
-        # Legacy LiteLLM mode
-        return await self._route_with_litellm(task_type, messages, config, metadata)
+        if request_key is not None and self._cache is not None:
+            await self._cache.set(request_key, result.content)
+            result.cache_status = "miss"
+
+        return result
+
+    def _build_fallback_driver(
+        self, task_type: TaskType, config: ModelConfig
+    ) -> DriverWithFallback:
+        """Get the primary/fallback driver pair for a task type.
+
+        The pair is built once per task type and reused, so every request
+        shares the same cached drivers and pooled HTTP connections.
+        Circuit breakers and limiters are process-wide state. The pairs
+        are dropped when DriverRegistry discards its cached drivers (e.g.
+        on shutdown).
+        """
+        if self._drivers_generation != DriverRegistry.generation:
+            self._fallback_drivers.clear()
+            self._drivers_generation = DriverRegistry.generation
+        driver = self._fallback_drivers.get(task_type)
+        if driver is None:
+            driver = DriverWithFallback(
+                primary=self._get_driver_for_model(config.primary),
+                fallback=self._get_driver_for_model(config.fallback),
+                fallback_models={config.primary: config.fallback},
+                priority=TASK_PRIORITIES[task_type],
+                hedge_after=self._hedge_after,
+            )
+            self._fallback_drivers[task_type] = driver
+        return driver
 
     async def _route_with_drivers(
         self,
         task_type: TaskType,
         messages: list[dict[str, str]],
         config: ModelConfig,
-    ) -> str:
+    ) -> RouteResult:
         """Route using ModelDriver abstraction (FR-10.1).
 
         This enables true LLM agnosticism - drivers can be swapped
@@ -279,17 +551,7 @@ class ModelRouter:
             config.primary,
         )
 
-        # Get driver for primary model
-        primary_driver = self._get_driver_for_model(config.primary)
-        fallback_driver = self._get_driver_for_model(config.fallback)
-
-        # Use DriverWithFallback for automatic recovery
-        driver = DriverWithFallback(
-            primary=primary_driver,
-            fallback=fallback_driver,
-            fallback_models={config.primary: config.fallback},
-        )
-
+        driver = self._build_fallback_driver(task_type, config)
         response = await driver.complete(
             messages=messages,
             model=config.primary,
@@ -297,7 +559,13 @@ class ModelRouter:
             temperature=config.temperature,
         )
 
-        return response.content
+        return RouteResult(
+            content=response.content,
+            model=config.fallback if response.fallback_used else config.primary,
+            prompt_tokens=_token_count(response.usage.get("input_tokens")),
+            completion_tokens=_token_count(response.usage.get("output_tokens")),
+            fallback_used=response.fallback_used,
+        )
 
     async def _route_with_litellm(
         self,
@@ -305,7 +573,7 @@ class ModelRouter:
         messages: list[dict[str, str]],
         config: ModelConfig,
         metadata: dict[str, Any] | None,
-    ) -> str:
+    ) -> RouteResult:
         """Route using LiteLLM (legacy mode)."""
         # Try primary model first
         try:
@@ -323,7 +591,7 @@ class ModelRouter:
             )
 
             response = await acompletion(**params)
-            return str(response.choices[0].message.content)
+            return _litellm_result(response, config.primary)
 
         except Exception as primary_error:
             logger.warning(
@@ -344,7 +612,7 @@ class ModelRouter:
                 )
 
                 response = await acompletion(**params)
-                return str(response.choices[0].message.content)
+                return _litellm_result(response, config.fallback, fallback_used=True)
 
             except Exception as fallback_error:
                 logger.error(
@@ -356,6 +624,170 @@ class ModelRouter:
                 # Re-raise the original error (more informative)
                 raise primary_error from fallback_error
 
+    async def route_stream(
+        self,
+        task_type: TaskType,
+        messages: list[dict[str, str]],
+        metadata: dict[str, Any] | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a response from the appropriate model as it is generated.
+
+        Falls back to the fallback model if the primary fails, including
+        part-way through a stream: a chunk with finish_reason ==
+        STREAM_RESTART is yielded first, telling the consumer to discard
+        the partial primary output.
+
+        Time-to-first-token and tokens/second are recorded per model in
+        the metrics sink. A cache hit is replayed as a single chunk, and a
+        completed stream is stored in the cache like route() responses.
+
+        Args:
+            task_type: The type of task (planning, coding, validation, fast)
+            messages: Chat messages in OpenAI format
+            metadata: Optional metadata for tracking (LiteLLM mode only)
+
+        Yields:
+            StreamChunk objects tagged with the model that produced them
+
+        Raises:
+            Exception: If both primary and fallback models fail
+        """
+        config = self.configs[task_type]
+
+        request_key = self._get_request_key(messages, config)
+        if request_key is not None and self._cache is not None:
+            cached = await self._cache.get(request_key)
+            if cached is not None:
+                yield StreamChunk(content=cached, model=config.primary)
+                yield StreamChunk(content="", finish_reason="stop", model=config.primary)
+                return
+
+        if self._use_drivers:
+            driver = self._build_fallback_driver(task_type, config)
+            source = driver.stream(
+                messages=messages,
+                model=config.primary,
+                max_tokens=config.max_tokens,
+                temperature=config.temperature,
+            )
+        else:
+            source = self._stream_with_litellm(task_type, messages, config, metadata)
+
+        parts: list[str] = []
+        async for chunk in self._measure_stream(source, config.primary):
+            if chunk.finish_reason == STREAM_RESTART:
+                parts.clear()
+            else:
+                parts.append(chunk.content)
+            yield chunk
+
+        if request_key is not None and self._cache is not None:
+            await self._cache.set(request_key, "".join(parts))
+
+    async def _measure_stream(
+        self, source: AsyncIterator[StreamChunk], default_model: str
+    ) -> AsyncIterator[StreamChunk]:
+        """Pass chunks through while recording first-token latency and throughput."""
+        model = default_model
+        start = time.monotonic()
+        first_token_at: float | None = None
+        tokens = 0
+
+        try:
+            async for chunk in source:
+                model = chunk.model or model
+                if chunk.finish_reason == STREAM_RESTART:
+                    self._metrics.record_stream_failure(model)
+                    start, first_token_at, tokens = time.monotonic(), None, 0
+                elif chunk.content:
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                    tokens += 1
+                yield chunk
+        except Exception:
+            self._metrics.record_stream_failure(model)
+            raise
+
+        if first_token_at is not None:
+            self._metrics.record_stream(
+                model,
+                ttft=first_token_at - start,
+                tokens=tokens,
+                generation_seconds=time.monotonic() - first_token_at,
+            )
+
+    async def _stream_with_litellm(
+        self,
+        task_type: TaskType,
+        messages: list[dict[str, str]],
+        config: ModelConfig,
+        metadata: dict[str, Any] | None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream using LiteLLM (legacy mode) with primary/fallback."""
+        yielded = False
+        try:
+            async for chunk in self._litellm_stream(
+                task_type, messages, config.primary, metadata
+            ):
+                yielded = yielded or bool(chunk.content)
+                yield chunk
+            return
+        except Exception as primary_error:
+            logger.warning(
+                "Primary model %s failed while streaming %s task: %s. Trying fallback %s",
+                config.primary,
+                task_type.value,
+                str(primary_error),
+                config.fallback,
+            )
+            if yielded:
+                yield StreamChunk(
+                    content="", finish_reason=STREAM_RESTART, model=config.primary
+                )
+            error = primary_error
+
+        try:
+            async for chunk in self._litellm_stream(
+                task_type, messages, config.fallback, metadata
+            ):
+                yield chunk
+        except Exception as fallback_error:
+            logger.error(
+                "Fallback model %s also failed for %s task: %s",
+                config.fallback,
+                task_type.value,
+                str(fallback_error),
+            )
+            raise error from fallback_error
+
+    async def _litellm_stream(
+        self,
+        task_type: TaskType,
+        messages: list[dict[str, str]],
+        model: str,
+        metadata: dict[str, Any] | None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a single model through LiteLLM."""
+        params = self._build_request_params(
+            task_type=task_type,
+            messages=messages,
+            model=model,
+            metadata=metadata,
+        )
+        params["stream"] = True
+
+        response = await acompletion(**params)
+        async for part in response:
+            if not part.choices:
+                continue
+            choice = part.choices[0]
+            if choice.delta.content:
+                yield StreamChunk(content=str(choice.delta.content), model=model)
+            if choice.finish_reason:
+                yield StreamChunk(
+                    content="", finish_reason=str(choice.finish_reason), model=model
+                )
+
     async def route_with_retry(
         self,
         task_type: TaskType,
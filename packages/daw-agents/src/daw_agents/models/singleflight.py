@@ -0,0 +1,113 @@
+"""
+Request Coalescing (single-flight) for the DAW Model Router.
+
+When several agents issue the same request at the same moment (ensemble
+validators, roundtable personas, parallel orchestrator workflows), only
+one call should reach the provider. SingleFlight tracks in-flight calls by
+key; concurrent callers with the same key await the shared result instead
+of starting a duplicate call.
+
+The shared call runs as its own task, so cancelling one waiter never
+cancels the work the other waiters depend on. Results are not retained
+once the call completes - that is the job of the response cache.
+
+Usage:
+    ```python
+    from daw_agents.models.singleflight import get_single_flight
+
+    flight = get_single_flight()
+    result = await flight.do(key, lambda: provider_call())
+    print(flight.stats.coalesced)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for coalesced calls."""
+
+    executed: int = 0
+    coalesced: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Serialize counters for logging or metrics export."""
+        return {"executed": self.executed, "coalesced": self.coalesced}
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key.
+
+    In-flight calls are tracked per event loop so the same instance can be
+    shared process-wide, including by workers that run a fresh loop per job.
+    """
+
+    def __init__(self) -> None:
+        self._calls: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Task[Any]]
+        ] = weakref.WeakKeyDictionary()
+        self.stats = SingleFlightStats()
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running on this loop."""
+        loop = asyncio.get_running_loop()
+        return len(self._calls.get(loop, {}))
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or join an identical call that is already running.
+
+        Args:
+            key: Identity of the call (e.g. a response cache key)
+            fn: Zero-argument coroutine factory performing the call
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised, for every waiter
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._calls.setdefault(loop, {})
+
+        task = calls.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.executed += 1
+            task = loop.create_task(self._run(fn))
+            calls[key] = task
+            task.add_done_callback(lambda t: self._forget(calls, key, t))
+
+        result: T = await asyncio.shield(task)
+        return result
+
+    @staticmethod
+    async def _run(fn: Callable[[], Awaitable[T]]) -> T:
+        return await fn()
+
+    @staticmethod
+    def _forget(
+        calls: dict[str, asyncio.Task[Any]], key: str, task: asyncio.Task[Any]
+    ) -> None:
+        if calls.get(key) is task:
+            del calls[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+_default_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide SingleFlight shared by all ModelRouters."""
+    return _default_single_flight
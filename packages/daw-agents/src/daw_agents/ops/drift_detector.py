@@ -6,7 +6,8 @@ This module provides:
 - DriftAction: Enum for recommended actions when drift is detected
 - MetricType: Enum for different metric types being tracked
 - DriftMetric: Model for individual drift measurements
-- TaskMetrics: Model for per-task measurement data
+- TaskMetrics: Model for per-task measurement data, optionally built from
+  the token usage ModelRouter records (TaskMetrics.from_model_usage)
 - BaselineConfig: Configuration for drift thresholds
 - DriftDetector: Main class for detecting behavioral drift
 
@@ -27,6 +28,8 @@ from enum import IntEnum, auto
 
 from pydantic import BaseModel, Field, model_validator
 
+from daw_agents.models.metrics import ModelMetrics, get_model_metrics
+
 
 class DriftSeverity(IntEnum):
     """Severity levels for drift detection.
@@ -142,6 +145,47 @@ class TaskMetrics(BaseModel):
     token_cost_usd: float = Field(ge=0.0)
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
+    @classmethod
+    def from_model_usage(
+        cls,
+        task_id: str,
+        task_type: str,
+        tool_usage_count: int,
+        step_count: int,
+        context_window_size: int,
+        retry_count: int = 0,
+        metrics: ModelMetrics | None = None,
+    ) -> TaskMetrics:
+        """Build TaskMetrics with token figures taken from the metrics sink.
+
+        Uses the usage ModelRouter recorded for requests whose metadata
+        carried this task_id: token_cost_usd is their summed cost and
+        context_tokens the largest prompt sent.
+
+        Args:
+            task_id: Task identifier passed as metadata["task_id"] to the router
+            task_type: Category of task
+            tool_usage_count: Number of tool calls made
+            step_count: Number of reasoning steps taken
+            context_window_size: Maximum context window size
+            retry_count: Number of retries performed
+            metrics: Metrics sink to read. Defaults to the process-wide sink.
+
+        Returns:
+            TaskMetrics for the task
+        """
+        records = (metrics or get_model_metrics()).usage_records(task_id=task_id)
+        return cls(
+            task_id=task_id,
+            task_type=task_type,
+            tool_usage_count=tool_usage_count,
+            step_count=step_count,
+            context_tokens=max((r.prompt_tokens for r in records), default=0),
+            context_window_size=context_window_size,
+            retry_count=retry_count,
+            token_cost_usd=sum(r.cost_usd for r in records),
+        )
+
     @property
     def context_utilization_pct(self) -> float:
         """Calculate context window utilization percentage."""
@@ -4,7 +4,8 @@ Helicone Observability Integration for DAW Agent Workbench.
 This module provides:
 - HeliconeConfig: Configuration model with API key and proxy URL
 - HeliconeHeaders: Header builder for LLM requests with caching support
-- HeliconeTracker: Request tracking and cost aggregation
+- HeliconeTracker: Request tracking and cost aggregation, optionally fed
+  from the in-process ModelMetrics sink written by ModelRouter
 - Integration with LiteLLM and OpenAI client patterns
 
 Based on OPS-001 requirements and Helicone SDK documentation.
@@ -28,6 +29,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, model_validator
 
+from daw_agents.models.metrics import ModelMetrics, get_model_metrics
+
 
 class HeliconeConfig(BaseModel):
     """Configuration for Helicone observability proxy.
@@ -310,6 +313,9 @@ class HeliconeTracker:
             latency_ms=1500,
         )
 
+        # Import requests recorded by ModelRouter.route_with_usage()
+        tracker.sync_from_metrics()
+
         # Get cost summary
         summary = tracker.get_cost_summary(TimeRange.last_hour())
     """
@@ -322,6 +328,7 @@ class HeliconeTracker:
         """
         self.config = config
         self._requests: list[TrackedRequest] = []
+        self._synced_sequence = 0
 
     def track_request(
         self,
@@ -364,6 +371,43 @@ class HeliconeTracker:
         self._requests.append(request)
         return request_id
 
+    def sync_from_metrics(self, metrics: ModelMetrics | None = None) -> int:
+        """Track usage recorded by ModelRouter since the last sync.
+
+        Records already dropped from the sink's bounded buffer are lost,
+        so sync at least once per max_usage_records requests.
+
+        Args:
+            metrics: Metrics sink to read. Defaults to the process-wide sink.
+
+        Returns:
+            Number of requests imported
+        """
+        records = (metrics or get_model_metrics()).usage_records(
+            after_sequence=self._synced_sequence
+        )
+        for record in records:
+            self._requests.append(
+                TrackedRequest(
+                    request_id=record.request_id,
+                    model=record.model,
+                    task_type=record.task_type,
+                    tokens_prompt=record.prompt_tokens,
+                    tokens_completion=record.completion_tokens,
+                    cost_usd=record.cost_usd,
+                    latency_ms=record.latency_ms,
+                    cached=record.cached,
+                    timestamp=record.timestamp,
+                    metadata={
+                        **record.metadata,
+                        "fallback_used": record.fallback_used,
+                        "cache_status": record.cache_status,
+                    },
+                )
+            )
+            self._synced_sequence = record.sequence
+        return len(records)
+
     def get_cost_summary(
         self,
         time_range: TimeRange,
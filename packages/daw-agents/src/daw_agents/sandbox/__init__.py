@@ -1,8 +1,16 @@
 """Sandbox module for secure code execution.
 
-This module provides wrappers for executing code in isolated environments.
+This module provides wrappers for executing code in isolated environments,
+and a pool of warm, pre-provisioned sandboxes leased per Developer run.
+
+- Sandbox: Backend-independent interface shared by all backends
+- E2BSandbox: Remote E2B cloud sandboxes
+- LocalSandbox: Temp-directory subprocess sandboxes with rlimits
+- SandboxRegistry: Backend selection via DAW_SANDBOX_BACKEND
+- SandboxPool: Warm sandboxes leased per Developer run
 """
 
+from daw_agents.sandbox.base import Sandbox
 from daw_agents.sandbox.e2b import (
     CommandResult,
     E2BSandbox,
@@ -12,13 +20,30 @@ from daw_agents.sandbox.e2b import (
     SandboxTimeoutError,
     load_api_key_from_file,
 )
+from daw_agents.sandbox.local import LocalSandbox, LocalSandboxConfig
+from daw_agents.sandbox.pool import (
+    SandboxPool,
+    SandboxPoolConfig,
+    SandboxPoolStats,
+    get_sandbox_pool,
+)
+from daw_agents.sandbox.registry import SandboxBackend, SandboxRegistry
 
 __all__ = [
     "CommandResult",
     "E2BSandbox",
+    "LocalSandbox",
+    "LocalSandboxConfig",
+    "Sandbox",
+    "SandboxBackend",
     "SandboxConfig",
     "SandboxError",
     "SandboxNotStartedError",
+    "SandboxPool",
+    "SandboxPoolConfig",
+    "SandboxPoolStats",
+    "SandboxRegistry",
     "SandboxTimeoutError",
+    "get_sandbox_pool",
     "load_api_key_from_file",
 ]
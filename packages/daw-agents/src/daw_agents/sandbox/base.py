@@ -0,0 +1,303 @@
+"""Backend-independent sandbox interface.
+
+Every code execution path (Developer tests, Healer fix validation, the
+sandbox pool) talks to a Sandbox, so the backend can be swapped without
+touching callers:
+
+- Sandbox: Abstract lifecycle, command and file interface, plus batched
+  write_files() and upload-and-run run_script()
+- CommandResult: Output of a command, identical for every backend
+- SandboxError and subclasses: Errors raised by any backend
+- pack_files()/unpack_files(): Convert between file mappings and tarballs
+
+Backends live next to this module (e2b.py, local.py) and are selected
+through SandboxRegistry (registry.py).
+"""
+
+from __future__ import annotations
+
+import inspect
+import io
+import posixpath
+import tarfile
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Self, TypeAlias
+
+from pydantic import BaseModel, Field
+
+OutputCallback: TypeAlias = Callable[[str], Awaitable[None] | None]
+"""Receives stdout/stderr text as it is produced (sync or async)."""
+
+FileSet: TypeAlias = Mapping[str, str | bytes] | bytes
+"""Files to upload: sandbox path -> content, or a (gzipped) tar archive."""
+
+# -----------------------------------------------------------------------------
+# Exceptions
+# -----------------------------------------------------------------------------
+
+
+class SandboxError(Exception):
+    """Base exception for sandbox-related errors."""
+
+
+class SandboxNotStartedError(SandboxError):
+    """Raised when trying to use a sandbox that hasn't been started."""
+
+
+class SandboxTimeoutError(SandboxError):
+    """Raised when a sandbox operation times out."""
+
+
+# -----------------------------------------------------------------------------
+# Command Result
+# -----------------------------------------------------------------------------
+
+
+class CommandResult(BaseModel):
+    """Result of a command execution in the sandbox.
+
+    Attributes:
+        stdout: Standard output from the command.
+        stderr: Standard error from the command.
+        exit_code: Exit code of the command (None if command didn't complete).
+        error: Error message if the command failed to execute.
+    """
+
+    stdout: str = Field(default="", description="Standard output")
+    stderr: str = Field(default="", description="Standard error")
+    exit_code: int | None = Field(default=None, description="Exit code")
+    error: str | None = Field(default=None, description="Execution error message")
+
+    @property
+    def success(self) -> bool:
+        """Check if the command executed successfully."""
+        return self.error is None and self.exit_code == 0
+
+
+# -----------------------------------------------------------------------------
+# File Sets and Output Streaming
+# -----------------------------------------------------------------------------
+
+
+def unpack_files(files: FileSet) -> dict[str, str | bytes]:
+    """Normalize a FileSet to a path -> content mapping.
+
+    Args:
+        files: Mapping of sandbox paths to content, or a tar archive (plain
+            or gzipped) whose member names are relative to the sandbox root,
+            as produced by pack_files() or `tar -C / -cf - home/user/app`.
+
+    Returns:
+        Mapping of sandbox path to content.
+    """
+    if not isinstance(files, bytes):
+        return dict(files)
+
+    unpacked: dict[str, str | bytes] = {}
+    with tarfile.open(fileobj=io.BytesIO(files), mode="r:*") as archive:
+        for member in archive.getmembers():
+            if not member.isfile():
+                continue
+            extracted = archive.extractfile(member)
+            if extracted is not None:
+                unpacked[posixpath.normpath("/" + member.name)] = extracted.read()
+    return unpacked
+
+
+def pack_files(files: Mapping[str, str | bytes], base_dir: str = "/") -> bytes:
+    """Pack files into a gzipped tar archive extractable at the filesystem root.
+
+    Args:
+        files: Mapping of sandbox paths to content.
+        base_dir: Directory relative paths are resolved against.
+
+    Returns:
+        Gzipped tar bytes whose member names are root-relative paths.
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz", compresslevel=6) as archive:
+        for path, content in files.items():
+            data = content.encode() if isinstance(content, str) else content
+            absolute = path if path.startswith("/") else f"{base_dir.rstrip('/')}/{path}"
+            info = tarfile.TarInfo(absolute.lstrip("/"))
+            info.size = len(data)
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+async def emit_output(callback: OutputCallback | None, text: str) -> None:
+    """Deliver a chunk of output to a sync or async callback."""
+    if callback is None or not text:
+        return
+    result = callback(text)
+    if inspect.isawaitable(result):
+        await result
+
+
+# -----------------------------------------------------------------------------
+# Sandbox Interface
+# -----------------------------------------------------------------------------
+
+
+class Sandbox(ABC):
+    """Isolated environment for running commands and holding files.
+
+    Paths are sandbox paths (e.g. /home/user/app.py); each backend maps
+    them onto its own storage. run_command never raises for command
+    failures or timeouts: they are reported through CommandResult.error.
+
+    Usage:
+        ```python
+        async with SandboxRegistry.create() as sandbox:
+            await sandbox.write_file("/home/user/app.py", "print('hi')")
+            result = await sandbox.run_command("python /home/user/app.py")
+        ```
+    """
+
+    @classmethod
+    @abstractmethod
+    def from_env(cls) -> Sandbox:
+        """Create a sandbox configured from environment variables."""
+
+    @property
+    @abstractmethod
+    def sandbox_id(self) -> str | None:
+        """Get the sandbox ID if running."""
+
+    @property
+    @abstractmethod
+    def is_running(self) -> bool:
+        """Check if the sandbox is currently running."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Create the sandbox environment."""
+
+    @abstractmethod
+    async def stop(self) -> bool:
+        """Tear the sandbox down.
+
+        Returns:
+            True if a running sandbox was stopped, False otherwise.
+        """
+
+    @abstractmethod
+    async def run_command(
+        self,
+        cmd: str,
+        *,
+        timeout: float = 60,
+        envs: dict[str, str] | None = None,
+        cwd: str | None = None,
+        on_stdout: OutputCallback | None = None,
+        on_stderr: OutputCallback | None = None,
+    ) -> CommandResult:
+        """Execute a shell command in the sandbox.
+
+        Args:
+            cmd: The command to execute.
+            timeout: Command timeout in seconds (default 60).
+            envs: Environment variables for the command.
+            cwd: Working directory for the command.
+            on_stdout: Called with stdout text as it is produced.
+            on_stderr: Called with stderr text as it is produced.
+
+        Returns:
+            CommandResult with stdout, stderr, exit_code, and error.
+        """
+
+    @abstractmethod
+    async def write_file(self, path: str, content: str | bytes) -> None:
+        """Write content to a file in the sandbox, creating parent directories."""
+
+    @abstractmethod
+    async def read_file(self, path: str) -> str:
+        """Read a file from the sandbox as text."""
+
+    async def write_files(self, files: FileSet) -> None:
+        """Write several files to the sandbox.
+
+        Backends override this to upload in one round trip; the default
+        writes the files one by one.
+
+        Args:
+            files: Mapping of sandbox paths to content, or a tar archive.
+        """
+        for path, content in unpack_files(files).items():
+            await self.write_file(path, content)
+
+    async def run_script(
+        self,
+        script: str,
+        *,
+        files: FileSet | None = None,
+        timeout: float = 60,
+        envs: dict[str, str] | None = None,
+        cwd: str | None = None,
+        on_stdout: OutputCallback | None = None,
+        on_stderr: OutputCallback | None = None,
+    ) -> CommandResult:
+        """Upload files and run a shell script in as few round trips as possible.
+
+        Args:
+            script: Shell script (one or more lines) to execute.
+            files: Files to write before the script runs (relative paths
+                are resolved against cwd).
+            timeout: Script timeout in seconds (default 60).
+            envs: Environment variables for the script.
+            cwd: Working directory for the script.
+            on_stdout: Called with stdout text as it is produced.
+            on_stderr: Called with stderr text as it is produced.
+
+        Returns:
+            CommandResult of the script.
+        """
+        if files:
+            await self.write_files(
+                {
+                    posixpath.join(cwd or "", path): content
+                    for path, content in unpack_files(files).items()
+                }
+            )
+        return await self.run_command(
+            script,
+            timeout=timeout,
+            envs=envs,
+            cwd=cwd,
+            on_stdout=on_stdout,
+            on_stderr=on_stderr,
+        )
+
+    # -------------------------------------------------------------------------
+    # Async Context Manager
+    # -------------------------------------------------------------------------
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Exit the async context manager, ensuring cleanup."""
+        await self.stop()
+
+
+__all__ = [
+    "CommandResult",
+    "FileSet",
+    "OutputCallback",
+    "Sandbox",
+    "SandboxError",
+    "SandboxNotStartedError",
+    "SandboxTimeoutError",
+    "emit_output",
+    "pack_files",
+    "unpack_files",
+]
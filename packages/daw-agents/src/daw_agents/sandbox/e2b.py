@@ -7,7 +7,8 @@ resource limits, and network allowlist capabilities.
 Key Features:
 - Sandbox initialization with API key
 - Command execution with output capture
-- File operations (write/read)
+- File operations (write/read, batched multi-file upload)
+- Upload-and-run scripts in a single round trip, with streamed output
 - Timeout handling
 - Sandbox lifecycle management (create/kill)
 - Graceful error handling and cleanup
@@ -15,34 +16,38 @@ Key Features:
 
 from __future__ import annotations
 
+import base64
 import logging
 import os
+import posixpath
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
+from daw_agents.sandbox.base import (
+    CommandResult,
+    FileSet,
+    OutputCallback,
+    Sandbox,
+    SandboxError,
+    SandboxNotStartedError,
+    SandboxTimeoutError,
+    emit_output,
+    pack_files,
+    unpack_files,
+)
+
 if TYPE_CHECKING:
     from e2b import AsyncSandbox  # type: ignore[import-untyped]
+    from e2b.sandbox.filesystem.filesystem import WriteEntry
 
 logger = logging.getLogger(__name__)
 
-
-# -----------------------------------------------------------------------------
-# Exceptions
-# -----------------------------------------------------------------------------
-
-
-class SandboxError(Exception):
-    """Base exception for sandbox-related errors."""
-
-
-class SandboxNotStartedError(SandboxError):
-    """Raised when trying to use a sandbox that hasn't been started."""
-
-
-class SandboxTimeoutError(SandboxError):
-    """Raised when a sandbox operation times out."""
+# Largest base64 tarball inlined into a run_script command. Linux caps a
+# single argv string at 128 KiB; larger uploads go through write_files.
+INLINE_UPLOAD_LIMIT = 96 * 1024
 
 
 # -----------------------------------------------------------------------------
@@ -72,27 +77,6 @@ class SandboxConfig(BaseModel):
     )
 
 
-class CommandResult(BaseModel):
-    """Result of a command execution in the sandbox.
-
-    Attributes:
-        stdout: Standard output from the command.
-        stderr: Standard error from the command.
-        exit_code: Exit code of the command (None if command didn't complete).
-        error: Error message if the command failed to execute.
-    """
-
-    stdout: str = Field(default="", description="Standard output")
-    stderr: str = Field(default="", description="Standard error")
-    exit_code: int | None = Field(default=None, description="Exit code")
-    error: str | None = Field(default=None, description="Execution error message")
-
-    @property
-    def success(self) -> bool:
-        """Check if the command executed successfully."""
-        return self.error is None and self.exit_code == 0
-
-
 # -----------------------------------------------------------------------------
 # Utility Functions
 # -----------------------------------------------------------------------------
@@ -119,7 +103,18 @@ def load_api_key_from_file(file_path: str | Path) -> str:
 # -----------------------------------------------------------------------------
 
 
-class E2BSandbox:
+def _output_handler(callback: OutputCallback | None) -> Callable[[str], Awaitable[None]] | None:
+    """Adapt an OutputCallback to E2B's on_stdout/on_stderr handler type."""
+    if callback is None:
+        return None
+
+    async def handle(text: str) -> None:
+        await emit_output(callback, text)
+
+    return handle
+
+
+class E2BSandbox(Sandbox):
     """Wrapper for E2B sandbox providing secure code execution.
 
     This class wraps the E2B SDK to provide a simplified interface for:
@@ -241,6 +236,8 @@ class E2BSandbox:
         timeout: float = 60,
         envs: dict[str, str] | None = None,
         cwd: str | None = None,
+        on_stdout: OutputCallback | None = None,
+        on_stderr: OutputCallback | None = None,
     ) -> CommandResult:
         """Execute a command in the sandbox.
 
@@ -249,6 +246,8 @@ class E2BSandbox:
             timeout: Command timeout in seconds (default 60).
             envs: Environment variables for the command.
             cwd: Working directory for the command.
+            on_stdout: Called with stdout text as E2B streams it back.
+            on_stderr: Called with stderr text as E2B streams it back.
 
         Returns:
             CommandResult with stdout, stderr, exit_code, and error.
@@ -262,6 +261,8 @@ class E2BSandbox:
                 timeout=timeout,
                 envs=envs,
                 cwd=cwd,
+                on_stdout=_output_handler(on_stdout),
+                on_stderr=_output_handler(on_stderr),
             )
 
             return CommandResult(
@@ -336,20 +337,86 @@ class E2BSandbox:
         content: str = await self._sandbox.files.read(path)
         return content
 
-    # -------------------------------------------------------------------------
-    # Async Context Manager
-    # -------------------------------------------------------------------------
+    async def write_files(self, files: FileSet) -> None:
+        """Upload several files in one request.
+
+        Args:
+            files: Mapping of sandbox paths to content, or a tar archive.
+        """
+        self._ensure_started()
+        assert self._sandbox is not None
 
-    async def __aenter__(self) -> E2BSandbox:
-        """Enter the async context manager."""
-        await self.start()
-        return self
+        entries: list[WriteEntry] = [
+            {"path": path, "data": content} for path, content in unpack_files(files).items()
+        ]
+        if not entries:
+            return
+        logger.debug("Writing files to sandbox", extra={"count": len(entries)})
+        await self._sandbox.files.write_files(entries)
 
-    async def __aexit__(
+    async def run_script(
         self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: object,
-    ) -> None:
-        """Exit the async context manager, ensuring cleanup."""
-        await self.stop()
+        script: str,
+        *,
+        files: FileSet | None = None,
+        timeout: float = 60,
+        envs: dict[str, str] | None = None,
+        cwd: str | None = None,
+        on_stdout: OutputCallback | None = None,
+        on_stderr: OutputCallback | None = None,
+    ) -> CommandResult:
+        """Upload files and run a script in a single E2B round trip.
+
+        The files are sent as a base64 tarball inside the command and
+        unpacked before the script runs. Uploads too large to inline
+        (INLINE_UPLOAD_LIMIT) fall back to one write_files() request.
+
+        Args:
+            script: Shell script (one or more lines) to execute.
+            files: Files to write before the script runs (relative paths
+                are resolved against cwd, default /home/user).
+            timeout: Script timeout in seconds (default 60).
+            envs: Environment variables for the script.
+            cwd: Working directory for the script.
+            on_stdout: Called with stdout text as it is produced.
+            on_stderr: Called with stderr text as it is produced.
+
+        Returns:
+            CommandResult of the script (a failed unpack is reported as a
+            non-zero exit code).
+        """
+        command = script
+        if files:
+            base_dir = posixpath.join("/home/user", cwd or "")
+            contents = {
+                posixpath.join(base_dir, path): content
+                for path, content in unpack_files(files).items()
+            }
+            archive = base64.b64encode(pack_files(contents)).decode()
+            if len(archive) <= INLINE_UPLOAD_LIMIT:
+                command = (
+                    f"echo {archive} | base64 -d | tar -xzf - -C / --no-same-owner"
+                    f" && {{\n{script}\n}}"
+                )
+            else:
+                await self.write_files(contents)
+
+        return await self.run_command(
+            command,
+            timeout=timeout,
+            envs=envs,
+            cwd=cwd,
+            on_stdout=on_stdout,
+            on_stderr=on_stderr,
+        )
+
+
+__all__ = [
+    "CommandResult",
+    "E2BSandbox",
+    "SandboxConfig",
+    "SandboxError",
+    "SandboxNotStartedError",
+    "SandboxTimeoutError",
+    "load_api_key_from_file",
+]
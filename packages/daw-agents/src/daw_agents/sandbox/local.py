@@ -0,0 +1,410 @@
+"""Local subprocess sandbox backend.
+
+Runs commands as subprocesses of the current host inside a private
+temporary directory, so CI, evals and air-gapped deployments can execute
+code without the remote E2B service and its per-call network round-trips.
+
+Isolation:
+- Every sandbox gets its own temporary root; sandbox paths such as
+  /home/user/app.py map to <root>/home/user/app.py and may not escape it
+- Occurrences of the aliased prefixes (/home/user, /tmp) in commands are
+  rewritten to the mapped directories, so E2B-style commands run unchanged
+- Commands run with resource limits (address space, CPU time, file size,
+  open files, processes) applied via setrlimit in the child
+- Commands get a minimal environment and their own process group, which
+  is killed on timeout
+- Optionally, commands run under unshare(1) in new user, PID and network
+  namespaces (no network access)
+
+This is not a security boundary equivalent to E2B's microVMs: without
+namespaces, commands can still read the host filesystem. Use it for
+trusted workloads.
+
+Usage:
+    ```python
+    async with LocalSandbox() as sandbox:
+        await sandbox.write_file("/home/user/test_app.py", test_code)
+        result = await sandbox.run_command("cd /home/user && python -m pytest")
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import logging
+import os
+import re
+import resource
+import shutil
+import signal
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path, PurePosixPath
+
+from pydantic import BaseModel, Field
+
+from daw_agents.sandbox.base import (
+    CommandResult,
+    OutputCallback,
+    Sandbox,
+    SandboxError,
+    SandboxNotStartedError,
+    emit_output,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from a command's stdout/stderr pipe per chunk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+NAMESPACE_COMMAND = [
+    "unshare",
+    "--user",
+    "--map-root-user",
+    "--net",
+    "--pid",
+    "--fork",
+    "--kill-child",
+]
+
+
+# -----------------------------------------------------------------------------
+# Configuration
+# -----------------------------------------------------------------------------
+
+
+class LocalSandboxConfig(BaseModel):
+    """Configuration for the local subprocess sandbox.
+
+    Attributes:
+        base_dir: Directory in which sandbox roots are created (default: system temp).
+        home: Sandbox home directory and default working directory.
+        path_aliases: Absolute prefixes rewritten to the sandbox root in commands.
+        memory_limit_mb: Address-space limit per command (RLIMIT_AS).
+        cpu_time_seconds: CPU-time limit per command (RLIMIT_CPU).
+        max_file_size_mb: Largest file a command may write (RLIMIT_FSIZE).
+        max_open_files: Open file descriptor limit (RLIMIT_NOFILE).
+        max_processes: Process limit for the sandbox user (RLIMIT_NPROC).
+        namespaces: Run commands under unshare(1) without network access.
+        inherit_env: Pass the host environment through to commands.
+    """
+
+    base_dir: str | None = Field(default=None, description="Parent for sandbox roots")
+    home: str = Field(default="/home/user", description="Sandbox home directory")
+    path_aliases: list[str] = Field(
+        default_factory=lambda: ["/home/user", "/tmp"],
+        description="Sandbox path prefixes rewritten in commands",
+    )
+    memory_limit_mb: int | None = Field(default=2048, ge=16, description="RLIMIT_AS in MB")
+    cpu_time_seconds: int | None = Field(default=None, ge=1, description="RLIMIT_CPU")
+    max_file_size_mb: int | None = Field(default=512, ge=1, description="RLIMIT_FSIZE in MB")
+    max_open_files: int | None = Field(default=1024, ge=16, description="RLIMIT_NOFILE")
+    max_processes: int | None = Field(default=None, ge=1, description="RLIMIT_NPROC")
+    namespaces: bool = Field(default=False, description="Isolate commands with unshare(1)")
+    inherit_env: bool = Field(default=False, description="Pass host environment through")
+
+
+# -----------------------------------------------------------------------------
+# Local Sandbox
+# -----------------------------------------------------------------------------
+
+
+class LocalSandbox(Sandbox):
+    """Sandbox backed by a temporary directory and local subprocesses.
+
+    Implements the same interface and CommandResult contract as
+    E2BSandbox: timeouts and launch failures are reported in
+    CommandResult.error rather than raised.
+    """
+
+    def __init__(self, config: LocalSandboxConfig | None = None) -> None:
+        """Initialize the local sandbox.
+
+        Args:
+            config: LocalSandboxConfig (uses defaults if not provided).
+        """
+        self.config = config or LocalSandboxConfig()
+        self._root: Path | None = None
+        self._aliases: re.Pattern[str] | None = None
+        self._processes: set[asyncio.subprocess.Process] = set()
+
+    @classmethod
+    def from_env(cls) -> LocalSandbox:
+        """Create a LocalSandbox configured from the environment.
+
+        Reads DAW_LOCAL_SANDBOX_DIR (base directory for sandbox roots) and
+        DAW_LOCAL_SANDBOX_NAMESPACES ("1"/"true" to enable unshare).
+        """
+        namespaces = os.environ.get("DAW_LOCAL_SANDBOX_NAMESPACES", "").lower()
+        return cls(
+            LocalSandboxConfig(
+                base_dir=os.environ.get("DAW_LOCAL_SANDBOX_DIR") or None,
+                namespaces=namespaces in ("1", "true", "yes"),
+            )
+        )
+
+    @property
+    def sandbox_id(self) -> str | None:
+        """Get the sandbox ID if running."""
+        if self._root is None:
+            return None
+        return f"local-{self._root.name}"
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the sandbox is currently running."""
+        return self._root is not None and self._root.is_dir()
+
+    @property
+    def root(self) -> Path | None:
+        """Host directory backing the sandbox filesystem."""
+        return self._root
+
+    async def start(self) -> None:
+        """Create the sandbox root and its aliased directories."""
+        if self.config.namespaces and shutil.which("unshare") is None:
+            raise SandboxError("unshare(1) is required for namespace isolation")
+
+        root = Path(tempfile.mkdtemp(prefix="daw-sandbox-", dir=self.config.base_dir))
+        for alias in {self.config.home, *self.config.path_aliases}:
+            (root / alias.lstrip("/")).mkdir(parents=True, exist_ok=True)
+
+        # Longest prefix first so /home/user/x is not matched as /home
+        prefixes = sorted(self.config.path_aliases, key=len, reverse=True)
+        self._aliases = re.compile(
+            r"(?<![\w./-])(" + "|".join(re.escape(p.rstrip("/")) for p in prefixes) + r")(?![\w.-])"
+        )
+        self._root = root
+        logger.info("Local sandbox started", extra={"sandbox_id": self.sandbox_id})
+
+    async def stop(self) -> bool:
+        """Kill running commands and delete the sandbox root.
+
+        Returns:
+            True if the sandbox was running, False otherwise.
+        """
+        if self._root is None:
+            return False
+
+        for process in list(self._processes):
+            self._kill(process)
+        shutil.rmtree(self._root, ignore_errors=True)
+        logger.info("Local sandbox stopped", extra={"sandbox_id": self.sandbox_id})
+        self._root = None
+        return True
+
+    async def run_command(
+        self,
+        cmd: str,
+        *,
+        timeout: float = 60,
+        envs: dict[str, str] | None = None,
+        cwd: str | None = None,
+        on_stdout: OutputCallback | None = None,
+        on_stderr: OutputCallback | None = None,
+    ) -> CommandResult:
+        """Execute a shell command in the sandbox.
+
+        Output is read incrementally and passed to the callbacks as it
+        arrives; on timeout the output produced so far is returned.
+
+        Args:
+            cmd: The command to execute (sandbox paths are rewritten).
+            timeout: Command timeout in seconds (default 60).
+            envs: Environment variables for the command.
+            cwd: Sandbox working directory (default: config.home).
+            on_stdout: Called with stdout text as it is produced.
+            on_stderr: Called with stderr text as it is produced.
+
+        Returns:
+            CommandResult with stdout, stderr, exit_code, and error.
+        """
+        root = self._ensure_started()
+        command = self._rewrite(cmd)
+        argv = ["/bin/sh", "-c", command]
+        if self.config.namespaces:
+            argv = [*NAMESPACE_COMMAND, *argv]
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self._host_path(cwd or self.config.home),
+                env=self._environment(root, envs),
+                preexec_fn=self._limiter(),
+                start_new_session=True,
+            )
+        except Exception as e:
+            logger.error("Failed to launch command", extra={"cmd": cmd, "error": str(e)})
+            return CommandResult(error=f"Execution error: {e}")
+
+        assert process.stdout is not None and process.stderr is not None
+        stdout: list[str] = []
+        stderr: list[str] = []
+        self._processes.add(process)
+        pumps = asyncio.gather(
+            _pump(process.stdout, stdout, on_stdout),
+            _pump(process.stderr, stderr, on_stderr),
+            process.wait(),
+        )
+        try:
+            await asyncio.wait_for(pumps, timeout)
+        except TimeoutError:
+            logger.warning("Command timed out", extra={"cmd": cmd, "timeout": timeout})
+            self._kill(process)
+            await process.wait()
+            return CommandResult(
+                stdout="".join(stdout),
+                stderr="".join(stderr),
+                error=f"Command timed out after {timeout}s",
+            )
+        except BaseException:
+            # Cancelled: the command must not outlive its caller
+            self._kill(process)
+            await process.wait()
+            pumps.cancel()
+            await asyncio.wait([pumps])
+            if not pumps.cancelled():
+                pumps.exception()
+            raise
+        finally:
+            self._processes.discard(process)
+
+        return CommandResult(
+            stdout="".join(stdout),
+            stderr="".join(stderr),
+            exit_code=process.returncode,
+        )
+
+    async def write_file(self, path: str, content: str | bytes) -> None:
+        """Write content to a file in the sandbox.
+
+        Args:
+            path: Sandbox path of the file (relative paths are under home).
+            content: Content to write (string or bytes).
+        """
+        target = self._host_path(path)
+        logger.debug("Writing file to sandbox", extra={"path": path})
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            target.write_bytes(content)
+        else:
+            target.write_text(content)
+
+    async def read_file(self, path: str) -> str:
+        """Read content from a file in the sandbox.
+
+        Args:
+            path: Sandbox path of the file (relative paths are under home).
+
+        Returns:
+            File content as a string.
+        """
+        logger.debug("Reading file from sandbox", extra={"path": path})
+        return self._host_path(path).read_text()
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _ensure_started(self) -> Path:
+        if self._root is None:
+            raise SandboxNotStartedError(
+                "Sandbox has not been started. Call start() or use as context manager."
+            )
+        return self._root
+
+    def _host_path(self, path: str) -> Path:
+        """Map a sandbox path to a host path inside the sandbox root.
+
+        Raises:
+            SandboxError: If the path resolves outside the sandbox root.
+        """
+        root = self._ensure_started()
+        sandbox_path = PurePosixPath(self.config.home, path)  # absolute paths win
+        host = Path(os.path.normpath(root / str(sandbox_path).lstrip("/")))
+        if host != root and root not in host.parents:
+            raise SandboxError(f"Path escapes sandbox: {path}")
+        return host
+
+    def _rewrite(self, cmd: str) -> str:
+        """Point aliased sandbox paths in a command at the sandbox root."""
+        assert self._aliases is not None and self._root is not None
+        root = str(self._root)
+        return self._aliases.sub(lambda m: root + m.group(1), cmd)
+
+    def _environment(self, root: Path, envs: dict[str, str] | None) -> dict[str, str]:
+        env = dict(os.environ) if self.config.inherit_env else {}
+        # Resolve `python`/`pip` to the interpreter running the agents
+        interpreter_bin = os.path.dirname(sys.executable)
+        env.update(
+            {
+                "PATH": f"{interpreter_bin}:{os.environ.get('PATH', os.defpath)}",
+                "HOME": str(self._host_path(self.config.home)),
+                "TMPDIR": str(root / "tmp"),
+                "LANG": "C.UTF-8",
+                "PYTHONDONTWRITEBYTECODE": "1",
+            }
+        )
+        if envs:
+            env.update({key: self._rewrite(value) for key, value in envs.items()})
+        return env
+
+    def _limiter(self) -> Callable[[], None]:
+        """Build the preexec_fn applying resource limits in the child."""
+        mb = 1024 * 1024
+        wanted = [
+            (resource.RLIMIT_AS, self.config.memory_limit_mb, mb),
+            (resource.RLIMIT_CPU, self.config.cpu_time_seconds, 1),
+            (resource.RLIMIT_FSIZE, self.config.max_file_size_mb, mb),
+            (resource.RLIMIT_NOFILE, self.config.max_open_files, 1),
+            (resource.RLIMIT_NPROC, self.config.max_processes, 1),
+        ]
+        limits: list[tuple[int, int]] = []
+        for limit, value, unit in wanted:
+            if value is None:
+                continue
+            _, hard = resource.getrlimit(limit)
+            amount = value * unit
+            if hard != resource.RLIM_INFINITY:
+                amount = min(amount, hard)
+            limits.append((limit, amount))
+
+        def apply_limits() -> None:
+            for limit, amount in limits:
+                resource.setrlimit(limit, (amount, amount))
+
+        return apply_limits
+
+    def _kill(self, process: asyncio.subprocess.Process) -> None:
+        if process.returncode is not None:
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+async def _pump(
+    stream: asyncio.StreamReader, chunks: list[str], callback: OutputCallback | None
+) -> None:
+    """Read a pipe to EOF, collecting and forwarding decoded text."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        data = await stream.read(STREAM_CHUNK_SIZE)
+        text = decoder.decode(data, final=not data)
+        if text:
+            chunks.append(text)
+            await emit_output(callback, text)
+        if not data:
+            return
+
+
+__all__ = [
+    "LocalSandbox",
+    "LocalSandboxConfig",
+]
@@ -0,0 +1,370 @@
+"""Warm pool of started sandboxes.
+
+Booting a sandbox and installing pytest dominates the cost of a
+short test run, and the Developer agent runs tests on every RED/GREEN
+iteration. SandboxPool keeps sandboxes started with tooling installed and
+leases one per Developer run:
+
+- SandboxPoolConfig: Pool size, recycling limits and setup commands
+- SandboxPoolStats: Utilization and lease wait-time metrics
+- SandboxPool: Leases warm sandboxes, resets their workspace between
+  leases and recycles them on error, age or lease count
+- get_sandbox_pool(): Process-wide pool configured from the environment
+
+Usage:
+    ```python
+    pool = SandboxPool(SandboxPoolConfig(size=4))
+    await pool.start()  # optional: warm all sandboxes up front
+
+    async with pool.lease() as sandbox:
+        await sandbox.write_file(f"{pool.workspace}/test_app.py", test_code)
+        result = await sandbox.run_command(f"cd {pool.workspace} && python -m pytest")
+
+    await pool.close()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel, Field
+
+from daw_agents.sandbox.base import Sandbox, SandboxError, SandboxTimeoutError
+from daw_agents.sandbox.registry import SandboxRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETUP_COMMANDS = ["pip install -q pytest"]
+
+
+# -----------------------------------------------------------------------------
+# Configuration and Metrics
+# -----------------------------------------------------------------------------
+
+
+class SandboxPoolConfig(BaseModel):
+    """Configuration for a SandboxPool.
+
+    Attributes:
+        size: Number of sandboxes kept started.
+        max_age_seconds: Recycle sandboxes older than this (keep below the
+            sandbox timeout so a lease never outlives its sandbox).
+        max_leases: Recycle a sandbox after this many leases.
+        acquire_timeout: Seconds to wait for a free sandbox.
+        workspace: Directory leases write into; wiped between leases.
+        setup_commands: Commands run once when a sandbox starts.
+    """
+
+    size: int = Field(default=2, ge=1, le=64, description="Warm sandboxes kept started")
+    max_age_seconds: float = Field(
+        default=240.0, gt=0, description="Recycle sandboxes older than this"
+    )
+    max_leases: int = Field(default=50, ge=1, description="Recycle after this many leases")
+    acquire_timeout: float = Field(
+        default=120.0, gt=0, description="Seconds to wait for a free sandbox"
+    )
+    workspace: str = Field(
+        default="/home/user/workspace", description="Per-lease working directory"
+    )
+    setup_commands: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_SETUP_COMMANDS),
+        description="Commands run once per sandbox (tooling install)",
+    )
+
+
+@dataclass
+class SandboxPoolStats:
+    """Counters for pool utilization and lease wait times."""
+
+    size: int = 0
+    in_use: int = 0
+    idle: int = 0
+    leases: int = 0
+    created: int = 0
+    recycled: int = 0
+    errors: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the pool currently leased."""
+        return self.in_use / self.size if self.size else 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Mean time a lease waited for a sandbox."""
+        return self.total_wait_ms / self.leases if self.leases else 0.0
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Convert stats to a dictionary."""
+        return {
+            "size": self.size,
+            "in_use": self.in_use,
+            "idle": self.idle,
+            "utilization": self.utilization,
+            "leases": self.leases,
+            "created": self.created,
+            "recycled": self.recycled,
+            "errors": self.errors,
+            "avg_wait_ms": self.avg_wait_ms,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+
+@dataclass
+class _PooledSandbox:
+    """A started sandbox and its recycling bookkeeping."""
+
+    sandbox: Sandbox
+    created_at: float = field(default_factory=time.monotonic)
+    leases: int = 0
+
+
+# -----------------------------------------------------------------------------
+# Sandbox Pool
+# -----------------------------------------------------------------------------
+
+
+class SandboxPool:
+    """Pool of warm sandboxes leased one at a time.
+
+    Sandboxes are started on demand up to config.size (or all at once with
+    start()) and run config.setup_commands once. A lease gets exclusive use
+    of a sandbox with an empty workspace. On release the workspace is wiped
+    and the sandbox returns to the pool. It is killed and replaced instead
+    if the lease raised, the reset failed, or it exceeded max_age_seconds
+    or max_leases. Replacements are started in the background so the pool
+    stays warm.
+    """
+
+    def __init__(
+        self,
+        config: SandboxPoolConfig | None = None,
+        sandbox_factory: Callable[[], Sandbox] | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            config: Pool configuration (uses defaults if not provided).
+            sandbox_factory: Creates unstarted sandboxes
+                (default: SandboxRegistry.create, i.e. DAW_SANDBOX_BACKEND).
+        """
+        self.config = config or SandboxPoolConfig()
+        self._factory = sandbox_factory or SandboxRegistry.create
+        self._idle: asyncio.Queue[_PooledSandbox] = asyncio.Queue()
+        self._total = 0  # started or starting
+        self._background: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self.stats = SandboxPoolStats(size=self.config.size)
+
+    @property
+    def workspace(self) -> str:
+        """Directory leases should write into."""
+        return self.config.workspace
+
+    async def start(self) -> None:
+        """Start sandboxes until the pool is full."""
+        missing = self.config.size - self._total
+        if missing <= 0:
+            return
+        self._total += missing
+        results = await asyncio.gather(
+            *(self._create() for _ in range(missing)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                self._total -= 1
+                logger.warning("Failed to warm sandbox: %s", result)
+            else:
+                self._idle.put_nowait(result)
+        self._refresh_gauges()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Sandbox]:
+        """Lease a warm sandbox for the duration of the context.
+
+        Yields:
+            A started Sandbox with an empty workspace.
+
+        Raises:
+            SandboxError: If the pool is closed or a sandbox cannot be started.
+            SandboxTimeoutError: If none frees up within acquire_timeout.
+        """
+        pooled = await self._acquire()
+        failed = False
+        try:
+            yield pooled.sandbox
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self._release(pooled, failed)
+
+    async def close(self) -> None:
+        """Kill all idle sandboxes and stop replenishing.
+
+        Leased sandboxes are killed when they are released.
+        """
+        self._closed = True
+        for task in list(self._background):
+            task.cancel()
+        while not self._idle.empty():
+            await self._kill(self._idle.get_nowait())
+        self._refresh_gauges()
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    async def _acquire(self) -> _PooledSandbox:
+        if self._closed:
+            raise SandboxError("Sandbox pool is closed")
+
+        started = time.monotonic()
+        deadline = started + self.config.acquire_timeout
+        while True:
+            if not self._idle.empty():
+                pooled = self._idle.get_nowait()
+            elif self._total < self.config.size:
+                self._total += 1
+                try:
+                    pooled = await self._create()
+                except BaseException:
+                    self._total -= 1
+                    self.stats.errors += 1
+                    raise
+            else:
+                remaining = deadline - time.monotonic()
+                try:
+                    pooled = await asyncio.wait_for(self._idle.get(), max(remaining, 0))
+                except TimeoutError as e:
+                    raise SandboxTimeoutError(
+                        f"No sandbox available within {self.config.acquire_timeout}s"
+                    ) from e
+
+            if self._expired(pooled) or not pooled.sandbox.is_running:
+                await self._recycle(pooled)
+                continue
+            break
+
+        wait_ms = (time.monotonic() - started) * 1000
+        pooled.leases += 1
+        self.stats.leases += 1
+        self.stats.total_wait_ms += wait_ms
+        self.stats.max_wait_ms = max(self.stats.max_wait_ms, wait_ms)
+        self.stats.in_use += 1
+        self._refresh_gauges()
+        logger.debug("Leased sandbox %s after %.1fms", pooled.sandbox.sandbox_id, wait_ms)
+        return pooled
+
+    async def _release(self, pooled: _PooledSandbox, failed: bool) -> None:
+        self.stats.in_use -= 1
+        if failed:
+            self.stats.errors += 1
+        if self._closed or failed or self._expired(pooled) or not await self._reset(pooled):
+            await self._recycle(pooled)
+        else:
+            self._idle.put_nowait(pooled)
+        self._refresh_gauges()
+
+    async def _create(self) -> _PooledSandbox:
+        """Start a sandbox and run the setup commands on it."""
+        sandbox = self._factory()
+        await sandbox.start()
+        try:
+            for command in [*self.config.setup_commands, f"mkdir -p {self.workspace}"]:
+                result = await sandbox.run_command(command, timeout=300)
+                if not result.success:
+                    raise SandboxError(
+                        f"Sandbox setup failed ({command}): {result.error or result.stderr}"
+                    )
+        except BaseException:
+            with suppress(Exception):
+                await sandbox.stop()
+            raise
+        self.stats.created += 1
+        logger.info("Started pooled sandbox %s", sandbox.sandbox_id)
+        return _PooledSandbox(sandbox=sandbox)
+
+    async def _reset(self, pooled: _PooledSandbox) -> bool:
+        """Wipe the workspace; False if the sandbox should be recycled."""
+        result = await pooled.sandbox.run_command(
+            f"rm -rf {self.workspace} && mkdir -p {self.workspace}", timeout=30
+        )
+        return result.success
+
+    def _expired(self, pooled: _PooledSandbox) -> bool:
+        age = time.monotonic() - pooled.created_at
+        return age > self.config.max_age_seconds or pooled.leases >= self.config.max_leases
+
+    async def _recycle(self, pooled: _PooledSandbox) -> None:
+        """Kill a sandbox and start a replacement in the background."""
+        self.stats.recycled += 1
+        self._total -= 1
+        await self._kill(pooled)
+        if not self._closed:
+            task = asyncio.create_task(self._replenish())
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def _replenish(self) -> None:
+        if self._closed or self._total >= self.config.size:
+            return
+        self._total += 1
+        try:
+            pooled = await self._create()
+        except Exception as e:
+            self._total -= 1
+            self.stats.errors += 1
+            logger.warning("Failed to replace recycled sandbox: %s", e)
+            return
+        if self._closed:
+            self._total -= 1
+            await self._kill(pooled)
+            return
+        self._idle.put_nowait(pooled)
+        self._refresh_gauges()
+
+    async def _kill(self, pooled: _PooledSandbox) -> None:
+        try:
+            await pooled.sandbox.stop()
+        except Exception as e:
+            logger.warning("Failed to stop sandbox %s: %s", pooled.sandbox.sandbox_id, e)
+
+    def _refresh_gauges(self) -> None:
+        self.stats.idle = self._idle.qsize()
+
+
+# -----------------------------------------------------------------------------
+# Process-wide Pool
+# -----------------------------------------------------------------------------
+
+_pool: SandboxPool | None = None
+
+
+def get_sandbox_pool() -> SandboxPool:
+    """Get the process-wide sandbox pool (created on first use).
+
+    Sandboxes come from SandboxRegistry.create, so the backend selected by
+    DAW_SANDBOX_BACKEND must be configured (e.g. E2B_API_KEY) by the time
+    the first sandbox is leased.
+    """
+    global _pool
+    if _pool is None:
+        _pool = SandboxPool()
+    return _pool
+
+
+__all__ = [
+    "SandboxPool",
+    "SandboxPoolConfig",
+    "SandboxPoolStats",
+    "get_sandbox_pool",
+]
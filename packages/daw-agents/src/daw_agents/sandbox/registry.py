@@ -0,0 +1,94 @@
+"""Config-based sandbox backend selection.
+
+Mirrors DriverRegistry for model drivers: callers ask the registry for a
+sandbox and the backend comes from the DAW_SANDBOX_BACKEND environment
+variable, so deployments switch between E2B and local execution without
+code changes.
+
+Usage:
+    ```python
+    from daw_agents.sandbox.registry import SandboxRegistry
+
+    # From environment (DAW_SANDBOX_BACKEND=local)
+    async with SandboxRegistry.create() as sandbox:
+        result = await sandbox.run_command("python --version")
+
+    # Explicit selection
+    sandbox = SandboxRegistry.create("e2b")
+    ```
+"""
+
+from __future__ import annotations
+
+import os
+from enum import Enum
+
+from daw_agents.sandbox.base import Sandbox
+from daw_agents.sandbox.e2b import E2BSandbox
+from daw_agents.sandbox.local import LocalSandbox
+
+DEFAULT_BACKEND = "e2b"
+
+
+class SandboxBackend(str, Enum):
+    """Supported sandbox backends."""
+
+    E2B = "e2b"
+    LOCAL = "local"
+
+
+class SandboxRegistry:
+    """Registry of sandbox backends with config-based selection.
+
+    Unlike model drivers, sandboxes are stateful and single-use, so the
+    registry hands out a new (unstarted) instance on every create().
+    """
+
+    _backends: dict[SandboxBackend, type[Sandbox]] = {
+        SandboxBackend.E2B: E2BSandbox,
+        SandboxBackend.LOCAL: LocalSandbox,
+    }
+
+    @classmethod
+    def register(cls, backend: SandboxBackend, sandbox_class: type[Sandbox]) -> None:
+        """Register a custom backend."""
+        cls._backends[backend] = sandbox_class
+
+    @classmethod
+    def backend_from_env(cls) -> SandboxBackend:
+        """Backend named by DAW_SANDBOX_BACKEND (default: e2b)."""
+        return SandboxBackend(os.environ.get("DAW_SANDBOX_BACKEND", DEFAULT_BACKEND).lower())
+
+    @classmethod
+    def create(cls, backend: str | SandboxBackend | None = None) -> Sandbox:
+        """Create an unstarted sandbox.
+
+        Args:
+            backend: Backend or None to use DAW_SANDBOX_BACKEND
+
+        Returns:
+            Sandbox configured from the environment via from_env()
+
+        Raises:
+            ValueError: If the backend is unknown or misconfigured
+        """
+        if backend is None:
+            backend = cls.backend_from_env()
+        if isinstance(backend, str):
+            backend = SandboxBackend(backend.lower())
+
+        sandbox_class = cls._backends.get(backend)
+        if sandbox_class is None:
+            raise ValueError(f"Unknown sandbox backend: {backend}")
+        return sandbox_class.from_env()
+
+    @classmethod
+    def list_backends(cls) -> list[SandboxBackend]:
+        """List all registered backends."""
+        return list(cls._backends.keys())
+
+
+__all__ = [
+    "SandboxBackend",
+    "SandboxRegistry",
+]
@@ -1,10 +1,22 @@
 """
 TDD Guard Package.
 
-Provides Red-Green-Refactor enforcement logic for test-driven development.
+Provides Red-Green-Refactor enforcement logic for test-driven development,
+with an async test runner backed by a persistent pytest worker, a result
+cache and test-impact selection.
 """
 
 from daw_agents.tdd.exceptions import TDDViolation, TDDViolationError
 from daw_agents.tdd.guard import TDDGuard, TestResult
+from daw_agents.tdd.impact import TestImpactAnalyzer
+from daw_agents.tdd.worker import PytestWorker, WorkerCrashedError
 
-__all__ = ["TDDGuard", "TestResult", "TDDViolation", "TDDViolationError"]
+__all__ = [
+    "PytestWorker",
+    "TDDGuard",
+    "TestImpactAnalyzer",
+    "TestResult",
+    "TDDViolation",
+    "TDDViolationError",
+    "WorkerCrashedError",
+]
@@ -4,18 +4,35 @@ TDD Guard - Red-Green-Refactor Enforcement Logic.
 CORE-005: Create a logic module that checks for the existence of a failing test file
 before allowing 'Implementation' tools to be called. Must block writes to src/ until
 tests/ file exists and fails.
+
+The async API (run_test_async, enforce_red_phase_async, enforce_green_phase_async)
+runs pytest in a persistent worker process, caches results by the content of the
+test file and the source files it imports, and can run only the tests affected by
+a changed source file. The sync API shells out to pytest on every call.
 """
 
 from __future__ import annotations
 
+import asyncio
 import fnmatch
+import logging
 import subprocess
+import sys
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Literal
 
 from daw_agents.tdd.exceptions import TDDViolation
+from daw_agents.tdd.impact import TestImpactAnalyzer
+from daw_agents.tdd.worker import PytestWorker, WorkerCrashedError
+
+logger = logging.getLogger(__name__)
+
+# Pytest exit codes whose results depend only on the code (safe to cache)
+_CACHEABLE_EXIT_CODES = (0, 1)
 
 
 @dataclass
@@ -30,6 +47,8 @@ class TestResult:
         error: Error message if tests failed.
         exit_code: Pytest exit code.
         duration_ms: Time taken to run tests in milliseconds.
+        cached: Whether the result was served from the result cache.
+        selected_tests: Node IDs run when only affected tests were selected.
     """
 
     passed: bool
@@ -38,6 +57,8 @@ class TestResult:
     error: str | None = None
     exit_code: int | None = None
     duration_ms: float | None = None
+    cached: bool = False
+    selected_tests: list[str] | None = None
 
 
 WorkflowState = Literal["red", "green", "refactor"] | None
@@ -61,6 +82,10 @@ class TDDGuard:
         pytest_args: Additional arguments to pass to pytest.
         strict: If True, enforce TDD for all files without exception.
         excluded_patterns: File patterns to exclude from TDD enforcement.
+        test_timeout: Seconds before a test run is aborted.
+        use_worker: Run async tests in a persistent pytest worker.
+        worker_max_runs: Runs served before the worker process is recycled.
+        cache_size: Maximum cached async results (0 disables caching).
     """
 
     project_root: Path
@@ -74,17 +99,35 @@ class TDDGuard:
     excluded_patterns: list[str] = field(
         default_factory=lambda: ["__init__.py", "conftest.py", "__pycache__"]
     )
+    test_timeout: float = 300.0
+    use_worker: bool = True
+    worker_max_runs: int = 100
+    cache_size: int = 256
 
     # Internal state tracking
     _workflow_states: dict[str, WorkflowState] = field(
         default_factory=dict, init=False, repr=False
     )
+    _result_cache: OrderedDict[str, TestResult] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _analyzer: TestImpactAnalyzer | None = field(default=None, init=False, repr=False)
+    _worker: PytestWorker | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Ensure project_root is a Path object."""
         if isinstance(self.project_root, str):
             self.project_root = Path(self.project_root)
 
+    @property
+    def analyzer(self) -> TestImpactAnalyzer:
+        """Import analyzer used for cache keys and test selection."""
+        if self._analyzer is None:
+            self._analyzer = TestImpactAnalyzer(
+                self.project_root, source_roots=(self.src_dir, ".")
+            )
+        return self._analyzer
+
     def get_test_file_path(self, source_file: Path) -> Path:
         """
         Get the expected test file path for a source file.
@@ -217,7 +260,7 @@ class TDDGuard:
                 cwd=str(self.project_root),
                 capture_output=True,
                 text=True,
-                timeout=300,  # 5 minute timeout
+                timeout=self.test_timeout,
             )
 
             duration_ms = (time.time() - start_time) * 1000
@@ -246,6 +289,123 @@ class TDDGuard:
                 duration_ms=duration_ms,
             )
 
+    async def run_test_async(
+        self,
+        test_file: Path,
+        changed_files: Sequence[Path] | None = None,
+        use_cache: bool = True,
+    ) -> TestResult:
+        """
+        Run a test file without blocking the event loop.
+
+        Results are cached by the content of the test file, the project
+        files it imports, applicable conftest.py files and the pytest
+        arguments, so repeated checks on unchanged code return at once.
+        If no test in the file depends on changed_files, the whole file's
+        result applies: it is served from the cache or the file is run.
+
+        Args:
+            test_file: Path to the test file to run.
+            changed_files: Source files that changed; when given, only the
+                tests that reference them are run.
+            use_cache: Serve and store results in the result cache.
+
+        Returns:
+            TestResult with pass/fail status and output.
+
+        Raises:
+            FileNotFoundError: If the test file does not exist.
+        """
+        test_file = Path(test_file)
+
+        if not test_file.exists():
+            raise FileNotFoundError(f"Test file not found: {test_file}")
+
+        selected: list[str] | None = None
+        if changed_files:
+            # [] selects nothing; the whole file's result still applies
+            selected = self.analyzer.affected_tests(test_file, changed_files) or None
+        targets = selected or [str(test_file)]
+        args = [*targets, "-v", "--tb=short", *self.pytest_args]
+
+        use_cache = use_cache and self.cache_size > 0
+        key = ""
+        if use_cache:
+            key = await asyncio.to_thread(self.analyzer.fingerprint, test_file, args)
+            hit = self._result_cache.get(key)
+            if hit is not None:
+                self._result_cache.move_to_end(key)
+                return replace(hit, cached=True, duration_ms=0.0)
+
+        start_time = time.time()
+        try:
+            exit_code, output = await self._run_pytest(args)
+        except TimeoutError:
+            return TestResult(
+                passed=False,
+                test_file=str(test_file),
+                output="",
+                error="Test execution timed out",
+                exit_code=-1,
+                duration_ms=(time.time() - start_time) * 1000,
+                selected_tests=selected,
+            )
+
+        passed = exit_code == 0
+        result = TestResult(
+            passed=passed,
+            test_file=str(test_file),
+            output=output,
+            error=None if passed else self._extract_error(output),
+            exit_code=exit_code,
+            duration_ms=(time.time() - start_time) * 1000,
+            selected_tests=selected,
+        )
+
+        if use_cache and exit_code in _CACHEABLE_EXIT_CODES:
+            self._result_cache[key] = result
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+        return result
+
+    async def _run_pytest(self, args: list[str]) -> tuple[int, str]:
+        """Run pytest in the worker, or in a fresh subprocess as a fallback."""
+        if self.use_worker:
+            if self._worker is None:
+                self._worker = PytestWorker(self.project_root, max_runs=self.worker_max_runs)
+            try:
+                return await self._worker.run(args, timeout=self.test_timeout)
+            except WorkerCrashedError as e:
+                logger.warning("pytest worker failed, running in a subprocess: %s", e)
+
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "pytest",
+            *args,
+            cwd=str(self.project_root),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), self.test_timeout)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        assert process.returncode is not None
+        return process.returncode, stdout.decode(errors="replace")
+
+    def clear_cache(self) -> None:
+        """Drop all cached async test results."""
+        self._result_cache.clear()
+
+    async def aclose(self) -> None:
+        """Stop the persistent pytest worker, if one was started."""
+        if self._worker is not None:
+            await self._worker.close()
+            self._worker = None
+
     def _extract_error(self, output: str) -> str:
         """Extract the error message from pytest output."""
         lines = output.split("\n")
@@ -286,6 +446,60 @@ class TDDGuard:
         # Update workflow state
         self._workflow_states[str(test_file)] = "red"
 
+    async def enforce_red_phase_async(
+        self, test_file: Path, changed_files: Sequence[Path] | None = None
+    ) -> None:
+        """
+        Async RED phase enforcement using run_test_async.
+
+        Args:
+            test_file: Path to the test file.
+            changed_files: Source files that changed (limits the run to
+                affected tests).
+
+        Raises:
+            TDDViolation: If the test passes (should fail in RED phase).
+        """
+        result = await self.run_test_async(test_file, changed_files)
+
+        if result.passed:
+            raise TDDViolation(
+                message="Test must fail in RED phase before implementation can begin. "
+                "Write a failing test that defines the expected behavior.",
+                phase="red",
+                test_file=str(test_file),
+                test_result=result,
+            )
+
+        self._workflow_states[str(test_file)] = "red"
+
+    async def enforce_green_phase_async(
+        self, test_file: Path, changed_files: Sequence[Path] | None = None
+    ) -> None:
+        """
+        Async GREEN phase enforcement using run_test_async.
+
+        Args:
+            test_file: Path to the test file.
+            changed_files: Source files that changed (limits the run to
+                affected tests).
+
+        Raises:
+            TDDViolation: If the test fails (should pass in GREEN phase).
+        """
+        result = await self.run_test_async(test_file, changed_files)
+
+        if not result.passed:
+            raise TDDViolation(
+                message="Test must pass in GREEN phase. "
+                "Implementation is not complete or contains errors.",
+                phase="green",
+                test_file=str(test_file),
+                test_result=result,
+            )
+
+        self._workflow_states[str(test_file)] = "green"
+
     def enforce_green_phase(self, test_file: Path) -> None:
         """
         Enforce GREEN phase - test must pass.
@@ -0,0 +1,293 @@
+"""
+Test impact analysis for the TDD Guard.
+
+Statically follows the imports of a test file (via ``ast``) to the project
+source files it depends on, so that the guard can:
+
+- Fingerprint a test run by the content of the test file, the source files
+  it transitively imports and the conftest.py files that apply to it
+- Select only the tests in a file that reference names coming from a
+  changed source file
+
+Resolution is deliberately conservative: anything the analyzer cannot
+attribute to specific tests (fixtures, helpers or module-level code using
+a changed name) selects the whole file.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class _ParsedFile:
+    """Per-file analysis, reused while the file's content hash is unchanged."""
+
+    digest: str
+    tree: ast.Module | None
+    imports: dict[str, Path] = field(default_factory=dict)  # bound name -> module file
+    dependencies: set[Path] = field(default_factory=set)  # direct project imports
+
+
+@dataclass
+class TestImpactAnalyzer:
+    """
+    Resolves project-local imports and selects affected tests.
+
+    Attributes:
+        project_root: Root directory of the project.
+        source_roots: Directories (relative to project_root) searched for
+            top-level modules, in order. The test file's own directory is
+            always searched last.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    project_root: Path
+    source_roots: Sequence[str] = ("src", ".")
+
+    _files: dict[Path, _ParsedFile] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Ensure project_root is an absolute Path."""
+        self.project_root = Path(self.project_root).resolve()
+
+    def dependencies(self, path: Path) -> set[Path]:
+        """
+        Get the project files a file transitively imports.
+
+        Args:
+            path: Python file to analyze.
+
+        Returns:
+            Resolved paths of imported project files (excluding ``path``).
+        """
+        start = Path(path).resolve()
+        seen: set[Path] = set()
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            parsed = self._parse(current)
+            if parsed is None:
+                continue
+            for dependency in parsed.dependencies:
+                if dependency not in seen and dependency != start:
+                    seen.add(dependency)
+                    stack.append(dependency)
+        return seen
+
+    def fingerprint(self, test_file: Path, extra: Iterable[str] = ()) -> str:
+        """
+        Hash everything that can change the outcome of running a test file.
+
+        Covers the test file, its transitive project imports, conftest.py
+        files between the project root and the test file, and ``extra``
+        (e.g. pytest arguments).
+
+        Args:
+            test_file: Test file to fingerprint.
+            extra: Additional strings to mix into the key.
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        test_file = Path(test_file).resolve()
+        files = {test_file, *self.dependencies(test_file), *self._conftests(test_file)}
+
+        digest = hashlib.sha256()
+        for path in sorted(files):
+            parsed = self._parse(path)
+            digest.update(str(path).encode())
+            digest.update((parsed.digest if parsed else "missing").encode())
+        for item in extra:
+            digest.update(b"\0" + item.encode())
+        return digest.hexdigest()
+
+    def affected_tests(self, test_file: Path, changed_files: Iterable[Path]) -> list[str] | None:
+        """
+        Select the tests in a file affected by changed source files.
+
+        Args:
+            test_file: Test file to select from.
+            changed_files: Source files that changed.
+
+        Returns:
+            Pytest node IDs of affected tests; ``[]`` if the file does not
+            depend on any changed file; ``None`` if the whole file must run,
+            including when a changed file is missing (e.g. a module the test
+            imports but that does not exist yet), outside the project, or
+            reached through a conftest.py.
+        """
+        test_file = Path(test_file).resolve()
+        changed = {Path(p).resolve() for p in changed_files}
+        if test_file in changed:
+            return None
+        if any(not path.is_file() or not self._is_project_file(path) for path in changed):
+            return None
+        if changed & set(self._conftests(test_file)):
+            return None
+        if not changed & self.dependencies(test_file):
+            return []
+
+        parsed = self._parse(test_file)
+        if parsed is None or parsed.tree is None:
+            return None
+
+        affected_names = {
+            name
+            for name, module in parsed.imports.items()
+            if module in changed or changed & self.dependencies(module)
+        }
+        if not affected_names:
+            # Reached through conftest or fixtures we cannot attribute
+            return None
+
+        selected: list[str] = []
+        for node in parsed.tree.body:
+            if isinstance(node, ast.Import | ast.ImportFrom):
+                continue
+            uses = _names_used(node) & affected_names
+            if _is_test_node(node):
+                if uses:
+                    selected.append(f"{test_file}::{node.name}")  # type: ignore[attr-defined]
+            elif uses:
+                # Fixture, helper or module-level code depends on the change
+                return None
+
+        return selected or None
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _parse(self, path: Path) -> _ParsedFile | None:
+        # Hash the content every time: mtimes are too coarse to tell apart
+        # edits made within the same clock tick.
+        try:
+            source = path.read_bytes()
+        except OSError:
+            return None
+        digest = hashlib.sha256(source).hexdigest()
+        cached = self._files.get(path)
+        if cached is not None and cached.digest == digest:
+            return cached
+
+        parsed = _ParsedFile(digest=digest, tree=None)
+        if path.suffix == ".py":
+            try:
+                parsed.tree = ast.parse(source, filename=str(path))
+            except SyntaxError:
+                parsed.tree = None
+            else:
+                self._collect_imports(path, parsed)
+        self._files[path] = parsed
+        return parsed
+
+    def _collect_imports(self, path: Path, parsed: _ParsedFile) -> None:
+        assert parsed.tree is not None
+        for node in ast.walk(parsed.tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    module = self._resolve(alias.name, path)
+                    if module is None:
+                        continue
+                    parsed.dependencies.update(_package_inits(module))
+                    bound = alias.asname or alias.name.split(".")[0]
+                    parsed.imports[bound] = module
+            elif isinstance(node, ast.ImportFrom):
+                base = self._resolve_from(node, path)
+                for alias in node.names:
+                    # "from pkg import mod" may name a submodule
+                    submodule = self._resolve_relative(base, alias.name, node, path)
+                    module = submodule or base
+                    if module is None:
+                        continue
+                    parsed.dependencies.add(module)
+                    parsed.imports[alias.asname or alias.name] = module
+                if base is not None:
+                    parsed.dependencies.update(_package_inits(base))
+
+    def _resolve_from(self, node: ast.ImportFrom, path: Path) -> Path | None:
+        if node.level == 0:
+            return self._resolve(node.module or "", path) if node.module else None
+        package_dir = path.parent
+        for _ in range(node.level - 1):
+            package_dir = package_dir.parent
+        if not node.module:
+            return _module_file(package_dir)
+        return _module_file(package_dir.joinpath(*node.module.split(".")))
+
+    def _resolve_relative(
+        self, base: Path | None, name: str, node: ast.ImportFrom, path: Path
+    ) -> Path | None:
+        if name == "*":
+            return None
+        if node.level == 0 and node.module:
+            return self._resolve(f"{node.module}.{name}", path)
+        if base is not None and base.name == "__init__.py":
+            return _module_file(base.parent / name)
+        return None
+
+    def _resolve(self, dotted: str, importer: Path) -> Path | None:
+        parts = dotted.split(".")
+        roots = [self.project_root / root for root in self.source_roots]
+        roots.append(importer.parent)
+        for root in roots:
+            module = _module_file(root.joinpath(*parts))
+            if module is not None and self._is_project_file(module):
+                return module
+        return None
+
+    def _is_project_file(self, path: Path) -> bool:
+        return self.project_root in path.parents and "site-packages" not in path.parts
+
+    def _conftests(self, test_file: Path) -> list[Path]:
+        conftests: list[Path] = []
+        directory = test_file.parent
+        while directory == self.project_root or self.project_root in directory.parents:
+            candidate = directory / "conftest.py"
+            if candidate.exists():
+                conftests.append(candidate)
+                conftests.extend(self.dependencies(candidate))
+            if directory == self.project_root:
+                break
+            directory = directory.parent
+        return conftests
+
+
+def _module_file(base: Path) -> Path | None:
+    """Resolve a module path stem to its .py file or package __init__."""
+    candidate = base.with_suffix(".py")
+    if candidate.is_file():
+        return candidate.resolve()
+    package = base / "__init__.py"
+    if package.is_file():
+        return package.resolve()
+    return None
+
+
+def _package_inits(module: Path) -> set[Path]:
+    """A module plus the __init__.py of every package importing it runs."""
+    files = {module}
+    package = module.parent if module.name != "__init__.py" else module.parent.parent
+    while (package / "__init__.py").is_file():
+        files.add((package / "__init__.py").resolve())
+        package = package.parent
+    return files
+
+
+def _is_test_node(node: ast.stmt) -> bool:
+    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+        return node.name.startswith("test")
+    if isinstance(node, ast.ClassDef):
+        return node.name.startswith("Test")
+    return False
+
+
+def _names_used(node: ast.AST) -> set[str]:
+    """Names loaded anywhere inside a node (attribute chains count by root)."""
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
@@ -0,0 +1,195 @@
+"""
+Pytest worker process for single-module validation jobs.
+
+Serves (code, tests) jobs for the Validator's ValidationWorkerPool. Each
+job writes ``module.py`` and ``test_module.py`` to its own temporary
+directory and runs ``pytest.main`` in this long-lived interpreter, so
+pytest and its plugins are imported once. Modules imported from the job
+directory are dropped afterwards, so jobs never see each other's code.
+
+Outcomes are collected by an in-process plugin and line coverage of
+``module.py`` is measured in memory (with coverage.py when installed,
+otherwise a trace function), so no report files are written or re-read.
+
+Protocol: one JSON request per line on stdin (``{"code": str, "tests":
+str}``, or ``{"workspace": str}`` naming a directory that already holds
+both files) and one JSON response per line with ``exit_code``, the test
+counts, ``failed_test_names``, ``coverage_percent`` and ``output``. The
+client is PytestWorker with ``module`` set to this module.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+
+from daw_agents.tdd.worker import _purge_project_modules
+
+
+class _ResultCollector:
+    """pytest plugin recording the outcome of every test."""
+
+    def __init__(self) -> None:
+        self.outcomes: dict[str, str] = {}
+
+    def pytest_runtest_logreport(self, report: Any) -> None:
+        if report.failed:
+            # Setup and teardown errors count as failures of the test
+            self.outcomes[report.nodeid] = "failed"
+        elif report.skipped and report.when != "teardown":
+            self.outcomes[report.nodeid] = "skipped"
+        elif report.when == "call":
+            self.outcomes.setdefault(report.nodeid, "passed")
+
+    def summary(self) -> dict[str, Any]:
+        outcomes = list(self.outcomes.values())
+        return {
+            "total_tests": len(outcomes),
+            "passed_tests": outcomes.count("passed"),
+            "failed_tests": outcomes.count("failed"),
+            "skipped_tests": outcomes.count("skipped"),
+            "failed_test_names": [
+                nodeid for nodeid, outcome in self.outcomes.items() if outcome == "failed"
+            ],
+        }
+
+
+class _LineCoverage:
+    """In-memory line coverage of a single file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._filename = str(path)
+        self._executed: set[int] = set()
+        self._coverage: Any = None
+
+    def __enter__(self) -> _LineCoverage:
+        try:
+            import coverage
+        except ImportError:
+            threading.settrace(self._trace)
+            sys.settrace(self._trace)
+        else:
+            self._coverage = coverage.Coverage(
+                data_file=None, include=[self._filename], config_file=False
+            )
+            self._coverage.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._coverage is not None:
+            self._coverage.stop()
+        else:
+            sys.settrace(None)
+            threading.settrace(None)
+
+    def percent(self) -> float:
+        if self._coverage is not None:
+            try:
+                return float(self._coverage.report(file=io.StringIO()))
+            except Exception:  # noqa: BLE001 - e.g. module never imported
+                return 0.0
+        statements = _executable_lines(self.path)
+        if not statements:
+            return 100.0
+        return 100.0 * len(statements & self._executed) / len(statements)
+
+    def _trace(self, frame: FrameType, event: str, arg: Any) -> Any:
+        if frame.f_code.co_filename != self._filename:
+            return None
+        self._executed.add(frame.f_lineno)
+        return self._trace_lines
+
+    def _trace_lines(self, frame: FrameType, event: str, arg: Any) -> Any:
+        if event == "line":
+            self._executed.add(frame.f_lineno)
+        return self._trace_lines
+
+
+def _executable_lines(path: Path) -> set[int]:
+    """Line numbers that carry bytecode anywhere in a source file."""
+    try:
+        code = compile(path.read_text(), str(path), "exec")
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    lines: set[int] = set()
+    stack = [code]
+    while stack:
+        current = stack.pop()
+        lines.update(line for _, _, line in current.co_lines() if line)
+        stack.extend(const for const in current.co_consts if isinstance(const, CodeType))
+    return lines
+
+
+def _run_job(pytest: Any, root: Path) -> dict[str, Any]:
+    """Run one validation job from a job directory in a fresh import namespace."""
+    source = root / "module.py"
+    test_file = root / "test_module.py"
+
+    collector = _ResultCollector()
+    coverage = _LineCoverage(source)
+    output = io.StringIO()
+    saved_path = list(sys.path)
+    sys.path.insert(0, str(root))
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            with coverage:
+                exit_code = int(
+                    pytest.main(
+                        [
+                            str(test_file),
+                            "-v",
+                            "--tb=short",
+                            f"--rootdir={root}",
+                            "-p",
+                            "no:cacheprovider",
+                        ],
+                        plugins=[collector],
+                    )
+                )
+    except BaseException:  # noqa: BLE001 - report anything, keep serving
+        output.write(traceback.format_exc())
+        exit_code = int(pytest.ExitCode.INTERNAL_ERROR)
+    finally:
+        sys.path[:] = saved_path
+        _purge_project_modules(root)
+
+    return {
+        "exit_code": exit_code,
+        **collector.summary(),
+        "coverage_percent": coverage.percent(),
+        "output": output.getvalue(),
+    }
+
+
+def main() -> None:
+    """Serve validation jobs over stdin/stdout until stdin closes."""
+    protocol = os.fdopen(os.dup(1), "w", buffering=1)
+    os.dup2(2, 1)
+
+    import pytest  # imported once, kept warm for every job
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request.get("workspace"):
+            result = _run_job(pytest, Path(request["workspace"]).resolve())
+        else:
+            with tempfile.TemporaryDirectory(prefix="daw-validate-") as temp_dir:
+                root = Path(temp_dir).resolve()
+                (root / "module.py").write_text(str(request["code"]))
+                (root / "test_module.py").write_text(str(request["tests"]))
+                result = _run_job(pytest, root)
+        protocol.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
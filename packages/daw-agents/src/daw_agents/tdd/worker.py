@@ -0,0 +1,242 @@
+"""
+Persistent pytest worker for the TDD Guard.
+
+Starting a Python interpreter and importing pytest, plugins and heavy
+third-party libraries dominates the cost of running a single test file.
+PytestWorker keeps one interpreter alive per project and runs
+``pytest.main`` in it for every request, so those imports stay warm.
+
+Between runs the worker drops every module loaded from the project
+directory (source, tests and conftest files) and restores ``sys.path``,
+so each run sees the current code on disk. The worker is restarted after
+``max_runs`` requests, on timeout and if it dies.
+
+Protocol: one JSON request per line on stdin (``{"args": [...]}``) and one
+JSON response per line (``{"exit_code": int, "output": str}``) on a copy
+of the original stdout. File descriptor 1 itself is pointed at stderr so
+stray writes cannot corrupt the protocol.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import signal
+import sys
+import traceback
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Large enough for the verbose output of big test files
+_STREAM_LIMIT = 32 * 1024 * 1024
+
+# Directory containing the daw_agents package, importable by the worker
+_PACKAGE_PARENT = str(Path(__file__).resolve().parents[2])
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when the worker process exits while handling a request."""
+
+
+class PytestWorker:
+    """
+    Async client for a long-lived pytest worker process.
+
+    Requests are serialized; the process is started lazily on first use.
+
+    Attributes:
+        cwd: Directory pytest runs in (the project root).
+        max_runs: Requests served before the process is recycled.
+        runs: Requests served by the current process.
+    """
+
+    module = "daw_agents.tdd.worker"
+    """Module run with ``python -m`` as the worker process."""
+
+    def __init__(self, cwd: Path, max_runs: int = 100) -> None:
+        """
+        Initialize the worker client.
+
+        Args:
+            cwd: Directory pytest runs in.
+            max_runs: Requests served before the process is recycled.
+        """
+        self.cwd = Path(cwd)
+        self.max_runs = max_runs
+        self.runs = 0
+        self._process: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the worker process is alive."""
+        return self._process is not None and self._process.returncode is None
+
+    async def run(self, args: list[str], timeout: float) -> tuple[int, str]:
+        """
+        Run pytest with the given arguments in the worker.
+
+        Args:
+            args: Arguments for ``pytest.main``.
+            timeout: Seconds to wait before killing the worker.
+
+        Returns:
+            Tuple of pytest exit code and captured output.
+
+        Raises:
+            TimeoutError: If the run exceeded ``timeout`` (worker is killed).
+            WorkerCrashedError: If the worker died during the run.
+        """
+        response = await self.request({"args": args}, timeout)
+        return int(response["exit_code"]), str(response["output"])
+
+    async def request(self, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """
+        Send one JSON request to the worker and wait for its response.
+
+        Args:
+            payload: Request understood by the worker module's ``main()``.
+            timeout: Seconds to wait before killing the worker.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            TimeoutError: If the request exceeded ``timeout`` (worker is killed).
+            WorkerCrashedError: If the worker died during the request.
+        """
+        async with self._lock:
+            if self.runs >= self.max_runs:
+                await self._stop()
+            process = await self._ensure_started()
+            assert process.stdin is not None and process.stdout is not None
+
+            self.runs += 1
+            request = json.dumps(payload) + "\n"
+            try:
+                process.stdin.write(request.encode())
+                await process.stdin.drain()
+                line = await asyncio.wait_for(process.stdout.readline(), timeout)
+            except TimeoutError:
+                await self._stop()
+                raise
+            except asyncio.CancelledError:
+                # The response would arrive for the next request; drop the process
+                self.kill()
+                raise
+            except (BrokenPipeError, ConnectionResetError) as e:
+                await self._stop()
+                raise WorkerCrashedError(f"pytest worker died: {e}") from e
+
+            if not line:
+                await self._stop()
+                raise WorkerCrashedError("pytest worker exited unexpectedly")
+
+            response: dict[str, Any] = json.loads(line)
+            return response
+
+    async def close(self) -> None:
+        """Stop the worker process."""
+        async with self._lock:
+            await self._stop()
+
+    def kill(self) -> None:
+        """Kill the worker process without waiting (e.g. its event loop is gone)."""
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(process.pid, signal.SIGKILL)
+
+    def _environment(self) -> dict[str, str]:
+        """Environment of the worker process.
+
+        The guard runs the project's own tests, which may need the same
+        settings as the server, so the full environment is passed on.
+        """
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (_PACKAGE_PARENT, env.get("PYTHONPATH")) if p
+        )
+        return env
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self._process is not None and self._process.returncode is None:
+            return self._process
+
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            self.module,
+            cwd=str(self.cwd),
+            env=self._environment(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_STREAM_LIMIT,
+        )
+        self.runs = 0
+        logger.debug("Started pytest worker pid=%s in %s", self._process.pid, self.cwd)
+        return self._process
+
+    async def _stop(self) -> None:
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), 1.0)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+
+
+# -----------------------------------------------------------------------------
+# Worker process
+# -----------------------------------------------------------------------------
+
+
+def _purge_project_modules(root: Path) -> None:
+    """Forget modules imported from the project so the next run reloads them."""
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if not file:
+            continue
+        path = Path(file).resolve()
+        if root in path.parents and "site-packages" not in path.parts:
+            del sys.modules[name]
+
+
+def main() -> None:
+    """Serve pytest runs over stdin/stdout until stdin closes."""
+    protocol = os.fdopen(os.dup(1), "w", buffering=1)
+    os.dup2(2, 1)
+
+    import pytest  # imported once, kept warm for every run
+
+    root = Path.cwd().resolve()
+    for line in sys.stdin:
+        request = json.loads(line)
+        output = io.StringIO()
+        saved_path = list(sys.path)
+        try:
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                exit_code = int(pytest.main(list(request["args"])))
+        except BaseException:  # noqa: BLE001 - report anything, keep serving
+            output.write(traceback.format_exc())
+            exit_code = int(pytest.ExitCode.INTERNAL_ERROR)
+        finally:
+            sys.path[:] = saved_path
+            _purge_project_modules(root)
+
+        protocol.write(json.dumps({"exit_code": exit_code, "output": output.getvalue()}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
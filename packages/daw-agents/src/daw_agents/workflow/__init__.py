@@ -2,9 +2,18 @@
 
 This package contains workflow-related modules including:
 - Orchestrator: Main workflow engine coordinating all agents
+- CheckpointSaver: Per-node persistence of Orchestrator state (in-memory
+  or delta-encoded Redis) for resuming workflows
 - RuleEnforcer: Coding style enforcement and linting integration
 """
 
+from daw_agents.workflow.checkpoint import (
+    Checkpoint,
+    CheckpointSaver,
+    CheckpointStats,
+    InMemoryCheckpointSaver,
+    RedisCheckpointSaver,
+)
 from daw_agents.workflow.orchestrator import (
     Orchestrator,
     OrchestratorConfig,
@@ -30,6 +39,12 @@ __all__ = [
     "OrchestratorState",
     "OrchestratorStatus",
     "WorkflowResult",
+    # Checkpoints
+    "Checkpoint",
+    "CheckpointSaver",
+    "CheckpointStats",
+    "InMemoryCheckpointSaver",
+    "RedisCheckpointSaver",
     # Rule Enforcer
     "CursorRule",
     "CursorRulesParser",
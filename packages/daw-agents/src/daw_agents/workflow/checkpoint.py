@@ -0,0 +1,451 @@
+"""
+Checkpoint persistence for Orchestrator workflow state.
+
+This module provides:
+- Checkpoint: A persisted OrchestratorState with the last completed node
+- CheckpointStats: Write-volume counters for a saver
+- StateDelta / diff_state(): Field-level delta between two snapshots
+- CheckpointSaver: Abstract saver interface
+- InMemoryCheckpointSaver: Process-local saver (tests, single worker)
+- RedisCheckpointSaver: Delta-encoded saver backed by Redis
+
+The Orchestrator saves its state after every node. A fresh process can
+then resume execute() from the last completed node, and pending PRD or
+deployment approvals survive worker restarts.
+
+Redis layout (per workflow, all keys share the workflow TTL):
+- orchestrator:checkpoint:<id>            hash: one encoded value per field
+- orchestrator:checkpoint:<id>:list:<f>   list: one encoded item per entry
+                                          of an append-only field (tasks,
+                                          executor_results, validator_results)
+
+Each save writes only the fields that changed since the previous save and
+appends only new list items, so the cost per node stays constant as a
+workflow accumulates hundreds of task results. Values above a size
+threshold are zlib-compressed.
+
+Usage:
+    ```python
+    from daw_agents.workflow import Orchestrator, RedisCheckpointSaver
+
+    orchestrator = Orchestrator(checkpoint_saver=RedisCheckpointSaver(ttl_seconds=86400))
+    result = await orchestrator.execute("Build a todo app", workflow_id="wf-42")
+    # ... after a restart, the same call resumes from the last completed node
+    result = await orchestrator.execute("Build a todo app", workflow_id="wf-42")
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import copy
+import json
+import logging
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis as AsyncRedis
+    from redis.typing import EncodableT, FieldT
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY_PREFIX = "orchestrator:checkpoint"
+DEFAULT_CHECKPOINT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_COMPRESS_THRESHOLD = 1024
+DEFAULT_TIMEOUT_SECONDS = 1.0
+DEFAULT_ERROR_BACKOFF_SECONDS = 30.0
+DEFAULT_MAX_SNAPSHOTS = 1024
+
+# State fields that only ever grow by appending; stored as Redis lists
+APPEND_ONLY_FIELDS = ("tasks", "executor_results", "validator_results")
+
+# Statuses after which a workflow is not saved again by its own nodes
+_TERMINAL_STATUSES = frozenset({"complete", "error"})
+
+_NODE_FIELD = "__node"
+_SEQUENCE_FIELD = "__sequence"
+_RAW_PREFIX = "j:"
+_COMPRESSED_PREFIX = "z:"
+
+
+@dataclass
+class Checkpoint:
+    """A saved workflow state.
+
+    Attributes:
+        workflow_id: Workflow the state belongs to
+        state: OrchestratorState as of the end of node
+        node: Name of the last completed node
+        sequence: Number of saves for this workflow (1 for the first)
+    """
+
+    workflow_id: str
+    state: dict[str, Any]
+    node: str
+    sequence: int
+
+
+@dataclass
+class CheckpointStats:
+    """Counters describing checkpoint write volume."""
+
+    saves: int = 0
+    fields_written: int = 0
+    items_appended: int = 0
+    lists_rewritten: int = 0
+    bytes_written: int = 0
+    errors: int = 0
+    skipped: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert stats to a dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class StateDelta:
+    """Changes between two snapshots of a workflow state.
+
+    Attributes:
+        fields: Scalar fields whose value changed (or were added)
+        removed: Scalar fields present before but not now
+        appends: New trailing items of append-only list fields
+        rewrites: Append-only fields whose existing items changed
+    """
+
+    fields: dict[str, Any] = field(default_factory=dict)
+    removed: list[str] = field(default_factory=list)
+    appends: dict[str, list[Any]] = field(default_factory=dict)
+    rewrites: dict[str, list[Any]] = field(default_factory=dict)
+
+    @property
+    def empty(self) -> bool:
+        """Whether nothing changed."""
+        return not (self.fields or self.removed or self.appends or self.rewrites)
+
+
+def diff_state(previous: Mapping[str, Any] | None, current: Mapping[str, Any]) -> StateDelta:
+    """Compute the delta that turns previous into current.
+
+    Append-only fields are compared by length and last item: if current is
+    at least as long and still holds previous's last item at the same
+    position, only the new tail is reported. Otherwise the whole list is
+    reported as a rewrite. With no previous snapshot, everything is new.
+
+    Args:
+        previous: Last persisted state, or None
+        current: State to persist
+
+    Returns:
+        StateDelta describing the writes needed
+    """
+    delta = StateDelta()
+    previous = previous or {}
+
+    for name, value in current.items():
+        if name in APPEND_ONLY_FIELDS and isinstance(value, list):
+            old = previous.get(name)
+            if not isinstance(old, list):
+                delta.rewrites[name] = list(value)
+            elif len(value) >= len(old) and (not old or value[len(old) - 1] == old[-1]):
+                if len(value) > len(old):
+                    delta.appends[name] = list(value[len(old) :])
+            else:
+                delta.rewrites[name] = list(value)
+        elif name not in previous or previous[name] != value:
+            delta.fields[name] = value
+
+    delta.removed = [
+        name for name in previous if name not in current and name not in APPEND_ONLY_FIELDS
+    ]
+    return delta
+
+
+def encode_value(value: Any, compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD) -> str:
+    """Encode a value as JSON, zlib-compressing it when large.
+
+    Returns a string so it can be stored through a decode_responses client.
+    """
+    raw = json.dumps(value, default=str, separators=(",", ":"))
+    if len(raw) < compress_threshold:
+        return _RAW_PREFIX + raw
+    packed = base64.b64encode(zlib.compress(raw.encode("utf-8"))).decode("ascii")
+    return _COMPRESSED_PREFIX + packed
+
+
+def decode_value(encoded: str) -> Any:
+    """Decode a value produced by encode_value()."""
+    if encoded.startswith(_COMPRESSED_PREFIX):
+        raw = zlib.decompress(base64.b64decode(encoded[len(_COMPRESSED_PREFIX) :]))
+        return json.loads(raw)
+    if encoded.startswith(_RAW_PREFIX):
+        return json.loads(encoded[len(_RAW_PREFIX) :])
+    return json.loads(encoded)
+
+
+class CheckpointSaver(ABC):
+    """Interface for persisting Orchestrator state between nodes.
+
+    Implementations must never raise from save(): a checkpoint outage is
+    logged and counted, and the workflow carries on.
+    """
+
+    def __init__(self) -> None:
+        self.stats = CheckpointStats()
+
+    @abstractmethod
+    async def save(self, workflow_id: str, state: Mapping[str, Any], node: str) -> None:
+        """Persist state as of the end of node."""
+
+    @abstractmethod
+    async def load(self, workflow_id: str) -> Checkpoint | None:
+        """Load the latest checkpoint, or None if there is none."""
+
+    @abstractmethod
+    async def delete(self, workflow_id: str) -> None:
+        """Remove a workflow's checkpoint."""
+
+
+class InMemoryCheckpointSaver(CheckpointSaver):
+    """Process-local checkpoint saver.
+
+    Keeps a deep copy of every saved state. Useful in tests and for a
+    single worker; state is lost with the process.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._checkpoints: dict[str, Checkpoint] = {}
+
+    async def save(self, workflow_id: str, state: Mapping[str, Any], node: str) -> None:
+        previous = self._checkpoints.get(workflow_id)
+        sequence = previous.sequence + 1 if previous else 1
+        self._checkpoints[workflow_id] = Checkpoint(
+            workflow_id=workflow_id,
+            state=copy.deepcopy(dict(state)),
+            node=node,
+            sequence=sequence,
+        )
+        self.stats.saves += 1
+
+    async def load(self, workflow_id: str) -> Checkpoint | None:
+        checkpoint = self._checkpoints.get(workflow_id)
+        return copy.deepcopy(checkpoint) if checkpoint else None
+
+    async def delete(self, workflow_id: str) -> None:
+        self._checkpoints.pop(workflow_id, None)
+
+
+class RedisCheckpointSaver(CheckpointSaver):
+    """Delta-encoded checkpoint saver backed by Redis.
+
+    The last saved state of each workflow is kept in memory, and each save
+    sends only diff_state() against it in one MULTI/EXEC pipeline, then
+    refreshes the workflow's TTL. After a restart the first load() seeds
+    that snapshot again; a save without one (or after a failed write)
+    rewrites the workflow in full.
+
+    Snapshots are dropped once a workflow reaches a terminal status, and
+    at most max_snapshots are kept (least recently used evicted first), so
+    paused or abandoned workflows cannot grow the process without bound.
+
+    The client is created lazily (by client_factory, or
+    get_async_redis_client() on the LangGraph database), so constructing
+    the saver never opens a connection. Each round trip is bounded by
+    timeout_seconds; after a failure the saver skips Redis for
+    error_backoff_seconds, so an outage costs one timeout rather than one
+    per node.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRedis | None = None,
+        db: int | None = None,
+        ttl_seconds: int = DEFAULT_CHECKPOINT_TTL_SECONDS,
+        compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD,
+        key_prefix: str = CHECKPOINT_KEY_PREFIX,
+        client_factory: Callable[[], Awaitable[AsyncRedis]] | None = None,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        error_backoff_seconds: float = DEFAULT_ERROR_BACKOFF_SECONDS,
+        max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._db = db
+        self._client_factory = client_factory
+        self.ttl_seconds = ttl_seconds
+        self.compress_threshold = compress_threshold
+        self.key_prefix = key_prefix
+        self.timeout_seconds = timeout_seconds
+        self.error_backoff_seconds = error_backoff_seconds
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, tuple[int, dict[str, Any]]] = OrderedDict()
+        self._retry_at = 0.0
+
+    async def _get_client(self) -> AsyncRedis:
+        if self._client is None:
+            if self._client_factory is not None:
+                self._client = await self._client_factory()
+            else:
+                from daw_agents.config.redis import RedisConfig, get_async_redis_client
+
+                db = self._db if self._db is not None else RedisConfig().db_langgraph
+                self._client = await get_async_redis_client(db=db)
+        return self._client
+
+    def _available(self) -> bool:
+        """Whether Redis may be tried (not backing off after a failure)."""
+        if time.monotonic() < self._retry_at:
+            self.stats.skipped += 1
+            return False
+        return True
+
+    def _failed(self, action: str, workflow_id: str, error: BaseException) -> None:
+        self.stats.errors += 1
+        self._retry_at = time.monotonic() + self.error_backoff_seconds
+        logger.warning("Checkpoint %s failed for %s: %r", action, workflow_id, error)
+
+    def _key(self, workflow_id: str) -> str:
+        return f"{self.key_prefix}:{workflow_id}"
+
+    def _list_key(self, workflow_id: str, name: str) -> str:
+        return f"{self.key_prefix}:{workflow_id}:list:{name}"
+
+    def _remember(self, workflow_id: str, sequence: int, state: Mapping[str, Any]) -> None:
+        """Keep the snapshot the next save diffs against."""
+        if state.get("status") in _TERMINAL_STATUSES:
+            self._snapshots.pop(workflow_id, None)
+            return
+        self._snapshots[workflow_id] = (sequence, _snapshot(state))
+        self._snapshots.move_to_end(workflow_id)
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+
+    def _encode(self, value: Any) -> str:
+        encoded = encode_value(value, self.compress_threshold)
+        self.stats.bytes_written += len(encoded)
+        return encoded
+
+    async def save(self, workflow_id: str, state: Mapping[str, Any], node: str) -> None:
+        snapshot = self._snapshots.get(workflow_id)
+        sequence, previous = snapshot if snapshot else (0, None)
+        if not self._available():
+            self._snapshots.pop(workflow_id, None)
+            return
+        delta = diff_state(previous, state)
+        key = self._key(workflow_id)
+
+        try:
+            client = await self._get_client()
+            pipe = client.pipeline(transaction=True)
+            if previous is None:
+                # Full write: drop whatever an earlier process left behind
+                pipe.delete(key, *(self._list_key(workflow_id, f) for f in APPEND_ONLY_FIELDS))
+
+            mapping: dict[FieldT, EncodableT] = {
+                name: self._encode(value) for name, value in delta.fields.items()
+            }
+            mapping[_NODE_FIELD] = node
+            mapping[_SEQUENCE_FIELD] = str(sequence + 1)
+            pipe.hset(key, mapping=mapping)
+            if delta.removed:
+                pipe.hdel(key, *delta.removed)
+
+            for name, items in delta.rewrites.items():
+                list_key = self._list_key(workflow_id, name)
+                pipe.delete(list_key)
+                if items:
+                    pipe.rpush(list_key, *(self._encode(item) for item in items))
+            for name, items in delta.appends.items():
+                pipe.rpush(self._list_key(workflow_id, name), *(self._encode(item) for item in items))
+
+            pipe.expire(key, self.ttl_seconds)
+            for name in APPEND_ONLY_FIELDS:
+                pipe.expire(self._list_key(workflow_id, name), self.ttl_seconds)
+            await asyncio.wait_for(pipe.execute(), self.timeout_seconds)
+        except Exception as e:
+            # Unknown what reached Redis: rewrite in full next time
+            self._snapshots.pop(workflow_id, None)
+            self._failed("save", workflow_id, e)
+            return
+
+        self.stats.saves += 1
+        self.stats.fields_written += len(delta.fields)
+        self.stats.items_appended += sum(len(items) for items in delta.appends.values())
+        self.stats.lists_rewritten += len(delta.rewrites)
+        self._remember(workflow_id, sequence + 1, state)
+
+    async def load(self, workflow_id: str) -> Checkpoint | None:
+        if not self._available():
+            return None
+        try:
+            client = await self._get_client()
+            pipe = client.pipeline(transaction=True)
+            pipe.hgetall(self._key(workflow_id))
+            for name in APPEND_ONLY_FIELDS:
+                pipe.lrange(self._list_key(workflow_id, name), 0, -1)
+            fields, *list_items = await asyncio.wait_for(pipe.execute(), self.timeout_seconds)
+        except Exception as e:
+            self._failed("load", workflow_id, e)
+            return None
+
+        if not fields:
+            return None
+        lists = dict(zip(APPEND_ONLY_FIELDS, list_items, strict=True))
+        node = fields.pop(_NODE_FIELD, "")
+        sequence = int(fields.pop(_SEQUENCE_FIELD, "0"))
+        state = {name: decode_value(value) for name, value in fields.items()}
+        for name, items in lists.items():
+            state[name] = [decode_value(item) for item in items]
+
+        self._remember(workflow_id, sequence, state)
+        return Checkpoint(workflow_id=workflow_id, state=state, node=node, sequence=sequence)
+
+    async def delete(self, workflow_id: str) -> None:
+        self._snapshots.pop(workflow_id, None)
+        if not self._available():
+            return
+        try:
+            client = await self._get_client()
+            await asyncio.wait_for(
+                client.delete(
+                    self._key(workflow_id),
+                    *(self._list_key(workflow_id, name) for name in APPEND_ONLY_FIELDS),
+                ),
+                self.timeout_seconds,
+            )
+        except Exception as e:
+            self._failed("delete", workflow_id, e)
+
+
+def _snapshot(state: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy a state for later diffing.
+
+    Lists are copied so appends to the live state show up as a delta;
+    items themselves are shared, since nodes replace rather than mutate
+    results.
+    """
+    return {name: list(value) if isinstance(value, list) else value for name, value in state.items()}
+
+
+__all__ = [
+    "APPEND_ONLY_FIELDS",
+    "CHECKPOINT_KEY_PREFIX",
+    "Checkpoint",
+    "CheckpointSaver",
+    "CheckpointStats",
+    "DEFAULT_CHECKPOINT_TTL_SECONDS",
+    "InMemoryCheckpointSaver",
+    "RedisCheckpointSaver",
+    "StateDelta",
+    "decode_value",
+    "diff_state",
+    "encode_value",
+]
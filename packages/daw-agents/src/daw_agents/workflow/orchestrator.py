@@ -8,9 +8,12 @@ The Orchestrator is the central coordination point (per FR-01.4) that:
 2. Decomposes PRD into atomic tasks
 3. Executes each task via the Developer agent (TDD workflow)
 4. Validates each task via the Validator agent
+   (optionally running independent tasks concurrently, following the
+   task dependency DAG)
 5. Applies deployment gates before deployment
 6. Supports human-in-the-loop interrupts for approvals
-7. Persists state to Redis for checkpoint/recovery
+7. Persists state to Redis after every node for checkpoint/recovery
+   (see daw_agents.workflow.checkpoint)
 
 CRITICAL ARCHITECTURE DECISIONS:
 - Uses LangGraph StateGraph for workflow orchestration
@@ -33,8 +36,10 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable
+import uuid
+from collections.abc import Awaitable, Callable
 from enum import Enum
 from typing import Any
 
@@ -47,6 +52,11 @@ from daw_agents.agents.planner.taskmaster import Taskmaster
 from daw_agents.agents.validator.agent import ValidatorAgent
 from daw_agents.config.redis import RedisConfig, get_async_redis_client
 from daw_agents.models.router import ModelRouter
+from daw_agents.workflow.checkpoint import (
+    DEFAULT_CHECKPOINT_TTL_SECONDS,
+    CheckpointSaver,
+    RedisCheckpointSaver,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +98,11 @@ class OrchestratorConfig(BaseModel):
         require_human_approval: Whether to require human approval before deployment (default: True)
         require_prd_approval: Whether to require human approval of PRD before execution (default: True)
         checkpoint_enabled: Whether to enable Redis state checkpoints (default: True)
+        checkpoint_ttl_seconds: Lifetime of a workflow's checkpoint, refreshed on
+            every save (default: 7 days)
+        parallel_execution: Run tasks whose dependencies are satisfied concurrently
+            instead of one at a time (default: False)
+        max_parallel_tasks: Maximum tasks in flight in parallel mode (default: 4)
     """
 
     max_retries: int = Field(default=3, ge=0, le=10, description="Max retry attempts")
@@ -100,6 +115,17 @@ class OrchestratorConfig(BaseModel):
     checkpoint_enabled: bool = Field(
         default=True, description="Enable Redis state checkpoints"
     )
+    checkpoint_ttl_seconds: int = Field(
+        default=DEFAULT_CHECKPOINT_TTL_SECONDS,
+        ge=60,
+        description="Checkpoint TTL per workflow, refreshed on every save",
+    )
+    parallel_execution: bool = Field(
+        default=False, description="Execute independent tasks concurrently"
+    )
+    max_parallel_tasks: int = Field(
+        default=4, ge=1, le=64, description="Max concurrent tasks in parallel mode"
+    )
 
 
 class WorkflowResult(BaseModel):
@@ -115,10 +141,12 @@ class WorkflowResult(BaseModel):
         executor_results: Results from Developer agent per task
         validator_results: Results from Validator agent per task
         error: Error message if workflow failed
+        workflow_id: Checkpoint ID; pass it to execute() again to resume
     """
 
     success: bool = Field(..., description="Whether workflow succeeded")
     status: str = Field(..., description="Final workflow status")
+    workflow_id: str | None = Field(default=None, description="Workflow checkpoint ID")
     prd_output: dict[str, Any] | None = Field(
         default=None, description="Generated PRD document"
     )
@@ -153,6 +181,8 @@ class OrchestratorState(TypedDict):
         prd_approval_required: Whether awaiting PRD approval before execution
         prd_feedback: User feedback from PRD review (for rejection/modification)
         retry_count: Current retry count for current task
+        workflow_id: Identifier checkpoints are saved under
+        last_node: Last completed node (where a resumed workflow continues)
     """
 
     user_input: str
@@ -168,6 +198,8 @@ class OrchestratorState(TypedDict):
     prd_approval_required: bool
     prd_feedback: str | None
     retry_count: int
+    workflow_id: str | None
+    last_node: str | None
 
 
 # -----------------------------------------------------------------------------
@@ -195,6 +227,7 @@ class Orchestrator:
         _taskmaster: Planner agent instance
         _developer: Executor agent instance
         _validator: Validator agent instance
+        _checkpoint_saver: Saver persisting state after every node (or None)
         _pending_approval: State saved when awaiting approval
         _event_handlers: List of event handler callbacks
 
@@ -212,6 +245,7 @@ class Orchestrator:
         taskmaster: Taskmaster | None = None,
         developer: Developer | None = None,
         validator: ValidatorAgent | None = None,
+        checkpoint_saver: CheckpointSaver | None = None,
     ) -> None:
         """Initialize the Orchestrator.
 
@@ -221,6 +255,8 @@ class Orchestrator:
             taskmaster: Optional Taskmaster (Planner) agent. Creates default if None.
             developer: Optional Developer (Executor) agent. Creates default if None.
             validator: Optional ValidatorAgent. Creates default if None.
+            checkpoint_saver: Optional CheckpointSaver, used when
+                checkpoint_enabled is set. Defaults to a RedisCheckpointSaver.
         """
         self._model_router = model_router or ModelRouter()
         self._config = config or OrchestratorConfig()
@@ -228,6 +264,14 @@ class Orchestrator:
         self._developer = developer
         self._validator = validator
 
+        # Checkpoint persistence (connects lazily)
+        self._checkpoint_saver: CheckpointSaver | None = None
+        if self._config.checkpoint_enabled:
+            self._checkpoint_saver = checkpoint_saver or RedisCheckpointSaver(
+                client_factory=self._checkpoint_client,
+                ttl_seconds=self._config.checkpoint_ttl_seconds,
+            )
+
         # Human approval state (deployment)
         self._pending_approval: dict[str, Any] | None = None
 
@@ -257,19 +301,41 @@ class Orchestrator:
                                                                   |-> execute (retry)
                                                                   |-> error -> END
 
+        In parallel mode plan routes to execute_parallel instead, which runs
+        every task (develop, validate, retry) and then routes to deploy or error.
+
+        Every node is wrapped to record itself as last_node and save a
+        checkpoint. START routes on last_node, so a workflow restored from a
+        checkpoint continues after the last node it completed.
+
         Returns:
             Compiled StateGraph workflow.
         """
         builder = StateGraph(OrchestratorState)
 
         # Add nodes
-        builder.add_node("plan", self._plan_node)
-        builder.add_node("execute", self._execute_node)
-        builder.add_node("validate", self._validate_node)
-        builder.add_node("deploy", self._deploy_node)
+        builder.add_node("plan", self._checkpointed("plan", self._plan_node))
+        builder.add_node("execute", self._checkpointed("execute", self._execute_node))
+        builder.add_node(
+            "execute_parallel",
+            self._checkpointed("execute_parallel", self._execute_parallel_node),
+        )
+        builder.add_node("validate", self._checkpointed("validate", self._validate_node))
+        builder.add_node("deploy", self._checkpointed("deploy", self._deploy_node))
 
-        # Add edges
-        builder.add_edge(START, "plan")
+        # Add edges: fresh workflows plan, resumed ones continue after last_node
+        builder.add_conditional_edges(
+            START,
+            self._route_from_start,
+            {
+                "plan": "plan",
+                "execute": "execute",
+                "execute_parallel": "execute_parallel",
+                "validate": "validate",
+                "deploy": "deploy",
+                "end": END,
+            },
+        )
 
         # After plan: execute, await PRD approval, or error
         builder.add_conditional_edges(
@@ -277,11 +343,22 @@ class Orchestrator:
             self._route_after_plan,
             {
                 "execute": "execute",
+                "execute_parallel": "execute_parallel",
                 "awaiting_prd_approval": END,  # Workflow pauses for PRD approval
                 "error": END,
             },
         )
 
+        # After parallel execution: deploy or error
+        builder.add_conditional_edges(
+            "execute_parallel",
+            self._route_after_parallel,
+            {
+                "deploy": "deploy",
+                "error": END,
+            },
+        )
+
         # After execute: always validate
         builder.add_conditional_edges(
             "execute",
@@ -308,6 +385,35 @@ class Orchestrator:
 
         return builder.compile()
 
+    async def _checkpoint_client(self) -> Any:
+        """Create the Redis client for the default checkpoint saver."""
+        return await get_async_redis_client(db=RedisConfig().db_langgraph)
+
+    def _checkpointed(
+        self,
+        name: str,
+        node: Callable[[OrchestratorState], Awaitable[dict[str, Any]]],
+    ) -> Callable[..., Awaitable[dict[str, Any]]]:
+        """Wrap a node so its resulting state is checkpointed.
+
+        Args:
+            name: Node name recorded as last_node
+            node: Node coroutine function
+
+        Returns:
+            Node coroutine function that saves a checkpoint after running
+        """
+
+        async def run(state: OrchestratorState) -> dict[str, Any]:
+            updates = await node(state)
+            updates["last_node"] = name
+            workflow_id = state.get("workflow_id")
+            if self._checkpoint_saver is not None and workflow_id:
+                await self._checkpoint_saver.save(workflow_id, {**state, **updates}, node=name)
+            return updates
+
+        return run
+
     # -------------------------------------------------------------------------
     # Workflow Nodes
     # -------------------------------------------------------------------------
@@ -413,37 +519,13 @@ class Orchestrator:
         current_task = tasks[current_idx]
         task_id = current_task.get("id", f"TASK-{current_idx}")
 
-        logger.info("Executing task %s: %s", task_id, current_task.get("description", "")[:50])
-        self._emit_event({"type": "status_change", "status": "coding", "task_id": task_id})
-
         try:
-            # Get or create developer
-            developer = self._developer or Developer(router=self._model_router)
-
-            # Determine file paths from task
-            source_file = current_task.get("context_files", ["src/main.py"])[0]
-            test_file = source_file.replace("src/", "tests/test_")
-
-            # Execute TDD workflow
-            result = await developer.execute(
-                task=current_task.get("description", ""),
-                source_file=source_file,
-                test_file=test_file,
-            )
+            result_dict = await self._develop_task(current_task, task_id)
 
             # Add result to executor_results
             new_results = list(state["executor_results"])
-            result_dict = result.model_dump() if hasattr(result, "model_dump") else {
-                "task_id": task_id,
-                "success": result.success if hasattr(result, "success") else False,
-                "source_code": getattr(result, "source_code", ""),
-                "test_code": getattr(result, "test_code", ""),
-            }
-            result_dict["task_id"] = task_id
             new_results.append(result_dict)
 
-            logger.info("Task %s execution complete: success=%s", task_id, result_dict.get("success"))
-
             return {
                 "executor_results": new_results,
                 "status": OrchestratorStatus.VALIDATING.value,
@@ -480,32 +562,15 @@ class Orchestrator:
         current_result = executor_results[current_idx]
         task_id = current_result.get("task_id", f"TASK-{current_idx}")
 
-        logger.info("Validating task %s", task_id)
-        self._emit_event({"type": "status_change", "status": "validating", "task_id": task_id})
-
         try:
-            # Get or create validator
-            validator = self._validator or ValidatorAgent(router=self._model_router)
-
-            # Extract code from executor result
-            code = current_result.get("source_code", "")
-            requirements = state["tasks"][current_idx].get("description", "")
-
-            # Run validation
-            validation_result = await validator.validate(code=code, requirements=requirements)
+            validation_dict = await self._validate_task(
+                state["tasks"][current_idx], current_result, task_id
+            )
 
             # Add result to validator_results
             new_results = list(state["validator_results"])
-            validation_dict = validation_result.model_dump() if hasattr(validation_result, "model_dump") else {
-                "passed": validation_result.status == "approved" if hasattr(validation_result, "status") else False,
-            }
-            validation_dict["task_id"] = task_id
-            validation_dict["passed"] = validation_dict.get("status") == "approved" or validation_dict.get("passed", False)
-            validation_dict["fixable"] = validation_dict.get("status") not in ["critical", "security_failure"]
             new_results.append(validation_dict)
 
-            logger.info("Task %s validation complete: passed=%s", task_id, validation_dict.get("passed"))
-
             return {
                 "validator_results": new_results,
             }
@@ -517,6 +582,224 @@ class Orchestrator:
                 "error": f"Validation failed for {task_id}: {str(e)}",
             }
 
+    async def _execute_parallel_node(self, state: OrchestratorState) -> dict[str, Any]:
+        """Parallel execute node: Run every task as soon as its dependencies pass.
+
+        Tasks are scheduled from the dependency DAG (the "dependencies" ids
+        produced by the TaskDecomposer). Up to config.max_parallel_tasks tasks
+        run Developer -> Validator at once; each retries independently, so a
+        retrying task never holds back its siblings. Ready tasks start in
+        their planned order, and results are merged back in task order
+        (attempts in order within a task), so the output does not depend on
+        completion timing.
+
+        A task that fails validation (or exhausts its retries) blocks only its
+        dependents; unrelated tasks still run. Tasks naming an unknown
+        dependency id, or on a dependency cycle, are not run and are
+        reported as such.
+
+        The results are checkpointed as each task finishes, so a workflow
+        resumed after a crash mid-batch reruns only the tasks that had not
+        passed yet.
+
+        Args:
+            state: Current orchestrator state
+
+        Returns:
+            State updates with executor_results and validator_results
+        """
+        tasks = state["tasks"]
+        task_ids = [task.get("id", f"TASK-{idx}") for idx, task in enumerate(tasks)]
+        positions = {task_id: idx for idx, task_id in enumerate(task_ids)}
+        failures: dict[int, str] = {}
+        dependencies: list[set[int]] = []
+        for idx, task in enumerate(tasks):
+            dep_ids = task.get("dependencies") or []
+            unknown = [dep_id for dep_id in dep_ids if dep_id not in positions]
+            if unknown:
+                failures[idx] = f"Unknown dependencies of {task_ids[idx]}: {', '.join(unknown)}"
+            dependencies.append({positions[dep_id] for dep_id in dep_ids if dep_id in positions})
+        cyclic = _cyclic_tasks(dependencies)
+
+        logger.info(
+            "Executing %d tasks in parallel (max %d concurrent)",
+            len(tasks),
+            self._config.max_parallel_tasks,
+        )
+
+        # Tasks that passed before a restart keep their results and are not rerun
+        attempts = _passed_attempts(state, positions)
+        passed = set(attempts)
+        pending = [
+            idx
+            for idx in range(len(tasks))
+            if idx not in failures and idx not in cyclic and idx not in passed
+        ]
+        running: dict[asyncio.Task[Any], int] = {}
+
+        while pending or running:
+            for idx in list(pending):
+                if len(running) >= self._config.max_parallel_tasks:
+                    break
+                if dependencies[idx] <= passed:
+                    pending.remove(idx)
+                    coro = self._run_task(tasks[idx], task_ids[idx])
+                    running[asyncio.create_task(coro)] = idx
+
+            if not running:
+                break  # Everything left depends on a failed task
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                idx = running.pop(finished)
+                attempts[idx], error = finished.result()
+                if error is None:
+                    passed.add(idx)
+                else:
+                    failures[idx] = error
+            await self._save_progress(state, _attempt_results(attempts))
+
+        updates: dict[str, Any] = {
+            **_attempt_results(attempts),
+            "current_task_idx": len(tasks),
+        }
+
+        if failures or cyclic or pending:
+            errors = [failures[idx] for idx in sorted(failures)]
+            if cyclic:
+                cycle = ", ".join(task_ids[idx] for idx in sorted(cyclic))
+                errors.append(f"Dependency cycle: {cycle}")
+            if pending:
+                blocked = ", ".join(task_ids[idx] for idx in pending)
+                errors.append(f"Blocked by failed dependencies: {blocked}")
+            logger.error("Parallel execution failed: %s", "; ".join(errors))
+            updates["status"] = OrchestratorStatus.ERROR.value
+            updates["error"] = "; ".join(errors)
+            return updates
+
+        logger.info("Parallel execution complete: %d tasks passed", len(passed))
+        updates["status"] = OrchestratorStatus.VALIDATING.value
+        return updates
+
+    async def _save_progress(self, state: OrchestratorState, results: dict[str, Any]) -> None:
+        """Checkpoint the task results of a node that has not finished yet.
+
+        The checkpoint keeps the previous last_node, so a resumed workflow
+        enters the node again and picks up from these results.
+        """
+        workflow_id = state.get("workflow_id")
+        if self._checkpoint_saver is not None and workflow_id:
+            await self._checkpoint_saver.save(
+                workflow_id, {**state, **results}, node=state.get("last_node") or ""
+            )
+
+    async def _run_task(
+        self, task: dict[str, Any], task_id: str
+    ) -> tuple[list[tuple[dict[str, Any], dict[str, Any]]], str | None]:
+        """Develop and validate one task, retrying fixable failures.
+
+        Args:
+            task: Task dictionary
+            task_id: Task identifier
+
+        Returns:
+            Tuple of (executor/validator result pairs per attempt, error or None)
+        """
+        attempts: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        for _ in range(self._config.max_retries + 1):
+            try:
+                executor_result = await self._develop_task(task, task_id)
+            except Exception as e:
+                logger.error("Execution failed for task %s: %s", task_id, str(e))
+                return attempts, f"Execution failed for {task_id}: {str(e)}"
+            try:
+                validation = await self._validate_task(task, executor_result, task_id)
+            except Exception as e:
+                logger.error("Validation failed for task %s: %s", task_id, str(e))
+                return attempts, f"Validation failed for {task_id}: {str(e)}"
+
+            attempts.append((executor_result, validation))
+            if validation["passed"]:
+                return attempts, None
+            if not validation["fixable"]:
+                return attempts, f"Validation failed for {task_id}: not fixable"
+
+        return attempts, f"Validation failed for {task_id} after {len(attempts)} attempts"
+
+    async def _develop_task(self, task: dict[str, Any], task_id: str) -> dict[str, Any]:
+        """Run the Developer TDD workflow for a task.
+
+        Args:
+            task: Task dictionary
+            task_id: Task identifier
+
+        Returns:
+            Executor result dictionary tagged with task_id
+        """
+        logger.info("Executing task %s: %s", task_id, task.get("description", "")[:50])
+        self._emit_event({"type": "status_change", "status": "coding", "task_id": task_id})
+
+        # Get or create developer
+        developer = self._developer or Developer(router=self._model_router)
+
+        # Determine file paths from task
+        source_file = (task.get("context_files") or ["src/main.py"])[0]
+        test_file = source_file.replace("src/", "tests/test_")
+
+        # Execute TDD workflow
+        result = await developer.execute(
+            task=task.get("description", ""),
+            source_file=source_file,
+            test_file=test_file,
+        )
+
+        result_dict = result.model_dump() if hasattr(result, "model_dump") else {
+            "task_id": task_id,
+            "success": result.success if hasattr(result, "success") else False,
+            "source_code": getattr(result, "source_code", ""),
+            "test_code": getattr(result, "test_code", ""),
+        }
+        result_dict["task_id"] = task_id
+
+        logger.info("Task %s execution complete: success=%s", task_id, result_dict.get("success"))
+        return result_dict
+
+    async def _validate_task(
+        self, task: dict[str, Any], executor_result: dict[str, Any], task_id: str
+    ) -> dict[str, Any]:
+        """Run the Validator on a task's executor result.
+
+        Args:
+            task: Task dictionary (its description is the requirement)
+            executor_result: Executor result holding the source code
+            task_id: Task identifier
+
+        Returns:
+            Validator result dictionary with task_id, passed and fixable
+        """
+        logger.info("Validating task %s", task_id)
+        self._emit_event({"type": "status_change", "status": "validating", "task_id": task_id})
+
+        # Get or create validator
+        validator = self._validator or ValidatorAgent(router=self._model_router)
+
+        # Extract code from executor result
+        code = executor_result.get("source_code", "")
+        requirements = task.get("description", "")
+
+        # Run validation
+        validation_result = await validator.validate(code=code, requirements=requirements)
+
+        validation_dict: dict[str, Any] = validation_result.model_dump() if hasattr(validation_result, "model_dump") else {
+            "passed": validation_result.status == "approved" if hasattr(validation_result, "status") else False,
+        }
+        validation_dict["task_id"] = task_id
+        validation_dict["passed"] = validation_dict.get("status") == "approved" or validation_dict.get("passed", False)
+        validation_dict["fixable"] = validation_dict.get("status") not in ["critical", "security_failure"]
+
+        logger.info("Task %s validation complete: passed=%s", task_id, validation_dict.get("passed"))
+        return validation_dict
+
     async def _deploy_node(self, state: OrchestratorState) -> dict[str, Any]:
         """Deploy node: Check deployment gates and request approval.
 
@@ -544,7 +827,7 @@ class Orchestrator:
 
                 # Save state for approval workflow
                 self._pending_approval = {
-                    "workflow_id": id(state),  # Simple ID for now
+                    "workflow_id": state.get("workflow_id") or id(state),
                     "state": dict(state),
                 }
 
@@ -577,6 +860,33 @@ class Orchestrator:
     # Routing Functions
     # -------------------------------------------------------------------------
 
+    def _route_from_start(self, state: OrchestratorState) -> str:
+        """Route a workflow entering the graph.
+
+        Fresh workflows start at plan. A workflow restored from a checkpoint
+        takes the route its last completed node would have taken.
+
+        Args:
+            state: Current orchestrator state
+
+        Returns:
+            Next node name, or "end" if the workflow has nothing left to run
+        """
+        routes: dict[str, Callable[[OrchestratorState], str]] = {
+            "plan": self._route_after_plan,
+            "execute": self._route_after_execute,
+            "execute_parallel": self._route_after_parallel,
+            "validate": self._route_after_validate,
+        }
+        last_node = state.get("last_node")
+        if not last_node:
+            return "plan"
+        route = routes.get(last_node)
+        if route is None:
+            return "end"
+        next_node = route(state)
+        return next_node if next_node in routes or next_node == "deploy" else "end"
+
     def _route_after_plan(self, state: OrchestratorState) -> str:
         """Route after planning based on results.
 
@@ -584,7 +894,8 @@ class Orchestrator:
             state: Current orchestrator state
 
         Returns:
-            Next node name ("execute", "awaiting_prd_approval", or "error")
+            Next node name ("execute", "execute_parallel",
+            "awaiting_prd_approval", or "error")
         """
         if state.get("error"):
             return "error"
@@ -593,6 +904,8 @@ class Orchestrator:
         # If PRD approval is required, end workflow here and wait for approval
         if state.get("prd_approval_required"):
             return "awaiting_prd_approval"
+        if self._config.parallel_execution:
+            return "execute_parallel"
         return "execute"
 
     def _route_after_execute(self, state: OrchestratorState) -> str:
@@ -608,6 +921,19 @@ class Orchestrator:
             return "error"
         return "validate"
 
+    def _route_after_parallel(self, state: OrchestratorState) -> str:
+        """Route after parallel execution.
+
+        Args:
+            state: Current orchestrator state
+
+        Returns:
+            Next node name ("deploy" or "error")
+        """
+        if state.get("error"):
+            return "error"
+        return "deploy"
+
     def _route_after_validate(self, state: OrchestratorState) -> str:
         """Route after validation based on results.
 
@@ -653,11 +979,14 @@ class Orchestrator:
     # Public API
     # -------------------------------------------------------------------------
 
-    def create_initial_state(self, user_input: str) -> OrchestratorState:
+    def create_initial_state(
+        self, user_input: str, workflow_id: str | None = None
+    ) -> OrchestratorState:
         """Create initial state for the workflow.
 
         Args:
             user_input: User's requirement string
+            workflow_id: Optional checkpoint ID for the workflow
 
         Returns:
             Initial OrchestratorState
@@ -676,16 +1005,24 @@ class Orchestrator:
             "prd_approval_required": False,
             "prd_feedback": None,
             "retry_count": 0,
+            "workflow_id": workflow_id,
+            "last_node": None,
         }
 
-    async def execute(self, user_input: str) -> WorkflowResult:
+    async def execute(
+        self, user_input: str, workflow_id: str | None = None
+    ) -> WorkflowResult:
         """Execute the complete orchestrator workflow.
 
         Takes a user requirement and runs the full pipeline:
         Planning -> Execution -> Validation -> Deployment
 
+        If a checkpoint exists for workflow_id, the workflow resumes after
+        its last completed node instead of starting over.
+
         Args:
             user_input: User's requirement string
+            workflow_id: Checkpoint ID. A new one is generated if None.
 
         Returns:
             WorkflowResult with all outputs
@@ -695,7 +1032,16 @@ class Orchestrator:
         """
         logger.info("Starting orchestrator workflow for: %s", user_input[:100])
 
-        initial_state = self.create_initial_state(user_input)
+        # A generated ID has no checkpoint yet, so only a given one is looked up
+        restored = await self.restore_from_checkpoint(workflow_id) if workflow_id else None
+        workflow_id = workflow_id or uuid.uuid4().hex
+        initial_state = self.create_initial_state(user_input, workflow_id)
+        if restored is not None:
+            logger.info(
+                "Resuming workflow %s after node %s", workflow_id, restored.get("last_node")
+            )
+            initial_state.update(restored)
+            initial_state["workflow_id"] = workflow_id
 
         try:
             final_state = await self.workflow.ainvoke(initial_state)
@@ -709,6 +1055,7 @@ class Orchestrator:
             return WorkflowResult(
                 success=success,
                 status=final_state.get("status", "error"),
+                workflow_id=workflow_id,
                 prd_output=final_state.get("prd_output"),
                 tasks=final_state.get("tasks", []),
                 executor_results=final_state.get("executor_results", []),
@@ -722,6 +1069,7 @@ class Orchestrator:
                 success=False,
                 status=OrchestratorStatus.ERROR.value,
                 error=str(e),
+                workflow_id=workflow_id,
             )
 
     async def approve(self, workflow_id: str) -> bool | dict[str, Any]:
@@ -737,12 +1085,18 @@ class Orchestrator:
         """
         logger.info("Approving workflow: %s", workflow_id)
 
-        if not self._pending_approval:
+        pending = self._pending_approval or await self._load_pending_approval(workflow_id)
+        if not pending:
             logger.warning("No pending approval found")
             return False
 
         # Clear pending approval
         self._pending_approval = None
+        await self._update_checkpoint(
+            workflow_id,
+            status=OrchestratorStatus.COMPLETE.value,
+            human_approval_required=False,
+        )
 
         return {"continued": True, "status": "approved"}
 
@@ -760,12 +1114,19 @@ class Orchestrator:
         """
         logger.info("Rejecting workflow: %s, reason: %s", workflow_id, reason)
 
-        if not self._pending_approval:
+        pending = self._pending_approval or await self._load_pending_approval(workflow_id)
+        if not pending:
             logger.warning("No pending approval found")
             return False
 
         # Clear pending approval
         self._pending_approval = None
+        await self._update_checkpoint(
+            workflow_id,
+            status=OrchestratorStatus.ERROR.value,
+            human_approval_required=False,
+            error=f"Deployment rejected: {reason}",
+        )
 
         return {"cancelled": True, "reason": reason}
 
@@ -786,16 +1147,23 @@ class Orchestrator:
         """
         logger.info("Approving PRD for workflow: %s", workflow_id)
 
-        if not self._pending_prd_approval:
+        prd_data = self._pending_prd_approval or await self._load_pending_prd_approval(
+            workflow_id
+        )
+        if not prd_data:
             logger.warning("No pending PRD approval found")
             return {
                 "success": False,
                 "error": "No pending PRD approval found",
             }
 
-        # Get pending PRD data
-        prd_data = self._pending_prd_approval
+        # Clear pending PRD; execute(workflow_id=...) now resumes into coding
         self._pending_prd_approval = None
+        await self._update_checkpoint(
+            workflow_id,
+            status=OrchestratorStatus.CODING.value,
+            prd_approval_required=False,
+        )
 
         self._emit_event({
             "type": "prd_approved",
@@ -827,15 +1195,18 @@ class Orchestrator:
         """
         logger.info("Rejecting PRD for workflow: %s, feedback: %s", workflow_id, feedback[:100] if feedback else "")
 
-        if not self._pending_prd_approval:
+        if not (
+            self._pending_prd_approval or await self._load_pending_prd_approval(workflow_id)
+        ):
             logger.warning("No pending PRD approval found")
             return {
                 "success": False,
                 "error": "No pending PRD approval found",
             }
 
-        # Clear pending PRD
+        # Clear pending PRD; the workflow restarts from planning
         self._pending_prd_approval = None
+        await self._discard_checkpoint(workflow_id)
 
         self._emit_event({
             "type": "prd_rejected",
@@ -867,7 +1238,10 @@ class Orchestrator:
         """
         logger.info("Requesting PRD modification for workflow: %s", workflow_id)
 
-        if not self._pending_prd_approval:
+        prd_data = self._pending_prd_approval or await self._load_pending_prd_approval(
+            workflow_id
+        )
+        if not prd_data:
             logger.warning("No pending PRD approval found")
             return {
                 "success": False,
@@ -875,8 +1249,8 @@ class Orchestrator:
             }
 
         # Keep the PRD data for reference during modification
-        prd_data = self._pending_prd_approval
         self._pending_prd_approval = None
+        await self._discard_checkpoint(workflow_id)
 
         self._emit_event({
             "type": "prd_modification_requested",
@@ -894,34 +1268,57 @@ class Orchestrator:
         }
 
     async def restore_from_checkpoint(self, checkpoint_id: str) -> OrchestratorState | None:
-        """Restore workflow state from Redis checkpoint.
+        """Restore workflow state from its checkpoint.
 
         Args:
-            checkpoint_id: ID of the checkpoint to restore
+            checkpoint_id: ID of the checkpoint (workflow) to restore
 
         Returns:
             Restored state or None if not found
         """
-        if not self._config.checkpoint_enabled:
-            logger.warning("Checkpoints are disabled")
+        if self._checkpoint_saver is None:
+            logger.debug("Checkpoints are disabled")
             return None
 
         try:
-            config = RedisConfig()
-            client = await get_async_redis_client(db=config.db_langgraph)
-
-            state_json = await client.get(f"orchestrator:checkpoint:{checkpoint_id}")
-            await client.close()
-
-            if state_json:
-                import json
+            checkpoint = await self._checkpoint_saver.load(checkpoint_id)
+        except Exception as e:
+            logger.error("Failed to restore checkpoint: %s", str(e))
+            return None
 
-                return json.loads(state_json)  # type: ignore
+        if checkpoint is None:
+            return None
+        state = dict(checkpoint.state)
+        state.setdefault("last_node", checkpoint.node)
+        return state  # type: ignore[return-value]
+
+    async def _load_pending_approval(self, workflow_id: str) -> dict[str, Any] | None:
+        """Rebuild a pending deployment approval from its checkpoint."""
+        state = await self.restore_from_checkpoint(workflow_id)
+        if not state or state.get("status") != OrchestratorStatus.AWAITING_APPROVAL.value:
             return None
+        return {"workflow_id": workflow_id, "state": dict(state)}
 
-        except Exception as e:
-            logger.error("Failed to restore checkpoint: %s", str(e))
+    async def _load_pending_prd_approval(self, workflow_id: str) -> dict[str, Any] | None:
+        """Rebuild a pending PRD approval from its checkpoint."""
+        state = await self.restore_from_checkpoint(workflow_id)
+        if not state or state.get("status") != OrchestratorStatus.AWAITING_PRD_APPROVAL.value:
             return None
+        return {"prd_output": state.get("prd_output"), "tasks": state.get("tasks", [])}
+
+    async def _update_checkpoint(self, workflow_id: str, **updates: Any) -> None:
+        """Apply updates to a workflow's checkpoint (approval decisions)."""
+        state = await self.restore_from_checkpoint(workflow_id)
+        if self._checkpoint_saver is None or state is None:
+            return
+        await self._checkpoint_saver.save(
+            workflow_id, {**state, **updates}, node=state.get("last_node") or ""
+        )
+
+    async def _discard_checkpoint(self, workflow_id: str) -> None:
+        """Delete a workflow's checkpoint so it plans again from scratch."""
+        if self._checkpoint_saver is not None:
+            await self._checkpoint_saver.delete(workflow_id)
 
     # -------------------------------------------------------------------------
     # Event Handling
@@ -950,6 +1347,62 @@ class Orchestrator:
                 logger.warning("Event handler failed: %s", str(e))
 
 
+def _attempt_results(
+    attempts: dict[int, list[tuple[dict[str, Any], dict[str, Any]]]],
+) -> dict[str, Any]:
+    """Flatten per-task attempts into executor and validator results in task order."""
+    return {
+        "executor_results": [e for idx in sorted(attempts) for e, _ in attempts[idx]],
+        "validator_results": [v for idx in sorted(attempts) for _, v in attempts[idx]],
+    }
+
+
+def _passed_attempts(
+    state: OrchestratorState, positions: dict[str, int]
+) -> dict[int, list[tuple[dict[str, Any], dict[str, Any]]]]:
+    """Recover the attempts of tasks whose last validation passed.
+
+    Args:
+        state: State restored from a checkpoint (empty results when fresh)
+        positions: Task position by task id
+
+    Returns:
+        Executor/validator result pairs per task position, for passed tasks
+    """
+    by_task: dict[int, list[tuple[dict[str, Any], dict[str, Any]]]] = {}
+    for executor, validation in zip(
+        state.get("executor_results") or [], state.get("validator_results") or []
+    ):
+        idx = positions.get(validation.get("task_id", ""))
+        if idx is not None:
+            by_task.setdefault(idx, []).append((executor, validation))
+    return {idx: pairs for idx, pairs in by_task.items() if pairs[-1][1].get("passed")}
+
+
+def _cyclic_tasks(dependencies: list[set[int]]) -> set[int]:
+    """Find the tasks that lie on a dependency cycle.
+
+    Args:
+        dependencies: Positions each task depends on, by task position
+
+    Returns:
+        Positions of the tasks that (transitively) depend on themselves
+    """
+    cyclic: set[int] = set()
+    for start, direct in enumerate(dependencies):
+        seen: set[int] = set()
+        stack = list(direct)
+        while stack:
+            idx = stack.pop()
+            if idx == start:
+                cyclic.add(start)
+                break
+            if idx not in seen:
+                seen.add(idx)
+                stack.extend(dependencies[idx])
+    return cyclic
+
+
 __all__ = [
     "Orchestrator",
     "OrchestratorConfig",
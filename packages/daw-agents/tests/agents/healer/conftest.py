@@ -0,0 +1,36 @@
+"""Pytest configuration for healer tests.
+
+Fixtures:
+- fresh_resolution_index: (autouse) Swaps in an empty ResolutionIndex, so
+  fingerprints added by one test's healer run do not match as known fixes
+  in another
+- offline_neo4j: (autouse) Makes the knowledge graph report itself
+  disconnected instead of dialling the configured Neo4j server
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from daw_agents.agents.healer.fingerprint import ResolutionIndex
+
+
+@pytest.fixture(autouse=True)
+def fresh_resolution_index() -> Iterator[ResolutionIndex]:
+    """Patch get_resolution_index() to return an index with no stored fixes."""
+    index = ResolutionIndex()
+    with patch("daw_agents.agents.healer.fingerprint._index", index):
+        yield index
+
+
+@pytest.fixture(autouse=True)
+def offline_neo4j() -> Iterator[MagicMock]:
+    """Replace the Neo4j connector with one that is never connected."""
+    connector = MagicMock()
+    connector.is_connected = AsyncMock(return_value=False)
+    connector.query = AsyncMock(return_value=[])
+    with patch("daw_agents.agents.healer.nodes._get_connector", return_value=connector):
+        yield connector
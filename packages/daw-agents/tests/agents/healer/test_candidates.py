@@ -0,0 +1,225 @@
+"""
+Tests for best-of-N healing (run_fix_candidates / heal_candidates_node).
+
+Covers:
+1. Diverse candidate model configs
+2. First passing candidate wins and cancels the rest
+3. Highest-confidence selection, timeouts and errors
+4. Healer in best-of-N mode
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from daw_agents.agents.healer.graph import Healer
+from daw_agents.agents.healer.models import CandidateFixConfig, ErrorInfo
+from daw_agents.agents.healer.nodes import (
+    candidate_model_configs,
+    heal_candidates_node,
+    run_fix_candidates,
+)
+from daw_agents.agents.healer.state import HealerState
+from daw_agents.models.providers import ModelConfig
+
+NODES = "daw_agents.agents.healer.nodes"
+
+BASE = ModelConfig(primary="model-a", fallback="model-b", max_tokens=2048, temperature=0.0)
+
+
+def _state(attempt: int = 0) -> HealerState:
+    return {
+        "error_info": {
+            "tool_name": "run_test",
+            "error_type": "TestFailure",
+            "error_message": "AssertionError: assert 3 == 2",
+            "stack_trace": "",
+            "source_file": "src/calc.py",
+            "test_file": "tests/test_calc.py",
+            "source_code": "def add(a, b): return a + b + 1",
+            "test_code": "def test_add(): assert add(1, 1) == 2",
+        },
+        "similar_errors": [],
+        "fix_suggestion": None,
+        "fixed_code": "",
+        "status": "suggest_fix",
+        "validation_result": None,
+        "attempt": attempt,
+        "max_attempts": 3,
+        "error": None,
+    }
+
+
+def _fake_llm(
+    outcomes: dict[float, tuple[str, float, float]],
+) -> Any:
+    """Fake generate_fix_suggestion keyed on the candidate's temperature.
+
+    outcomes maps temperature -> (fixed_code, confidence, delay).
+    """
+
+    async def generate(**kwargs: Any) -> dict[str, Any]:
+        fixed_code, confidence, delay = outcomes[kwargs["model_config"].temperature]
+        await asyncio.sleep(delay)
+        return {"description": fixed_code, "fixed_code": fixed_code, "confidence": confidence}
+
+    return generate
+
+
+async def _fake_tests(fixed_code: str, **kwargs: Any) -> dict[str, Any]:
+    """Fake run_validation_tests: code containing "good" passes."""
+    return {"passed": "good" in fixed_code, "output": "", "exit_code": 0, "duration_ms": 1.0}
+
+
+class TestCandidateModelConfigs:
+    """Tests for candidate_model_configs()."""
+
+    def test_temperatures_cycle_and_models_alternate(self) -> None:
+        configs = candidate_model_configs(BASE, 4, CandidateFixConfig(temperatures=[0.2, 0.9]))
+
+        assert [c.temperature for c in configs] == [0.2, 0.9, 0.2, 0.9]
+        assert [c.primary for c in configs] == ["model-a", "model-b", "model-a", "model-b"]
+        assert configs[1].fallback == "model-a"
+        assert all(c.max_tokens == 2048 for c in configs)
+
+    def test_alternation_can_be_disabled(self) -> None:
+        configs = candidate_model_configs(BASE, 3, CandidateFixConfig(alternate_models=False))
+
+        assert {c.primary for c in configs} == {"model-a"}
+
+
+class TestRunFixCandidates:
+    """Tests for run_fix_candidates()."""
+
+    @pytest.mark.asyncio
+    async def test_first_passing_candidate_wins_and_cancels_rest(self) -> None:
+        outcomes = {0.2: ("bad", 0.9, 0.05), 0.7: ("good", 0.5, 0.1), 1.0: ("good-late", 0.99, 5.0)}
+        configs = candidate_model_configs(BASE, 3)
+        with (
+            patch(f"{NODES}.generate_fix_suggestion", _fake_llm(outcomes)),
+            patch(f"{NODES}.run_validation_tests", _fake_tests),
+        ):
+            start = time.perf_counter()
+            chosen = await run_fix_candidates(_state(), configs)
+            elapsed = time.perf_counter() - start
+
+        assert chosen is not None
+        assert chosen["fixed_code"] == "good"
+        assert chosen["candidate"] == 1
+        assert elapsed < 2.0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_all_picks_highest_confidence_passing(self) -> None:
+        outcomes = {0.2: ("good-a", 0.6, 0.0), 0.7: ("good-b", 0.8, 0.05), 1.0: ("bad", 0.99, 0.0)}
+        config = CandidateFixConfig(wait_for_all=True)
+        with (
+            patch(f"{NODES}.generate_fix_suggestion", _fake_llm(outcomes)),
+            patch(f"{NODES}.run_validation_tests", _fake_tests),
+        ):
+            chosen = await run_fix_candidates(
+                _state(), candidate_model_configs(BASE, 3, config), config
+            )
+
+        assert chosen is not None
+        assert chosen["fixed_code"] == "good-b"
+
+    @pytest.mark.asyncio
+    async def test_no_pass_returns_highest_confidence_and_skips_failures(self) -> None:
+        outcomes = {0.2: ("bad-a", 0.4, 0.0), 0.7: ("bad-b", 0.7, 0.0), 1.0: ("never", 1.0, 5.0)}
+        config = CandidateFixConfig(candidate_timeout=0.2)
+        with (
+            patch(f"{NODES}.generate_fix_suggestion", _fake_llm(outcomes)),
+            patch(f"{NODES}.run_validation_tests", _fake_tests),
+        ):
+            chosen = await run_fix_candidates(
+                _state(), candidate_model_configs(BASE, 3, config), config
+            )
+
+        assert chosen is not None
+        assert chosen["fixed_code"] == "bad-b"
+        assert chosen["validation_result"]["passed"] is False
+
+    @pytest.mark.asyncio
+    async def test_all_candidates_erroring_returns_none(self) -> None:
+        with patch(
+            f"{NODES}.generate_fix_suggestion", AsyncMock(side_effect=RuntimeError("boom"))
+        ):
+            chosen = await run_fix_candidates(_state(), candidate_model_configs(BASE, 2))
+
+        assert chosen is None
+
+
+class TestHealCandidatesNode:
+    """Tests for heal_candidates_node()."""
+
+    @pytest.mark.asyncio
+    async def test_node_counts_round_as_one_attempt(self) -> None:
+        outcomes = {0.2: ("good", 0.8, 0.0), 0.7: ("bad", 0.9, 0.0)}
+        configs = candidate_model_configs(BASE, 2)
+        with (
+            patch(f"{NODES}.generate_fix_suggestion", _fake_llm(outcomes)),
+            patch(f"{NODES}.run_validation_tests", _fake_tests),
+        ):
+            update = await heal_candidates_node(
+                _state(attempt=1),
+                {"configurable": {"fix_candidate_models": configs}},
+            )
+
+        assert update["attempt"] == 2
+        assert update["fixed_code"] == "good"
+        assert update["validation_result"]["passed"] is True
+        assert update["fix_suggestion"]["candidate"] == 0
+
+    @pytest.mark.asyncio
+    async def test_node_reports_failure_when_every_candidate_errors(self) -> None:
+        with patch(
+            f"{NODES}.generate_fix_suggestion", AsyncMock(side_effect=RuntimeError("boom"))
+        ):
+            update = await heal_candidates_node(
+                _state(),
+                {"configurable": {"fix_candidate_models": candidate_model_configs(BASE, 2)}},
+            )
+
+        assert update["fix_suggestion"] is None
+        assert update["validation_result"]["passed"] is False
+        assert update["attempt"] == 1
+
+
+class TestBestOfNHealer:
+    """Tests for Healer(candidates=N)."""
+
+    def test_graph_uses_single_candidates_node(self) -> None:
+        healer = Healer(candidates=3)
+        node_names = list(healer.graph.nodes.keys())
+
+        assert "heal_candidates" in node_names
+        assert "suggest_fix" not in node_names
+        assert "validate_fix" not in node_names
+
+    @pytest.mark.asyncio
+    async def test_heal_retries_rounds_until_a_candidate_passes(self) -> None:
+        healer = Healer(candidates=2, candidate_config=CandidateFixConfig(temperatures=[0.3]))
+        rounds: list[int] = []
+
+        async def generate(**kwargs: Any) -> dict[str, Any]:
+            rounds.append(kwargs["previous_attempts"])
+            code = "good" if kwargs["previous_attempts"] == 1 else "bad"
+            return {"description": code, "fixed_code": code, "confidence": 0.5}
+
+        error_info = ErrorInfo(**_state()["error_info"])
+        with (
+            patch(f"{NODES}.analyze_error", AsyncMock(return_value={"error_signature": "sig"})),
+            patch(f"{NODES}.query_similar_errors", AsyncMock(return_value=[])),
+            patch(f"{NODES}.generate_fix_suggestion", generate),
+            patch(f"{NODES}.run_validation_tests", _fake_tests),
+        ):
+            result = await healer.heal(error_info)
+
+        assert result.fixed_code == "good"
+        assert result.attempts == 2
+        assert sorted(rounds) == [0, 0, 1, 1]
@@ -0,0 +1,244 @@
+"""
+Tests for Healer error fingerprinting and indexed similar-error lookup.
+
+Covers:
+1. Message template and stack-frame normalization
+2. ErrorFingerprint digests, MinHash similarity and node properties
+3. ResolutionIndex lookup and LRU eviction
+4. query_similar_errors over the index and indexed Neo4j properties
+5. store_to_neo4j / store_resolution persistence
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from daw_agents.agents.healer import nodes
+from daw_agents.agents.healer.fingerprint import (
+    NUM_BANDS,
+    ErrorFingerprint,
+    ResolutionIndex,
+    fingerprint_error,
+    normalize_frames,
+    normalize_message,
+)
+from daw_agents.agents.healer.models import ErrorInfo
+
+TRACEBACK = """Traceback (most recent call last):
+  File "/tmp/run-1a2b/tests/test_calc.py", line 5, in test_add
+    assert add(1, 1) == 2
+  File "/tmp/run-1a2b/src/calc.py", line 2, in add
+AssertionError: assert 3 == 2"""
+
+
+def _error_info(message: str = "AssertionError: assert 3 == 2", trace: str = TRACEBACK) -> dict:
+    return ErrorInfo(
+        tool_name="run_test",
+        error_type="TestFailure",
+        error_message=message,
+        stack_trace=trace,
+        source_file="src/calc.py",
+        test_file="tests/test_calc.py",
+    ).model_dump()
+
+
+class TestNormalization:
+    """Tests for normalize_message() and normalize_frames()."""
+
+    def test_literals_are_stripped(self) -> None:
+        template = normalize_message(
+            "KeyError: 'user_42' at 0x7f3a9c in /home/ci/build/app.py after 1.5s"
+        )
+
+        assert template == "keyerror: <str> at <hex> in <path> after <num>s"
+
+    def test_identifiers_keep_their_digits(self) -> None:
+        assert normalize_message("NameError: name 'x' is not defined in step2") == (
+            "nameerror: name <str> is not defined in step2"
+        )
+
+    def test_traceback_frames_drop_directories_and_lines(self) -> None:
+        assert normalize_frames(TRACEBACK) == ["test_calc.py:test_add", "calc.py:add"]
+
+    def test_pytest_short_frames(self) -> None:
+        output = (
+            "tests/test_calc.py:5: in test_add\n"
+            "    assert add(1, 1) == 2\n"
+            "src/calc.py:2: in add"
+        )
+
+        assert normalize_frames(output) == ["test_calc.py:test_add", "calc.py:add"]
+
+
+class TestErrorFingerprint:
+    """Tests for fingerprint_error() and ErrorFingerprint."""
+
+    def test_same_error_with_different_literals_matches_exactly(self) -> None:
+        first = fingerprint_error("TestFailure", "assert 3 == 2", TRACEBACK)
+        second = fingerprint_error(
+            "TestFailure",
+            "assert 10 == 7",
+            TRACEBACK.replace("run-1a2b", "run-9f9f").replace("line 5", "line 12"),
+        )
+
+        assert first.digest == second.digest
+        assert first.similarity(second) == 1.0
+
+    def test_unrelated_errors_are_dissimilar(self) -> None:
+        first = fingerprint_error("TestFailure", "assert 3 == 2", TRACEBACK)
+        other = fingerprint_error("ImportError", "No module named 'requests'")
+
+        assert first.digest != other.digest
+        assert first.similarity(other) < 0.2
+
+    def test_properties_round_trip(self) -> None:
+        fingerprint = fingerprint_error("TestFailure", "assert 3 == 2", TRACEBACK)
+        properties = {"error_type": "TestFailure", **fingerprint.to_properties()}
+
+        assert [f"lsh_{band}" in properties for band in range(NUM_BANDS)] == [True] * NUM_BANDS
+        assert ErrorFingerprint.from_properties(properties) == fingerprint
+        assert ErrorFingerprint.from_properties({"error_signature": "legacy"}) is None
+
+    def test_signature_ignores_literals(self) -> None:
+        first = ErrorInfo(**_error_info("assert 3 == 2"))
+        second = ErrorInfo(**_error_info("assert 8 == 5"))
+
+        assert first.to_signature() == second.to_signature()
+        assert first.to_signature().startswith("TestFailure:")
+
+
+class TestResolutionIndex:
+    """Tests for ResolutionIndex."""
+
+    def test_lookup_by_digest_and_band(self) -> None:
+        index = ResolutionIndex()
+        fingerprint = fingerprint_error("TestFailure", "assert 3 == 2", TRACEBACK)
+        index.add(fingerprint, {"fix_description": "Remove + 1"})
+
+        matches = index.lookup(fingerprint_error("TestFailure", "assert 9 == 4", TRACEBACK))
+
+        assert matches == [{"fix_description": "Remove + 1", "similarity": 1.0}]
+        assert index.lookup(fingerprint_error("ImportError", "No module named 'x'")) == []
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        index = ResolutionIndex(max_entries=2)
+        first = fingerprint_error("ValueError", "invalid literal for int")
+        second = fingerprint_error("KeyError", "missing config section")
+        third = fingerprint_error("OSError", "disk quota exceeded")
+        index.add(first, {"n": 1})
+        index.add(second, {"n": 2})
+        index.lookup(first)  # first is now most recently used
+        index.add(third, {"n": 3})
+
+        assert len(index) == 2
+        assert index.lookup(second) == []
+        assert index.lookup(first)[0]["n"] == 1
+
+
+class TestQuerySimilarErrors:
+    """Tests for query_similar_errors()."""
+
+    @pytest.mark.asyncio
+    async def test_index_hit_skips_neo4j(
+        self, fresh_resolution_index: ResolutionIndex, offline_neo4j: MagicMock
+    ) -> None:
+        info = _error_info()
+        fresh_resolution_index.add(
+            ErrorInfo(**info).to_fingerprint(), {"fix_description": "Remove + 1"}
+        )
+
+        results = await nodes.query_similar_errors("sig", "TestFailure", error_info=info)
+
+        assert results[0]["fix_description"] == "Remove + 1"
+        offline_neo4j.is_connected.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_neo4j_lookup_uses_indexed_equality_and_caches(
+        self,
+        fresh_resolution_index: ResolutionIndex,
+        offline_neo4j: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(nodes, "_indexes_ready", False)
+        info = _error_info()
+        # Same error as info, differing only in literals
+        stored_info = ErrorInfo(**_error_info("AssertionError: assert 7 == 1"))
+        stored = {
+            "id": "entry-1",
+            "error_signature": "TestFailure:abc",
+            "error_type": "TestFailure",
+            "fix_description": "Remove + 1",
+            "fixed_code": "def add(a, b): return a + b",
+            **stored_info.to_fingerprint().to_properties(),
+        }
+        offline_neo4j.is_connected.return_value = True
+        offline_neo4j.query = AsyncMock(
+            side_effect=lambda cypher, params=None: (
+                [{"e": stored}] if cypher.lstrip().startswith("MATCH") else []
+            )
+        )
+
+        results = await nodes.query_similar_errors("sig", "TestFailure", error_info=info)
+
+        assert [r["id"] for r in results] == ["entry-1"]
+        assert results[0]["similarity"] == 1.0
+        lookup, params = next(
+            (call.args[0], call.kwargs["params"])
+            for call in offline_neo4j.query.await_args_list
+            if call.args[0].lstrip().startswith("MATCH")
+        )
+        assert "CONTAINS" not in lookup
+        assert params["fingerprint"] == ErrorInfo(**info).to_fingerprint().digest
+        assert {f"lsh_{band}" for band in range(NUM_BANDS)} <= params.keys()
+        assert any(
+            "CREATE INDEX error_resolution_lsh_0" in call.args[0]
+            for call in offline_neo4j.query.await_args_list
+        )
+
+        # The fetched resolution now answers from the in-process index
+        offline_neo4j.query.reset_mock()
+        await nodes.query_similar_errors("sig", "TestFailure", error_info=info)
+        offline_neo4j.query.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_disconnected_graph_returns_empty(self) -> None:
+        assert await nodes.query_similar_errors("sig", "TestFailure", _error_info()) == []
+
+
+class TestStoreResolution:
+    """Tests for store_to_neo4j() and store_resolution()."""
+
+    @pytest.mark.asyncio
+    async def test_store_merges_on_fingerprint_with_indexed_bands(
+        self, offline_neo4j: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(nodes, "_indexes_ready", True)
+        offline_neo4j.is_connected.return_value = True
+        offline_neo4j.query = AsyncMock(return_value=[{"id": "entry-existing"}])
+        fingerprint = ErrorInfo(**_error_info()).to_fingerprint()
+
+        entry_id = await nodes.store_to_neo4j(
+            "TestFailure:abc", "TestFailure", "Remove + 1", "code", fingerprint=fingerprint
+        )
+
+        assert entry_id == "entry-existing"
+        cypher = offline_neo4j.query.await_args.args[0]
+        params = offline_neo4j.query.await_args.kwargs["params"]
+        assert "MERGE (e:ErrorResolution {fingerprint: $key})" in cypher
+        assert params["key"] == fingerprint.digest
+        assert params["props"]["lsh_0"] == fingerprint.bands[0]
+
+    @pytest.mark.asyncio
+    async def test_store_resolution_feeds_index_when_offline(
+        self, fresh_resolution_index: ResolutionIndex
+    ) -> None:
+        error_info = ErrorInfo(**_error_info())
+
+        entry_id = await nodes.store_resolution(error_info, "Remove + 1", "fixed")
+
+        matches = fresh_resolution_index.lookup(error_info.to_fingerprint())
+        assert entry_id.startswith("entry-")
+        assert matches[0]["id"] == entry_id
+        assert matches[0]["fixed_code"] == "fixed"
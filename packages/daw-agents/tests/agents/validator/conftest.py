@@ -0,0 +1,24 @@
+"""Pytest configuration for validator tests.
+
+Fixtures:
+- fresh_validation_cache: (autouse) Installs a memory-only ValidationCache
+  as the process-wide cache, so a stage result stored by one test is never
+  a hit in the next and DAW_VALIDATION_CACHE never selects Redis or disk
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from daw_agents.agents.validator.cache import ValidationCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_validation_cache() -> Iterator[ValidationCache]:
+    """Patch get_validation_cache() to return an empty, memory-only cache."""
+    cache = ValidationCache()
+    with patch("daw_agents.agents.validator.cache._cache", cache):
+        yield cache
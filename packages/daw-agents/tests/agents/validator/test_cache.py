@@ -0,0 +1,215 @@
+"""
+Tests for the content-addressed validation cache.
+
+Covers:
+1. make_validation_key over code, tests, config and tool identity
+2. ValidationCache tiers, copies, eviction and error results
+3. DiskResponseCache persistence and expiry
+4. Cached run_pytest / run_security_scan / run_linter
+5. get_validation_cache() configuration from the environment
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from daw_agents.agents.validator import cache as cache_module
+from daw_agents.agents.validator.cache import (
+    ValidationCache,
+    get_validation_cache,
+    make_validation_key,
+)
+from daw_agents.models.cache import DiskResponseCache
+
+NODES = "daw_agents.agents.validator.nodes"
+
+CODE = "def add(a, b):\n    return a + b\n"
+TESTS = "from module import add\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+
+
+class TestMakeValidationKey:
+    """Tests for make_validation_key()."""
+
+    def test_key_is_stable_and_content_addressed(self) -> None:
+        key = make_validation_key("tests", CODE, TESTS)
+
+        assert key == make_validation_key("tests", CODE, TESTS)
+        assert key.startswith("daw:validation:tests:")
+        assert key != make_validation_key("tests", CODE + "\n", TESTS)
+        assert key != make_validation_key("tests", CODE, TESTS + "\n")
+        assert key != make_validation_key("lint", CODE, TESTS)
+        assert key != make_validation_key("tests", CODE, TESTS, {"timeout": 30})
+
+    def test_key_changes_when_tool_is_upgraded(self, tmp_path: Path) -> None:
+        ruff = tmp_path / "ruff"
+        ruff.write_text("#!/bin/sh\n")
+        with patch(f"{cache_module.__name__}.shutil.which", return_value=str(ruff)):
+            before = make_validation_key("lint", CODE)
+            ruff.write_text("#!/bin/sh\n# 0.9.0\n")
+            after = make_validation_key("lint", CODE)
+
+        assert before != after
+
+
+class TestValidationCache:
+    """Tests for ValidationCache."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_returns_copies(self) -> None:
+        cache = ValidationCache()
+        key = make_validation_key("lint", CODE)
+        await cache.set(key, {"passed": True, "issues": []})
+
+        first = await cache.get(key)
+        assert first == {"passed": True, "issues": []}
+        first["issues"].append("mutated")  # type: ignore[index]
+
+        assert await cache.get(key) == {"passed": True, "issues": []}
+        assert cache.stats.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_error_results_are_not_cached(self) -> None:
+        cache = ValidationCache()
+        run = AsyncMock(return_value={"passed": False, "issues": [], "error": "Timeout"})
+
+        await cache.get_or_run("lint", run, CODE)
+        await cache.get_or_run("lint", run, CODE)
+
+        assert run.await_count == 2
+        assert cache.stats.sets == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        cache = ValidationCache(max_entries=1)
+        await cache.set("a", {"passed": True})
+        await cache.set("b", {"passed": True})
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") is not None
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_hits_are_promoted(self, tmp_path: Path) -> None:
+        writer = ValidationCache(backend=DiskResponseCache(tmp_path))
+        key = make_validation_key("security", CODE)
+        await writer.set(key, {"passed": True, "findings": []})
+
+        # A second process: empty memory tier, same directory
+        backend = DiskResponseCache(tmp_path)
+        reader = ValidationCache(backend=backend)
+        assert await reader.get(key) == {"passed": True, "findings": []}
+        assert await reader.get(key) == {"passed": True, "findings": []}
+
+        assert backend.stats.hits == 1
+        assert reader.memory.stats.hits == 1
+
+
+class TestDiskResponseCache:
+    """Tests for DiskResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_expired_and_corrupt_entries_are_misses(self, tmp_path: Path) -> None:
+        cache = DiskResponseCache(tmp_path, ttl_seconds=60)
+        await cache.set("fresh", "1")
+        await cache.set("stale", "2", ttl_seconds=-1)
+        await cache.set("corrupt", "3")
+        cache._path("corrupt").write_text("{not json")
+
+        assert await cache.get("fresh") == "1"
+        assert await cache.get("stale") is None
+        assert await cache.get("corrupt") is None
+        assert cache.stats.errors == 1
+        assert not cache._path("stale").exists()
+
+    @pytest.mark.asyncio
+    async def test_clear(self, tmp_path: Path) -> None:
+        cache = DiskResponseCache(tmp_path)
+        await cache.set("key", "value")
+
+        await cache.clear()
+
+        assert await cache.get("key") is None
+
+
+class TestCachedStages:
+    """Tests for the cached validation stage functions."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_artifact_runs_once(self) -> None:
+        from daw_agents.agents.validator.nodes import run_linter, run_pytest, run_security_scan
+
+        tests = AsyncMock(return_value={"passed": True, "total_tests": 1})
+        bandit = AsyncMock(return_value={"passed": True, "findings": []})
+        ruff = AsyncMock(return_value={"passed": True, "issues": []})
+        with (
+            patch(f"{NODES}._run_pytest", tests),
+            patch(f"{NODES}._run_bandit", bandit),
+            patch(f"{NODES}._run_ruff", ruff),
+        ):
+            for _ in range(3):
+                assert (await run_pytest(CODE, TESTS))["passed"] is True
+                await run_security_scan(CODE)
+                await run_linter(CODE)
+            await run_pytest(CODE, TESTS + "\n")
+
+        assert tests.await_count == 2
+        assert bandit.await_count == 1
+        assert ruff.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_real_pytest_result_is_cached(
+        self, fresh_validation_cache: ValidationCache
+    ) -> None:
+        from daw_agents.agents.validator.nodes import run_pytest
+
+        first = await run_pytest(CODE, TESTS)
+        second = await run_pytest(CODE, TESTS)
+
+        assert first == second
+        assert first["passed"] is True
+        assert fresh_validation_cache.stats.hits == 1
+
+
+class TestGetValidationCache:
+    """Tests for get_validation_cache() configuration."""
+
+    @pytest.mark.asyncio
+    async def test_off_disables_caching(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DAW_VALIDATION_CACHE", "off")
+        monkeypatch.setattr(cache_module, "_cache", None)
+        run = AsyncMock(return_value={"passed": True})
+
+        cache = get_validation_cache()
+        await cache.get_or_run("lint", run, CODE)
+        await cache.get_or_run("lint", run, CODE)
+
+        assert run.await_count == 2
+
+    def test_disk_tier_from_env(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setenv("DAW_VALIDATION_CACHE", "disk")
+        monkeypatch.setenv("DAW_VALIDATION_CACHE_DIR", os.fspath(tmp_path))
+        monkeypatch.setattr(cache_module, "_cache", None)
+
+        cache = get_validation_cache()
+
+        assert isinstance(cache.backend, DiskResponseCache)
+        assert cache.backend.directory == tmp_path
+        assert get_validation_cache() is cache
+
+    def test_default_disk_tier_is_private(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv("DAW_VALIDATION_CACHE", "disk")
+        monkeypatch.delenv("DAW_VALIDATION_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", os.fspath(tmp_path))
+        monkeypatch.setattr(cache_module, "_cache", None)
+
+        cache = get_validation_cache()
+
+        assert isinstance(cache.backend, DiskResponseCache)
+        assert cache.backend.directory == tmp_path / "daw-agents" / "validation"
+        assert cache.backend.directory.stat().st_mode & 0o777 == 0o700
+        assert cache.backend.ttl_seconds == cache.memory.ttl_seconds
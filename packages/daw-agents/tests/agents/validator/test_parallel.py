@@ -0,0 +1,179 @@
+"""
+Tests for parallel validation (run_parallel_checks / parallel_checks_node).
+
+Covers:
+1. Concurrent stages over one shared workspace
+2. Per-stage timeouts and errors
+3. Cancellation on a critical security finding
+4. ValidatorAgent in parallel mode
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from daw_agents.agents.validator.agent import ValidatorAgent
+from daw_agents.agents.validator.models import ParallelValidationConfig
+from daw_agents.agents.validator.nodes import run_parallel_checks
+
+NODES = "daw_agents.agents.validator.nodes"
+
+CODE = "def add(a, b):\n    return a + b\n"
+TESTS = "from module import add\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+
+CRITICAL = {
+    "passed": False,
+    "findings": [{"severity": "critical", "message": "Use of exec detected"}],
+}
+
+
+def _stage(result: dict[str, Any], delay: float = 0.0, seen: list[Path] | None = None) -> Any:
+    """Fake stage returning ``result`` after ``delay`` seconds."""
+
+    async def run(code: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        location = kwargs.get("workspace") or kwargs.get("path")
+        if seen is not None and location is not None:
+            seen.append(Path(location))
+        await asyncio.sleep(delay)
+        return result
+
+    return run
+
+
+class TestRunParallelChecks:
+    """Tests for run_parallel_checks()."""
+
+    @pytest.mark.asyncio
+    async def test_stages_run_concurrently_over_shared_workspace(self) -> None:
+        seen: list[Path] = []
+        with (
+            patch(f"{NODES}.run_pytest", _stage({"passed": True}, 0.4, seen)),
+            patch(f"{NODES}.run_security_scan", _stage({"passed": True, "findings": []}, 0.4, seen)),
+            patch(f"{NODES}.run_linter", _stage({"passed": True, "issues": []}, 0.4, seen)),
+        ):
+            start = time.perf_counter()
+            results = await run_parallel_checks(CODE, TESTS)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert set(results) == {"test_results", "security_findings", "style_issues"}
+        workspace = next(p for p in seen if p.name != "module.py")
+        assert len(seen) == 3
+        assert set(seen) == {workspace, workspace / "module.py"}
+        # The workspace is removed once all stages are done
+        assert not workspace.exists()
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_does_not_fail_other_stages(self) -> None:
+        config = ParallelValidationConfig(lint_timeout=0.2)
+        with (
+            patch(f"{NODES}.run_pytest", _stage({"passed": True})),
+            patch(f"{NODES}.run_security_scan", _stage({"passed": True, "findings": []})),
+            patch(f"{NODES}.run_linter", _stage({"passed": True, "issues": []}, 5.0)),
+        ):
+            results = await run_parallel_checks(CODE, TESTS, config)
+
+        assert results["test_results"] == {"passed": True}
+        assert results["style_issues"]["passed"] is False
+        assert results["style_issues"]["issues"] == []
+        assert results["style_issues"]["error"] == "Timeout after 0.2 seconds"
+
+    @pytest.mark.asyncio
+    async def test_stage_error_is_reported(self) -> None:
+        async def broken(code: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            raise RuntimeError("worker exploded")
+
+        with (
+            patch(f"{NODES}.run_pytest", broken),
+            patch(f"{NODES}.run_security_scan", _stage({"passed": True, "findings": []})),
+            patch(f"{NODES}.run_linter", _stage({"passed": True, "issues": []})),
+        ):
+            results = await run_parallel_checks(CODE, TESTS)
+
+        assert results["test_results"]["passed"] is False
+        assert results["test_results"]["total_tests"] == 0
+        assert results["test_results"]["error"] == "worker exploded"
+
+    @pytest.mark.asyncio
+    async def test_critical_finding_cancels_running_stages(self) -> None:
+        with (
+            patch(f"{NODES}.run_pytest", _stage({"passed": True}, 10.0)),
+            patch(f"{NODES}.run_security_scan", _stage(CRITICAL)),
+            patch(f"{NODES}.run_linter", _stage({"passed": True, "issues": []}, 10.0)),
+        ):
+            start = time.perf_counter()
+            results = await run_parallel_checks(CODE, TESTS)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 2.0
+        assert results["security_findings"] == CRITICAL
+        assert results["test_results"]["cancelled"] is True
+        assert results["style_issues"]["cancelled"] is True
+
+    @pytest.mark.asyncio
+    async def test_cancellation_can_be_disabled(self) -> None:
+        config = ParallelValidationConfig(cancel_on_critical=False)
+        with (
+            patch(f"{NODES}.run_pytest", _stage({"passed": True}, 0.2)),
+            patch(f"{NODES}.run_security_scan", _stage(CRITICAL)),
+            patch(f"{NODES}.run_linter", _stage({"passed": True, "issues": []}, 0.2)),
+        ):
+            results = await run_parallel_checks(CODE, TESTS, config)
+
+        assert results["test_results"] == {"passed": True}
+        assert results["style_issues"] == {"passed": True, "issues": []}
+
+    @pytest.mark.asyncio
+    async def test_real_stages(self) -> None:
+        results = await run_parallel_checks(CODE, TESTS)
+
+        assert results["test_results"]["passed"] is True
+        assert results["test_results"]["passed_tests"] == 1
+        assert "findings" in results["security_findings"]
+        assert "issues" in results["style_issues"]
+
+
+class TestParallelValidatorAgent:
+    """Tests for ValidatorAgent(parallel=True)."""
+
+    def test_graph_uses_parallel_node(self) -> None:
+        agent = ValidatorAgent(parallel=True)
+
+        nodes = set(agent.graph.get_graph().nodes)
+
+        assert "parallel_checks" in nodes
+        assert "run_tests" not in nodes
+
+    @pytest.mark.asyncio
+    async def test_validate_rejects_on_critical_finding(self) -> None:
+        agent = ValidatorAgent(parallel=True)
+        with (
+            patch(f"{NODES}.run_pytest", _stage({"passed": True}, 10.0)),
+            patch(f"{NODES}.run_security_scan", _stage(CRITICAL)),
+            patch(f"{NODES}.run_linter", _stage({"passed": True, "issues": []})),
+        ):
+            result = await agent.validate(code=CODE, requirements=TESTS)
+
+        assert result.status == "rejected"
+        assert result.passed_security is False
+        assert result.suggestions == ["Use of exec detected"]
+
+    @pytest.mark.asyncio
+    async def test_validate_approves_clean_code(self) -> None:
+        agent = ValidatorAgent(
+            parallel=True, parallel_config=ParallelValidationConfig(tests_timeout=30)
+        )
+        with (
+            patch(f"{NODES}.run_pytest", _stage({"passed": True})),
+            patch(f"{NODES}.run_security_scan", _stage({"passed": True, "findings": []})),
+            patch(f"{NODES}.run_linter", _stage({"passed": True, "issues": []})),
+        ):
+            result = await agent.validate(code=CODE, requirements=TESTS)
+
+        assert result.status == "approved"
@@ -0,0 +1,190 @@
+"""
+Tests for the Validator's warm pytest worker pool.
+
+Covers:
+1. Result dict shape, failures and in-memory coverage
+2. Isolation between jobs served by the same worker
+3. Concurrent jobs, timeouts and statistics
+4. run_pytest routing through the pool and its subprocess fallback
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from daw_agents.agents.validator.runner import ValidationWorkerPool
+
+CODE = "def add(a, b):\n    return a + b\n\n\ndef sub(a, b):\n    return a - b\n"
+TESTS = (
+    "from module import add, sub\n\n"
+    "def test_add():\n    assert add(1, 2) == 3\n\n"
+    "def test_sub():\n    assert sub(3, 1) == 2\n"
+)
+
+RESULT_KEYS = {
+    "passed",
+    "total_tests",
+    "passed_tests",
+    "failed_tests",
+    "skipped_tests",
+    "coverage_percent",
+    "failed_test_names",
+    "output",
+}
+
+
+class TestValidationWorkerPool:
+    """Tests for ValidationWorkerPool.run()."""
+
+    @pytest.mark.asyncio
+    async def test_passing_job(self) -> None:
+        pool = ValidationWorkerPool(size=1)
+        try:
+            result = await pool.run(CODE, TESTS)
+        finally:
+            await pool.close()
+
+        assert set(result) == RESULT_KEYS
+        assert result["passed"] is True
+        assert result["total_tests"] == 2
+        assert result["passed_tests"] == 2
+        assert result["failed_test_names"] == []
+        assert result["coverage_percent"] == 100.0
+        assert "2 passed" in result["output"]
+
+    @pytest.mark.asyncio
+    async def test_failures_skips_and_partial_coverage(self) -> None:
+        tests = (
+            "import pytest\nfrom module import add\n\n"
+            "def test_add():\n    assert add(1, 2) == 4\n\n"
+            "@pytest.mark.skip(reason='later')\n"
+            "def test_later():\n    pass\n"
+        )
+        pool = ValidationWorkerPool(size=1)
+        try:
+            result = await pool.run(CODE, tests)
+        finally:
+            await pool.close()
+
+        assert result["passed"] is False
+        assert result["failed_tests"] == 1
+        assert result["skipped_tests"] == 1
+        assert result["failed_test_names"] == ["test_module.py::test_add"]
+        # sub() is never called
+        assert 0.0 < result["coverage_percent"] < 100.0
+
+    @pytest.mark.asyncio
+    async def test_collection_error(self) -> None:
+        pool = ValidationWorkerPool(size=1)
+        try:
+            result = await pool.run(CODE, "def test_broken(:\n")
+        finally:
+            await pool.close()
+
+        assert result["passed"] is False
+        assert result["total_tests"] == 0
+        assert "SyntaxError" in result["output"]
+
+    @pytest.mark.asyncio
+    async def test_jobs_do_not_see_previous_code(self) -> None:
+        pool = ValidationWorkerPool(size=1)
+        try:
+            first = await pool.run(CODE, TESTS)
+            pid = pool._workers[0]._process.pid  # type: ignore[union-attr]
+            second = await pool.run(CODE.replace("a + b", "a * b"), TESTS)
+            same_process = pool._workers[0]._process.pid == pid  # type: ignore[union-attr]
+        finally:
+            await pool.close()
+
+        assert first["passed"] is True
+        assert second["passed"] is False
+        assert second["failed_test_names"] == ["test_module.py::test_add"]
+        assert same_process
+
+    @pytest.mark.asyncio
+    async def test_jobs_do_not_inherit_server_environment(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("DAW_TEST_API_KEY", "secret")
+        tests = (
+            "import os\n\n"
+            "def test_env():\n"
+            "    assert 'DAW_TEST_API_KEY' not in os.environ\n"
+            "    assert 'PATH' in os.environ\n"
+        )
+        pool = ValidationWorkerPool(size=1)
+        try:
+            result = await pool.run(CODE, tests)
+        finally:
+            await pool.close()
+
+        assert result["passed"] is True, result["output"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_use_separate_workers(self) -> None:
+        pool = ValidationWorkerPool(size=2)
+        try:
+            results = await asyncio.gather(pool.run(CODE, TESTS), pool.run(CODE, TESTS))
+            pids = {worker._process.pid for worker in pool._workers}  # type: ignore[union-attr]
+        finally:
+            await pool.close()
+
+        assert all(result["passed"] for result in results)
+        assert len(pids) == 2
+        assert pool.stats.jobs == 2
+        assert pool.stats.avg_run_ms > 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker_and_pool_recovers(self) -> None:
+        slow = "import time\n\ndef test_slow():\n    time.sleep(30)\n"
+        pool = ValidationWorkerPool(size=1)
+        try:
+            with pytest.raises(TimeoutError):
+                await pool.run(CODE, slow, timeout=3)
+            result = await pool.run(CODE, TESTS)
+        finally:
+            await pool.close()
+
+        assert result["passed"] is True
+        assert pool.stats.timeouts == 1
+        assert pool.stats.to_dict()["jobs"] == 1
+
+
+class TestRunPytest:
+    """Tests for run_pytest() routing."""
+
+    @pytest.mark.asyncio
+    async def test_uses_worker_pool(self) -> None:
+        from daw_agents.agents.validator.nodes import run_pytest
+
+        pool = ValidationWorkerPool(size=1)
+        try:
+            with patch(
+                "daw_agents.agents.validator.nodes.get_validation_pool", return_value=pool
+            ):
+                result = await run_pytest(CODE, TESTS)
+        finally:
+            await pool.close()
+
+        assert result["passed"] is True
+        assert pool.stats.jobs == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_pool_spawns_pytest(self) -> None:
+        from daw_agents.agents.validator.nodes import run_pytest
+
+        fallback = AsyncMock(return_value={"passed": True})
+        with (
+            patch(
+                "daw_agents.agents.validator.nodes.get_validation_pool",
+                return_value=ValidationWorkerPool(size=0),
+            ),
+            patch("daw_agents.agents.validator.nodes._run_pytest_subprocess", fallback),
+        ):
+            result = await run_pytest(CODE, TESTS)
+
+        assert result == {"passed": True}
+        fallback.assert_awaited_once_with(CODE, TESTS, None)
@@ -0,0 +1,35 @@
+"""Pytest configuration for context tests.
+
+Fixtures:
+- word_encoding: Patches tiktoken.get_encoding in compaction with
+  WordEncoding, so ContextCompactor can be built without BPE files
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+
+class WordEncoding:
+    """Minimal tiktoken.Encoding stand-in: one token per word."""
+
+    def __init__(self) -> None:
+        self.encoded = 0
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        self.encoded += 1
+        return list(range(len(text.split())))
+
+
+@pytest.fixture
+def word_encoding() -> Iterator[WordEncoding]:
+    """Use WordEncoding for every ContextCompactor built in the test."""
+    encoding = WordEncoding()
+    with patch(
+        "daw_agents.context.compaction.tiktoken.get_encoding",
+        return_value=encoding,
+    ):
+        yield encoding
@@ -566,7 +566,7 @@ class TestEndToEndCompaction:
             connector = Neo4jConnector.get_instance(neo4j_config)
             connector._driver = mock_driver
 
-        connector.create_node = AsyncMock(return_value="node_id")
+        connector.create_nodes = AsyncMock(return_value=["node_1", "node_2", "node_3"])
 
         config = CompactionConfig(
             max_tokens=50,
@@ -593,5 +593,5 @@ class TestEndToEndCompaction:
         assert len(compacted) < len(messages)
         assert compactor.count_message_tokens(compacted) <= 50
 
-        # Verify summary was stored (via the compact method with conversation_id)
-        # This depends on implementation - may need adjustment
+        # Verify summaries were stored in one batch (via conversation_id)
+        connector.create_nodes.assert_awaited_once()
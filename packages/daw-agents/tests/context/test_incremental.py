@@ -0,0 +1,171 @@
+"""
+Tests for incremental compaction from rolling summary checkpoints.
+
+These tests verify:
+1. A new turn only summarizes messages past the checkpoint's end_index
+2. Rewritten (shorter) histories discard the checkpoint
+3. Checkpoints are loaded from and upserted to Neo4j
+4. Missing checkpoints are rebuilt from stored group summaries
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from daw_agents.context.compaction import (
+    CompactionConfig,
+    ContextCompactor,
+    Message,
+    Summary,
+)
+from daw_agents.models.router import ModelRouter
+
+
+def _messages(n: int) -> list[Message]:
+    return [Message(role="user", content=f"message {i} " + "word " * 5) for i in range(n)]
+
+
+def _config(**overrides: Any) -> CompactionConfig:
+    values: dict[str, Any] = {
+        "max_tokens": 150,
+        "recent_messages_to_keep": 2,
+        "messages_per_summary": 5,
+        "incremental": True,
+    }
+    values.update(overrides)
+    return CompactionConfig(**values)
+
+
+def _router() -> MagicMock:
+    router = MagicMock(spec=ModelRouter)
+    router.route = AsyncMock(return_value="short summary")
+    return router
+
+
+class TestInMemoryCheckpoints:
+    """Test incremental compaction without Neo4j."""
+
+    @pytest.mark.asyncio
+    async def test_new_turn_summarizes_only_new_messages(
+        self, word_encoding: Any
+    ) -> None:
+        router = _router()
+        compactor = ContextCompactor(model_router=router, config=_config())
+        history = _messages(32)
+
+        await compactor.compact(history, conversation_id="c1")
+        first_calls = router.route.await_count
+        assert first_calls == 6  # 30 old messages in groups of 5
+        checkpoint = await compactor.load_checkpoint("c1")
+        assert checkpoint is not None
+        assert checkpoint.end_index == 29
+
+        history.append(Message(role="user", content="next turn"))
+        await compactor.compact(history, conversation_id="c1")
+
+        checkpoint = await compactor.load_checkpoint("c1")
+        assert checkpoint is not None
+        assert checkpoint.end_index == 30
+        # Only message 30 is summarized; the rolled-up text still fits
+        assert router.route.await_count - first_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_old_history_reuses_checkpoint(
+        self, word_encoding: Any
+    ) -> None:
+        router = _router()
+        compactor = ContextCompactor(model_router=router, config=_config())
+        history = _messages(32)
+
+        first = await compactor.compact(history, conversation_id="c1")
+        calls = router.route.await_count
+        second = await compactor.compact(history, conversation_id="c1")
+
+        assert router.route.await_count == calls
+        assert second[0].content == first[0].content
+
+    @pytest.mark.asyncio
+    async def test_shorter_history_discards_checkpoint(self, word_encoding: Any) -> None:
+        router = _router()
+        compactor = ContextCompactor(model_router=router, config=_config())
+        await compactor.compact(_messages(32), conversation_id="c1")
+
+        await compactor.compact(_messages(22), conversation_id="c1")
+
+        checkpoint = await compactor.load_checkpoint("c1")
+        assert checkpoint is not None
+        assert checkpoint.end_index == 19
+
+    @pytest.mark.asyncio
+    async def test_non_incremental_mode_resummarizes(self, word_encoding: Any) -> None:
+        router = _router()
+        compactor = ContextCompactor(
+            model_router=router, config=_config(incremental=False)
+        )
+        await compactor.compact(_messages(32), conversation_id="c1")
+        calls = router.route.await_count
+        await compactor.compact(_messages(32), conversation_id="c1")
+        assert router.route.await_count == 2 * calls
+        assert await compactor.load_checkpoint("c1") is None
+
+
+class TestNeo4jCheckpoints:
+    """Test checkpoint persistence in Neo4j."""
+
+    @pytest.mark.asyncio
+    async def test_loads_stored_checkpoint(self, word_encoding: Any) -> None:
+        router = _router()
+        connector = MagicMock()
+        connector.create_nodes = AsyncMock(return_value=["n1"])
+        connector.query = AsyncMock(
+            side_effect=[
+                [{"content": "stored checkpoint", "message_count": 25, "end_index": 24}],
+                [],  # MERGE of the new checkpoint
+            ]
+        )
+        compactor = ContextCompactor(
+            model_router=router, neo4j_connector=connector, config=_config()
+        )
+
+        await compactor.compact(_messages(32), conversation_id="c1")
+
+        # Only messages 25..29 are summarized
+        assert router.route.await_count == 1
+        rows = connector.create_nodes.call_args.kwargs["properties_list"]
+        assert [(r["start_index"], r["end_index"]) for r in rows] == [(25, 29)]
+
+        merge_call = connector.query.call_args_list[-1].kwargs
+        assert "MERGE (c:SummaryCheckpoint" in merge_call["cypher"]
+        assert merge_call["params"]["end_index"] == 29
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_checkpoint_from_stored_summaries(
+        self, word_encoding: Any
+    ) -> None:
+        connector = MagicMock()
+        connector.query = AsyncMock(
+            side_effect=[
+                [],  # no SummaryCheckpoint node
+                [
+                    {"content": "a", "start_index": 0, "end_index": 4},
+                    {"content": "a again", "start_index": 0, "end_index": 4},
+                    {"content": "b", "start_index": 5, "end_index": 9},
+                    {"content": "gap", "start_index": 15, "end_index": 19},
+                ],
+            ]
+        )
+        compactor = ContextCompactor(
+            model_router=_router(), neo4j_connector=connector, config=_config()
+        )
+
+        checkpoint = await compactor.load_checkpoint("c1")
+
+        assert isinstance(checkpoint, Summary)
+        assert checkpoint.content == "a\n---\nb"
+        assert checkpoint.end_index == 9
+        # Cached in memory afterwards
+        assert await compactor.load_checkpoint("c1") is checkpoint
+        assert connector.query.await_count == 2
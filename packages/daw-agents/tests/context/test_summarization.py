@@ -0,0 +1,155 @@
+"""
+Tests for concurrent and hierarchical summarization in ContextCompactor.
+
+These tests verify:
+1. Group summaries run concurrently, bounded by max_concurrent_summaries
+2. Summaries keep the order of their message groups
+3. Tree mode merges summaries level by level until they fit the budget
+4. Summaries from one compaction are stored in a single batched write
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from daw_agents.context.compaction import (
+    CompactionConfig,
+    ContextCompactor,
+    Message,
+    SummarizationMode,
+)
+from daw_agents.models.router import ModelRouter
+
+
+def _messages(n: int) -> list[Message]:
+    return [Message(role="user", content=f"message {i} " + "word " * 5) for i in range(n)]
+
+
+def _group_label(prompt: str) -> str:
+    """Label a summarization prompt by the first message it contains."""
+    first = prompt.split("\n\n", 1)[1].split("\n", 1)[0]
+    return first.split(": ", 1)[1].split(" ")[:2][-1]
+
+
+class TestConcurrentSummaries:
+    """Test fan-out of group summarization."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_bounded_and_ordered(self, word_encoding: Any) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def route(task_type: Any, messages: list[dict[str, str]]) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"summary of {_group_label(messages[0]['content'])}"
+
+        router = MagicMock(spec=ModelRouter)
+        router.route = AsyncMock(side_effect=route)
+        compactor = ContextCompactor(
+            model_router=router,
+            config=CompactionConfig(
+                max_tokens=200,
+                recent_messages_to_keep=2,
+                messages_per_summary=5,
+                max_concurrent_summaries=3,
+            ),
+        )
+
+        result = await compactor.compact(_messages(42))
+
+        assert peak == 3
+        assert router.route.await_count == 8
+        expected = "\n---\n".join(f"summary of {i}" for i in range(0, 40, 5))
+        assert result[0].content.endswith(expected)
+
+
+class TestTreeSummarization:
+    """Test map-reduce merging of summaries."""
+
+    @pytest.mark.asyncio
+    async def test_tree_merges_until_budget_fits(self, word_encoding: Any) -> None:
+        calls: list[int] = []
+
+        async def route(task_type: Any, messages: list[dict[str, str]]) -> str:
+            prompt = messages[0]["content"]
+            merged = prompt.count("system: ")
+            calls.append(merged)
+            return "merged " * 15 if merged else "long summary " * 10
+
+        router = MagicMock(spec=ModelRouter)
+        router.route = AsyncMock(side_effect=route)
+        compactor = ContextCompactor(
+            model_router=router,
+            config=CompactionConfig(
+                max_tokens=60,
+                recent_messages_to_keep=1,
+                messages_per_summary=2,
+                summarization_mode=SummarizationMode.TREE,
+                tree_fan_in=4,
+            ),
+        )
+
+        result = await compactor.compact(_messages(33))
+
+        # 16 group summaries -> 4 merged summaries (still too long) -> 1
+        assert calls.count(0) == 16
+        assert [c for c in calls if c] == [4, 4, 4, 4, 4]
+        assert compactor.count_message_tokens(result) <= 60
+
+    @pytest.mark.asyncio
+    async def test_flat_mode_resummarizes_once(self, word_encoding: Any) -> None:
+        router = MagicMock(spec=ModelRouter)
+        router.route = AsyncMock(return_value="long summary " * 10)
+        compactor = ContextCompactor(
+            model_router=router,
+            config=CompactionConfig(
+                max_tokens=60, recent_messages_to_keep=1, messages_per_summary=2
+            ),
+        )
+
+        await compactor.compact(_messages(33))
+
+        assert router.route.await_count == 17
+
+
+class TestBatchedStorage:
+    """Test summaries are written in one transaction."""
+
+    @pytest.mark.asyncio
+    async def test_summaries_stored_in_one_batch(self, word_encoding: Any) -> None:
+        router = MagicMock(spec=ModelRouter)
+        router.route = AsyncMock(return_value="summary")
+        connector = MagicMock()
+        connector.create_nodes = AsyncMock(return_value=["n1", "n2", "n3"])
+        compactor = ContextCompactor(
+            model_router=router,
+            neo4j_connector=connector,
+            config=CompactionConfig(
+                max_tokens=50, recent_messages_to_keep=2, messages_per_summary=4
+            ),
+        )
+
+        await compactor.compact(_messages(12), conversation_id="conv-1")
+
+        connector.create_nodes.assert_awaited_once()
+        rows = connector.create_nodes.call_args.kwargs["properties_list"]
+        assert [(r["start_index"], r["end_index"]) for r in rows] == [
+            (0, 3),
+            (4, 7),
+            (8, 9),
+        ]
+        assert {r["conversation_id"] for r in rows} == {"conv-1"}
+
+    @pytest.mark.asyncio
+    async def test_store_summaries_without_neo4j_raises(self, word_encoding: Any) -> None:
+        compactor = ContextCompactor(model_router=MagicMock(spec=ModelRouter))
+        with pytest.raises(RuntimeError, match="Neo4j connector not configured"):
+            await compactor.store_summaries([("s", {})], conversation_id="c")
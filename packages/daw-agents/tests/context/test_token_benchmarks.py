@@ -0,0 +1,87 @@
+"""
+Benchmarks for token counting over long conversation histories.
+
+Each benchmark counts a 1k-, 10k- and 100k-message history with the real
+cl100k_base encoding and compares:
+1. Uncached per-message encoding (the previous behaviour)
+2. Cold start through TokenCounter.encode_batch
+3. Warm recount served from the cache
+4. Appending one message to a RunningTokenTotal
+
+Timings are printed (run with -s); assertions only check results and
+encode counts so the benchmarks stay stable on slow machines.
+
+Run with: pytest -m slow tests/context/test_token_benchmarks.py -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+import tiktoken
+
+from daw_agents.context.compaction import Message
+from daw_agents.context.tokens import (
+    MESSAGE_OVERHEAD_TOKENS,
+    RunningTokenTotal,
+    TokenCounter,
+)
+
+pytestmark = pytest.mark.slow
+
+
+def _history(n: int) -> list[Message]:
+    return [
+        Message(
+            role="user" if i % 2 == 0 else "assistant",
+            content=f"Step {i}: updated the handler and re-ran the failing test suite.",
+        )
+        for i in range(n)
+    ]
+
+
+def _uncached_count(encoding: tiktoken.Encoding, messages: list[Message]) -> int:
+    return sum(
+        len(encoding.encode(m.role)) + MESSAGE_OVERHEAD_TOKENS + len(encoding.encode(m.content))
+        for m in messages
+    )
+
+
+@pytest.mark.parametrize("size", [1_000, 10_000, 100_000])
+def test_history_counting(size: int) -> None:
+    encoding = tiktoken.get_encoding("cl100k_base")
+    history = _history(size)
+
+    start = time.perf_counter()
+    expected = _uncached_count(encoding, history)
+    uncached = time.perf_counter() - start
+
+    counter = TokenCounter(encoding, max_entries=2 * size + 2)
+    start = time.perf_counter()
+    cold_total = counter.count_messages(history)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm_total = counter.count_messages(history)
+    warm = time.perf_counter() - start
+
+    running = RunningTokenTotal(counter)
+    running.sync(history)
+    misses = counter.stats.misses
+    history.append(Message(role="user", content="One more message to count."))
+    start = time.perf_counter()
+    appended_total = running.sync(history)
+    append = time.perf_counter() - start
+
+    print(
+        f"\n{size:>7} messages: uncached {uncached * 1000:9.1f} ms | "
+        f"cold batch {cold * 1000:9.1f} ms | warm {warm * 1000:8.1f} ms | "
+        f"append one {append * 1000:6.3f} ms"
+    )
+
+    assert cold_total == expected
+    assert warm_total == expected
+    assert appended_total == expected + counter.count_message(history[-1])
+    # Appending one message encodes only its content; the role is cached.
+    assert counter.stats.misses == misses + 1
@@ -0,0 +1,150 @@
+"""
+Tests for cached token counting.
+
+These tests verify:
+1. Counts are cached by content and encoded once
+2. encode_batch encodes only distinct cache misses, serially or threaded
+3. The cache is bounded and evicts least-recently-used entries
+4. RunningTokenTotal counts only appended messages
+5. ContextCompactor uses the cache and per-conversation running totals
+
+A whitespace-splitting encoding (conftest.WordEncoding) stands in for
+tiktoken so the tests count encode calls without loading BPE files.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from daw_agents.context.compaction import ContextCompactor, Message
+from daw_agents.context.tokens import (
+    MESSAGE_OVERHEAD_TOKENS,
+    RunningTokenTotal,
+    TokenCounter,
+)
+from daw_agents.models.router import ModelRouter
+
+
+def _history(n: int) -> list[Message]:
+    return [
+        Message(role="user" if i % 2 == 0 else "assistant", content=f"message number {i}")
+        for i in range(n)
+    ]
+
+
+class TestTokenCounter:
+    """Test cached counting."""
+
+    def test_repeated_text_encoded_once(self, word_encoding: Any) -> None:
+        encoding = word_encoding
+        counter = TokenCounter(encoding)
+        assert counter.count("one two three") == 3
+        assert counter.count("one two three") == 3
+        assert encoding.encoded == 1
+        assert counter.stats.hits == 1
+        assert counter.count("") == 0
+
+    def test_encode_batch_encodes_only_misses(self, word_encoding: Any) -> None:
+        encoding = word_encoding
+        counter = TokenCounter(encoding)
+        counter.count("a b")
+
+        counts = counter.encode_batch(["a b", "c", "d e f", "c", ""])
+
+        assert counts == [2, 1, 3, 1, 0]
+        # "a b" was cached and "c" is deduplicated within the batch
+        assert encoding.encoded == 3
+
+    def test_encode_batch_threaded_preserves_order(self, word_encoding: Any) -> None:
+        encoding = word_encoding
+        counter = TokenCounter(encoding, num_threads=4)
+        texts = [" ".join(["w"] * (i % 7 + 1)) + f" {i}" for i in range(40)]
+
+        with (
+            patch("daw_agents.context.tokens.PARALLEL_ENCODE_THRESHOLD", 8),
+            patch("daw_agents.context.tokens.os.cpu_count", return_value=4),
+        ):
+            counts = counter.encode_batch(texts)
+
+        assert counts == [i % 7 + 2 for i in range(40)]
+        assert encoding.encoded == 40
+
+    def test_cache_is_bounded(self, word_encoding: Any) -> None:
+        counter = TokenCounter(word_encoding, max_entries=2)
+        counter.count("a")
+        counter.count("b")
+        counter.count("a")  # refresh "a"
+        counter.count("c")  # evicts "b"
+        assert len(counter) == 2
+        assert counter.stats.evictions == 1
+        misses = counter.stats.misses
+        counter.count("a")
+        assert counter.stats.misses == misses
+
+    def test_count_messages_matches_per_message_count(self, word_encoding: Any) -> None:
+        counter = TokenCounter(word_encoding)
+        messages = _history(5)
+        expected = sum(
+            1 + MESSAGE_OVERHEAD_TOKENS + len(m.content.split()) for m in messages
+        )
+        assert counter.count_messages(messages) == expected
+        assert counter.count_message(messages[0]) == 1 + MESSAGE_OVERHEAD_TOKENS + 3
+
+
+class TestRunningTokenTotal:
+    """Test incremental totals."""
+
+    def test_append_counts_only_new_message(self, word_encoding: Any) -> None:
+        encoding = word_encoding
+        counter = TokenCounter(encoding)
+        running = RunningTokenTotal(counter)
+        history = _history(50)
+        running.sync(history)
+        encoded = encoding.encoded
+
+        history.append(Message(role="user", content="brand new words"))
+        total = running.sync(history)
+
+        assert encoding.encoded == encoded + 1
+        assert total == counter.count_messages(history)
+        assert len(running) == 51
+
+    def test_rewritten_history_is_recounted(self, word_encoding: Any) -> None:
+        counter = TokenCounter(word_encoding)
+        running = RunningTokenTotal(counter)
+        running.sync(_history(10))
+
+        replaced = [Message(role="system", content="summary")] + _history(10)[-2:]
+        assert running.sync(replaced) == counter.count_messages(replaced)
+
+        shorter = replaced[:1]
+        assert running.sync(shorter) == counter.count_messages(shorter)
+
+
+class TestCompactorIntegration:
+    """Test ContextCompactor counting through the cache."""
+
+    @pytest.fixture
+    def compactor(self, word_encoding: Any) -> ContextCompactor:
+        return ContextCompactor(model_router=ModelRouter())
+
+    def test_count_tokens_uses_cache(self, compactor: ContextCompactor) -> None:
+        compactor.count_tokens("cached text")
+        compactor.count_tokens("cached text")
+        assert compactor.token_counter.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_compact_tracks_running_total(
+        self, compactor: ContextCompactor
+    ) -> None:
+        history = _history(20)
+        assert await compactor.compact(history, max_tokens=10_000, conversation_id="c1") == history
+        history.append(Message(role="user", content="one more"))
+        await compactor.compact(history, max_tokens=10_000, conversation_id="c1")
+
+        running = compactor.running_total("c1")
+        assert len(running) == 21
+        assert running.total == compactor.count_message_tokens(history)
@@ -0,0 +1,350 @@
+"""
+Tests for vector-indexed semantic retrieval of summaries.
+
+These tests verify:
+1. InMemoryVectorIndex returns top-k by cosine similarity and upserts by id
+2. Recency boost decays with summary age and re-ranks close matches
+3. Neo4jVectorIndex creates the index and converts Neo4j cosine scores
+4. Summaries are embedded in one batch when stored
+5. Backfill embeds stored summaries batch by batch
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from daw_agents.context.compaction import CompactionConfig, ContextCompactor, Message
+from daw_agents.context.vector_index import (
+    InMemoryVectorIndex,
+    Neo4jVectorIndex,
+    VectorEntry,
+    recency_boost,
+)
+from daw_agents.models.router import ModelRouter
+
+VOCABULARY = ["database", "migration", "frontend", "button", "auth", "token"]
+
+
+class BagOfWordsEmbedder:
+    """Deterministic embedder: one dimension per vocabulary word."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [
+            [float(text.lower().split().count(word)) + 0.01 for word in VOCABULARY]
+            for text in texts
+        ]
+
+
+def _entry(entry_id: str, text: str, age_hours: float = 0.0) -> VectorEntry:
+    vector = [float(text.split().count(word)) + 0.01 for word in VOCABULARY]
+    return VectorEntry(
+        id=entry_id,
+        vector=vector,
+        content=text,
+        conversation_id="c1",
+        created_at=datetime.now(UTC) - timedelta(hours=age_hours),
+    )
+
+
+class TestInMemoryVectorIndex:
+    """Test exact cosine search."""
+
+    @pytest.mark.asyncio
+    async def test_top_k_ordered_by_similarity(self) -> None:
+        index = InMemoryVectorIndex()
+        await index.add(
+            [
+                _entry("a", "frontend button"),
+                _entry("b", "database migration"),
+                _entry("c", "database auth"),
+            ]
+        )
+
+        matches = await index.search(_entry("q", "database migration").vector, k=2)
+
+        assert [m.id for m in matches] == ["b", "c"]
+        assert matches[0].similarity == pytest.approx(1.0, abs=1e-5)
+        assert matches[0].similarity > matches[1].similarity
+
+    @pytest.mark.asyncio
+    async def test_add_replaces_existing_id(self) -> None:
+        index = InMemoryVectorIndex()
+        await index.add([_entry("a", "frontend button")])
+        await index.add([_entry("a", "auth token")])
+
+        matches = await index.search(_entry("q", "auth token").vector, k=5)
+
+        assert len(index) == 1
+        assert matches[0].content == "auth token"
+
+    @pytest.mark.asyncio
+    async def test_empty_index_returns_nothing(self) -> None:
+        assert await InMemoryVectorIndex().search([1.0, 0.0], k=3) == []
+
+
+class TestRecencyBoost:
+    """Test the age-decayed score bonus."""
+
+    def test_halves_every_half_life(self) -> None:
+        now = datetime(2026, 1, 8, tzinfo=UTC)
+        assert recency_boost(now, 0.2, 24, now=now) == pytest.approx(0.2)
+        assert recency_boost(now - timedelta(hours=24), 0.2, 24, now=now) == pytest.approx(0.1)
+        assert recency_boost(now - timedelta(hours=48), 0.2, 24, now=now) == pytest.approx(0.05)
+
+    def test_zero_weight_disables_boost(self) -> None:
+        assert recency_boost(datetime.now(UTC), 0.0, 24) == 0.0
+
+
+class TestNeo4jVectorIndex:
+    """Test Cypher issued for the Neo4j vector index."""
+
+    @pytest.mark.asyncio
+    async def test_search_creates_index_and_converts_scores(self) -> None:
+        connector = MagicMock()
+        connector.query = AsyncMock(
+            side_effect=[
+                [],  # CREATE VECTOR INDEX
+                [
+                    {
+                        "id": "n1",
+                        "content": "database migration",
+                        "conversation_id": "c1",
+                        "message_count": 5,
+                        "created_at": "2026-01-01T00:00:00+00:00",
+                        "score": 0.9,
+                    }
+                ],
+                [],  # second search
+            ]
+        )
+        index = Neo4jVectorIndex(connector)
+
+        matches = await index.search([0.1, 0.2, 0.3], k=3)
+
+        create = connector.query.call_args_list[0].kwargs
+        assert "CREATE VECTOR INDEX summary_embeddings IF NOT EXISTS" in create["cypher"]
+        assert create["params"] == {"dimensions": 3}
+        assert matches[0].similarity == pytest.approx(0.8)
+        assert matches[0].metadata == {"message_count": 5}
+
+        await index.search([0.1, 0.2, 0.3], k=3)
+        cyphers = [c.kwargs["cypher"] for c in connector.query.call_args_list]
+        assert sum("CREATE VECTOR INDEX" in cypher for cypher in cyphers) == 1
+
+    @pytest.mark.asyncio
+    async def test_add_sets_embeddings_in_one_write(self) -> None:
+        connector = MagicMock()
+        connector.query = AsyncMock(return_value=[])
+        index = Neo4jVectorIndex(connector)
+
+        await index.add([_entry("n1", "auth"), _entry("n2", "token")])
+
+        write = connector.query.call_args_list[-1].kwargs
+        assert "UNWIND $rows" in write["cypher"]
+        assert [row["id"] for row in write["params"]["rows"]] == ["n1", "n2"]
+
+
+class TestSemanticRetrieval:
+    """Test ContextCompactor with an embedder and vector index."""
+
+    @pytest.mark.asyncio
+    async def test_compaction_indexes_summaries_in_one_batch(
+        self, word_encoding: Any
+    ) -> None:
+        router = MagicMock(spec=ModelRouter)
+        router.route = AsyncMock(side_effect=["database migration", "frontend button"])
+        embedder = BagOfWordsEmbedder()
+        index = InMemoryVectorIndex()
+        compactor = ContextCompactor(
+            model_router=router,
+            config=CompactionConfig(
+                max_tokens=50, recent_messages_to_keep=2, messages_per_summary=4
+            ),
+            embedder=embedder,
+            vector_index=index,
+        )
+        messages = [Message(role="user", content="word " * 10) for _ in range(10)]
+
+        await compactor.compact(messages, conversation_id="c1")
+
+        assert embedder.calls == [["database migration", "frontend button"]]
+        assert len(index) == 2
+
+        results = await compactor.retrieve_relevant("migration of the database", limit=1)
+        assert results[0]["content"] == "database migration"
+        assert results[0]["conversation_id"] == "c1"
+        assert results[0]["message_count"] == 4
+        assert results[0]["score"] > results[0]["similarity"]
+
+    @pytest.mark.asyncio
+    async def test_recompaction_replaces_indexed_summaries(self, word_encoding: Any) -> None:
+        router = MagicMock(spec=ModelRouter)
+        router.route = AsyncMock(
+            side_effect=["database migration", "frontend button"] * 2
+        )
+        index = InMemoryVectorIndex()
+        compactor = ContextCompactor(
+            model_router=router,
+            config=CompactionConfig(
+                max_tokens=50, recent_messages_to_keep=2, messages_per_summary=4
+            ),
+            embedder=BagOfWordsEmbedder(),
+            vector_index=index,
+        )
+        messages = [Message(role="user", content=f"word{i} " * 10) for i in range(10)]
+
+        await compactor.compact(messages, conversation_id="c1")
+        await compactor.compact(messages, conversation_id="c1")
+
+        assert len(index) == 2
+        results = await compactor.retrieve_relevant("database migration", limit=5)
+        assert [r["content"] for r in results] == ["database migration", "frontend button"]
+
+    @pytest.mark.asyncio
+    async def test_recency_breaks_near_ties(self, word_encoding: Any) -> None:
+        index = InMemoryVectorIndex()
+        await index.add(
+            [
+                _entry("old", "database migration", age_hours=24 * 30),
+                _entry("new", "database migration auth", age_hours=0),
+            ]
+        )
+        compactor = ContextCompactor(
+            model_router=MagicMock(spec=ModelRouter),
+            config=CompactionConfig(recency_weight=0.3, recency_half_life_hours=24),
+            embedder=BagOfWordsEmbedder(),
+            vector_index=index,
+        )
+
+        results = await compactor.retrieve_relevant("database migration", limit=2)
+
+        assert [r["content"] for r in results] == [
+            "database migration auth",
+            "database migration",
+        ]
+        assert results[1]["similarity"] > results[0]["similarity"]
+
+    @pytest.mark.asyncio
+    async def test_store_summary_embeds_new_node(self, word_encoding: Any) -> None:
+        connector = MagicMock()
+        connector.create_node = AsyncMock(return_value="node-1")
+        connector.query = AsyncMock(return_value=[])
+        compactor = ContextCompactor(
+            model_router=MagicMock(spec=ModelRouter),
+            neo4j_connector=connector,
+            embedder=BagOfWordsEmbedder(),
+        )
+
+        await compactor.store_summary("auth token", "c1", {})
+
+        assert isinstance(compactor.vector_index, Neo4jVectorIndex)
+        write = connector.query.call_args_list[-1].kwargs
+        assert write["params"]["rows"][0]["id"] == "node-1"
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_does_not_fail_storage(
+        self, word_encoding: Any
+    ) -> None:
+        embedder = MagicMock()
+        embedder.embed = AsyncMock(side_effect=RuntimeError("rate limited"))
+        connector = MagicMock()
+        connector.create_node = AsyncMock(return_value="node-1")
+        compactor = ContextCompactor(
+            model_router=MagicMock(spec=ModelRouter),
+            neo4j_connector=connector,
+            embedder=embedder,
+            vector_index=InMemoryVectorIndex(),
+        )
+
+        assert await compactor.store_summary("auth", "c1", {}) == "node-1"
+
+    @pytest.mark.asyncio
+    async def test_without_embedder_uses_substring_query(
+        self, word_encoding: Any
+    ) -> None:
+        connector = MagicMock()
+        connector.query = AsyncMock(return_value=[])
+        compactor = ContextCompactor(
+            model_router=MagicMock(spec=ModelRouter), neo4j_connector=connector
+        )
+
+        await compactor.retrieve_relevant("auth")
+
+        assert "CONTAINS $query" in connector.query.call_args.kwargs["cypher"]
+
+
+class TestBackfill:
+    """Test batched embedding of existing summaries."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_pages_until_no_unembedded_summaries(
+        self, word_encoding: Any
+    ) -> None:
+        rows = [
+            {"id": f"n{i}", "content": "database", "conversation_id": "c1"}
+            for i in range(3)
+        ]
+        connector = MagicMock()
+        connector.query = AsyncMock(
+            side_effect=[
+                rows[:2],  # first batch
+                [],  # CREATE VECTOR INDEX
+                [],  # SET embeddings
+                rows[2:],  # second (short) batch
+                [],  # SET embeddings
+            ]
+        )
+        embedder = BagOfWordsEmbedder()
+        compactor = ContextCompactor(
+            model_router=MagicMock(spec=ModelRouter),
+            neo4j_connector=connector,
+            embedder=embedder,
+        )
+
+        assert await compactor.backfill_embeddings(batch_size=2) == 3
+
+        assert [len(batch) for batch in embedder.calls] == [2, 1]
+        fetch = connector.query.call_args_list[0].kwargs
+        assert "s.embedding IS NULL" in fetch["cypher"]
+        assert fetch["params"] == {"skip": 0, "limit": 2}
+
+    @pytest.mark.asyncio
+    async def test_backfill_into_memory_index_pages_with_skip(
+        self, word_encoding: Any
+    ) -> None:
+        rows = [
+            {"id": f"n{i}", "content": "auth", "conversation_id": "c1"}
+            for i in range(4)
+        ]
+        connector = MagicMock()
+        connector.query = AsyncMock(side_effect=[rows[:2], rows[2:], []])
+        index = InMemoryVectorIndex()
+        compactor = ContextCompactor(
+            model_router=MagicMock(spec=ModelRouter),
+            neo4j_connector=connector,
+            embedder=BagOfWordsEmbedder(),
+            vector_index=index,
+        )
+
+        assert await compactor.backfill_embeddings(batch_size=2) == 4
+
+        assert len(index) == 4
+        skips = [c.kwargs["params"]["skip"] for c in connector.query.call_args_list]
+        assert skips == [0, 2, 4]
+        assert "IS NULL" not in connector.query.call_args_list[0].kwargs["cypher"]
+
+    @pytest.mark.asyncio
+    async def test_backfill_requires_embedder(self, word_encoding: Any) -> None:
+        compactor = ContextCompactor(
+            model_router=MagicMock(spec=ModelRouter), neo4j_connector=MagicMock()
+        )
+        with pytest.raises(RuntimeError, match="Embedder not configured"):
+            await compactor.backfill_embeddings()
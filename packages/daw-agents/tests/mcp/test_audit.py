@@ -10,6 +10,8 @@ Tests cover:
 5. query_audit_trail() method - Query audit logs with time filtering
 6. Retention policy validation (7-year retention)
 7. Helicone integration for observability
+8. Bounded in-memory store and streaming export
+9. Checkpoints and segment-parallel chain verification
 
 Requirements (FR-01.3.3):
 - Every tool call logged with: timestamp, agent_id, user_id, tool name, action,
@@ -26,6 +28,7 @@ References:
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
@@ -1074,6 +1077,634 @@ class TestConcurrentLogging:
         assert len(entries) == 10
 
 
+# -----------------------------------------------------------------------------
+# Test: Background Writer
+# -----------------------------------------------------------------------------
+
+
+class TestBackgroundWriter:
+    """Tests for AuditWriter and AuditLogger with background_writes."""
+
+    @staticmethod
+    def _slow_connector(delay: float = 0.0) -> MagicMock:
+        """Connector recording each create_nodes batch after ``delay`` seconds."""
+        import asyncio
+
+        connector = MagicMock()
+        connector.batches = []
+
+        async def create_nodes(labels: list[str], properties_list: list[dict]) -> list[str]:
+            await asyncio.sleep(delay)
+            connector.batches.append(list(properties_list))
+            return [p["entry_id"] for p in properties_list]
+
+        connector.create_nodes = AsyncMock(side_effect=create_nodes)
+        connector.create_node = AsyncMock()
+        connector.query = AsyncMock(return_value=[])
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_do_not_wait_for_neo4j(self) -> None:
+        """log_tool_call should return before the Neo4j write completes."""
+        import time
+
+        from daw_agents.mcp.audit import AuditConfig, AuditLogger
+
+        connector = self._slow_connector(delay=0.5)
+        logger = AuditLogger(
+            config=AuditConfig(background_writes=True), neo4j_connector=connector
+        )
+
+        start = time.perf_counter()
+        for i in range(20):
+            await logger.log_tool_call(
+                agent_id="executor",
+                user_id="user_1",
+                tool_name=f"tool_{i}",
+                action="execute",
+                parameters={},
+                success=True,
+            )
+        elapsed = time.perf_counter() - start
+        await logger.close()
+
+        assert elapsed < 0.25
+        connector.create_node.assert_not_called()
+        assert sum(len(batch) for batch in connector.batches) == 20
+
+    @pytest.mark.asyncio
+    async def test_batches_by_size_in_chain_order(self) -> None:
+        """Entries should be group-committed in chain order, batch_size at a time."""
+        from daw_agents.mcp.audit import AuditConfig, AuditLogger
+
+        connector = self._slow_connector()
+        logger = AuditLogger(
+            config=AuditConfig(
+                background_writes=True, write_batch_size=4, write_flush_interval_ms=1000
+            ),
+            neo4j_connector=connector,
+        )
+        entries = [
+            await logger.log_tool_call(
+                agent_id="executor",
+                user_id="user_1",
+                tool_name="read_file",
+                action="execute",
+                parameters={"index": i},
+                success=True,
+            )
+            for i in range(10)
+        ]
+        await logger.close()
+
+        written = [p for batch in connector.batches for p in batch]
+        assert [len(batch) for batch in connector.batches] == [4, 4, 2]
+        assert [p["entry_id"] for p in written] == [e.entry_id for e in entries]
+        assert all(
+            later["previous_hash"] == earlier["entry_hash"]
+            for earlier, later in zip(written, written[1:], strict=False)
+        )
+        assert logger.writer is not None
+        assert logger.writer.stats.written == 10
+        assert logger.writer.stats.batches == 3
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushed_after_interval(self) -> None:
+        """A partial batch should be written once the flush interval passes."""
+        import asyncio
+
+        from daw_agents.mcp.audit import AuditEntry, AuditWriter
+
+        connector = self._slow_connector()
+        writer = AuditWriter(connector, batch_size=100, flush_interval=0.05)
+        entry = AuditEntry(
+            entry_id="audit_1",
+            timestamp=datetime.now(UTC),
+            agent_id="executor",
+            user_id="user_1",
+            tool_name="read_file",
+            action="execute",
+            result_status="success",
+            response_time_ms=1,
+        )
+
+        await writer.put(entry)
+        await asyncio.sleep(0.2)
+
+        assert len(connector.batches) == 1
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self) -> None:
+        """put() should wait while the queue is full instead of dropping."""
+        import asyncio
+
+        from daw_agents.mcp.audit import AuditEntry, AuditWriter
+
+        connector = self._slow_connector(delay=0.2)
+        writer = AuditWriter(connector, batch_size=1, flush_interval=0.01, max_queue_size=1)
+
+        def make(i: int) -> AuditEntry:
+            return AuditEntry(
+                entry_id=f"audit_{i}",
+                timestamp=datetime.now(UTC),
+                agent_id="executor",
+                user_id="user_1",
+                tool_name="read_file",
+                action="execute",
+                result_status="success",
+                response_time_ms=1,
+            )
+
+        await writer.put(make(0))  # taken by the writer task
+        await asyncio.sleep(0.05)
+        await writer.put(make(1))  # fills the queue
+        blocked = asyncio.create_task(writer.put(make(2)))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        await blocked
+        await writer.close()
+        assert [b[0]["entry_id"] for b in connector.batches] == [
+            "audit_0",
+            "audit_1",
+            "audit_2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self) -> None:
+        """A failed write should be retried before the batch is dropped."""
+        from daw_agents.mcp.audit import AuditConfig, AuditLogger
+
+        connector = self._slow_connector()
+        connector.create_nodes.side_effect = [RuntimeError("unavailable"), ["id"]]
+        logger = AuditLogger(
+            config=AuditConfig(background_writes=True), neo4j_connector=connector
+        )
+        assert logger.writer is not None
+        logger.writer.retry_backoff = 0.01
+
+        await logger.log_tool_call(
+            agent_id="executor",
+            user_id="user_1",
+            tool_name="read_file",
+            action="execute",
+            parameters={},
+            success=True,
+        )
+        await logger.close()
+
+        assert connector.create_nodes.await_count == 2
+        assert logger.writer.stats.retries == 1
+        assert logger.writer.stats.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_query_flushes_pending_entries(self) -> None:
+        """Queries against Neo4j should see entries still queued for writing."""
+        from daw_agents.mcp.audit import AuditConfig, AuditLogger
+
+        connector = self._slow_connector()
+        logger = AuditLogger(
+            config=AuditConfig(background_writes=True, write_flush_interval_ms=5000),
+            neo4j_connector=connector,
+        )
+        await logger.log_tool_call(
+            agent_id="executor",
+            user_id="user_1",
+            tool_name="read_file",
+            action="execute",
+            parameters={},
+            success=True,
+        )
+
+        await logger.query_audit_trail(agent_id="executor")
+
+        assert len(connector.batches) == 1
+        await logger.close()
+
+
+# -----------------------------------------------------------------------------
+# Test: Bounded In-Memory Store
+# -----------------------------------------------------------------------------
+
+
+class TestAuditStore:
+    """Tests for the bounded, indexed in-memory AuditStore."""
+
+    @staticmethod
+    def _entry(index: int, **overrides: object) -> object:
+        from daw_agents.mcp.audit import AuditEntry
+
+        fields: dict[str, object] = {
+            "entry_id": f"entry-{index}",
+            "agent_id": "executor" if index % 2 else "planner",
+            "user_id": "user_1",
+            "tool_name": "read_file",
+            "action": "execute",
+            "parameters": {},
+            "result_status": "success",
+            "response_time_ms": 10 * index,
+            "timestamp": datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=30 * index),
+        }
+        fields.update(overrides)
+        return AuditEntry(**fields)
+
+    def test_oldest_entries_are_evicted_from_entries_and_indexes(self) -> None:
+        """A full store should drop its oldest entries, including from indexes."""
+        from daw_agents.mcp.audit import AuditStore
+
+        store = AuditStore(max_entries=3)
+        for index in range(5):
+            store.append(self._entry(index))
+
+        assert len(store) == 3
+        assert [e.response_time_ms for e in store] == [20, 30, 40]
+        assert [e.response_time_ms for e in store.query(agent_id="planner")] == [20, 40]
+        assert store.statistics()["by_agent"] == {"planner": 2, "executor": 1}
+
+    def test_query_combines_index_and_time_filters(self) -> None:
+        """Queries should intersect field filters with the time range."""
+        from daw_agents.mcp.audit import AuditStore, ResultStatus
+
+        store = AuditStore(bucket_seconds=3600)
+        for index in range(10):
+            store.append(self._entry(index))
+        start = datetime(2026, 1, 1, 1, 0, tzinfo=UTC)
+        end = datetime(2026, 1, 1, 3, 0, tzinfo=UTC)
+
+        results = store.query(agent_id="executor", start_time=start, end_time=end)
+
+        assert [e.timestamp.strftime("%H:%M") for e in results] == ["01:30", "02:30"]
+        assert store.query(result_status=ResultStatus.DENIED) == []
+        assert len(store.query(limit=4)) == 4
+
+    def test_wide_time_range_uses_smaller_field_index(self) -> None:
+        """Time buckets should not be merged when a field index is smaller."""
+        from unittest.mock import patch
+
+        from daw_agents.mcp.audit import AuditStore
+
+        store = AuditStore(bucket_seconds=3600)
+        for index in range(10):
+            store.append(self._entry(index, tool_name="write_file" if index == 3 else "read_file"))
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+
+        with patch("daw_agents.mcp.audit.heapq.merge") as merge:
+            results = store.query(tool_name="write_file", start_time=start)
+        narrow = store.query(tool_name="read_file", end_time=start + timedelta(minutes=45))
+
+        merge.assert_not_called()
+        assert [e.response_time_ms for e in results] == [30]
+        assert [e.response_time_ms for e in narrow] == [0, 10]
+
+    def test_range_statistics_match_a_full_scan(self) -> None:
+        """Bucketed statistics should equal counting the entries directly."""
+        from daw_agents.mcp.audit import AuditStore
+
+        store = AuditStore(bucket_seconds=3600)
+        for index in range(12):
+            store.append(self._entry(index, result_status="failure" if index % 3 else "success"))
+        start = datetime(2026, 1, 1, 0, 45, tzinfo=UTC)
+        end = datetime(2026, 1, 1, 4, 15, tzinfo=UTC)
+        in_range = [e for e in store if start <= e.timestamp <= end]
+
+        stats = store.statistics(start_time=start, end_time=end)
+
+        assert stats["total_entries"] == len(in_range) == 7
+        assert stats["success_count"] == sum(e.result_status == "success" for e in in_range)
+        assert stats["avg_response_time_ms"] == pytest.approx(
+            sum(e.response_time_ms for e in in_range) / len(in_range)
+        )
+
+    def test_purge_expired_updates_statistics(self) -> None:
+        """Purged entries should leave the store, its indexes and its totals."""
+        from daw_agents.mcp.audit import AuditStore
+
+        store = AuditStore()
+        past = datetime.now(UTC) - timedelta(days=1)
+        store.append(self._entry(0, retention_until=past))
+        store.append(self._entry(1))
+
+        assert store.purge_expired(datetime.now(UTC)) == 1
+        assert len(store) == 1
+        assert store.query(agent_id="planner") == []
+        assert store.statistics()["total_entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_logger_memory_is_bounded_by_config(self) -> None:
+        """AuditLogger should keep at most max_memory_entries entries."""
+        from daw_agents.mcp.audit import AuditConfig, AuditLogger
+
+        logger = AuditLogger(config=AuditConfig(max_memory_entries=2))
+        for tool_name in ["read_file", "write_file", "delete_file"]:
+            await logger.log_tool_call(
+                agent_id="executor",
+                user_id="user_1",
+                tool_name=tool_name,
+                action="execute",
+                parameters={},
+                success=True,
+            )
+
+        entries = await logger.query_audit_trail()
+        stats = await logger.get_audit_statistics()
+
+        assert [e.tool_name for e in entries] == ["write_file", "delete_file"]
+        assert stats["by_tool"] == {"write_file": 1, "delete_file": 1}
+
+
+# -----------------------------------------------------------------------------
+# Test: Streaming Export
+# -----------------------------------------------------------------------------
+
+
+class TestStreamingExport:
+    """Tests for AuditLogger.stream_audit_trail."""
+
+    @staticmethod
+    async def _logger_with_entries(count: int, **kwargs: object) -> object:
+        from daw_agents.mcp.audit import AuditConfig, AuditLogger
+
+        logger = AuditLogger(config=AuditConfig(), **kwargs)
+        for index in range(count):
+            await logger.log_tool_call(
+                agent_id="executor",
+                user_id="user_1",
+                tool_name=f"tool_{index}",
+                action="execute",
+                parameters={"index": index},
+                success=True,
+            )
+        return logger
+
+    @pytest.mark.asyncio
+    async def test_jsonl_is_yielded_in_chunks(self) -> None:
+        """JSON Lines export should yield one chunk per chunk_size entries."""
+        import json
+
+        logger = await self._logger_with_entries(5)
+
+        chunks = [c async for c in logger.stream_audit_trail(format="jsonl", chunk_size=2)]
+
+        assert len(chunks) == 3
+        rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+        assert [row["tool_name"] for row in rows] == [f"tool_{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_streamed_json_matches_json_array(self) -> None:
+        """Streamed JSON should be the same array the entries serialize to."""
+        import json
+
+        logger = await self._logger_with_entries(3)
+        entries = await logger.query_audit_trail()
+
+        exported = "".join(
+            [c async for c in logger.stream_audit_trail(format="json", chunk_size=2)]
+        )
+
+        expected = json.dumps([e.model_dump(mode="json") for e in entries], indent=2)
+        assert exported == expected
+
+    @pytest.mark.asyncio
+    async def test_empty_json_export_is_empty_array(self) -> None:
+        """Exporting no entries as JSON should give an empty array."""
+        logger = await self._logger_with_entries(0)
+
+        assert await logger.export_audit_trail(format="json") == "[]"
+
+    @pytest.mark.asyncio
+    async def test_csv_has_single_header(self) -> None:
+        """CSV export should write its header once across chunks."""
+        import csv
+        import io
+
+        logger = await self._logger_with_entries(4)
+
+        exported = "".join(
+            [c async for c in logger.stream_audit_trail(format="csv", chunk_size=1)]
+        )
+
+        rows = list(csv.DictReader(io.StringIO(exported)))
+        assert [row["tool_name"] for row in rows] == [f"tool_{i}" for i in range(4)]
+        assert rows[0]["parameters"] == '{"index": 0}'
+
+    @pytest.mark.asyncio
+    async def test_unsupported_format_raises(self) -> None:
+        """An unknown format should raise ValueError."""
+        logger = await self._logger_with_entries(0)
+
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            await logger.export_audit_trail(format="xml")
+
+    @pytest.mark.asyncio
+    async def test_neo4j_export_pages_by_keyset(self) -> None:
+        """Neo4j export should page with (timestamp, entry_id) keysets."""
+        from daw_agents.mcp.audit import entry_to_properties
+
+        source = await self._logger_with_entries(3)
+        nodes = [entry_to_properties(e) for e in await source.query_audit_trail()]
+        connector = MagicMock()
+        connector.query = AsyncMock(
+            side_effect=[[{"n": node} for node in nodes[:2]], [{"n": nodes[2]}]]
+        )
+        logger = await self._logger_with_entries(0, neo4j_connector=connector)
+
+        exported = "".join(
+            [c async for c in logger.stream_audit_trail(format="jsonl", chunk_size=2)]
+        )
+
+        assert exported.count("\n") == 3
+        first, second = (call.args[1] for call in connector.query.await_args_list)
+        assert first["after_ts"] is None
+        assert second["after_ts"] == nodes[1]["timestamp"]
+        assert second["after_id"] == nodes[1]["entry_id"]
+
+
+# -----------------------------------------------------------------------------
+# Test: Checkpoints and Parallel Verification
+# -----------------------------------------------------------------------------
+
+
+class TestChainCheckpoints:
+    """Tests for checkpoints and segment-parallel chain verification."""
+
+    @staticmethod
+    async def _logger_with_entries(count: int, **config: object) -> object:
+        from daw_agents.mcp.audit import AuditConfig, AuditLogger
+
+        logger = AuditLogger(config=AuditConfig(**config))
+        for index in range(count):
+            await logger.log_tool_call(
+                agent_id="executor",
+                user_id="user_1",
+                tool_name="write_file",
+                action="execute",
+                parameters={"path": f"/tmp/{index}.txt", "tags": ["a", "é"]},
+                success=True,
+                response_time_ms=index,
+            )
+        return logger
+
+    @pytest.mark.asyncio
+    async def test_entry_hash_matches_canonical_json(self) -> None:
+        """compute_entry_hash should keep the hash of the canonical JSON form."""
+        import hashlib
+        import json
+
+        from daw_agents.mcp.audit import compute_entry_hash
+
+        logger = await self._logger_with_entries(2)
+        entry = (await logger.query_audit_trail())[1]
+        canonical = json.dumps(
+            {
+                "entry_id": entry.entry_id,
+                "timestamp": entry.timestamp.isoformat(),
+                "agent_id": entry.agent_id,
+                "user_id": entry.user_id,
+                "tool_name": entry.tool_name,
+                "action": entry.action,
+                "parameters": json.dumps(entry.parameters, sort_keys=True),
+                "result_status": entry.result_status.value,
+                "response_time_ms": entry.response_time_ms,
+                "previous_hash": entry.previous_hash or "",
+            },
+            sort_keys=True,
+        )
+
+        assert compute_entry_hash(entry) == hashlib.sha256(canonical.encode()).hexdigest()
+
+    def test_merkle_root(self) -> None:
+        """merkle_root should commit to every hash and their order."""
+        from daw_agents.mcp.audit import merkle_root
+
+        hashes = [f"{i:064x}" for i in range(5)]
+
+        assert merkle_root(hashes[:1]) == hashes[0]
+        assert merkle_root(hashes) != merkle_root(hashes[:4])
+        assert merkle_root(hashes) != merkle_root([hashes[1], hashes[0], *hashes[2:]])
+
+    @pytest.mark.asyncio
+    async def test_parallel_verification_finds_tampered_entry(self) -> None:
+        """verify_chain_parallel should report the first tampered entry."""
+        from daw_agents.mcp.audit import verify_chain_parallel
+
+        logger = await self._logger_with_entries(10)
+        entries = await logger.query_audit_trail()
+
+        assert verify_chain_parallel(entries, segment_size=3, max_workers=2).valid
+
+        entries[7] = entries[7].model_copy(update={"response_time_ms": 999})
+        result = verify_chain_parallel(entries, segment_size=3, max_workers=2)
+
+        assert not result.valid
+        assert result.failed_entry_id == entries[7].entry_id
+        assert result.reason == "hash mismatch"
+        assert result.entries_checked == 6
+
+    @pytest.mark.asyncio
+    async def test_logger_emits_signed_checkpoints(self) -> None:
+        """A checkpoint should be emitted and signed every checkpoint_interval entries."""
+        from daw_agents.mcp.audit import verify_checkpoint, verify_checkpoint_signature
+
+        logger = await self._logger_with_entries(
+            7, checkpoint_interval=3, checkpoint_key="audit-key"
+        )
+        entries = await logger.query_audit_trail()
+
+        assert [c.entry_count for c in logger.checkpoints] == [3, 3]
+        second = logger.checkpoints[1]
+        assert second.previous_hash == entries[2].entry_hash
+        assert verify_checkpoint(entries[3:6], second, key="audit-key")
+        assert not verify_checkpoint(entries[2:5], second, key="audit-key")
+        assert not verify_checkpoint_signature(second, "other-key")
+        forged = second.model_copy(update={"last_entry_hash": "0" * 64})
+        assert not verify_checkpoint_signature(forged, "audit-key")
+
+    @pytest.mark.asyncio
+    async def test_timestamps_strictly_increase(self) -> None:
+        """Entries should be timestamped in chain order without ties."""
+        logger = await self._logger_with_entries(50)
+        entries = await logger.query_audit_trail()
+
+        assert all(a.timestamp < b.timestamp for a, b in zip(entries, entries[1:]))
+
+    @pytest.mark.asyncio
+    async def test_verify_resumes_from_trusted_checkpoint(self) -> None:
+        """verify_audit_trail should only read entries after the checkpoint."""
+        from daw_agents.mcp.audit import sign_checkpoint
+
+        logger = await self._logger_with_entries(
+            8, checkpoint_interval=5, checkpoint_key="audit-key"
+        )
+        checkpoint = await logger.latest_checkpoint()
+        assert checkpoint is not None
+
+        result = await logger.verify_audit_trail(since=checkpoint, segment_size=2, max_workers=1)
+        untrusted = await logger.verify_audit_trail(
+            since=sign_checkpoint(checkpoint, "other-key"), max_workers=1
+        )
+
+        assert result.valid
+        assert result.entries_checked == 3
+        assert not untrusted.valid
+        assert untrusted.reason == "untrusted checkpoint"
+
+    @pytest.mark.asyncio
+    async def test_verify_starts_process_pool_only_for_second_segment(self) -> None:
+        """verify_audit_trail should verify a single segment without a process pool."""
+        from unittest.mock import patch
+
+        from daw_agents.mcp import audit
+
+        logger = await self._logger_with_entries(4)
+        pools = []
+
+        def process_pool(max_workers: int | None) -> ProcessPoolExecutor:
+            pool = original(max_workers)
+            pools.append(pool)
+            return pool
+
+        original = audit._process_pool
+        with patch.object(audit, "_process_pool", side_effect=process_pool):
+            single = await logger.verify_audit_trail(segment_size=10, max_workers=2)
+            assert pools == []
+            several = await logger.verify_audit_trail(segment_size=1, max_workers=2)
+
+        assert single.valid and several.valid
+        assert several.entries_checked == 4
+        assert len(pools) == 1
+        assert pools[0]._mp_context.get_start_method() != "fork"
+
+    @pytest.mark.asyncio
+    async def test_verify_streams_pages_from_neo4j(self) -> None:
+        """verify_audit_trail should read Neo4j page by page and detect breaks."""
+        from daw_agents.mcp.audit import AuditConfig, AuditLogger, entry_to_properties
+
+        source = await self._logger_with_entries(9)
+        nodes = [entry_to_properties(e) for e in await source.query_audit_trail()]
+
+        def page(cypher: str, params: dict) -> list[dict]:
+            after = (params["after_ts"], params["after_id"])
+            rows = [n for n in nodes if after[0] is None or (n["timestamp"], n["entry_id"]) > after]
+            return [{"n": n} for n in rows[: params["page_size"]]]
+
+        connector = MagicMock()
+        connector.query = AsyncMock(side_effect=page)
+        logger = AuditLogger(config=AuditConfig(), neo4j_connector=connector)
+
+        result = await logger.verify_audit_trail(segment_size=2, page_size=4, max_workers=1)
+
+        assert result.valid
+        assert result.entries_checked == 9
+        assert connector.query.await_count == 3
+
+        del nodes[4]
+        broken = await logger.verify_audit_trail(segment_size=2, page_size=4, max_workers=1)
+
+        assert not broken.valid
+        assert broken.reason == "chain broken"
+
+
 # -----------------------------------------------------------------------------
 # Test: Module Exports
 # -----------------------------------------------------------------------------
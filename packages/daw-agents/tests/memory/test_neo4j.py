@@ -6,7 +6,8 @@ These tests use mocking to avoid requiring a running Neo4j instance.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -129,6 +130,39 @@ class TestNeo4jConnectorOperations:
         assert element_id == "4:test:12345"
         mock_session.run.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_nodes_uses_single_statement(
+        self, connector: Neo4jConnector
+    ) -> None:
+        """Test that create_nodes writes every node with one UNWIND query."""
+        mock_driver = connector._driver  # type: ignore[attr-defined]
+        records = [{"i": 0, "id": "4:test:1"}, {"i": 1, "id": "4:test:2"}]
+
+        async def iterate() -> AsyncIterator[dict[str, Any]]:
+            for record in records:
+                yield record
+
+        mock_session = AsyncMock()
+        mock_session.run = AsyncMock(return_value=iterate())
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_driver.session = MagicMock(return_value=mock_session)
+
+        element_ids = await connector.create_nodes(
+            labels=["Summary"], properties_list=[{"n": 1}, {"n": 2}]
+        )
+
+        assert element_ids == ["4:test:1", "4:test:2"]
+        mock_session.run.assert_called_once()
+        cypher = mock_session.run.call_args.args[0]
+        assert "UNWIND" in cypher
+        assert mock_session.run.call_args.kwargs["rows"] == [{"n": 1}, {"n": 2}]
+
+    @pytest.mark.asyncio
+    async def test_create_nodes_empty(self, connector: Neo4jConnector) -> None:
+        """Test that create_nodes with no rows skips the database."""
+        assert await connector.create_nodes(["Summary"], []) == []
+
     @pytest.mark.asyncio
     async def test_create_relationship(self, connector: Neo4jConnector) -> None:
         """Test that create_relationship creates edge between nodes."""
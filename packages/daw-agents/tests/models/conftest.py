@@ -0,0 +1,48 @@
+"""Pytest configuration for model tests.
+
+Fixtures:
+- reset_driver_registries: (autouse) Clears the process-wide circuit
+  breakers and provider limiters before and after each test
+- model_configs: Builds a router config for every TaskType at a given
+  temperature (primary gpt-4o, gpt-4o-mini for validation and fallback)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from daw_agents.models.circuit_breaker import CircuitBreakerRegistry
+from daw_agents.models.drivers import DriverRegistry
+from daw_agents.models.providers import ModelConfig
+from daw_agents.models.router import TaskType
+
+ModelConfigFactory = Callable[[float], dict[TaskType, ModelConfig]]
+
+
+@pytest.fixture(autouse=True)
+def reset_driver_registries() -> Iterator[None]:
+    """Start and end every test with no breaker or limiter state."""
+    CircuitBreakerRegistry.clear()
+    DriverRegistry.clear_limiters()
+    yield
+    CircuitBreakerRegistry.clear()
+    DriverRegistry.clear_limiters()
+
+
+@pytest.fixture
+def model_configs() -> ModelConfigFactory:
+    """Return a factory for per-task ModelConfigs at the given temperature."""
+
+    def build(temperature: float) -> dict[TaskType, ModelConfig]:
+        return {
+            task_type: ModelConfig(
+                primary="gpt-4o" if task_type != TaskType.VALIDATION else "gpt-4o-mini",
+                fallback="gpt-4o-mini",
+                temperature=temperature,
+            )
+            for task_type in TaskType
+        }
+
+    return build
@@ -0,0 +1,207 @@
+"""
+Tests for the Model Router response cache.
+
+These tests verify:
+1. Canonical cache key generation (messages + ModelConfig)
+2. In-memory LRU eviction and TTL expiry
+3. Hit/miss counters
+4. Redis backend behaviour (including outage tolerance)
+5. ModelRouter integration (deterministic-only caching by default)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from daw_agents.models.cache import (
+    CacheStats,
+    InMemoryResponseCache,
+    RedisResponseCache,
+    make_cache_key,
+)
+from daw_agents.models.providers import ModelConfig
+from daw_agents.models.router import ModelRouter, TaskType
+
+
+def _completion(content: str) -> MagicMock:
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+
+class TestMakeCacheKey:
+    """Test canonical cache key generation."""
+
+    def test_same_request_same_key(self) -> None:
+        config = ModelConfig(primary="gpt-4o", fallback="gpt-4o-mini")
+        messages = [{"role": "user", "content": "Hello"}]
+        assert make_cache_key(messages, config) == make_cache_key(list(messages), config)
+
+    def test_key_ignores_surrounding_whitespace_and_role_case(self) -> None:
+        config = ModelConfig(primary="gpt-4o", fallback="gpt-4o-mini")
+        a = [{"role": "user", "content": "Hello"}]
+        b = [{"content": "  Hello\n", "role": "USER"}]
+        assert make_cache_key(a, config) == make_cache_key(b, config)
+
+    def test_key_changes_with_config(self) -> None:
+        messages = [{"role": "user", "content": "Hello"}]
+        a = ModelConfig(primary="gpt-4o", fallback="gpt-4o-mini", max_tokens=100)
+        b = ModelConfig(primary="gpt-4o", fallback="gpt-4o-mini", max_tokens=200)
+        assert make_cache_key(messages, a) != make_cache_key(messages, b)
+
+    def test_key_changes_with_content(self) -> None:
+        config = ModelConfig(primary="gpt-4o", fallback="gpt-4o-mini")
+        a = [{"role": "user", "content": "Hello"}]
+        b = [{"role": "user", "content": "Goodbye"}]
+        assert make_cache_key(a, config) != make_cache_key(b, config)
+
+
+class TestInMemoryResponseCache:
+    """Test the in-process LRU cache."""
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self) -> None:
+        cache = InMemoryResponseCache()
+        await cache.set("k", "v")
+        assert await cache.get("k") == "v"
+
+    @pytest.mark.asyncio
+    async def test_counts_hits_and_misses(self) -> None:
+        cache = InMemoryResponseCache()
+        await cache.get("missing")
+        await cache.set("k", "v")
+        await cache.get("k")
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        cache = InMemoryResponseCache(max_entries=2)
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")  # "b" is now least recently used
+        await cache.set("c", "3")
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "1"
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self) -> None:
+        cache = InMemoryResponseCache(ttl_seconds=10)
+        with patch("daw_agents.models.cache.time.monotonic", return_value=100.0):
+            await cache.set("k", "v")
+        with patch("daw_agents.models.cache.time.monotonic", return_value=111.0):
+            assert await cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_rejects_zero_capacity(self) -> None:
+        with pytest.raises(ValueError):
+            InMemoryResponseCache(max_entries=0)
+
+    def test_stats_to_dict(self) -> None:
+        stats = CacheStats(hits=3, misses=1)
+        assert stats.to_dict()["hit_rate"] == 0.75
+
+
+class TestRedisResponseCache:
+    """Test the Redis-backed cache."""
+
+    @pytest.mark.asyncio
+    async def test_uses_redis_ttl(self) -> None:
+        client = AsyncMock()
+        cache = RedisResponseCache(client=client, ttl_seconds=60)
+        await cache.set("k", "v")
+        client.set.assert_awaited_once_with("k", "v", ex=60)
+
+    @pytest.mark.asyncio
+    async def test_get_returns_stored_value(self) -> None:
+        client = AsyncMock()
+        client.get.return_value = "cached"
+        cache = RedisResponseCache(client=client)
+        assert await cache.get("k") == "cached"
+        assert cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self) -> None:
+        client = AsyncMock()
+        client.get.side_effect = ConnectionError("redis down")
+        cache = RedisResponseCache(client=client)
+        assert await cache.get("k") is None
+        assert cache.stats.misses == 1
+        assert cache.stats.errors == 1
+
+
+class TestRouterCaching:
+    """Test ModelRouter integration with the response cache."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_request_served_from_cache(self, model_configs: Any) -> None:
+        cache = InMemoryResponseCache()
+        router = ModelRouter(configs=model_configs(temperature=0.0), cache=cache)
+        messages = [{"role": "user", "content": "Summarize"}]
+
+        with patch("daw_agents.models.router.acompletion") as mock_completion:
+            mock_completion.return_value = _completion("Summary")
+            first = await router.route(TaskType.FAST, messages)
+            second = await router.route(TaskType.FAST, messages)
+
+        assert first == second == "Summary"
+        assert mock_completion.call_count == 1
+        assert router.cache_stats is not None
+        assert router.cache_stats.hits == 1
+        assert router.cache_stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_sampled_request_not_cached_by_default(self, model_configs: Any) -> None:
+        cache = InMemoryResponseCache()
+        router = ModelRouter(configs=model_configs(temperature=0.7), cache=cache)
+        messages = [{"role": "user", "content": "Brainstorm"}]
+
+        with patch("daw_agents.models.router.acompletion") as mock_completion:
+            mock_completion.return_value = _completion("Idea")
+            await router.route(TaskType.FAST, messages)
+            await router.route(TaskType.FAST, messages)
+
+        assert mock_completion.call_count == 2
+        assert cache.stats.lookups == 0
+
+    @pytest.mark.asyncio
+    async def test_sampled_request_cached_when_allowed(self, model_configs: Any) -> None:
+        router = ModelRouter(
+            configs=model_configs(temperature=0.7),
+            cache=InMemoryResponseCache(),
+            cache_nondeterministic=True,
+        )
+        messages = [{"role": "user", "content": "Brainstorm"}]
+
+        with patch("daw_agents.models.router.acompletion") as mock_completion:
+            mock_completion.return_value = _completion("Idea")
+            await router.route(TaskType.FAST, messages)
+            await router.route(TaskType.FAST, messages)
+
+        assert mock_completion.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, model_configs: Any) -> None:
+        cache = InMemoryResponseCache()
+        router = ModelRouter(configs=model_configs(temperature=0.0), cache=cache)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        with patch("daw_agents.models.router.acompletion") as mock_completion:
+            mock_completion.side_effect = Exception("unavailable")
+            with pytest.raises(Exception, match="unavailable"):
+                await router.route(TaskType.FAST, messages)
+
+        assert len(cache) == 0
+
+    def test_cache_stats_none_without_cache(self) -> None:
+        assert ModelRouter().cache_stats is None
+
+    def test_cache_stats_for_empty_cache(self) -> None:
+        router = ModelRouter(cache=InMemoryResponseCache())
+
+        assert router.cache_stats is not None
+        assert router.cache_stats.hits == 0
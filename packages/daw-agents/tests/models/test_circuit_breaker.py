@@ -0,0 +1,333 @@
+"""
+Tests for circuit breaking and hedged failover in DriverWithFallback.
+
+These tests verify:
+1. Breaker state transitions (closed -> open -> half-open -> closed)
+2. Error-rate and p95-latency tripping over a rolling window
+3. Process-wide sharing of breakers
+4. DriverWithFallback skipping an open primary
+5. Hedged requests: first response wins, loser is cancelled
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from daw_agents.models.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from daw_agents.models.drivers import (
+    CompletionResponse,
+    DriverType,
+    DriverWithFallback,
+    StreamChunk,
+)
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def _driver(driver_type: DriverType, complete: Any) -> MagicMock:
+    driver = MagicMock()
+    driver.driver_type = driver_type
+    driver.complete = complete
+    return driver
+
+
+class TestCircuitBreaker:
+    """Test breaker state machine."""
+
+    def test_starts_closed(self) -> None:
+        breaker = CircuitBreaker("test")
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_trips_on_error_rate(self) -> None:
+        breaker = CircuitBreaker("test", CircuitBreakerConfig(min_calls=4))
+        for _ in range(2):
+            breaker.record_success(0.1)
+        for _ in range(2):
+            breaker.record_failure(0.1)
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_does_not_trip_below_min_calls(self) -> None:
+        breaker = CircuitBreaker("test", CircuitBreakerConfig(min_calls=10))
+        for _ in range(5):
+            breaker.record_failure(0.1)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_trips_on_p95_latency(self) -> None:
+        config = CircuitBreakerConfig(min_calls=5, p95_latency_threshold=2.0)
+        breaker = CircuitBreaker("test", config)
+        for _ in range(5):
+            breaker.record_success(3.0)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_after_cooldown_then_closes(self) -> None:
+        config = CircuitBreakerConfig(min_calls=1, open_seconds=30)
+        with patch("daw_agents.models.circuit_breaker.time.monotonic", return_value=0.0):
+            breaker = CircuitBreaker("test", config)
+            breaker.record_failure(0.1)
+            assert breaker.state == CircuitState.OPEN
+
+        with patch("daw_agents.models.circuit_breaker.time.monotonic", return_value=31.0):
+            assert breaker.state == CircuitState.HALF_OPEN
+            assert breaker.allow_request()
+            assert not breaker.allow_request()  # only one probe
+            breaker.record_success(0.1)
+            assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self) -> None:
+        config = CircuitBreakerConfig(min_calls=1, open_seconds=30)
+        with patch("daw_agents.models.circuit_breaker.time.monotonic", return_value=0.0):
+            breaker = CircuitBreaker("test", config)
+            breaker.record_failure(0.1)
+        with patch("daw_agents.models.circuit_breaker.time.monotonic", return_value=31.0):
+            assert breaker.allow_request()
+            breaker.record_failure(0.1)
+            assert breaker.state == CircuitState.OPEN
+
+    def test_released_probe_frees_slot_without_changing_state(self) -> None:
+        config = CircuitBreakerConfig(min_calls=1, open_seconds=0)
+        breaker = CircuitBreaker("test", config)
+        breaker.record_failure(0.1)
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.release_probe()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+
+    def test_old_samples_leave_window(self) -> None:
+        config = CircuitBreakerConfig(window_seconds=10, min_calls=1)
+        with patch("daw_agents.models.circuit_breaker.time.monotonic", return_value=0.0):
+            breaker = CircuitBreaker("test", config)
+            breaker._samples.append((0.0, False, 0.1))
+        with patch("daw_agents.models.circuit_breaker.time.monotonic", return_value=20.0):
+            assert breaker.error_rate() == 0.0
+
+    def test_p95_latency(self) -> None:
+        breaker = CircuitBreaker("test", CircuitBreakerConfig(min_calls=1000))
+        for latency in range(1, 101):
+            breaker.record_success(float(latency))
+        assert breaker.p95_latency() == 95.0
+
+
+class TestCircuitBreakerRegistry:
+    """Test process-wide breaker sharing."""
+
+    def test_same_key_same_breaker(self) -> None:
+        assert CircuitBreakerRegistry.get("claude", "m") is CircuitBreakerRegistry.get(
+            "claude", "m"
+        )
+        assert CircuitBreakerRegistry.get("claude", "m") is not (
+            CircuitBreakerRegistry.get("claude", "other")
+        )
+
+    def test_configure_applies_to_new_breakers(self) -> None:
+        CircuitBreakerRegistry.configure(CircuitBreakerConfig(min_calls=3))
+        assert CircuitBreakerRegistry.get("openai", "gpt-4o").config.min_calls == 3
+
+    def test_snapshot(self) -> None:
+        CircuitBreakerRegistry.get("claude", "m").record_success(0.2)
+        snapshot = CircuitBreakerRegistry.snapshot()
+        assert snapshot[0]["name"] == "claude:m"
+        assert snapshot[0]["state"] == "closed"
+
+
+class TestDriverWithFallbackBreaker:
+    """Test DriverWithFallback integration with circuit breakers."""
+
+    @pytest.mark.asyncio
+    async def test_open_primary_is_skipped(self) -> None:
+        CircuitBreakerRegistry.configure(CircuitBreakerConfig(min_calls=2))
+        primary_complete = AsyncMock(side_effect=Exception("primary down"))
+        primary = _driver(DriverType.CLAUDE, primary_complete)
+        fallback = _driver(
+            DriverType.OPENAI,
+            AsyncMock(return_value=CompletionResponse(content="fb", model="gpt-4o")),
+        )
+        driver = DriverWithFallback(primary=primary, fallback=fallback)
+
+        for _ in range(2):
+            assert (await driver.complete(messages=MESSAGES, model="m")).content == "fb"
+        assert primary_complete.await_count == 2
+        assert CircuitBreakerRegistry.get("claude", "m").state == CircuitState.OPEN
+
+        await driver.complete(messages=MESSAGES, model="m")
+        assert primary_complete.await_count == 2  # skipped while open
+
+    @pytest.mark.asyncio
+    async def test_breaker_state_shared_across_wrappers(self) -> None:
+        CircuitBreakerRegistry.get("claude", "m")._trip("test")
+        primary_complete = AsyncMock()
+        fallback = _driver(
+            DriverType.OPENAI,
+            AsyncMock(return_value=CompletionResponse(content="fb", model="gpt-4o")),
+        )
+        driver = DriverWithFallback(
+            primary=_driver(DriverType.CLAUDE, primary_complete), fallback=fallback
+        )
+        await driver.complete(messages=MESSAGES, model="m")
+        primary_complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_breaker_can_be_disabled(self) -> None:
+        CircuitBreakerRegistry.get("claude", "m")._trip("test")
+        primary_complete = AsyncMock(
+            return_value=CompletionResponse(content="p", model="m")
+        )
+        driver = DriverWithFallback(
+            primary=_driver(DriverType.CLAUDE, primary_complete),
+            fallback=MagicMock(),
+            use_circuit_breaker=False,
+        )
+        assert (await driver.complete(messages=MESSAGES, model="m")).content == "p"
+
+
+class TestHedgedRequests:
+    """Test latency-aware hedged failover."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_does_not_hedge(self) -> None:
+        fallback_complete = AsyncMock()
+        driver = DriverWithFallback(
+            primary=_driver(
+                DriverType.CLAUDE,
+                AsyncMock(return_value=CompletionResponse(content="p", model="m")),
+            ),
+            fallback=_driver(DriverType.OPENAI, fallback_complete),
+            hedge_after=1.0,
+        )
+        assert (await driver.complete(messages=MESSAGES, model="m")).content == "p"
+        fallback_complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_fallback(self) -> None:
+        primary_cancelled = asyncio.Event()
+
+        async def slow_primary(**kwargs: Any) -> CompletionResponse:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+            return CompletionResponse(content="p", model="m")
+
+        driver = DriverWithFallback(
+            primary=_driver(DriverType.CLAUDE, slow_primary),
+            fallback=_driver(
+                DriverType.OPENAI,
+                AsyncMock(return_value=CompletionResponse(content="fb", model="f")),
+            ),
+            hedge_after=0.01,
+        )
+        response = await driver.complete(messages=MESSAGES, model="m")
+        await asyncio.sleep(0)
+
+        assert response.content == "fb"
+        assert primary_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_half_open_probe_is_released(self) -> None:
+        breaker = CircuitBreakerRegistry.get(DriverType.CLAUDE.value, "m")
+        breaker.config = CircuitBreakerConfig(min_calls=1, open_seconds=0)
+        breaker.record_failure(0.1)
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        async def slow_primary(**kwargs: Any) -> CompletionResponse:
+            await asyncio.sleep(10)
+            return CompletionResponse(content="p", model="m")
+
+        driver = DriverWithFallback(
+            primary=_driver(DriverType.CLAUDE, slow_primary),
+            fallback=_driver(
+                DriverType.OPENAI,
+                AsyncMock(return_value=CompletionResponse(content="fb", model="f")),
+            ),
+            hedge_after=0.01,
+        )
+        response = await driver.complete(messages=MESSAGES, model="m")
+        await asyncio.sleep(0)
+
+        assert response.content == "fb"
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_early_releases_half_open_probe(self) -> None:
+        breaker = CircuitBreakerRegistry.get(DriverType.CLAUDE.value, "m")
+        breaker.config = CircuitBreakerConfig(min_calls=1, open_seconds=0)
+        breaker.record_failure(0.1)
+
+        async def stream(**kwargs: Any) -> AsyncIterator[StreamChunk]:
+            for piece in ["a", "b", "c"]:
+                yield StreamChunk(content=piece)
+
+        primary = _driver(DriverType.CLAUDE, AsyncMock())
+        primary.stream = stream
+        driver = DriverWithFallback(
+            primary=primary, fallback=_driver(DriverType.OPENAI, AsyncMock())
+        )
+        chunks = driver.stream(messages=MESSAGES, model="m")
+        assert (await anext(chunks)).content == "a"
+        await chunks.aclose()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+
+    @pytest.mark.asyncio
+    async def test_hedged_primary_can_still_win(self) -> None:
+        async def primary(**kwargs: Any) -> CompletionResponse:
+            await asyncio.sleep(0.02)
+            return CompletionResponse(content="p", model="m")
+
+        async def fallback(**kwargs: Any) -> CompletionResponse:
+            await asyncio.sleep(1)
+            return CompletionResponse(content="fb", model="f")
+
+        driver = DriverWithFallback(
+            primary=_driver(DriverType.CLAUDE, primary),
+            fallback=_driver(DriverType.OPENAI, fallback),
+            hedge_after=0.01,
+        )
+        assert (await driver.complete(messages=MESSAGES, model="m")).content == "p"
+
+    @pytest.mark.asyncio
+    async def test_hedged_failure_of_both_raises_primary_error(self) -> None:
+        async def primary(**kwargs: Any) -> CompletionResponse:
+            await asyncio.sleep(0.02)
+            raise RuntimeError("primary failed")
+
+        driver = DriverWithFallback(
+            primary=_driver(DriverType.CLAUDE, primary),
+            fallback=_driver(
+                DriverType.OPENAI, AsyncMock(side_effect=RuntimeError("fallback failed"))
+            ),
+            hedge_after=0.01,
+        )
+        with pytest.raises(RuntimeError, match="primary failed"):
+            await driver.complete(messages=MESSAGES, model="m")
+
+    @pytest.mark.asyncio
+    async def test_quick_primary_failure_falls_back_normally(self) -> None:
+        driver = DriverWithFallback(
+            primary=_driver(
+                DriverType.CLAUDE, AsyncMock(side_effect=RuntimeError("boom"))
+            ),
+            fallback=_driver(
+                DriverType.OPENAI,
+                AsyncMock(return_value=CompletionResponse(content="fb", model="f")),
+            ),
+            hedge_after=1.0,
+        )
+        assert (await driver.complete(messages=MESSAGES, model="m")).content == "fb"
@@ -0,0 +1,209 @@
+"""
+Tests for the shared HTTP client pool used by model drivers.
+
+These tests verify:
+1. Pool configuration from environment
+2. One shared client per provider and event loop, recreated after close
+3. Pre-warming only configured providers and tolerating failures
+4. Drivers receive pooled clients; shutdown releases them
+5. ModelRouter reuses its DriverWithFallback per task type
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from daw_agents.models.client_pool import ClientPool, ClientPoolConfig
+from daw_agents.models.drivers import DriverRegistry, LocalDriver, OpenAIDriver
+from daw_agents.models.providers import ModelConfig
+from daw_agents.models.router import ModelRouter, TaskType
+
+
+class TestClientPoolConfig:
+    """Test pool configuration."""
+
+    def test_defaults(self) -> None:
+        config = ClientPoolConfig()
+        assert config.max_connections == 100
+        assert config.max_keepalive_connections == 20
+
+    def test_from_env(self) -> None:
+        env = {
+            "DAW_HTTP_MAX_CONNECTIONS": "10",
+            "DAW_HTTP_MAX_KEEPALIVE": "5",
+            "DAW_HTTP_KEEPALIVE_EXPIRY": "15",
+            "DAW_HTTP2": "false",
+        }
+        with patch.dict(os.environ, env):
+            config = ClientPoolConfig.from_env()
+        assert config.max_connections == 10
+        assert config.max_keepalive_connections == 5
+        assert config.keepalive_expiry == 15.0
+        assert config.http2 is False
+
+
+class TestClientPool:
+    """Test pooled client management."""
+
+    @pytest.mark.asyncio
+    async def test_client_shared_per_provider(self) -> None:
+        pool = ClientPool(ClientPoolConfig(http2=False))
+        try:
+            assert pool.get_http_client("openai") is pool.get_http_client("openai")
+            assert pool.get_http_client("openai") is not pool.get_http_client("local")
+            assert len(pool) == 2
+        finally:
+            await pool.aclose()
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_recreated(self) -> None:
+        pool = ClientPool(ClientPoolConfig(http2=False))
+        client = pool.get_http_client("openai")
+        await client.aclose()
+        replacement = pool.get_http_client("openai")
+        assert replacement is not client
+        await pool.aclose()
+
+    def test_each_event_loop_gets_its_own_client(self) -> None:
+        pool = ClientPool(ClientPoolConfig(http2=False))
+
+        async def use() -> Any:
+            client = pool.get_http_client("openai")
+            assert pool.get_http_client("openai") is client
+            await pool.aclose()
+            return client
+
+        first = asyncio.run(use())
+        second = asyncio.run(use())
+
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+    def test_http2_requires_h2(self) -> None:
+        pool = ClientPool(ClientPoolConfig(http2=True))
+        with patch("daw_agents.models.client_pool.importlib.util.find_spec", return_value=None):
+            assert pool.http2_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_prewarm_only_configured_providers(self) -> None:
+        pool = ClientPool(ClientPoolConfig(http2=False))
+        client = MagicMock()
+        client.head = AsyncMock()
+        env = {"OPENAI_API_KEY": "sk-test"}
+        with (
+            patch.dict(os.environ, env, clear=True),
+            patch.object(pool, "get_http_client", return_value=client),
+        ):
+            result = await pool.prewarm()
+
+        assert result == {"openai": True}
+        client.head.assert_awaited_once_with("https://api.openai.com")
+
+    @pytest.mark.asyncio
+    async def test_prewarm_tolerates_failures(self) -> None:
+        pool = ClientPool(ClientPoolConfig(http2=False))
+        client = MagicMock()
+        client.head = AsyncMock(side_effect=ConnectionError("offline"))
+        with patch.object(pool, "get_http_client", return_value=client):
+            result = await pool.prewarm({"local": "http://localhost:11434"})
+        assert result == {"local": False}
+
+
+class TestDriverIntegration:
+    """Test drivers use pooled clients."""
+
+    def test_openai_driver_passes_pooled_client(self) -> None:
+        pool = MagicMock()
+        fake_openai = MagicMock()
+        with (
+            patch("daw_agents.models.drivers.get_client_pool", return_value=pool),
+            patch.dict(sys.modules, {"openai": fake_openai}),
+        ):
+            OpenAIDriver(api_key="k")._get_client()
+
+        pool.get_http_client.assert_called_once_with("openai")
+        kwargs = fake_openai.AsyncOpenAI.call_args.kwargs
+        assert kwargs["http_client"] is pool.get_http_client.return_value
+
+    def test_local_driver_passes_pooled_client(self) -> None:
+        pool = MagicMock()
+        fake_openai = MagicMock()
+        with (
+            patch("daw_agents.models.drivers.get_client_pool", return_value=pool),
+            patch.dict(sys.modules, {"openai": fake_openai}),
+        ):
+            LocalDriver()._get_client()
+        pool.get_http_client.assert_called_once_with("local")
+
+    def test_driver_rebuilds_sdk_client_when_pooled_client_changes(self) -> None:
+        pool = MagicMock()
+        pool.get_http_client.side_effect = [MagicMock(), MagicMock(), MagicMock()]
+        fake_openai = MagicMock()
+        fake_openai.AsyncOpenAI.side_effect = lambda **kwargs: MagicMock()
+        driver = OpenAIDriver(api_key="k")
+        with (
+            patch("daw_agents.models.drivers.get_client_pool", return_value=pool),
+            patch.dict(sys.modules, {"openai": fake_openai}),
+        ):
+            first = driver._get_client()
+            second = driver._get_client()
+
+        assert first is not second
+        assert fake_openai.AsyncOpenAI.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_registry_shutdown_closes_pool_and_clears_drivers(self) -> None:
+        pool = MagicMock()
+        pool.aclose = AsyncMock()
+        DriverRegistry.get_driver("local")
+        with patch("daw_agents.models.drivers.get_client_pool", return_value=pool):
+            await DriverRegistry.shutdown()
+        pool.aclose.assert_awaited_once()
+        assert DriverRegistry._instances == {}
+
+
+class TestRouterDriverReuse:
+    """Test ModelRouter reuses DriverWithFallback instances."""
+
+    @pytest.mark.asyncio
+    async def test_fallback_driver_built_once_per_task_type(self) -> None:
+        configs = {
+            task_type: ModelConfig(primary=f"{task_type.value}-m", fallback="fb")
+            for task_type in TaskType
+        }
+        router = ModelRouter(configs=configs, use_drivers=True)
+        built: list[str] = []
+
+        def get_driver(model: str) -> Any:
+            built.append(model)
+            return MagicMock()
+
+        with patch.object(router, "_get_driver_for_model", side_effect=get_driver):
+            first = router._build_fallback_driver(TaskType.CODING, configs[TaskType.CODING])
+            second = router._build_fallback_driver(TaskType.CODING, configs[TaskType.CODING])
+            router._build_fallback_driver(TaskType.FAST, configs[TaskType.FAST])
+
+        assert first is second
+        assert built == ["coding-m", "fb", "fast-m", "fb"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_drivers_rebuilt_after_registry_shutdown(self) -> None:
+        config = ModelConfig(primary="coding-m", fallback="fb")
+        router = ModelRouter(use_drivers=True)
+        pool = MagicMock()
+        pool.aclose = AsyncMock()
+
+        with patch.object(router, "_get_driver_for_model", side_effect=lambda m: MagicMock()):
+            first = router._build_fallback_driver(TaskType.CODING, config)
+            with patch("daw_agents.models.drivers.get_client_pool", return_value=pool):
+                await DriverRegistry.shutdown()
+            second = router._build_fallback_driver(TaskType.CODING, config)
+
+        assert first is not second
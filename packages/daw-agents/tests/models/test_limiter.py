@@ -0,0 +1,254 @@
+"""
+Tests for per-provider admission control.
+
+These tests verify:
+1. TokenBucket refill and wait-time calculation
+2. Concurrency limits and priority-ordered admission
+3. RPM/TPM budgets and usage reconciliation
+4. Queue-wait metrics
+5. DriverRegistry sharing and DriverWithFallback integration
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from daw_agents.models.drivers import (
+    CompletionResponse,
+    DriverRegistry,
+    DriverType,
+    DriverWithFallback,
+)
+from daw_agents.models.limiter import (
+    LimiterConfig,
+    ProviderLimiter,
+    TokenBucket,
+    estimate_tokens,
+)
+from daw_agents.models.router import TASK_PRIORITIES, TaskType
+
+
+class TestTokenBucket:
+    """Test the token bucket primitive."""
+
+    def test_starts_full(self) -> None:
+        bucket = TokenBucket(per_minute=60)
+        assert bucket.wait_time(60) == 0.0
+
+    def test_wait_time_after_consume(self) -> None:
+        with patch("daw_agents.models.limiter.time.monotonic", return_value=0.0):
+            bucket = TokenBucket(per_minute=60)  # 1 token per second
+            bucket.consume(60)
+            assert bucket.wait_time(2) == pytest.approx(2.0)
+
+    def test_refills_over_time(self) -> None:
+        with patch("daw_agents.models.limiter.time.monotonic", return_value=0.0):
+            bucket = TokenBucket(per_minute=60)
+            bucket.consume(60)
+        with patch("daw_agents.models.limiter.time.monotonic", return_value=10.0):
+            assert bucket.available == pytest.approx(10.0)
+
+    def test_oversized_request_waits_for_full_bucket(self) -> None:
+        bucket = TokenBucket(per_minute=60)
+        assert bucket.wait_time(1000) == 0.0
+
+    def test_rejects_non_positive_rate(self) -> None:
+        with pytest.raises(ValueError):
+            TokenBucket(per_minute=0)
+
+
+class TestLimiterConfig:
+    """Test limiter configuration."""
+
+    def test_from_env(self) -> None:
+        env = {"DAW_CLAUDE_MAX_CONCURRENCY": "3", "DAW_CLAUDE_RPM": "50"}
+        with patch.dict(os.environ, env):
+            config = LimiterConfig.from_env("claude")
+        assert config.max_concurrency == 3
+        assert config.requests_per_minute == 50
+        assert config.tokens_per_minute is None
+
+    def test_rejects_zero_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            LimiterConfig(max_concurrency=0)
+
+
+class TestProviderLimiter:
+    """Test admission control behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self) -> None:
+        limiter = ProviderLimiter(LimiterConfig(max_concurrency=2))
+        running = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal running, peak
+            async with limiter.acquire():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert limiter.stats.admitted == 6
+        assert limiter.stats.queued == 4
+        assert limiter.active == 0
+
+    @pytest.mark.asyncio
+    async def test_admits_by_priority(self) -> None:
+        limiter = ProviderLimiter(LimiterConfig(max_concurrency=1))
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def holder() -> None:
+            async with limiter.acquire():
+                await gate.wait()
+
+        async def call(name: str, priority: int) -> None:
+            async with limiter.acquire(priority=priority):
+                order.append(name)
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(call("fast", TASK_PRIORITIES[TaskType.FAST])),
+            asyncio.create_task(call("coding", TASK_PRIORITIES[TaskType.CODING])),
+            asyncio.create_task(
+                call("validation", TASK_PRIORITIES[TaskType.VALIDATION])
+            ),
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, *tasks)
+
+        assert order == ["validation", "coding", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_rpm_budget_delays_admission(self) -> None:
+        # 600 RPM = 10 requests/second with a bucket of 600
+        limiter = ProviderLimiter(LimiterConfig(requests_per_minute=600))
+        assert limiter._rpm is not None
+        limiter._rpm.consume(limiter._rpm.capacity)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with limiter.acquire():
+            pass
+        assert loop.time() - start >= 0.05
+        assert limiter.stats.max_wait_seconds > 0
+
+    @pytest.mark.asyncio
+    async def test_tpm_usage_is_reconciled(self) -> None:
+        limiter = ProviderLimiter(LimiterConfig(tokens_per_minute=10_000))
+        assert limiter._tpm is not None
+
+        async with limiter.acquire(tokens=5_000) as lease:
+            lease.record_usage({"input_tokens": 800, "output_tokens": 200})
+
+        assert limiter._tpm.available == pytest.approx(9_000, abs=5)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        limiter = ProviderLimiter(LimiterConfig(max_concurrency=1))
+        gate = asyncio.Event()
+
+        async def holder() -> None:
+            async with limiter.acquire():
+                await gate.wait()
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+
+        async def waiter() -> None:
+            async with limiter.acquire():
+                pass
+
+        waiting = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+        waiting.cancel()
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 0
+
+        gate.set()
+        await first
+        assert limiter.active == 0
+        assert limiter.stats.cancelled == 1
+
+    def test_stats_to_dict(self) -> None:
+        limiter = ProviderLimiter()
+        limiter.stats.record(priority=0, wait=0.5)
+        data = limiter.stats.to_dict()
+        assert data["admitted"] == 1
+        assert data["average_wait_seconds"] == 0.5
+        assert data["wait_by_priority"] == {0: 0.5}
+
+
+class TestEstimateTokens:
+    """Test TPM token estimation."""
+
+    def test_includes_prompt_and_completion_budget(self) -> None:
+        messages = [{"role": "user", "content": "x" * 400}]
+        assert estimate_tokens(messages, max_tokens=1000) == 1100
+
+
+class TestRegistryIntegration:
+    """Test DriverRegistry limiter sharing and DriverWithFallback admission."""
+
+    def test_limiter_shared_per_driver_type(self) -> None:
+        assert DriverRegistry.get_limiter(DriverType.CLAUDE) is DriverRegistry.get_limiter(
+            "claude"
+        )
+        assert DriverRegistry.get_limiter("claude") is not DriverRegistry.get_limiter(
+            "openai"
+        )
+
+    def test_configure_limiter(self) -> None:
+        limiter = DriverRegistry.configure_limiter(
+            DriverType.OPENAI, LimiterConfig(max_concurrency=1)
+        )
+        assert DriverRegistry.get_limiter(DriverType.OPENAI) is limiter
+        assert limiter.config.max_concurrency == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_driver_calls_pass_through_limiter(self) -> None:
+        limiter = DriverRegistry.configure_limiter(
+            DriverType.CLAUDE, LimiterConfig(max_concurrency=1)
+        )
+        primary = MagicMock()
+        primary.driver_type = DriverType.CLAUDE
+        primary.complete = AsyncMock(
+            return_value=CompletionResponse(content="ok", model="claude-3-5-sonnet")
+        )
+        fallback = MagicMock()
+        fallback.driver_type = DriverType.OPENAI
+
+        driver = DriverWithFallback(primary=primary, fallback=fallback, priority=0)
+        await asyncio.gather(
+            *(
+                driver.complete(messages=[{"role": "user", "content": "hi"}], model="m")
+                for _ in range(3)
+            )
+        )
+
+        assert limiter.stats.admitted == 3
+        assert limiter.stats.admitted_by_priority == {0: 3}
+
+    @pytest.mark.asyncio
+    async def test_limiter_can_be_disabled(self) -> None:
+        primary = MagicMock()
+        primary.driver_type = DriverType.CLAUDE
+        primary.complete = AsyncMock(
+            return_value=CompletionResponse(content="ok", model="claude-3-5-sonnet")
+        )
+        driver = DriverWithFallback(
+            primary=primary, fallback=MagicMock(), use_limiter=False
+        )
+        await driver.complete(messages=[], model="m")
+        assert DriverRegistry.get_limiter(DriverType.CLAUDE).stats.admitted == 0
@@ -0,0 +1,188 @@
+"""
+Tests for request coalescing (single-flight) in the Model Router.
+
+These tests verify:
+1. Concurrent calls with the same key share one execution
+2. Errors propagate to every waiter
+3. Cancelling one waiter does not cancel the shared call
+4. ModelRouter coalesces identical requests on both LiteLLM and driver paths
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from daw_agents.models.drivers import CompletionResponse
+from daw_agents.models.router import ModelRouter, TaskType
+from daw_agents.models.singleflight import SingleFlight, get_single_flight
+
+
+class TestSingleFlight:
+    """Test the SingleFlight primitive."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+
+        async def work() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+        assert results == ["done"] * 5
+        assert calls == 1
+        assert flight.stats.executed == 1
+        assert flight.stats.coalesced == 4
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self) -> None:
+        flight = SingleFlight()
+
+        async def work() -> int:
+            await asyncio.sleep(0)
+            return 1
+
+        await asyncio.gather(flight.do("a", work), flight.do("b", work))
+        assert flight.stats.executed == 2
+        assert flight.stats.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self) -> None:
+        flight = SingleFlight()
+
+        async def work() -> int:
+            return 1
+
+        await flight.do("k", work)
+        await flight.do("k", work)
+        assert flight.stats.executed == 2
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_waiters(self) -> None:
+        flight = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            flight.do("k", work), flight.do("k", work), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self) -> None:
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    def test_default_instance_is_shared(self) -> None:
+        assert get_single_flight() is get_single_flight()
+
+
+class TestRouterCoalescing:
+    """Test ModelRouter request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_litellm_path_coalesces_identical_requests(self, model_configs: Any) -> None:
+        flight = SingleFlight()
+        router = ModelRouter(configs=model_configs(0.0), single_flight=flight)
+        messages = [{"role": "user", "content": "Validate this"}]
+
+        async def slow_completion(**kwargs: Any) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return MagicMock(choices=[MagicMock(message=MagicMock(content="ok"))])
+
+        with patch(
+            "daw_agents.models.router.acompletion", side_effect=slow_completion
+        ) as mock_completion:
+            results = await asyncio.gather(
+                *(router.route(TaskType.VALIDATION, messages) for _ in range(3))
+            )
+
+        assert results == ["ok", "ok", "ok"]
+        assert mock_completion.call_count == 1
+        assert router.coalesce_stats.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_driver_path_coalesces_identical_requests(self, model_configs: Any) -> None:
+        flight = SingleFlight()
+        router = ModelRouter(
+            configs=model_configs(0.0), use_drivers=True, single_flight=flight
+        )
+        messages = [{"role": "user", "content": "Critique"}]
+        calls = 0
+
+        async def complete(**kwargs: Any) -> CompletionResponse:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return CompletionResponse(content="critique", model="gpt-4o")
+
+        driver = MagicMock()
+        driver.complete = complete
+        with patch.object(router, "_get_driver_for_model", return_value=driver):
+            results = await asyncio.gather(
+                *(router.route(TaskType.CODING, messages) for _ in range(4))
+            )
+
+        assert results == ["critique"] * 4
+        assert calls == 1
+        assert flight.stats.coalesced == 3
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_are_not_coalesced(self, model_configs: Any) -> None:
+        flight = SingleFlight()
+        router = ModelRouter(configs=model_configs(0.7), single_flight=flight)
+        messages = [{"role": "user", "content": "Brainstorm"}]
+
+        with patch("daw_agents.models.router.acompletion") as mock_completion:
+            mock_completion.return_value = MagicMock(
+                choices=[MagicMock(message=MagicMock(content="idea"))]
+            )
+            await asyncio.gather(
+                *(router.route(TaskType.FAST, messages) for _ in range(3))
+            )
+
+        assert mock_completion.call_count == 3
+        assert flight.stats.executed == 0
+
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self, model_configs: Any) -> None:
+        flight = SingleFlight()
+        router = ModelRouter(
+            configs=model_configs(0.0), coalesce=False, single_flight=flight
+        )
+        messages = [{"role": "user", "content": "Hello"}]
+
+        with patch("daw_agents.models.router.acompletion") as mock_completion:
+            mock_completion.return_value = MagicMock(
+                choices=[MagicMock(message=MagicMock(content="hi"))]
+            )
+            await asyncio.gather(
+                *(router.route(TaskType.FAST, messages) for _ in range(2))
+            )
+
+        assert mock_completion.call_count == 2
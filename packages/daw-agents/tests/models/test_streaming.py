@@ -0,0 +1,198 @@
+"""
+Tests for ModelRouter.route_stream and streaming metrics.
+
+These tests verify:
+1. Chunks are streamed through both the driver and LiteLLM paths
+2. Fallback when the primary fails before or during a stream
+3. Time-to-first-token and tokens/second recorded per model
+4. Cache replay of streamed responses
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from daw_agents.models.cache import InMemoryResponseCache
+from daw_agents.models.drivers import STREAM_RESTART, DriverType, StreamChunk
+from daw_agents.models.metrics import ModelMetrics, StreamStats
+from daw_agents.models.router import ModelRouter, TaskType
+
+MESSAGES = [{"role": "user", "content": "Write a function"}]
+
+
+def _stream_driver(
+    driver_type: DriverType, pieces: list[str], fail_after: int | None = None
+) -> MagicMock:
+    async def stream(**kwargs: Any) -> AsyncIterator[StreamChunk]:
+        for index, piece in enumerate(pieces):
+            if fail_after is not None and index == fail_after:
+                raise RuntimeError("stream broke")
+            yield StreamChunk(content=piece)
+        yield StreamChunk(content="", finish_reason="stop")
+
+    driver = MagicMock()
+    driver.driver_type = driver_type
+    driver.stream = stream
+    return driver
+
+
+def _litellm_stream(pieces: list[str], fail: bool = False) -> Any:
+    async def generator() -> AsyncIterator[MagicMock]:
+        if fail:
+            raise RuntimeError("litellm stream broke")
+        for piece in pieces:
+            choice = MagicMock()
+            choice.delta.content = piece
+            choice.finish_reason = None
+            yield MagicMock(choices=[choice])
+        done = MagicMock()
+        done.delta.content = None
+        done.finish_reason = "stop"
+        yield MagicMock(choices=[done])
+
+    return generator()
+
+
+async def _collect(chunks: AsyncIterator[StreamChunk]) -> list[StreamChunk]:
+    return [chunk async for chunk in chunks]
+
+
+class TestDriverStreaming:
+    """Test route_stream in driver mode."""
+
+    @pytest.mark.asyncio
+    async def test_streams_chunks_from_primary(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(configs=model_configs(0.2), use_drivers=True, metrics=metrics)
+        primary = _stream_driver(DriverType.CLAUDE, ["def ", "f():"])
+        fallback = _stream_driver(DriverType.OPENAI, ["unused"])
+
+        with patch.object(
+            router,
+            "_get_driver_for_model",
+            side_effect=lambda model: primary if model == "gpt-4o" else fallback,
+        ):
+            chunks = await _collect(router.route_stream(TaskType.CODING, MESSAGES))
+
+        assert "".join(c.content for c in chunks) == "def f():"
+        assert all(c.model == "gpt-4o" for c in chunks)
+        stats = metrics.stream_stats("gpt-4o")
+        assert stats.streams == 1
+        assert stats.total_tokens == 2
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_failure_restarts_on_fallback(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(configs=model_configs(0.2), use_drivers=True, metrics=metrics)
+        primary = _stream_driver(DriverType.CLAUDE, ["par", "tial"], fail_after=1)
+        fallback = _stream_driver(DriverType.OPENAI, ["full ", "answer"])
+
+        with patch.object(
+            router,
+            "_get_driver_for_model",
+            side_effect=lambda model: primary if model == "gpt-4o" else fallback,
+        ):
+            chunks = await _collect(router.route_stream(TaskType.CODING, MESSAGES))
+
+        restart_index = next(
+            i for i, c in enumerate(chunks) if c.finish_reason == STREAM_RESTART
+        )
+        after = "".join(c.content for c in chunks[restart_index + 1 :])
+        assert chunks[0].content == "par"
+        assert after == "full answer"
+        assert metrics.stream_stats("gpt-4o").failures == 1
+        assert metrics.stream_stats("gpt-4o-mini").streams == 1
+
+
+class TestLiteLLMStreaming:
+    """Test route_stream in LiteLLM mode."""
+
+    @pytest.mark.asyncio
+    async def test_streams_via_litellm(self, model_configs: Any) -> None:
+        router = ModelRouter(configs=model_configs(0.2), metrics=ModelMetrics())
+
+        async def acompletion(**kwargs: Any) -> Any:
+            assert kwargs["stream"] is True
+            return _litellm_stream(["Hello", " world"])
+
+        with patch("daw_agents.models.router.acompletion", side_effect=acompletion):
+            chunks = await _collect(router.route_stream(TaskType.FAST, MESSAGES))
+
+        assert "".join(c.content for c in chunks) == "Hello world"
+        assert chunks[-1].finish_reason == "stop"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_primary_stream_fails(self, model_configs: Any) -> None:
+        router = ModelRouter(configs=model_configs(0.2), metrics=ModelMetrics())
+        models: list[str] = []
+
+        async def acompletion(**kwargs: Any) -> Any:
+            models.append(kwargs["model"])
+            return _litellm_stream(["fallback"], fail=kwargs["model"] == "gpt-4o")
+
+        with patch("daw_agents.models.router.acompletion", side_effect=acompletion):
+            chunks = await _collect(router.route_stream(TaskType.FAST, MESSAGES))
+
+        assert models == ["gpt-4o", "gpt-4o-mini"]
+        assert not any(c.finish_reason == STREAM_RESTART for c in chunks)
+        assert "".join(c.content for c in chunks) == "fallback"
+
+    @pytest.mark.asyncio
+    async def test_raises_when_both_streams_fail(self, model_configs: Any) -> None:
+        router = ModelRouter(configs=model_configs(0.2), metrics=ModelMetrics())
+
+        async def acompletion(**kwargs: Any) -> Any:
+            raise RuntimeError(f"{kwargs['model']} down")
+
+        with patch("daw_agents.models.router.acompletion", side_effect=acompletion):
+            with pytest.raises(RuntimeError, match="gpt-4o down"):
+                await _collect(router.route_stream(TaskType.FAST, MESSAGES))
+
+
+class TestStreamCaching:
+    """Test cache integration for streamed responses."""
+
+    @pytest.mark.asyncio
+    async def test_completed_stream_is_cached_and_replayed(self, model_configs: Any) -> None:
+        router = ModelRouter(
+            configs=model_configs(temperature=0.0),
+            cache=InMemoryResponseCache(),
+            metrics=ModelMetrics(),
+        )
+
+        async def acompletion(**kwargs: Any) -> Any:
+            return _litellm_stream(["cached ", "text"])
+
+        with patch(
+            "daw_agents.models.router.acompletion", side_effect=acompletion
+        ) as mock_completion:
+            await _collect(router.route_stream(TaskType.FAST, MESSAGES))
+            replay = await _collect(router.route_stream(TaskType.FAST, MESSAGES))
+            result = await router.route(TaskType.FAST, MESSAGES)
+
+        assert mock_completion.call_count == 1
+        assert replay[0].content == "cached text"
+        assert result == "cached text"
+
+
+class TestStreamStats:
+    """Test stream metric aggregation."""
+
+    def test_ttft_and_throughput(self) -> None:
+        stats = StreamStats()
+        stats.record(ttft=0.2, tokens=100, generation_seconds=2.0)
+        stats.record(ttft=0.4, tokens=100, generation_seconds=2.0)
+        assert stats.average_ttft == pytest.approx(0.3)
+        assert stats.min_ttft == 0.2
+        assert stats.tokens_per_second == 50.0
+
+    def test_snapshot(self) -> None:
+        metrics = ModelMetrics()
+        metrics.record_stream("m", ttft=0.1, tokens=10, generation_seconds=1.0)
+        assert metrics.snapshot()["streams"]["m"]["streams"] == 1
+        metrics.reset()
+        assert metrics.snapshot()["streams"] == {}
@@ -0,0 +1,266 @@
+"""
+Tests for per-request usage accounting in ModelRouter.
+
+These tests verify:
+1. route_with_usage returns token counts, latency and the answering model
+2. Fallback and cache status are reported for both routing modes
+3. Every request is recorded in the metrics sink with an estimated cost
+4. HeliconeTracker and TaskMetrics read usage from the sink
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from daw_agents.models.cache import InMemoryResponseCache
+from daw_agents.models.drivers import CompletionResponse, DriverType
+from daw_agents.models.metrics import ModelMetrics, estimate_cost_usd
+from daw_agents.models.router import ModelRouter, TaskType
+from daw_agents.models.singleflight import SingleFlight
+from daw_agents.ops.drift_detector import TaskMetrics
+from daw_agents.ops.helicone import HeliconeConfig, HeliconeTracker, TimeRange
+
+MESSAGES = [{"role": "user", "content": "Write a function"}]
+
+
+def _litellm_response(content: str, prompt: int, completion: int) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    response.usage.prompt_tokens = prompt
+    response.usage.completion_tokens = completion
+    return response
+
+
+def _driver(driver_type: DriverType, error: Exception | None = None) -> MagicMock:
+    driver = MagicMock()
+    driver.driver_type = driver_type
+    if error is not None:
+        driver.complete = AsyncMock(side_effect=error)
+    else:
+        driver.complete = AsyncMock(
+            return_value=CompletionResponse(
+                content="answer",
+                model="provider-model-id",
+                usage={"input_tokens": 120, "output_tokens": 30},
+            )
+        )
+    return driver
+
+
+class TestLiteLLMUsage:
+    """Test usage reporting in LiteLLM mode."""
+
+    @pytest.mark.asyncio
+    async def test_reports_tokens_and_model(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(configs=model_configs(0.0), metrics=metrics, coalesce=False)
+
+        with patch(
+            "daw_agents.models.router.acompletion",
+            new=AsyncMock(return_value=_litellm_response("hi", 100, 20)),
+        ):
+            result = await router.route_with_usage(
+                TaskType.CODING, MESSAGES, metadata={"task_id": "t-1"}
+            )
+
+        assert result.content == "hi"
+        assert result.model == "gpt-4o"
+        assert (result.prompt_tokens, result.completion_tokens) == (100, 20)
+        assert result.fallback_used is False
+        assert result.cache_status == "bypass"
+        assert result.latency_ms >= 0
+
+        [record] = metrics.usage_records()
+        assert record.total_tokens == 120
+        assert record.metadata == {"task_id": "t-1"}
+        assert record.cost_usd == pytest.approx(estimate_cost_usd("gpt-4o", 100, 20))
+
+    @pytest.mark.asyncio
+    async def test_reports_fallback(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(configs=model_configs(0.0), metrics=metrics, coalesce=False)
+
+        async def acompletion(**kwargs: Any) -> Any:
+            if kwargs["model"] == "gpt-4o":
+                raise RuntimeError("primary down")
+            return _litellm_response("fb", 10, 5)
+
+        with patch("daw_agents.models.router.acompletion", side_effect=acompletion):
+            result = await router.route_with_usage(TaskType.CODING, MESSAGES)
+
+        assert result.model == "gpt-4o-mini"
+        assert result.fallback_used is True
+        assert metrics.usage_totals()["gpt-4o-mini"]["fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_reports_zero_tokens(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(
+            configs=model_configs(0.0), cache=InMemoryResponseCache(), metrics=metrics
+        )
+
+        with patch(
+            "daw_agents.models.router.acompletion",
+            new=AsyncMock(return_value=_litellm_response("hi", 100, 20)),
+        ):
+            first = await router.route_with_usage(TaskType.CODING, MESSAGES)
+            second = await router.route_with_usage(TaskType.CODING, MESSAGES)
+
+        assert first.cache_status == "miss"
+        assert second.cache_status == "hit"
+        assert second.cached is True
+        assert second.total_tokens == 0
+        assert metrics.usage_totals()["gpt-4o"]["cached"] == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_report_zero_tokens(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(
+            configs=model_configs(0.0), metrics=metrics, single_flight=SingleFlight()
+        )
+        release = asyncio.Event()
+
+        async def acompletion(**kwargs: Any) -> Any:
+            await release.wait()
+            return _litellm_response("shared", 50, 10)
+
+        with patch("daw_agents.models.router.acompletion", side_effect=acompletion):
+            tasks = [
+                asyncio.ensure_future(router.route_with_usage(TaskType.CODING, MESSAGES))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        statuses = sorted(r.cache_status for r in results)
+        assert statuses == ["bypass", "coalesced", "coalesced"]
+        assert sum(r.total_tokens for r in results) == 60
+        assert len(metrics.usage_records()) == 3
+
+    @pytest.mark.asyncio
+    async def test_route_still_returns_content(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(configs=model_configs(0.0), metrics=metrics)
+
+        with patch(
+            "daw_agents.models.router.acompletion",
+            new=AsyncMock(return_value=_litellm_response("plain", 1, 1)),
+        ):
+            assert await router.route(TaskType.FAST, MESSAGES) == "plain"
+
+        assert len(metrics.usage_records()) == 1
+
+
+class TestDriverUsage:
+    """Test usage reporting in driver mode."""
+
+    @pytest.mark.asyncio
+    async def test_reports_driver_usage(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(configs=model_configs(0.0), use_drivers=True, metrics=metrics)
+        primary = _driver(DriverType.OPENAI)
+
+        with patch.object(router, "_get_driver_for_model", return_value=primary):
+            result = await router.route_with_usage(TaskType.CODING, MESSAGES)
+
+        assert result.model == "gpt-4o"
+        assert (result.prompt_tokens, result.completion_tokens) == (120, 30)
+        assert result.fallback_used is False
+
+    @pytest.mark.asyncio
+    async def test_reports_driver_fallback(self, model_configs: Any) -> None:
+        metrics = ModelMetrics()
+        router = ModelRouter(configs=model_configs(0.0), use_drivers=True, metrics=metrics)
+        primary = _driver(DriverType.CLAUDE, error=RuntimeError("down"))
+        fallback = _driver(DriverType.OPENAI)
+
+        with patch.object(
+            router,
+            "_get_driver_for_model",
+            side_effect=lambda model: primary if model == "gpt-4o" else fallback,
+        ):
+            result = await router.route_with_usage(TaskType.CODING, MESSAGES)
+
+        assert result.model == "gpt-4o-mini"
+        assert result.fallback_used is True
+
+
+class TestUsageSink:
+    """Test the usage records kept by ModelMetrics."""
+
+    def test_cost_estimate(self) -> None:
+        assert estimate_cost_usd("gpt-4o", 1_000_000, 0) == pytest.approx(2.5)
+        assert estimate_cost_usd("openai/gpt-4o-mini", 0, 1_000_000) == pytest.approx(0.6)
+        assert estimate_cost_usd("unknown-model", 1000, 1000) == 0.0
+
+    def test_records_are_bounded(self) -> None:
+        metrics = ModelMetrics(max_usage_records=2)
+        for _ in range(3):
+            metrics.record_usage(model="m", task_type="fast")
+        assert [r.sequence for r in metrics.usage_records()] == [2, 3]
+
+    def test_filters(self) -> None:
+        metrics = ModelMetrics()
+        metrics.record_usage(model="m", task_type="fast", metadata={"task_id": "a"})
+        metrics.record_usage(model="m", task_type="fast", metadata={"task_id": "b"})
+        assert len(metrics.usage_records(task_id="a")) == 1
+        assert [r.sequence for r in metrics.usage_records(after_sequence=1)] == [2]
+        metrics.reset()
+        assert metrics.snapshot()["usage"] == {}
+
+
+class TestSinkConsumers:
+    """Test HeliconeTracker and TaskMetrics reading the sink."""
+
+    def test_helicone_sync_is_incremental(self) -> None:
+        metrics = ModelMetrics()
+        tracker = HeliconeTracker(HeliconeConfig())
+        metrics.record_usage(
+            model="gpt-4o", task_type="coding", prompt_tokens=1000, completion_tokens=100
+        )
+        metrics.record_usage(model="gpt-4o", task_type="coding", cache_status="hit")
+
+        assert tracker.sync_from_metrics(metrics) == 2
+        assert tracker.sync_from_metrics(metrics) == 0
+
+        summary = tracker.get_cost_summary(TimeRange.last_hour(), group_by="model")
+        assert summary.total_requests == 2
+        assert summary.cached_requests == 1
+        assert summary.total_tokens == 1100
+        assert summary.total_cost_usd == pytest.approx(
+            estimate_cost_usd("gpt-4o", 1000, 100)
+        )
+
+    def test_task_metrics_from_usage(self) -> None:
+        metrics = ModelMetrics()
+        for prompt in (2000, 5000):
+            metrics.record_usage(
+                model="gpt-4o",
+                task_type="coding",
+                prompt_tokens=prompt,
+                completion_tokens=100,
+                metadata={"task_id": "task-1"},
+            )
+        metrics.record_usage(
+            model="gpt-4o", task_type="coding", prompt_tokens=9000,
+            metadata={"task_id": "other"},
+        )
+
+        task_metrics = TaskMetrics.from_model_usage(
+            task_id="task-1",
+            task_type="coding",
+            tool_usage_count=3,
+            step_count=4,
+            context_window_size=128_000,
+            metrics=metrics,
+        )
+
+        assert task_metrics.context_tokens == 5000
+        assert task_metrics.token_cost_usd == pytest.approx(
+            estimate_cost_usd("gpt-4o", 7000, 200)
+        )
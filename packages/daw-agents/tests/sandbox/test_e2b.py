@@ -16,7 +16,7 @@ Tests cover:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -590,3 +590,101 @@ class TestUtilityMethods:
         sandbox._sandbox = mock_e2b
 
         assert sandbox.is_running is True
+
+
+# -----------------------------------------------------------------------------
+# Test: Batched Uploads and Single Round-Trip Scripts
+# -----------------------------------------------------------------------------
+
+
+class TestBatchedExecution:
+    """Tests for write_files(), run_script() and output streaming."""
+
+    @staticmethod
+    def _sandbox() -> tuple[Any, MagicMock]:
+        from daw_agents.sandbox.e2b import E2BSandbox, SandboxConfig
+
+        sandbox = E2BSandbox(config=SandboxConfig(api_key="test_key"))
+        mock_e2b_sandbox = MagicMock()
+        mock_e2b_sandbox.files.write_files = AsyncMock()
+        result = MagicMock(stdout="ok", stderr="", exit_code=0)
+        mock_e2b_sandbox.commands.run = AsyncMock(return_value=result)
+        sandbox._sandbox = mock_e2b_sandbox
+        return sandbox, mock_e2b_sandbox
+
+    @pytest.mark.asyncio
+    async def test_write_files_uploads_in_one_request(self) -> None:
+        """write_files should send every file in a single write_files call."""
+        sandbox, mock = self._sandbox()
+
+        await sandbox.write_files({"/app/a.py": "a = 1", "/app/b.bin": b"\x00"})
+
+        mock.files.write_files.assert_awaited_once_with(
+            [{"path": "/app/a.py", "data": "a = 1"}, {"path": "/app/b.bin", "data": b"\x00"}]
+        )
+
+    @pytest.mark.asyncio
+    async def test_write_files_accepts_tarball(self) -> None:
+        """write_files should unpack a tar archive into entries."""
+        from daw_agents.sandbox.base import pack_files
+
+        sandbox, mock = self._sandbox()
+
+        await sandbox.write_files(pack_files({"/app/a.py": "a = 1"}))
+
+        entries = mock.files.write_files.call_args.args[0]
+        assert entries == [{"path": "/app/a.py", "data": b"a = 1"}]
+
+    @pytest.mark.asyncio
+    async def test_run_script_is_one_round_trip(self, tmp_path: Any) -> None:
+        """run_script should inline the files into the command it runs."""
+        import subprocess
+
+        sandbox, mock = self._sandbox()
+
+        result = await sandbox.run_script(
+            "cat app.py",
+            files={"app.py": "print('hi')\n", "/tmp/data.txt": "data"},
+            cwd="/home/user",
+        )
+
+        assert result.success
+        mock.files.write_files.assert_not_awaited()
+        mock.commands.run.assert_awaited_once()
+        command = mock.commands.run.call_args.args[0]
+        assert mock.commands.run.call_args.kwargs["cwd"] == "/home/user"
+
+        # The inlined archive unpacks to the sandbox paths
+        unpack = command.split(" && {")[0].replace("-C /", f"-C {tmp_path}")
+        subprocess.run(["bash", "-c", unpack], check=True)
+        assert (tmp_path / "home/user/app.py").read_text() == "print('hi')\n"
+        assert (tmp_path / "tmp/data.txt").read_text() == "data"
+        assert command.endswith("{\ncat app.py\n}")
+
+    @pytest.mark.asyncio
+    async def test_run_script_uploads_large_files_separately(self) -> None:
+        """Payloads too large for a command line should use write_files."""
+        import os
+
+        sandbox, mock = self._sandbox()
+        blob = os.urandom(200 * 1024)
+
+        await sandbox.run_script("ls", files={"big.bin": blob})
+
+        mock.files.write_files.assert_awaited_once_with(
+            [{"path": "/home/user/big.bin", "data": blob}]
+        )
+        assert mock.commands.run.call_args.args[0] == "ls"
+
+    @pytest.mark.asyncio
+    async def test_run_command_streams_output(self) -> None:
+        """run_command should forward output callbacks to E2B."""
+        sandbox, mock = self._sandbox()
+        chunks: list[str] = []
+
+        await sandbox.run_command("make", on_stdout=chunks.append)
+        kwargs = mock.commands.run.call_args.kwargs
+        await kwargs["on_stdout"]("building\n")
+
+        assert chunks == ["building\n"]
+        assert kwargs["on_stderr"] is None
@@ -0,0 +1,267 @@
+"""Tests for the local subprocess sandbox backend and backend registry.
+
+Tests cover:
+1. Lifecycle: private root created on start and removed on stop
+2. Commands return the same CommandResult contract as E2B
+3. Sandbox paths are mapped into the root and cannot escape it
+4. Timeouts kill the command's process group
+5. Resource limits are applied to commands
+6. SandboxRegistry selects the backend from DAW_SANDBOX_BACKEND
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from daw_agents.sandbox.base import SandboxError, SandboxNotStartedError
+from daw_agents.sandbox.e2b import E2BSandbox
+from daw_agents.sandbox.local import LocalSandbox, LocalSandboxConfig
+from daw_agents.sandbox.registry import SandboxBackend, SandboxRegistry
+
+
+class TestLocalSandboxLifecycle:
+    """Test start/stop of the temporary root."""
+
+    @pytest.mark.asyncio
+    async def test_context_manager_creates_and_removes_root(self, tmp_path) -> None:
+        sandbox = LocalSandbox(LocalSandboxConfig(base_dir=str(tmp_path)))
+
+        async with sandbox:
+            root = sandbox.root
+            assert root is not None and root.parent == tmp_path
+            assert (root / "home/user").is_dir()
+            assert sandbox.is_running
+            assert sandbox.sandbox_id == f"local-{root.name}"
+
+        assert not root.exists()
+        assert not sandbox.is_running
+        assert await sandbox.stop() is False
+
+    @pytest.mark.asyncio
+    async def test_requires_start(self) -> None:
+        with pytest.raises(SandboxNotStartedError):
+            await LocalSandbox().run_command("true")
+
+
+class TestLocalSandboxCommands:
+    """Test command execution and the CommandResult contract."""
+
+    @pytest.mark.asyncio
+    async def test_captures_output_and_exit_code(self) -> None:
+        async with LocalSandbox() as sandbox:
+            result = await sandbox.run_command("echo out; echo err >&2; exit 3")
+
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+        assert result.exit_code == 3
+        assert result.error is None
+        assert not result.success
+
+    @pytest.mark.asyncio
+    async def test_commands_are_fast(self) -> None:
+        async with LocalSandbox() as sandbox:
+            started = time.perf_counter()
+            result = await sandbox.run_command("echo hi")
+            elapsed = time.perf_counter() - started
+
+        assert result.success
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_aliased_paths_are_rewritten(self) -> None:
+        async with LocalSandbox() as sandbox:
+            await sandbox.write_file("/home/user/app.py", "print(6 * 7)\n")
+            await sandbox.write_file("/tmp/data.txt", "tmp\n")
+            result = await sandbox.run_command(
+                "cd /home/user && python app.py && cat /tmp/data.txt && pwd"
+            )
+
+            assert result.success, result.stderr
+            lines = result.stdout.splitlines()
+            assert lines[:2] == ["42", "tmp"]
+            assert lines[2] == str(sandbox.root / "home/user")
+
+    @pytest.mark.asyncio
+    async def test_runs_pytest_like_e2b_commands(self) -> None:
+        async with LocalSandbox() as sandbox:
+            await sandbox.write_file("/home/user/calc.py", "def add(a, b):\n    return a + b\n")
+            await sandbox.write_file(
+                "/home/user/test_calc.py",
+                "from calc import add\n\ndef test_add():\n    assert add(1, 2) == 3\n",
+            )
+            result = await sandbox.run_command(
+                "cd /home/user && python -m pytest test_calc.py -q -p no:cacheprovider"
+            )
+
+        assert result.success, result.stdout + result.stderr
+        assert "1 passed" in result.stdout
+
+    @pytest.mark.asyncio
+    async def test_environment_is_minimal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DAW_SECRET", "leak")
+        async with LocalSandbox() as sandbox:
+            result = await sandbox.run_command(
+                'echo "${DAW_SECRET:-none} $EXTRA $HOME"', envs={"EXTRA": "/tmp/x"}
+            )
+
+            root = sandbox.root
+            assert result.stdout.split() == [
+                "none",
+                f"{root}/tmp/x",
+                f"{root}/home/user",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process_group(self) -> None:
+        async with LocalSandbox() as sandbox:
+            started = time.perf_counter()
+            result = await sandbox.run_command("sleep 5 & sleep 5; wait", timeout=0.2)
+
+        assert time.perf_counter() - started < 2
+        assert result.exit_code is None
+        assert result.error is not None and "timed out" in result.error
+
+    @pytest.mark.asyncio
+    async def test_cancelled_command_is_killed(self) -> None:
+        pids: list[int] = []
+        async with LocalSandbox() as sandbox:
+            task = asyncio.create_task(
+                sandbox.run_command(
+                    "echo $$; exec sleep 37", on_stdout=lambda text: pids.append(int(text))
+                )
+            )
+            while not pids:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(pids[0], 0)
+
+    @pytest.mark.asyncio
+    async def test_file_size_limit_is_enforced(self) -> None:
+        config = LocalSandboxConfig(max_file_size_mb=1)
+        async with LocalSandbox(config) as sandbox:
+            result = await sandbox.run_command(
+                "head -c 2097152 /dev/zero > big.bin", timeout=10
+            )
+            size = (sandbox.root / "home/user/big.bin").stat().st_size
+
+        assert not result.success
+        assert size <= 1024 * 1024
+
+
+class TestLocalSandboxFiles:
+    """Test path mapping for file operations."""
+
+    @pytest.mark.asyncio
+    async def test_write_and_read_round_trip(self) -> None:
+        async with LocalSandbox() as sandbox:
+            await sandbox.write_file("src/pkg/mod.py", "x = 1\n")
+            await sandbox.write_file("/home/user/blob.bin", b"\x00\x01")
+
+            assert await sandbox.read_file("/home/user/src/pkg/mod.py") == "x = 1\n"
+            assert (sandbox.root / "home/user/blob.bin").read_bytes() == b"\x00\x01"
+
+    @pytest.mark.asyncio
+    async def test_paths_cannot_escape_root(self) -> None:
+        async with LocalSandbox() as sandbox:
+            with pytest.raises(SandboxError, match="escapes"):
+                await sandbox.read_file("../../../../etc/passwd")
+
+            # Absolute host paths land inside the root instead
+            await sandbox.write_file("/etc/passwd", "sandboxed")
+            assert (sandbox.root / "etc/passwd").read_text() == "sandboxed"
+
+
+class TestSandboxRegistry:
+    """Test backend selection."""
+
+    def test_defaults_to_e2b(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("DAW_SANDBOX_BACKEND", raising=False)
+        monkeypatch.setenv("E2B_API_KEY", "test-key")
+
+        assert SandboxRegistry.backend_from_env() is SandboxBackend.E2B
+        assert isinstance(SandboxRegistry.create(), E2BSandbox)
+
+    def test_selects_local_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DAW_SANDBOX_BACKEND", "LOCAL")
+        monkeypatch.setenv("DAW_LOCAL_SANDBOX_NAMESPACES", "true")
+
+        sandbox = SandboxRegistry.create()
+
+        assert isinstance(sandbox, LocalSandbox)
+        assert sandbox.config.namespaces is True
+
+    def test_unknown_backend_raises(self) -> None:
+        with pytest.raises(ValueError):
+            SandboxRegistry.create("docker")
+
+    def test_lists_backends(self) -> None:
+        assert set(SandboxRegistry.list_backends()) >= {
+            SandboxBackend.E2B,
+            SandboxBackend.LOCAL,
+        }
+
+
+class TestLocalSandboxStreaming:
+    """Test batched uploads, run_script and incremental output."""
+
+    @pytest.mark.asyncio
+    async def test_output_is_streamed_before_exit(self) -> None:
+        received: list[tuple[float, str]] = []
+
+        async def on_stdout(text: str) -> None:
+            received.append((time.perf_counter(), text))
+
+        async with LocalSandbox() as sandbox:
+            result = await sandbox.run_command(
+                "echo first; sleep 0.3; echo second", on_stdout=on_stdout
+            )
+            finished = time.perf_counter()
+
+        assert result.stdout == "first\nsecond\n"
+        assert "".join(text for _, text in received) == result.stdout
+        assert received[0][1] == "first\n"
+        assert finished - received[0][0] >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_partial_output(self) -> None:
+        async with LocalSandbox() as sandbox:
+            result = await sandbox.run_command("echo started; sleep 5", timeout=0.3)
+
+        assert result.stdout == "started\n"
+        assert result.error is not None
+
+    @pytest.mark.asyncio
+    async def test_run_script_writes_files_relative_to_cwd(self) -> None:
+        errors: list[str] = []
+        async with LocalSandbox() as sandbox:
+            result = await sandbox.run_script(
+                "python -m pytest -q -p no:cacheprovider test_calc.py\necho done >&2",
+                files={
+                    "calc.py": "def add(a, b):\n    return a + b\n",
+                    "test_calc.py": "from calc import add\n\ndef test_add():\n    assert add(1, 2) == 3\n",
+                },
+                cwd="/home/user/project",
+                on_stderr=errors.append,
+            )
+
+        assert result.success, result.stdout + result.stderr
+        assert "1 passed" in result.stdout
+        assert "".join(errors) == "done\n"
+
+    @pytest.mark.asyncio
+    async def test_write_files_accepts_tarball(self) -> None:
+        from daw_agents.sandbox.base import pack_files
+
+        async with LocalSandbox() as sandbox:
+            await sandbox.write_files(pack_files({"/home/user/a.txt": "a", "b.txt": "b"}))
+
+            assert await sandbox.read_file("/home/user/a.txt") == "a"
+            assert await sandbox.read_file("/b.txt") == "b"
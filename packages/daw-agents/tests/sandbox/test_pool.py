@@ -0,0 +1,277 @@
+"""Tests for the warm SandboxPool.
+
+Tests cover:
+1. Setup commands run once per sandbox, not once per lease
+2. Leases reuse sandboxes and reset the workspace in between
+3. Sandboxes are recycled on lease errors, age and lease count
+4. Lease wait-time and utilization metrics, and acquire timeouts
+5. Developer.execute leases one sandbox per run and passes it to the graph
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from daw_agents.sandbox.e2b import CommandResult, SandboxTimeoutError
+from daw_agents.sandbox.pool import SandboxPool, SandboxPoolConfig
+
+_ids = itertools.count()
+
+
+def _fake_sandbox() -> MagicMock:
+    """Unstarted sandbox whose commands all succeed."""
+    sandbox = MagicMock()
+    sandbox.sandbox_id = f"sbx-{next(_ids)}"
+    sandbox.is_running = True
+    sandbox.start = AsyncMock()
+    sandbox.stop = AsyncMock()
+    sandbox.run_command = AsyncMock(return_value=CommandResult(stdout="", exit_code=0))
+    return sandbox
+
+
+class FakeFactory:
+    """Records every sandbox the pool creates."""
+
+    def __init__(self) -> None:
+        self.created: list[MagicMock] = []
+
+    def __call__(self) -> MagicMock:
+        sandbox = _fake_sandbox()
+        self.created.append(sandbox)
+        return sandbox
+
+
+def _commands(sandbox: MagicMock) -> list[str]:
+    return [c.args[0] for c in sandbox.run_command.call_args_list]
+
+
+class TestSandboxPoolLeasing:
+    """Test warm-up, reuse and workspace resets."""
+
+    @pytest.mark.asyncio
+    async def test_start_warms_every_sandbox(self) -> None:
+        factory = FakeFactory()
+        pool = SandboxPool(SandboxPoolConfig(size=3), sandbox_factory=factory)
+
+        await pool.start()
+
+        assert len(factory.created) == 3
+        for sandbox in factory.created:
+            sandbox.start.assert_awaited_once()
+            assert _commands(sandbox)[0] == "pip install -q pytest"
+        assert pool.stats.idle == 3
+
+    @pytest.mark.asyncio
+    async def test_leases_reuse_sandbox_and_reset_workspace(self) -> None:
+        factory = FakeFactory()
+        pool = SandboxPool(SandboxPoolConfig(size=1), sandbox_factory=factory)
+
+        for _ in range(3):
+            async with pool.lease() as sandbox:
+                assert sandbox is factory.created[0]
+
+        commands = _commands(factory.created[0])
+        assert commands.count("pip install -q pytest") == 1
+        assert commands.count(f"rm -rf {pool.workspace} && mkdir -p {pool.workspace}") == 3
+        assert pool.stats.leases == 3
+        assert pool.stats.created == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_setup_stops_sandbox(self) -> None:
+        factory = FakeFactory()
+        pool = SandboxPool(
+            SandboxPoolConfig(size=1, setup_commands=["false"]), sandbox_factory=factory
+        )
+        failing = _fake_sandbox()
+        failing.run_command = AsyncMock(return_value=CommandResult(exit_code=1, stderr="no"))
+        pool._factory = lambda: failing
+
+        with pytest.raises(Exception, match="Sandbox setup failed"):
+            async with pool.lease():
+                pass
+
+        failing.stop.assert_awaited_once()
+        assert pool.stats.errors == 1
+
+
+class TestSandboxPoolRecycling:
+    """Test replacing broken and worn-out sandboxes."""
+
+    @pytest.mark.asyncio
+    async def test_error_in_lease_recycles_sandbox(self) -> None:
+        factory = FakeFactory()
+        pool = SandboxPool(SandboxPoolConfig(size=1), sandbox_factory=factory)
+
+        with pytest.raises(RuntimeError):
+            async with pool.lease():
+                raise RuntimeError("boom")
+        await asyncio.sleep(0)  # let the replacement start
+
+        factory.created[0].stop.assert_awaited_once()
+        assert pool.stats.recycled == 1
+        assert pool.stats.errors == 1
+        async with pool.lease() as sandbox:
+            assert sandbox is factory.created[1]
+
+    @pytest.mark.asyncio
+    async def test_failed_reset_recycles_sandbox(self) -> None:
+        factory = FakeFactory()
+        pool = SandboxPool(SandboxPoolConfig(size=1), sandbox_factory=factory)
+
+        async with pool.lease() as sandbox:
+            sandbox.run_command.return_value = CommandResult(exit_code=1)
+
+        factory.created[0].stop.assert_awaited_once()
+        assert pool.stats.recycled == 1
+
+    @pytest.mark.asyncio
+    async def test_max_leases_recycles_sandbox(self) -> None:
+        factory = FakeFactory()
+        pool = SandboxPool(SandboxPoolConfig(size=1, max_leases=2), sandbox_factory=factory)
+
+        for _ in range(2):
+            async with pool.lease():
+                pass
+        await asyncio.sleep(0)
+
+        assert pool.stats.recycled == 1
+        assert len(factory.created) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_idle_sandbox_is_replaced_on_acquire(self) -> None:
+        factory = FakeFactory()
+        pool = SandboxPool(SandboxPoolConfig(size=1), sandbox_factory=factory)
+        await pool.start()
+        pool._idle._queue[0].created_at -= pool.config.max_age_seconds + 1  # type: ignore[attr-defined]
+
+        async with pool.lease() as sandbox:
+            assert sandbox is not factory.created[0]
+
+        factory.created[0].stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_kills_idle_sandboxes(self) -> None:
+        factory = FakeFactory()
+        pool = SandboxPool(SandboxPoolConfig(size=2), sandbox_factory=factory)
+        await pool.start()
+
+        await pool.close()
+
+        for sandbox in factory.created:
+            sandbox.stop.assert_awaited_once()
+        with pytest.raises(Exception, match="closed"):
+            async with pool.lease():
+                pass
+
+
+class TestSandboxPoolMetrics:
+    """Test utilization and wait-time metrics."""
+
+    @pytest.mark.asyncio
+    async def test_utilization_tracks_leases(self) -> None:
+        pool = SandboxPool(SandboxPoolConfig(size=2), sandbox_factory=FakeFactory())
+
+        async with pool.lease():
+            assert pool.stats.utilization == 0.5
+            async with pool.lease():
+                assert pool.stats.utilization == 1.0
+
+        stats = pool.stats.to_dict()
+        assert stats["utilization"] == 0.0
+        assert stats["idle"] == 2
+        assert stats["leases"] == 2
+
+    @pytest.mark.asyncio
+    async def test_waiters_record_wait_time(self) -> None:
+        pool = SandboxPool(SandboxPoolConfig(size=1), sandbox_factory=FakeFactory())
+
+        async def hold() -> None:
+            async with pool.lease():
+                await asyncio.sleep(0.05)
+
+        async def wait() -> None:
+            await asyncio.sleep(0.01)
+            async with pool.lease():
+                pass
+
+        await asyncio.gather(hold(), wait())
+
+        assert pool.stats.leases == 2
+        assert pool.stats.max_wait_ms >= 30
+        assert 0 < pool.stats.avg_wait_ms < pool.stats.max_wait_ms
+
+    @pytest.mark.asyncio
+    async def test_acquire_times_out_when_exhausted(self) -> None:
+        pool = SandboxPool(
+            SandboxPoolConfig(size=1, acquire_timeout=0.05), sandbox_factory=FakeFactory()
+        )
+
+        async with pool.lease():
+            with pytest.raises(SandboxTimeoutError):
+                async with pool.lease():
+                    pass
+
+
+class TestDeveloperSandboxPool:
+    """Test Developer integration with the pool."""
+
+    @pytest.mark.asyncio
+    async def test_execute_leases_one_sandbox_per_run(self) -> None:
+        from daw_agents.agents.developer.graph import Developer
+
+        factory = FakeFactory()
+        pool = SandboxPool(SandboxPoolConfig(size=1), sandbox_factory=factory)
+        developer = Developer(sandbox_pool=pool)
+
+        with patch.object(developer, "graph") as mock_graph:
+            mock_graph.ainvoke = AsyncMock(
+                return_value={
+                    "status": "complete",
+                    "source_file": "src/calc.py",
+                    "test_file": "tests/test_calc.py",
+                    "iteration": 1,
+                    "error": None,
+                }
+            )
+            await developer.execute(
+                task="Add", source_file="src/calc.py", test_file="tests/test_calc.py"
+            )
+            await developer.execute(
+                task="Add", source_file="src/calc.py", test_file="tests/test_calc.py"
+            )
+
+        configurable = mock_graph.ainvoke.call_args.kwargs["config"]["configurable"]
+        assert configurable["sandbox"] is factory.created[0]
+        assert configurable["sandbox_workspace"] == pool.workspace
+        assert pool.stats.leases == 2
+        assert pool.stats.created == 1
+
+    @pytest.mark.asyncio
+    async def test_run_test_node_uses_leased_sandbox(self) -> None:
+        from daw_agents.agents.developer.nodes import run_test_node
+
+        sandbox = _fake_sandbox()
+        sandbox.run_script = AsyncMock(return_value=CommandResult(stdout="", exit_code=0))
+        state = {
+            "test_code": "def test_add(): assert True",
+            "source_code": "",
+            "test_file": "test_calc.py",
+            "source_file": "calc.py",
+            "iteration": 0,
+        }
+
+        result = await run_test_node(
+            state,  # type: ignore[arg-type]
+            config={"configurable": {"sandbox": sandbox, "sandbox_workspace": "/ws"}},
+        )
+
+        assert result["test_result"]["passed"] is True
+        script = sandbox.run_script.call_args
+        assert script.args == ("cd /ws && python -m pytest test_calc.py -v",)
+        assert set(script.kwargs["files"]) == {"/ws/calc.py", "/ws/test_calc.py"}
+        sandbox.start.assert_not_awaited()
+        sandbox.stop.assert_not_awaited()
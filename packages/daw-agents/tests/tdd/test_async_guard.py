@@ -0,0 +1,334 @@
+"""
+Tests for the async TDD Guard runner.
+
+Covers:
+1. Import analysis, fingerprints and affected-test selection
+2. run_test_async in a persistent pytest worker
+3. Result caching keyed on test and source content
+4. Worker recycling, timeouts and async phase enforcement
+"""
+
+from pathlib import Path
+
+import pytest
+
+from daw_agents.tdd.exceptions import TDDViolation
+from daw_agents.tdd.guard import TDDGuard
+from daw_agents.tdd.impact import TestImpactAnalyzer
+
+PYTEST_ARGS = ["-p", "no:cacheprovider", "-o", "pythonpath=src"]
+
+
+def _project(tmp_path: Path) -> Path:
+    """A project with two source modules and one test file using both."""
+    (tmp_path / "src" / "shop").mkdir(parents=True)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "src" / "shop" / "__init__.py").write_text("")
+    (tmp_path / "src" / "shop" / "money.py").write_text(
+        "def cents(amount):\n    return round(amount * 100)\n"
+    )
+    (tmp_path / "src" / "shop" / "cart.py").write_text(
+        "from shop.money import cents\n\n"
+        "def total(prices):\n    return cents(sum(prices))\n"
+    )
+    (tmp_path / "src" / "shop" / "names.py").write_text(
+        "def title(name):\n    return name.title()\n"
+    )
+    (tmp_path / "tests" / "test_shop.py").write_text(
+        "from shop.cart import total\n"
+        "from shop.names import title\n\n"
+        "def test_total():\n    assert total([1.5, 2]) == 350\n\n"
+        "def test_title():\n    assert title('ada') == 'Ada'\n"
+    )
+    return tmp_path
+
+
+class TestImpactAnalysis:
+    """Tests for TestImpactAnalyzer."""
+
+    def test_dependencies_are_transitive(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        analyzer = TestImpactAnalyzer(root)
+
+        deps = analyzer.dependencies(root / "tests" / "test_shop.py")
+
+        names = {p.name for p in deps}
+        assert {"cart.py", "money.py", "names.py", "__init__.py"} <= names
+
+    def test_fingerprint_changes_with_imported_source(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        analyzer = TestImpactAnalyzer(root)
+        test_file = root / "tests" / "test_shop.py"
+
+        before = analyzer.fingerprint(test_file)
+        assert analyzer.fingerprint(test_file) == before
+
+        (root / "src" / "shop" / "money.py").write_text("def cents(a):\n    return 0\n")
+        assert analyzer.fingerprint(test_file) != before
+
+    def test_fingerprint_includes_conftest(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        analyzer = TestImpactAnalyzer(root)
+        test_file = root / "tests" / "test_shop.py"
+        before = analyzer.fingerprint(test_file)
+
+        (root / "tests" / "conftest.py").write_text("import pytest\n")
+
+        assert analyzer.fingerprint(test_file) != before
+
+    def test_selects_tests_using_changed_module(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        analyzer = TestImpactAnalyzer(root)
+        test_file = root / "tests" / "test_shop.py"
+
+        # money.py is reached only through cart.total
+        selected = analyzer.affected_tests(test_file, [root / "src" / "shop" / "money.py"])
+
+        assert selected == [f"{test_file.resolve()}::test_total"]
+
+    def test_unrelated_change_selects_nothing(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        (root / "src" / "other.py").write_text("x = 1\n")
+        analyzer = TestImpactAnalyzer(root)
+
+        selected = analyzer.affected_tests(
+            root / "tests" / "test_shop.py", [root / "src" / "other.py"]
+        )
+
+        assert selected == []
+
+    def test_change_reached_through_conftest_selects_whole_file(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        (root / "tests" / "conftest.py").write_text("from shop.money import cents\n")
+        analyzer = TestImpactAnalyzer(root)
+        test_file = root / "tests" / "test_shop.py"
+        test_file.write_text("def test_plain():\n    assert True\n")
+
+        assert analyzer.affected_tests(test_file, [root / "src" / "shop" / "money.py"]) is None
+
+    def test_missing_changed_file_selects_whole_file(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        analyzer = TestImpactAnalyzer(root)
+
+        selected = analyzer.affected_tests(
+            root / "tests" / "test_shop.py", [root / "src" / "shop" / "missing.py"]
+        )
+
+        assert selected is None
+
+    def test_helper_using_changed_name_selects_whole_file(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        test_file = root / "tests" / "test_shop.py"
+        test_file.write_text(
+            test_file.read_text() + "\n\ndef helper():\n    return title('x')\n"
+        )
+        analyzer = TestImpactAnalyzer(root)
+
+        assert analyzer.affected_tests(test_file, [root / "src" / "shop" / "names.py"]) is None
+
+
+class TestRunTestAsync:
+    """Tests for TDDGuard.run_test_async()."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_persistent_worker(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS)
+        try:
+            first = await guard.run_test_async(root / "tests" / "test_shop.py", use_cache=False)
+            worker = guard._worker
+            assert worker is not None
+            pid = worker._process.pid  # type: ignore[union-attr]
+
+            second = await guard.run_test_async(
+                root / "tests" / "test_shop.py", use_cache=False
+            )
+            same_process = worker._process.pid == pid  # type: ignore[union-attr]
+        finally:
+            await guard.aclose()
+
+        assert first.passed and second.passed
+        assert "2 passed" in second.output
+        assert same_process
+        assert worker.runs == 2
+        assert not second.cached
+
+    @pytest.mark.asyncio
+    async def test_reports_failures_and_reloads_changed_source(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS)
+        test_file = root / "tests" / "test_shop.py"
+        try:
+            assert (await guard.run_test_async(test_file)).passed
+
+            (root / "src" / "shop" / "names.py").write_text(
+                "def title(name):\n    return name\n"
+            )
+            result = await guard.run_test_async(test_file)
+        finally:
+            await guard.aclose()
+
+        assert result.passed is False
+        assert result.exit_code == 1
+        assert result.error is not None and "test_title" in result.error
+
+    @pytest.mark.asyncio
+    async def test_unchanged_code_is_served_from_cache(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS)
+        test_file = root / "tests" / "test_shop.py"
+        try:
+            first = await guard.run_test_async(test_file)
+            again = await guard.run_test_async(test_file)
+            runs = guard._worker.runs  # type: ignore[union-attr]
+        finally:
+            await guard.aclose()
+
+        assert not first.cached
+        assert again.cached
+        assert again.passed == first.passed
+        assert again.output == first.output
+        assert runs == 1
+
+    @pytest.mark.asyncio
+    async def test_runs_only_affected_tests(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS)
+        try:
+            result = await guard.run_test_async(
+                root / "tests" / "test_shop.py",
+                changed_files=[root / "src" / "shop" / "names.py"],
+            )
+        finally:
+            await guard.aclose()
+
+        assert result.passed
+        assert result.selected_tests is not None and len(result.selected_tests) == 1
+        assert "1 passed" in result.output
+        assert "test_total" not in result.output
+
+    @pytest.mark.asyncio
+    async def test_unaffected_file_reuses_whole_file_result(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        unrelated = root / "src" / "shop" / "stock.py"
+        unrelated.write_text("LEVEL = 1\n")
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS)
+        test_file = root / "tests" / "test_shop.py"
+        try:
+            first = await guard.run_test_async(test_file, changed_files=[unrelated])
+            reused = await guard.run_test_async(test_file, changed_files=[unrelated])
+            runs = guard._worker.runs  # type: ignore[union-attr]
+        finally:
+            await guard.aclose()
+
+        # Nothing selected: the whole file runs once, then comes from the cache
+        assert first.passed and first.exit_code == 0
+        assert first.selected_tests is None
+        assert reused.cached and reused.output == first.output
+        assert runs == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_through_conftest_fixture_is_reported(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        money = root / "src" / "shop" / "money.py"
+        money.write_text("def cents(amount):\n    raise ValueError('broken')\n")
+        (root / "tests" / "conftest.py").write_text(
+            "import pytest\n\nfrom shop.money import cents\n\n"
+            "@pytest.fixture\ndef price():\n    return cents(1)\n"
+        )
+        test_file = root / "tests" / "test_price.py"
+        test_file.write_text("def test_price(price):\n    assert price == 100\n")
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS)
+        try:
+            result = await guard.run_test_async(test_file, changed_files=[money])
+        finally:
+            await guard.aclose()
+
+        assert result.passed is False
+        assert result.exit_code == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_is_recycled(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS, worker_max_runs=1)
+        test_file = root / "tests" / "test_shop.py"
+        try:
+            await guard.run_test_async(test_file, use_cache=False)
+            first_pid = guard._worker._process.pid  # type: ignore[union-attr]
+            await guard.run_test_async(test_file, use_cache=False)
+            second_pid = guard._worker._process.pid  # type: ignore[union-attr]
+        finally:
+            await guard.aclose()
+
+        assert first_pid != second_pid
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_reported_and_not_cached(self, tmp_path: Path) -> None:
+        (tmp_path / "tests").mkdir()
+        test_file = tmp_path / "tests" / "test_slow.py"
+        test_file.write_text("import time\n\ndef test_slow():\n    time.sleep(30)\n")
+        guard = TDDGuard(project_root=tmp_path, pytest_args=PYTEST_ARGS, test_timeout=3)
+        try:
+            result = await guard.run_test_async(test_file)
+        finally:
+            await guard.aclose()
+
+        assert result.passed is False
+        assert result.error == "Test execution timed out"
+        assert not guard._result_cache
+
+    @pytest.mark.asyncio
+    async def test_subprocess_mode_without_worker(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS, use_worker=False)
+
+        result = await guard.run_test_async(root / "tests" / "test_shop.py")
+
+        assert result.passed
+        assert guard._worker is None
+
+    @pytest.mark.asyncio
+    async def test_missing_file_raises(self, tmp_path: Path) -> None:
+        guard = TDDGuard(project_root=tmp_path)
+        with pytest.raises(FileNotFoundError):
+            await guard.run_test_async(tmp_path / "tests" / "test_missing.py")
+
+
+class TestAsyncEnforcement:
+    """Tests for the async RED/GREEN enforcement helpers."""
+
+    @pytest.mark.asyncio
+    async def test_red_then_green(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        names = root / "src" / "shop" / "names.py"
+        names.write_text("def title(name):\n    raise NotImplementedError\n")
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS)
+        test_file = root / "tests" / "test_shop.py"
+        try:
+            await guard.enforce_red_phase_async(test_file)
+            with pytest.raises(TDDViolation):
+                await guard.enforce_green_phase_async(test_file, changed_files=[names])
+
+            names.write_text("def title(name):\n    return name.title()\n")
+            await guard.enforce_green_phase_async(test_file, changed_files=[names])
+        finally:
+            await guard.aclose()
+
+        assert guard._workflow_states[str(test_file)] == "green"
+
+    @pytest.mark.asyncio
+    async def test_red_phase_for_module_not_written_yet(self, tmp_path: Path) -> None:
+        root = _project(tmp_path)
+        test_file = root / "tests" / "test_stock.py"
+        test_file.write_text(
+            "from shop.stock import level\n\ndef test_level():\n    assert level() == 1\n"
+        )
+        guard = TDDGuard(project_root=root, pytest_args=PYTEST_ARGS)
+        try:
+            await guard.enforce_red_phase_async(
+                test_file, changed_files=[root / "src" / "shop" / "stock.py"]
+            )
+        finally:
+            await guard.aclose()
+
+        assert guard._workflow_states[str(test_file)] == "red"
@@ -0,0 +1,448 @@
+"""
+Tests for Orchestrator checkpoint persistence.
+
+These tests verify:
+1. diff_state reports changed fields and appended list items only
+2. Large values are compressed and round-trip
+3. RedisCheckpointSaver writes deltas, refreshes TTLs and reloads state
+4. Redis outages are logged, backed off and never raised
+5. Orchestrator saves after every node and resumes from the last one
+6. Pending approvals survive a new Orchestrator instance
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from daw_agents.workflow.checkpoint import (
+    InMemoryCheckpointSaver,
+    RedisCheckpointSaver,
+    decode_value,
+    diff_state,
+    encode_value,
+)
+from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+
+class FakePipeline:
+    """Queues commands and applies them to a FakeRedis on execute()."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> FakePipeline:
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        self._redis.round_trips += 1
+        return [
+            await getattr(self._redis, name)(*args, **kwargs)
+            for name, args, kwargs in self._commands
+        ]
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis (decode_responses=True) for the saver."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.ttls: dict[str, int] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def hset(self, key: str, mapping: dict[str, str]) -> int:
+        self.hashes.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def hdel(self, key: str, *fields: str) -> int:
+        return sum(self.hashes.get(key, {}).pop(f, None) is not None for f in fields)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def rpush(self, key: str, *values: str) -> int:
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    async def lrange(self, key: str, start: int, end: int) -> list[str]:
+        return list(self.lists.get(key, []))
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        self.ttls[key] = seconds
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(
+            (self.hashes.pop(k, None) is not None) + (self.lists.pop(k, None) is not None)
+            for k in keys
+        )
+
+
+def _state(results: int = 0, **overrides: Any) -> dict[str, Any]:
+    state: dict[str, Any] = {
+        "user_input": "Build an app",
+        "prd_output": {"title": "App"},
+        "tasks": [{"id": f"T{i}"} for i in range(3)],
+        "current_task_idx": 0,
+        "executor_results": [{"task_id": f"T{i}", "source_code": "x" * 50} for i in range(results)],
+        "validator_results": [],
+        "status": "coding",
+        "error": None,
+    }
+    state.update(overrides)
+    return state
+
+
+class TestDiffState:
+    """Test snapshot deltas."""
+
+    def test_first_snapshot_writes_everything(self) -> None:
+        delta = diff_state(None, _state(results=2))
+        assert delta.fields["status"] == "coding"
+        assert len(delta.rewrites["executor_results"]) == 2
+        assert not delta.appends
+
+    def test_appended_results_are_a_tail(self) -> None:
+        previous = _state(results=2)
+        current = _state(results=3, current_task_idx=1)
+
+        delta = diff_state(previous, current)
+
+        assert delta.fields == {"current_task_idx": 1}
+        assert delta.appends == {"executor_results": [current["executor_results"][2]]}
+        assert not delta.rewrites
+
+    def test_changed_items_rewrite_the_list(self) -> None:
+        previous = _state(results=2)
+        current = _state(results=2)
+        current["executor_results"][1] = {"task_id": "T1", "source_code": "changed"}
+
+        delta = diff_state(previous, current)
+
+        assert "executor_results" in delta.rewrites
+
+    def test_unchanged_state_is_empty(self) -> None:
+        assert diff_state(_state(results=1), _state(results=1)).empty
+
+
+class TestEncoding:
+    """Test value encoding."""
+
+    def test_small_values_stay_plain(self) -> None:
+        assert encode_value({"a": 1}) == 'j:{"a":1}'
+
+    def test_large_values_compress_and_round_trip(self) -> None:
+        value = {"source_code": "def f():\n    return 1\n" * 200}
+        encoded = encode_value(value, compress_threshold=100)
+        assert encoded.startswith("z:")
+        assert len(encoded) < len(value["source_code"])
+        assert decode_value(encoded) == value
+
+
+class TestRedisCheckpointSaver:
+    """Test the delta-encoded Redis saver."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_round_trip(self) -> None:
+        redis = FakeRedis()
+        saver = RedisCheckpointSaver(client=redis, ttl_seconds=600)  # type: ignore[arg-type]
+        state = _state(results=2)
+
+        await saver.save("wf-1", state, node="execute")
+        loaded = await RedisCheckpointSaver(client=redis).load("wf-1")  # type: ignore[arg-type]
+
+        assert loaded is not None
+        assert loaded.state == state
+        assert loaded.node == "execute"
+        assert loaded.sequence == 1
+        assert set(redis.ttls.values()) == {600}
+
+    @pytest.mark.asyncio
+    async def test_each_save_writes_only_the_delta(self) -> None:
+        redis = FakeRedis()
+        saver = RedisCheckpointSaver(client=redis)  # type: ignore[arg-type]
+        await saver.save("wf-1", _state(results=0), node="plan")
+        first_bytes = saver.stats.bytes_written
+
+        for n in range(1, 101):
+            await saver.save("wf-1", _state(results=n, current_task_idx=n), node="execute")
+
+        # One item appended and one scalar changed per node
+        assert saver.stats.items_appended == 100
+        assert saver.stats.fields_written == 5 + 100  # 5 scalar fields up front
+        assert saver.stats.lists_rewritten == 3
+        per_node = (saver.stats.bytes_written - first_bytes) / 100
+        assert per_node < 150
+        assert redis.round_trips == 101
+
+        loaded = await saver.load("wf-1")
+        assert loaded is not None
+        assert len(loaded.state["executor_results"]) == 100
+        assert loaded.sequence == 101
+
+    @pytest.mark.asyncio
+    async def test_load_seeds_deltas_after_restart(self) -> None:
+        redis = FakeRedis()
+        await RedisCheckpointSaver(client=redis).save("wf-1", _state(results=5), node="validate")  # type: ignore[arg-type]
+
+        restarted = RedisCheckpointSaver(client=redis)  # type: ignore[arg-type]
+        await restarted.load("wf-1")
+        await restarted.save("wf-1", _state(results=6), node="execute")
+
+        assert restarted.stats.items_appended == 1
+        assert restarted.stats.lists_rewritten == 0
+
+    @pytest.mark.asyncio
+    async def test_outage_backs_off_and_never_raises(self) -> None:
+        client = MagicMock()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=ConnectionError("refused"))
+        client.pipeline.return_value = pipe
+        saver = RedisCheckpointSaver(client=client, error_backoff_seconds=60)
+
+        await saver.save("wf-1", _state(), node="plan")
+        await saver.save("wf-1", _state(), node="execute")
+        assert await saver.load("wf-1") is None
+
+        assert saver.stats.errors == 1
+        assert saver.stats.skipped == 2
+        assert pipe.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_dropped_at_terminal_status(self) -> None:
+        saver = RedisCheckpointSaver(client=FakeRedis())  # type: ignore[arg-type]
+
+        await saver.save("wf-1", _state(results=1), node="execute")
+        assert "wf-1" in saver._snapshots
+        await saver.save("wf-1", _state(results=1, status="complete"), node="deploy")
+
+        assert "wf-1" not in saver._snapshots
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_bounded(self) -> None:
+        saver = RedisCheckpointSaver(client=FakeRedis(), max_snapshots=2)  # type: ignore[arg-type]
+
+        for workflow_id in ("wf-1", "wf-2", "wf-3"):
+            await saver.save(workflow_id, _state(), node="plan")
+
+        assert list(saver._snapshots) == ["wf-2", "wf-3"]
+
+    @pytest.mark.asyncio
+    async def test_missing_checkpoint_loads_none(self) -> None:
+        saver = RedisCheckpointSaver(client=FakeRedis())  # type: ignore[arg-type]
+        assert await saver.load("nope") is None
+
+
+def _agents() -> tuple[AsyncMock, AsyncMock, AsyncMock]:
+    taskmaster = AsyncMock()
+    taskmaster.workflow = MagicMock()
+    taskmaster.workflow.ainvoke = AsyncMock(
+        return_value={
+            "prd": MagicMock(model_dump=lambda: {"title": "App"}),
+            "tasks": [MagicMock(model_dump=lambda: {"id": "T1", "description": "one"})],
+        }
+    )
+    developer = AsyncMock()
+    developer.execute = AsyncMock(
+        return_value=MagicMock(model_dump=lambda: {"success": True, "source_code": "x = 1"})
+    )
+    validator = AsyncMock()
+    validator.validate = AsyncMock(return_value=MagicMock(model_dump=lambda: {"status": "approved"}))
+    return taskmaster, developer, validator
+
+
+class TestOrchestratorCheckpointing:
+    """Test checkpoint writes and resume in the Orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_saves_after_every_node(self) -> None:
+        taskmaster, developer, validator = _agents()
+        saver = InMemoryCheckpointSaver()
+        orchestrator = Orchestrator(
+            taskmaster=taskmaster,
+            developer=developer,
+            validator=validator,
+            config=OrchestratorConfig(
+                checkpoint_enabled=True, require_prd_approval=False, require_human_approval=False
+            ),
+            checkpoint_saver=saver,
+        )
+
+        result = await orchestrator.execute("Build an app", workflow_id="wf-1")
+
+        assert result.workflow_id == "wf-1"
+        checkpoint = await saver.load("wf-1")
+        assert checkpoint is not None
+        assert checkpoint.node == "deploy"
+        assert checkpoint.sequence == 4  # plan, execute, validate, deploy
+        assert checkpoint.state["status"] == "complete"
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_prd_approval_on_new_instance(self) -> None:
+        taskmaster, developer, validator = _agents()
+        saver = InMemoryCheckpointSaver()
+        config = OrchestratorConfig(
+            checkpoint_enabled=True, require_prd_approval=True, require_human_approval=False
+        )
+
+        first = Orchestrator(taskmaster=taskmaster, config=config, checkpoint_saver=saver)
+        paused = await first.execute("Build an app", workflow_id="wf-1")
+        assert paused.status == "awaiting_prd_approval"
+
+        # A different worker picks the workflow up
+        second = Orchestrator(
+            taskmaster=taskmaster,
+            developer=developer,
+            validator=validator,
+            config=config,
+            checkpoint_saver=saver,
+        )
+        approval = await second.approve_prd("wf-1")
+        assert approval["success"] is True
+        assert approval["tasks_count"] == 1
+
+        result = await second.execute("Build an app", workflow_id="wf-1")
+
+        assert result.status == "complete"
+        assert taskmaster.workflow.ainvoke.await_count == 1  # not re-planned
+        developer.execute.assert_awaited_once()
+        assert [r["task_id"] for r in result.validator_results] == ["T1"]
+
+    @pytest.mark.asyncio
+    async def test_pending_deployment_approval_survives_restart(self) -> None:
+        taskmaster, developer, validator = _agents()
+        saver = InMemoryCheckpointSaver()
+        config = OrchestratorConfig(
+            checkpoint_enabled=True, require_prd_approval=False, require_human_approval=True
+        )
+        first = Orchestrator(
+            taskmaster=taskmaster,
+            developer=developer,
+            validator=validator,
+            config=config,
+            checkpoint_saver=saver,
+        )
+        await first.execute("Build an app", workflow_id="wf-1")
+
+        second = Orchestrator(config=config, checkpoint_saver=saver)
+        assert await second.reject("wf-1", reason="Not ready") == {
+            "cancelled": True,
+            "reason": "Not ready",
+        }
+
+        checkpoint = await saver.load("wf-1")
+        assert checkpoint is not None
+        assert checkpoint.state["status"] == "error"
+        assert checkpoint.state["error"] == "Deployment rejected: Not ready"
+
+    @pytest.mark.asyncio
+    async def test_parallel_workflow_saves_checkpoints(self) -> None:
+        taskmaster, developer, validator = _agents()
+        saver = InMemoryCheckpointSaver()
+        orchestrator = Orchestrator(
+            taskmaster=taskmaster,
+            developer=developer,
+            validator=validator,
+            config=OrchestratorConfig(
+                checkpoint_enabled=True,
+                parallel_execution=True,
+                require_prd_approval=False,
+                require_human_approval=False,
+            ),
+            checkpoint_saver=saver,
+        )
+
+        result = await orchestrator.execute("Build an app", workflow_id="wf-1")
+
+        assert result.status == "complete"
+        checkpoint = await saver.load("wf-1")
+        assert checkpoint is not None
+        assert checkpoint.node == "deploy"
+        assert checkpoint.sequence == 4  # plan, T1 finished, execute_parallel, deploy
+        assert [r["task_id"] for r in checkpoint.state["validator_results"]] == ["T1"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_progress_survives_crash_mid_batch(self) -> None:
+        taskmaster, _, validator = _agents()
+        taskmaster.workflow.ainvoke.return_value["tasks"] = [
+            MagicMock(model_dump=lambda: {"id": "A", "description": "a"}),
+            MagicMock(model_dump=lambda: {"id": "B", "description": "b"}),
+        ]
+
+        async def execute(task: str, source_file: str, test_file: str) -> MagicMock:
+            if task == "b":
+                await asyncio.Event().wait()  # still running when the worker dies
+            return MagicMock(model_dump=lambda: {"success": True, "source_code": task})
+
+        developer = AsyncMock()
+        developer.execute = AsyncMock(side_effect=execute)
+        saver = InMemoryCheckpointSaver()
+        config = OrchestratorConfig(
+            parallel_execution=True, require_prd_approval=False, require_human_approval=False
+        )
+        first = Orchestrator(
+            taskmaster=taskmaster,
+            developer=developer,
+            validator=validator,
+            config=config,
+            checkpoint_saver=saver,
+        )
+        run = asyncio.create_task(first.execute("Build an app", workflow_id="wf-1"))
+        checkpoint = None
+        while checkpoint is None or not checkpoint.state["validator_results"]:
+            await asyncio.sleep(0.01)
+            checkpoint = await saver.load("wf-1")
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        _, restarted_developer, _ = _agents()
+        second = Orchestrator(
+            developer=restarted_developer,
+            validator=validator,
+            config=config,
+            checkpoint_saver=saver,
+        )
+        result = await second.execute("Build an app", workflow_id="wf-1")
+
+        assert result.status == "complete"
+        restarted_developer.execute.assert_awaited_once()  # only B runs again
+        assert restarted_developer.execute.await_args.kwargs["task"] == "b"
+        assert [r["task_id"] for r in result.validator_results] == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_degrades(self) -> None:
+        taskmaster, developer, validator = _agents()
+        client = AsyncMock(side_effect=ConnectionError("refused"))
+        with patch("daw_agents.workflow.orchestrator.get_async_redis_client", client):
+            orchestrator = Orchestrator(
+                taskmaster=taskmaster,
+                developer=developer,
+                validator=validator,
+                config=OrchestratorConfig(
+                    require_prd_approval=False, require_human_approval=False
+                ),
+            )
+            assert client.await_count == 0  # nothing connects at construction
+
+            result = await orchestrator.execute("Build an app", workflow_id="wf-1")
+
+        assert result.status == "complete"
+        assert client.await_count == 1  # backs off after the first failure
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_disabled(self) -> None:
+        orchestrator = Orchestrator(config=OrchestratorConfig(checkpoint_enabled=False))
+        assert await orchestrator.restore_from_checkpoint("wf-1") is None
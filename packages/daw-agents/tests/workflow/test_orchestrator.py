@@ -1004,3 +1004,270 @@ class TestOrchestratorGraphStructure:
 
         orchestrator = Orchestrator()
         assert hasattr(orchestrator, "_deploy_node")
+
+
+# -----------------------------------------------------------------------------
+# Test: Parallel Task Execution
+# -----------------------------------------------------------------------------
+
+
+def _parallel_state(tasks: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build an orchestrator state in the coding phase for the given tasks."""
+    return {
+        "user_input": "Build an app",
+        "prd_output": {"title": "App"},
+        "tasks": tasks,
+        "current_task_idx": 0,
+        "executor_results": [],
+        "validator_results": [],
+        "deployment_status": None,
+        "status": "coding",
+        "error": None,
+        "human_approval_required": False,
+        "prd_approval_required": False,
+        "prd_feedback": None,
+        "retry_count": 0,
+    }
+
+
+def _timed_developer(delays: dict[str, float], log: list[str]) -> AsyncMock:
+    """Developer mock that sleeps per task description and records start order."""
+    import asyncio
+
+    in_flight = {"now": 0, "peak": 0}
+
+    async def execute(task: str, source_file: str, test_file: str) -> MagicMock:
+        log.append(task)
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(delays.get(task, 0.01))
+        in_flight["now"] -= 1
+        return MagicMock(model_dump=lambda: {"success": True, "source_code": task})
+
+    developer = AsyncMock()
+    developer.execute = AsyncMock(side_effect=execute)
+    developer.in_flight = in_flight
+    return developer
+
+
+def _validator(failures: dict[str, list[str]] | None = None) -> AsyncMock:
+    """Validator mock; failures maps source code to statuses for successive calls."""
+    remaining = {code: list(statuses) for code, statuses in (failures or {}).items()}
+
+    async def validate(code: str, requirements: str) -> MagicMock:
+        statuses = remaining.get(code)
+        status = statuses.pop(0) if statuses else "approved"
+        return MagicMock(model_dump=lambda: {"status": status})
+
+    validator = AsyncMock()
+    validator.validate = AsyncMock(side_effect=validate)
+    return validator
+
+
+class TestOrchestratorParallelExecution:
+    """Tests for dependency-aware parallel task execution."""
+
+    def test_config_parallel_defaults(self) -> None:
+        """Parallel execution should be opt-in."""
+        from daw_agents.workflow.orchestrator import OrchestratorConfig
+
+        config = OrchestratorConfig()
+        assert config.parallel_execution is False
+        assert config.max_parallel_tasks == 4
+
+    def test_route_after_plan_to_execute_parallel(self) -> None:
+        """Plan should route to execute_parallel in parallel mode."""
+        from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+        orchestrator = Orchestrator(config=OrchestratorConfig(parallel_execution=True))
+        state = _parallel_state([{"id": "TASK-001"}])
+        assert orchestrator._route_after_plan(state) == "execute_parallel"  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_independent_tasks_take_critical_path(self) -> None:
+        """Wall time should follow the longest dependency chain, not the sum."""
+        import time
+
+        from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+        log: list[str] = []
+        developer = _timed_developer(dict.fromkeys("abcdef", 0.05), log)
+        tasks = [
+            {"id": "A", "description": "a"},
+            {"id": "B", "description": "b"},
+            {"id": "C", "description": "c"},
+            {"id": "D", "description": "d", "dependencies": ["A", "B"]},
+            {"id": "E", "description": "e", "dependencies": ["C"]},
+            {"id": "F", "description": "f", "dependencies": ["D", "E"]},
+        ]
+        orchestrator = Orchestrator(
+            developer=developer,
+            validator=_validator(),
+            config=OrchestratorConfig(parallel_execution=True, max_parallel_tasks=4),
+        )
+
+        start = time.perf_counter()
+        result = await orchestrator._execute_parallel_node(_parallel_state(tasks))  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+
+        assert result["status"] == "validating"
+        assert "error" not in result
+        # Three dependency levels of 50ms each, rather than six tasks in sequence
+        assert elapsed < 0.25
+        assert log.index("f") == 5
+        assert set(log[:3]) == {"a", "b", "c"}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """No more than max_parallel_tasks tasks should run at once."""
+        from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+        developer = _timed_developer({}, [])
+        tasks = [{"id": f"T{i}", "description": f"t{i}"} for i in range(7)]
+        orchestrator = Orchestrator(
+            developer=developer,
+            validator=_validator(),
+            config=OrchestratorConfig(parallel_execution=True, max_parallel_tasks=3),
+        )
+
+        await orchestrator._execute_parallel_node(_parallel_state(tasks))  # type: ignore[arg-type]
+
+        assert developer.in_flight["peak"] == 3
+        assert developer.execute.await_count == 7
+
+    @pytest.mark.asyncio
+    async def test_results_merge_in_task_order(self) -> None:
+        """Results should follow task order, not completion order."""
+        from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+        developer = _timed_developer({"slow": 0.05, "fast": 0.0}, [])
+        tasks = [
+            {"id": "SLOW", "description": "slow"},
+            {"id": "FAST", "description": "fast"},
+        ]
+        orchestrator = Orchestrator(
+            developer=developer,
+            validator=_validator(),
+            config=OrchestratorConfig(parallel_execution=True),
+        )
+
+        result = await orchestrator._execute_parallel_node(_parallel_state(tasks))  # type: ignore[arg-type]
+
+        assert [r["task_id"] for r in result["executor_results"]] == ["SLOW", "FAST"]
+        assert [r["task_id"] for r in result["validator_results"]] == ["SLOW", "FAST"]
+
+    @pytest.mark.asyncio
+    async def test_retries_do_not_block_siblings(self) -> None:
+        """A retrying task should not delay an independent task."""
+        from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+        log: list[str] = []
+        developer = _timed_developer({}, log)
+        tasks = [
+            {"id": "FLAKY", "description": "flaky"},
+            {"id": "STEADY", "description": "steady"},
+            {"id": "NEXT", "description": "next", "dependencies": ["STEADY"]},
+        ]
+        orchestrator = Orchestrator(
+            developer=developer,
+            validator=_validator({"flaky": ["rejected", "rejected"]}),
+            config=OrchestratorConfig(parallel_execution=True, max_retries=3),
+        )
+
+        result = await orchestrator._execute_parallel_node(_parallel_state(tasks))  # type: ignore[arg-type]
+
+        assert "error" not in result
+        # NEXT starts while FLAKY is still retrying
+        assert log.index("next") < len(log) - 1
+        assert [r["task_id"] for r in result["executor_results"]] == [
+            "FLAKY",
+            "FLAKY",
+            "FLAKY",
+            "STEADY",
+            "NEXT",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_blocks_only_dependents(self) -> None:
+        """A failed task should block its dependents but not unrelated tasks."""
+        from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+        log: list[str] = []
+        tasks = [
+            {"id": "BROKEN", "description": "broken"},
+            {"id": "CHILD", "description": "child", "dependencies": ["BROKEN"]},
+            {"id": "OTHER", "description": "other"},
+        ]
+        orchestrator = Orchestrator(
+            developer=_timed_developer({}, log),
+            validator=_validator({"broken": ["security_failure"]}),
+            config=OrchestratorConfig(parallel_execution=True),
+        )
+
+        result = await orchestrator._execute_parallel_node(_parallel_state(tasks))  # type: ignore[arg-type]
+
+        assert result["status"] == "error"
+        assert "BROKEN" in result["error"]
+        assert "Blocked by failed dependencies: CHILD" in result["error"]
+        assert sorted(log) == ["broken", "other"]
+        assert orchestrator._route_after_parallel(result) == "error"  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_unknown_dependencies_and_cycles_are_reported(self) -> None:
+        """Bad dependency ids and cycles should be reported, not run or called blocked."""
+        from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+        log: list[str] = []
+        tasks = [
+            {"id": "ORPHAN", "description": "orphan", "dependencies": ["MISSING"]},
+            {"id": "PING", "description": "ping", "dependencies": ["PONG"]},
+            {"id": "PONG", "description": "pong", "dependencies": ["PING"]},
+            {"id": "AFTER", "description": "after", "dependencies": ["PONG"]},
+            {"id": "OTHER", "description": "other"},
+        ]
+        orchestrator = Orchestrator(
+            developer=_timed_developer({}, log),
+            validator=_validator(),
+            config=OrchestratorConfig(parallel_execution=True),
+        )
+
+        result = await orchestrator._execute_parallel_node(_parallel_state(tasks))  # type: ignore[arg-type]
+
+        assert result["status"] == "error"
+        assert result["error"] == (
+            "Unknown dependencies of ORPHAN: MISSING; "
+            "Dependency cycle: PING, PONG; "
+            "Blocked by failed dependencies: AFTER"
+        )
+        assert log == ["other"]
+
+    @pytest.mark.asyncio
+    async def test_execute_runs_parallel_workflow(self) -> None:
+        """execute() should run all tasks through the parallel node to deploy."""
+        from daw_agents.workflow.orchestrator import Orchestrator, OrchestratorConfig
+
+        task_models = [
+            MagicMock(model_dump=lambda: {"id": "A", "description": "a"}),
+            MagicMock(model_dump=lambda: {"id": "B", "description": "b", "dependencies": ["A"]}),
+        ]
+        taskmaster = AsyncMock()
+        taskmaster.workflow = MagicMock()
+        taskmaster.workflow.ainvoke = AsyncMock(
+            return_value={"prd": MagicMock(model_dump=lambda: {"title": "T"}), "tasks": task_models}
+        )
+        orchestrator = Orchestrator(
+            taskmaster=taskmaster,
+            developer=_timed_developer({}, []),
+            validator=_validator(),
+            config=OrchestratorConfig(
+                parallel_execution=True,
+                require_prd_approval=False,
+                require_human_approval=False,
+            ),
+        )
+
+        result = await orchestrator.execute("Build an app")
+
+        assert result.success is True
+        assert result.status == "complete"
+        assert [r["task_id"] for r in result.validator_results] == ["A", "B"]